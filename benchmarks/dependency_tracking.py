@@ -0,0 +1,88 @@
+"""Benchmark: dependency bookkeeping cost in a session with many readers.
+
+Renders N components that each read a shared Stateful attribute and a key
+of a tracked dict, then changes the attribute so all N re-render. Reports
+the time per full re-render and the memory retained per dependency edge.
+
+Usage:
+    uv run python benchmarks/dependency_tracking.py
+"""
+
+from __future__ import annotations
+
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+
+from trellis.core.components.composition import component
+from trellis.core.rendering.render import render
+from trellis.core.rendering.session import RenderSession, set_render_session
+from trellis.core.state.stateful import Stateful
+
+SIZES = (1_000, 10_000)
+ITERATIONS = 10
+
+
+@dataclass(kw_only=True)
+class SharedState(Stateful):
+    tick: int = 0
+    labels: dict[int, str] = field(default_factory=dict)
+
+
+def _render_readers(size: int, *, read: bool) -> tuple[float, int]:
+    """Render size readers and time re-renders triggered by state.tick.
+
+    Returns:
+        (re-render in ms, memory retained by the initial render in bytes)
+    """
+    state = SharedState(labels={i: str(i) for i in range(size)})
+
+    @component
+    def Reader(index: int) -> None:
+        if read:
+            _ = state.tick
+            _ = state.labels[index]
+
+    @component
+    def App() -> None:
+        _ = state.tick
+        for i in range(size):
+            Reader(index=i, key=str(i))
+
+    gc.collect()
+    tracemalloc.start()
+    session = RenderSession(App)
+    set_render_session(session)
+    render(session)
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        state.tick += 1
+        render(session)
+    render_ms = (time.perf_counter() - start) / ITERATIONS * 1e3
+
+    set_render_session(None)
+    return render_ms, retained
+
+
+def bench(size: int) -> tuple[float, float]:
+    """Return (full re-render in ms, retained bytes per dependency edge)."""
+    render_ms, with_reads = _render_readers(size, read=True)
+    _, without_reads = _render_readers(size, read=False)
+    # Each Reader holds two edges: state.tick and one key of state.labels
+    return render_ms, (with_reads - without_reads) / (2 * size)
+
+
+def main() -> None:
+    print(f"{'readers':>10} {'render (ms)':>12} {'bytes/edge':>12}")
+    for size in SIZES:
+        render_ms, per_edge = bench(size)
+        print(f"{size:>10} {render_ms:>12.1f} {per_edge:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
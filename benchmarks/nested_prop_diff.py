@@ -0,0 +1,73 @@
+"""Benchmark: update patch size for streaming data props.
+
+Renders a TimeSeriesChart whose series slide forward by one sample per
+update and a LineChart whose rows grow by one per update, then reports the
+encoded size of each update patch and the time to diff and serialize it.
+
+Usage:
+    uv run python benchmarks/nested_prop_diff.py
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+import msgspec
+
+from trellis.core.components.composition import component
+from trellis.core.rendering.patches import RenderUpdatePatch
+from trellis.core.rendering.render import render
+from trellis.core.rendering.session import RenderSession, set_render_session
+from trellis.core.state.stateful import Stateful
+from trellis.platforms.common.handler import _serialize_patches
+from trellis.widgets.charts import LineChart, TimeSeriesChart
+
+SIZES = (1_000, 10_000, 100_000)
+ITERATIONS = 10
+
+
+@dataclass(kw_only=True)
+class Feed(Stateful):
+    start: int = 0
+    count: int = 0
+
+
+def bench(size: int) -> tuple[int, float]:
+    """Return (mean patch bytes, mean ms per update) for one data size."""
+    feed = Feed(count=size)
+
+    @component
+    def App() -> None:
+        window = range(feed.start, feed.start + size)
+        TimeSeriesChart(data=[[float(t) for t in window], [t * 0.5 for t in window]])
+        LineChart(data=[{"name": f"t{i}", "cpu": i % 100} for i in range(feed.count)])
+
+    session = RenderSession(App)
+    set_render_session(session)
+    render(session)
+
+    total_bytes = 0
+    total_time = 0.0
+    for _ in range(ITERATIONS):
+        feed.start += 1
+        feed.count += 1
+        start = time.perf_counter()
+        patches = render(session)
+        updates = [p for p in patches if isinstance(p, RenderUpdatePatch)]
+        encoded = msgspec.json.encode(_serialize_patches(updates, session))
+        total_time += time.perf_counter() - start
+        total_bytes += len(encoded)
+    set_render_session(None)
+    return total_bytes // ITERATIONS, total_time / ITERATIONS * 1000
+
+
+def main() -> None:
+    print(f"{'items':>8} {'patch bytes':>12} {'update (ms)':>12}")
+    for size in SIZES:
+        patch_bytes, update_ms = bench(size)
+        print(f"{size:>8} {patch_bytes:>12} {update_ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
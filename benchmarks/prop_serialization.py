@@ -0,0 +1,68 @@
+"""Benchmark: serializing large data props for the wire.
+
+Renders a TimeSeriesChart holding N samples per series and a LineChart
+holding N row dicts, then times serializing each element's props the way
+the initial render and update patches do.
+
+Usage:
+    uv run python benchmarks/prop_serialization.py
+"""
+
+from __future__ import annotations
+
+import time
+
+from trellis.core.components.composition import component
+from trellis.core.rendering.render import render
+from trellis.core.rendering.session import RenderSession, set_render_session
+from trellis.platforms.common.serialization import serialize_element
+from trellis.widgets.charts import LineChart, TimeSeriesChart
+
+SIZES = (1_000, 10_000, 100_000)
+ITERATIONS = 20
+
+
+def _time_serialize(session: RenderSession, element_id: str) -> float:
+    """Return the mean time in milliseconds to serialize one element."""
+    element = session.elements.get(element_id)
+    assert element is not None
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        serialize_element(element, session)
+    return (time.perf_counter() - start) / ITERATIONS * 1000
+
+
+def bench(size: int) -> tuple[float, float]:
+    """Return (time series ms, row dicts ms) for one data size."""
+    samples = [
+        [float(i) for i in range(size)],
+        [i * 0.5 for i in range(size)],
+        [i * 0.25 for i in range(size)],
+    ]
+    rows = [{"name": f"t{i}", "cpu": i % 100, "memory": i * 0.1} for i in range(size)]
+
+    @component
+    def App() -> None:
+        TimeSeriesChart(data=samples, series=[{"label": "a"}, {"label": "b"}])
+        LineChart(data=rows, data_keys=["cpu", "memory"])
+
+    session = RenderSession(App)
+    set_render_session(session)
+    render(session)
+    root = session.root_element
+    assert root is not None
+    series_ms = _time_serialize(session, root.child_ids[0])
+    rows_ms = _time_serialize(session, root.child_ids[1])
+    set_render_session(None)
+    return series_ms, rows_ms
+
+
+def main() -> None:
+    print(f"{'items':>8} {'time series (ms)':>17} {'row dicts (ms)':>15}")
+    for size in SIZES:
+        series_ms, rows_ms = bench(size)
+        print(f"{size:>8} {series_ms:>17.2f} {rows_ms:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
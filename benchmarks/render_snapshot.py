@@ -0,0 +1,76 @@
+"""Benchmark: per-render overhead of a single-leaf update as the tree grows.
+
+Renders a flat tree of N elements, then repeatedly updates one leaf and
+times the incremental render. With copy-on-write snapshots the per-render
+cost should stay flat as N grows; the `clone` column shows what the old
+full-dict snapshot alone would have cost at each size.
+
+Usage:
+    uv run python benchmarks/render_snapshot.py
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+from trellis.core.components.composition import component
+from trellis.core.rendering.render import render
+from trellis.core.rendering.session import RenderSession, set_render_session
+from trellis.core.state.stateful import Stateful
+
+SIZES = (1_000, 5_000, 20_000)
+ITERATIONS = 200
+
+
+@dataclass(kw_only=True)
+class CounterState(Stateful):
+    value: int = 0
+
+
+def bench(size: int) -> tuple[float, float]:
+    """Return (incremental render, ElementStore.clone) time in microseconds."""
+    counter = CounterState()
+
+    @component
+    def Counter() -> None:
+        _ = counter.value
+
+    @component
+    def Filler() -> None:
+        pass
+
+    @component
+    def App() -> None:
+        Counter()
+        for i in range(size):
+            Filler(key=str(i))
+
+    session = RenderSession(App)
+    set_render_session(session)
+    render(session)
+
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        counter.value += 1
+        render(session)
+    render_us = (time.perf_counter() - start) / ITERATIONS * 1e6
+
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        session.elements.clone()
+    clone_us = (time.perf_counter() - start) / ITERATIONS * 1e6
+
+    set_render_session(None)
+    return render_us, clone_us
+
+
+def main() -> None:
+    print(f"{'elements':>10} {'render (us)':>12} {'clone (us)':>12}")
+    for size in SIZES:
+        render_us, clone_us = bench(size)
+        print(f"{size:>10} {render_us:>12.1f} {clone_us:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark: Stateful attribute reads per second.
+
+Times four kinds of attribute access on a Stateful instance:
+
+- tracked: an annotated field read with no active dependency (callbacks, hooks)
+- tracked (render): the same read while a dependency is being tracked, as
+  during component execution
+- untracked: a plain instance attribute that does not participate in
+  reactivity
+- method: a bound method lookup
+
+Usage:
+    uv run python benchmarks/stateful_reads.py
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from trellis.core.rendering.session import RenderSession, set_render_session
+from trellis.core.state.stateful import Stateful
+
+READS = 1_000_000
+
+
+@dataclass(kw_only=True)
+class BenchState(Stateful):
+    value: int = 0
+
+    def method(self) -> int:
+        return 0
+
+
+class _Dependency:
+    """Minimal StateDependency stand-in for an executing element."""
+
+    def notify_dirty(self) -> None:
+        pass
+
+
+def _reads_per_second(read: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    read()
+    return READS / (time.perf_counter() - start)
+
+
+def bench() -> dict[str, float]:
+    """Return reads per second for each access kind."""
+    state = BenchState()
+    object.__setattr__(state, "plain", 0)
+    loop = range(READS)
+
+    def tracked() -> None:
+        for _ in loop:
+            _ = state.value
+
+    def untracked() -> None:
+        for _ in loop:
+            _ = state.plain  # type: ignore[attr-defined]
+
+    def method() -> None:
+        for _ in loop:
+            _ = state.method
+
+    results = {
+        "tracked": _reads_per_second(tracked),
+        "untracked": _reads_per_second(untracked),
+        "method": _reads_per_second(method),
+    }
+
+    session = RenderSession(lambda: None)  # type: ignore[arg-type]
+    set_render_session(session)
+    dependency = _Dependency()
+    with session.tracking(dependency):
+        results["tracked (render)"] = _reads_per_second(tracked)
+    set_render_session(None)
+
+    return results
+
+
+def main() -> None:
+    print(f"{'access':>18} {'reads/sec':>14}")
+    for kind, rate in bench().items():
+        print(f"{kind:>18} {rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
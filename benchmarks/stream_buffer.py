@@ -0,0 +1,89 @@
+"""Benchmark: streaming samples into a TimeSeriesChart.
+
+Simulates a 10 Hz sensor trace with a one-hour window (36,000 samples, two
+series). Each update appends one sample and evicts the oldest, once with the
+window held in a plain list of columns and once in a StreamBuffer. Reports
+the encoded update patch size and the time to render and serialize it.
+
+Usage:
+    uv run python benchmarks/stream_buffer.py
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+
+import msgspec
+
+from trellis.core.components.composition import component
+from trellis.core.rendering.patches import RenderUpdatePatch
+from trellis.core.rendering.render import render
+from trellis.core.rendering.session import RenderSession, set_render_session
+from trellis.core.state.stateful import Stateful
+from trellis.core.state.stream import StreamBuffer
+from trellis.platforms.common.handler import _serialize_patches
+from trellis.widgets.charts import TimeSeriesChart
+
+WINDOW = 36_000
+ITERATIONS = 20
+
+
+@dataclass(kw_only=True)
+class Feed(Stateful):
+    tick: int = WINDOW
+    buffer: StreamBuffer[tuple[float, float, float]] = field(
+        default_factory=lambda: StreamBuffer(
+            ((float(t), t * 0.5, t * 0.25) for t in range(WINDOW)), maxlen=WINDOW, columns=3
+        )
+    )
+
+
+def bench(use_buffer: bool) -> tuple[int, float]:
+    """Return (mean patch bytes, mean ms per update)."""
+    feed = Feed()
+
+    @component
+    def App() -> None:
+        if use_buffer:
+            TimeSeriesChart(data=feed.buffer)
+        else:
+            window = range(feed.tick - WINDOW, feed.tick)
+            TimeSeriesChart(
+                data=[
+                    [float(t) for t in window],
+                    [t * 0.5 for t in window],
+                    [t * 0.25 for t in window],
+                ]
+            )
+
+    session = RenderSession(App)
+    set_render_session(session)
+    render(session)
+
+    total_bytes = 0
+    total_time = 0.0
+    for _ in range(ITERATIONS):
+        t = feed.tick
+        start = time.perf_counter()
+        if use_buffer:
+            feed.buffer.append((float(t), t * 0.5, t * 0.25))
+        feed.tick += 1
+        patches = render(session)
+        updates = [p for p in patches if isinstance(p, RenderUpdatePatch)]
+        encoded = msgspec.json.encode(_serialize_patches(updates, session))
+        total_time += time.perf_counter() - start
+        total_bytes += len(encoded)
+    set_render_session(None)
+    return total_bytes // ITERATIONS, total_time / ITERATIONS * 1000
+
+
+def main() -> None:
+    print(f"{'data':>14} {'patch bytes':>12} {'update (ms)':>12}")
+    for label, use_buffer in (("list", False), ("StreamBuffer", True)):
+        patch_bytes, update_ms = bench(use_buffer)
+        print(f"{label:>14} {patch_bytes:>12} {update_ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
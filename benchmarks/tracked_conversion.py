@@ -0,0 +1,72 @@
+"""Benchmark: assigning a nested JSON-like payload to a Stateful field.
+
+Builds a telemetry-style payload (a list of N dicts, each holding nested
+lists and dicts) and assigns it to a tracked attribute. Reports the time and
+peak allocation of the assignment, and of reading one nested value after
+it.
+
+Usage:
+    uv run python benchmarks/tracked_conversion.py
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+import typing as tp
+from dataclasses import dataclass, field
+
+from trellis.core.state.stateful import Stateful
+
+SIZES = (1_000, 10_000, 100_000)
+
+
+@dataclass(kw_only=True)
+class TelemetryState(Stateful):
+    samples: list[dict[str, tp.Any]] = field(default_factory=list)
+
+
+def _payload(size: int) -> list[dict[str, tp.Any]]:
+    return [
+        {"id": i, "tags": ["a", "b"], "reading": {"value": float(i), "unit": "V"}}
+        for i in range(size)
+    ]
+
+
+def _measure(action: tp.Callable[[], None]) -> tuple[float, int]:
+    """Return (ms, peak bytes allocated) for action."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    action()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed * 1000, peak
+
+
+def bench(size: int) -> tuple[float, int, float]:
+    """Return (assign ms, assign peak bytes, nested read ms) for one payload size."""
+    state = TelemetryState()
+    payload = _payload(size)
+
+    def assign() -> None:
+        state.samples = payload
+
+    assign_ms, assign_peak = _measure(assign)
+
+    start = time.perf_counter()
+    _ = state.samples[size // 2]["reading"]["value"]
+    read_ms = (time.perf_counter() - start) * 1000
+
+    return assign_ms, assign_peak, read_ms
+
+
+def main() -> None:
+    print(f"{'items':>8} {'assign ms':>10} {'assign peak KB':>15} {'nested read ms':>15}")
+    for size in SIZES:
+        assign_ms, assign_peak, read_ms = bench(size)
+        print(f"{size:>8} {assign_ms:>10.2f} {assign_peak / 1024:>15.1f} {read_ms:>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark: serializing a large chart as lists versus typed arrays.
+
+Renders a TimeSeriesChart with two columns of points, given either as lists
+of floats or as ``array.array("d")``, then reports the time to serialize the
+element and encode it with msgpack, and the encoded size.
+
+Usage:
+    uv run python benchmarks/typed_arrays.py
+"""
+
+from __future__ import annotations
+
+import array
+import time
+import typing as tp
+
+import msgspec
+
+from trellis.core.components.composition import component
+from trellis.core.rendering.render import render
+from trellis.core.rendering.session import RenderSession, set_render_session
+from trellis.platforms.common.serialization import serialize_element
+from trellis.widgets.charts import TimeSeriesChart
+
+SIZES = (1_000, 10_000, 100_000)
+ITERATIONS = 10
+
+
+def bench(columns: list[tp.Any]) -> tuple[int, float]:
+    """Return (encoded bytes, mean ms to serialize and encode) for one chart."""
+
+    @component
+    def App() -> None:
+        TimeSeriesChart(data=columns)
+
+    session = RenderSession(App)
+    set_render_session(session)
+    render(session)
+    assert session.root_element is not None
+    chart = session.elements.get(session.root_element.child_ids[0])
+    assert chart is not None
+
+    encoder = msgspec.msgpack.Encoder()
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        encoded = encoder.encode(serialize_element(chart, session))
+    elapsed = (time.perf_counter() - start) / ITERATIONS * 1000
+    set_render_session(None)
+    return len(encoded), elapsed
+
+
+def main() -> None:
+    print(
+        f"{'points':>8} {'list bytes':>12} {'list (ms)':>10} {'array bytes':>12} {'array (ms)':>11}"
+    )
+    for size in SIZES:
+        timestamps = [1_700_000_000.0 + i for i in range(size)]
+        values = [i * 0.5 for i in range(size)]
+        list_bytes, list_ms = bench([timestamps, values])
+        array_bytes, array_ms = bench([array.array("d", timestamps), array.array("d", values)])
+        print(f"{size:>8} {list_bytes:>12} {list_ms:>10.2f} {array_bytes:>12} {array_ms:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -30,6 +30,7 @@ from trellis.core import (
     KeySequence,
     LifecycleTracker,
     Mutable,
+    Opaque,
     PatchCollector,
     ReactComponentBase,
     Ref,
@@ -39,14 +40,19 @@ from trellis.core import (
     RenderSession,
     RenderUpdatePatch,
     Stateful,
+    StreamBuffer,
     Tracked,
     TrackedDict,
     TrackedList,
     TrackedSet,
+    Versioned,
+    batch,
     callback,
     component,
+    computed,
     convert_to_tracked,
     diff_props,
+    every_event,
     get_ref,
     get_render_session,
     is_render_active,
@@ -57,6 +63,7 @@ from trellis.core import (
     sequence,
     set_ref,
     set_render_session,
+    state_version,
 )
 from trellis.core.state import state_var
 from trellis.routing import Route, RouterState, Routes, router
@@ -83,6 +90,7 @@ __all__ = [
     "KeySequence",
     "LifecycleTracker",
     "Mutable",
+    "Opaque",
     "PatchCollector",
     "ReactComponentBase",
     "Ref",
@@ -95,14 +103,19 @@ __all__ = [
     "RouterState",
     "Routes",
     "Stateful",
+    "StreamBuffer",
     "Tracked",
     "TrackedDict",
     "TrackedList",
     "TrackedSet",
+    "Versioned",
+    "batch",
     "callback",
     "component",
+    "computed",
     "convert_to_tracked",
     "diff_props",
+    "every_event",
     "get_ref",
     "get_render_session",
     "is_render_active",
@@ -117,4 +130,5 @@ __all__ = [
     "set_ref",
     "set_render_session",
     "state_var",
+    "state_version",
 ]
@@ -14,8 +14,12 @@ from trellis.app.configvars import (
     coerce_value,
     get_config_vars,
     validate_batch_delay,
+    validate_compression,
     validate_debug_categories,
+    validate_non_negative_float,
+    validate_non_negative_int,
     validate_port_or_none,
+    validate_positive_int,
     validate_window_size,
 )
 from trellis.platforms.common.base import PlatformType
@@ -53,7 +57,19 @@ _BATCH_DELAY = ConfigVar(
     "batch_delay",
     default=1 / 30,
     validator=validate_batch_delay,
-    help="Delay in seconds for batching render updates",
+    help="Minimum delay in seconds between render updates",
+)
+_RENDER_WORKERS = ConfigVar(
+    "render_workers",
+    default=0,
+    validator=validate_non_negative_int,
+    help="Threads re-renders run on, shared by all sessions (0 renders on the event loop)",
+)
+_RENDER_SLICE_BUDGET = ConfigVar(
+    "render_slice_budget",
+    default=0.0,
+    validator=validate_non_negative_float,
+    help="Seconds a re-render runs before yielding to the event loop (0 renders in one go)",
 )
 _HOT_RELOAD = ConfigVar(
     "hot_reload",
@@ -111,6 +127,27 @@ _PORT: ConfigVar[int | None] = ConfigVar(
     short_name="p",
     help="Server port to bind to",
 )
+_COMPRESSION = ConfigVar(
+    "compression",
+    default="deflate",
+    category="server",
+    validator=validate_compression,
+    help="WebSocket message compression (deflate, permessage-deflate, none)",
+)
+_COMPRESSION_THRESHOLD = ConfigVar(
+    "compression_threshold",
+    default=4096,
+    category="server",
+    validator=validate_positive_int,
+    help="Smallest encoded message in bytes that deflate compression applies to",
+)
+_RESUME_GRACE = ConfigVar(
+    "resume_grace",
+    default=30.0,
+    category="server",
+    validator=validate_non_negative_float,
+    help="Seconds a disconnected session waits for its client to reconnect (0 disables)",
+)
 
 
 def _default_routing_mode(platform: PlatformType) -> RoutingMode:
@@ -211,7 +248,13 @@ class Config:
         platform: Target platform (server, desktop, browser)
         force_build: Force rebuild of client bundle even if sources unchanged
         watch: Whether to watch for file changes
-        batch_delay: Delay in seconds for batching render updates
+        batch_delay: Minimum delay in seconds between render updates
+        render_workers: Size of the thread pool that re-renders run on,
+            shared by all sessions (0 renders on the event loop; ignored
+            by the browser platform)
+        render_slice_budget: Seconds a re-render runs before yielding to
+            the event loop (0 renders each pass in one go); cannot be
+            combined with render_workers
         hot_reload: Whether to enable hot reload during development
         routing_mode: URL routing strategy (standard, hash_url, embedded)
         debug: Comma-separated debug categories to enable
@@ -220,6 +263,12 @@ class Config:
         title: Application title (page/window title, defaults to name)
         host: Server bind address
         port: Server port (None for auto-select)
+        compression: WebSocket compression: "deflate" (messages above the
+            threshold), "permessage-deflate" (every frame) or "none"
+        compression_threshold: Smallest encoded message in bytes that
+            "deflate" compression applies to
+        resume_grace: Seconds a disconnected session is kept for its client
+            to reconnect and resume (0 disables resume)
         window_size: Desktop window size ('maximized' or 'WIDTHxHEIGHT')
         identifier: Reverse-domain bundle identifier (e.g., 'com.example.myapp')
         version: Application version string (semver)
@@ -237,6 +286,8 @@ class Config:
     force_build: bool = False
     watch: bool = False
     batch_delay: float = field(default_factory=lambda: 1 / 30)
+    render_workers: int = 0
+    render_slice_budget: float = 0.0
     hot_reload: bool = True
     routing_mode: RoutingMode | None = None
     debug: str = ""
@@ -250,6 +301,9 @@ class Config:
     # Server settings
     host: str = "127.0.0.1"
     port: int | None = None
+    compression: str = "deflate"
+    compression_threshold: int = 4096
+    resume_grace: float = 30.0
 
     # Desktop settings
     window_size: str = "maximized"
@@ -269,6 +323,8 @@ class Config:
         force_build: bool = False,
         watch: bool = False,
         batch_delay: float = 1 / 30,
+        render_workers: int = 0,
+        render_slice_budget: float = 0.0,
         hot_reload: bool = True,
         routing_mode: RoutingMode | None = None,
         debug: str = "",
@@ -278,6 +334,9 @@ class Config:
         library: bool = False,
         host: str = "127.0.0.1",
         port: int | None = None,
+        compression: str = "deflate",
+        compression_threshold: int = 4096,
+        resume_grace: float = 30.0,
         window_size: str = "maximized",
         identifier: str | None = None,
         version: str | None = None,
@@ -301,6 +360,10 @@ class Config:
         self.force_build = _FORCE_BUILD.resolve(force_build)
         self.watch = _WATCH.resolve(watch)
         self.batch_delay = _BATCH_DELAY.resolve(batch_delay)
+        self.render_workers = _RENDER_WORKERS.resolve(render_workers)
+        self.render_slice_budget = _RENDER_SLICE_BUDGET.resolve(render_slice_budget)
+        if self.render_workers and self.render_slice_budget:
+            raise ValueError("render_slice_budget and render_workers are mutually exclusive")
         self.hot_reload = _HOT_RELOAD.resolve(hot_reload)
         self.routing_mode = _ROUTING_MODE.resolve(routing_mode)
         if self.routing_mode is None:
@@ -318,6 +381,9 @@ class Config:
         # Server settings
         self.host = _HOST.resolve(host)
         self.port = _PORT.resolve(port)
+        self.compression = _COMPRESSION.resolve(compression)
+        self.compression_threshold = _COMPRESSION_THRESHOLD.resolve(compression_threshold)
+        self.resume_grace = _RESUME_GRACE.resolve(resume_grace)
 
         # Desktop settings
         self.window_size = _WINDOW_SIZE.resolve(window_size)
@@ -45,6 +45,7 @@ MAX_PORT = 65535
 MIN_BATCH_DELAY = 0.001
 MAX_BATCH_DELAY = 10.0
 WINDOW_SIZE_PARTS_COUNT = 2
+COMPRESSION_MODES = ("deflate", "permessage-deflate", "none")
 
 # Context variable to hold CLI arguments
 _cli_context: ContextVar[dict[str, Any] | None] = ContextVar("cli_context", default=None)
@@ -343,6 +344,23 @@ def validate_positive_int(value: int) -> int:
     return value
 
 
+def validate_non_negative_int(value: int) -> int:
+    """Validate that a value is a non-negative integer (>= 0).
+
+    Args:
+        value: Integer value
+
+    Returns:
+        The value unchanged
+
+    Raises:
+        ValueError: If value is negative
+    """
+    if value < 0:
+        raise ValueError(f"Value must be non-negative, got {value}")
+    return value
+
+
 def validate_positive_float(value: float) -> float:
     """Validate that a value is a positive float (> 0).
 
@@ -360,6 +378,23 @@ def validate_positive_float(value: float) -> float:
     return value
 
 
+def validate_non_negative_float(value: float) -> float:
+    """Validate that a value is a non-negative float (>= 0).
+
+    Args:
+        value: Float value
+
+    Returns:
+        The value unchanged
+
+    Raises:
+        ValueError: If value is negative
+    """
+    if value < 0:
+        raise ValueError(f"Value must be non-negative, got {value}")
+    return value
+
+
 def validate_batch_delay(value: float) -> float:
     """Validate that batch_delay is within acceptable bounds.
 
@@ -377,6 +412,26 @@ def validate_batch_delay(value: float) -> float:
     return value
 
 
+def validate_compression(value: str) -> str:
+    """Validate and normalize a WebSocket compression mode.
+
+    Args:
+        value: One of "deflate", "permessage-deflate" or "none" (case-insensitive)
+
+    Returns:
+        The normalized mode
+
+    Raises:
+        ValueError: If the mode is unknown
+    """
+    mode = value.strip().lower()
+    if mode not in COMPRESSION_MODES:
+        raise ValueError(
+            f"Unknown compression mode: {value!r} (expected {', '.join(COMPRESSION_MODES)})"
+        )
+    return mode
+
+
 def validate_window_size(value: str) -> str:
     """Validate and normalize window size string.
 
@@ -492,7 +547,10 @@ __all__ = [
     "get_cli_args",
     "get_config_vars",
     "validate_batch_delay",
+    "validate_compression",
     "validate_debug_categories",
+    "validate_non_negative_float",
+    "validate_non_negative_int",
     "validate_port_or_none",
     "validate_positive_float",
     "validate_positive_int",
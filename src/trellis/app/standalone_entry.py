@@ -35,6 +35,8 @@ def main() -> None:
 
     run_kwargs: dict[str, Any] = {
         "batch_delay": config.batch_delay,
+        "render_workers": config.render_workers,
+        "render_slice_budget": config.render_slice_budget,
         "hot_reload": False,
         "window_title": config.title,
     }
@@ -23,7 +23,12 @@ def _build_run_kwargs(config: Config) -> dict[str, Any]:
         "host": config.host,
         "port": config.port,
         "batch_delay": config.batch_delay,
+        "render_workers": config.render_workers,
+        "render_slice_budget": config.render_slice_budget,
         "hot_reload": config.hot_reload,
+        "compression": config.compression,
+        "compression_threshold": config.compression_threshold,
+        "resume_grace": config.resume_grace,
     }
     if config.platform == PlatformType.DESKTOP:
         kwargs["window_title"] = config.title
@@ -1,5 +1,8 @@
 """Core rendering primitives for the Trellis UI framework."""
 
+# callbacks
+from trellis.core.callback_context import every_event
+
 # components
 from trellis.core.components import (
     Component,
@@ -55,17 +58,23 @@ from trellis.core.rendering import (
 )
 from trellis.core.state import (
     Mutable,
+    Opaque,
     Ref,
     Stateful,
+    StreamBuffer,
     Tracked,
     TrackedDict,
     TrackedList,
     TrackedSet,
+    Versioned,
+    batch,
     callback,
+    computed,
     convert_to_tracked,
     get_ref,
     mutable,
     set_ref,
+    state_version,
 )
 
 __all__ = [
@@ -89,6 +98,7 @@ __all__ = [
     "MessageHandler",
     "MessageHandlerProtocol",
     "Mutable",
+    "Opaque",
     "PatchCollector",
     "ReactComponentBase",
     "Ref",
@@ -99,15 +109,20 @@ __all__ = [
     "RenderUpdatePatch",
     "Stateful",
     "StatefulMessageHandlerMixin",
+    "StreamBuffer",
     "Tracked",
     "TrackedDict",
     "TrackedList",
     "TrackedSet",
+    "Versioned",
+    "batch",
     "callback",
     "component",
+    "computed",
     "convert_to_tracked",
     "diff_props",
     "dispatch",
+    "every_event",
     "get_message_handler",
     "get_ref",
     "get_render_session",
@@ -124,4 +139,5 @@ __all__ = [
     "set_message_handler",
     "set_ref",
     "set_render_session",
+    "state_version",
 ]
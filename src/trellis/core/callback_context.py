@@ -7,6 +7,10 @@ context-based state like RouterState.
 
 The callback_context context manager sets up the necessary context and
 acquires the session lock to prevent concurrent rendering.
+
+Handlers of continuous input (mutable bindings, on_change, on_input, ...)
+only see the latest event of a burst that queued up on the server. The
+every_event decorator opts a callback out of that.
 """
 
 from __future__ import annotations
@@ -22,11 +26,17 @@ if tp.TYPE_CHECKING:
 
 __all__ = [
     "callback_context",
+    "every_event",
     "get_callback_element_state",
     "get_callback_node_id",
     "get_callback_session",
+    "wants_every_event",
 ]
 
+F = tp.TypeVar("F", bound=tp.Callable[..., tp.Any])
+
+_EVERY_EVENT_ATTR = "__trellis_every_event__"
+
 
 @dataclass
 class _CallbackContext:
@@ -129,3 +139,40 @@ def get_callback_element_state() -> ElementState:
         # Create state if it doesn't exist (shouldn't happen in practice)
         state = ctx.session.states.get_or_create(ctx.node_id)
     return state
+
+
+def every_event(fn: F) -> F:
+    """Mark a callback as needing every event sent to it.
+
+    By default, when several input events for the same mutable binding or
+    continuous-input handler (on_change, on_input, on_mouse_move, ...) are
+    waiting on the server, only the latest is applied. Handlers that
+    accumulate events rather than track a current value opt out with this.
+
+    Args:
+        fn: The callback function
+
+    Returns:
+        The same function, marked
+
+    Example:
+        @every_event
+        def record(value: float) -> None:
+            state.samples.append(value)
+
+        Slider(value=callback(state.value, record))
+    """
+    setattr(fn, _EVERY_EVENT_ATTR, True)
+    return fn
+
+
+def wants_every_event(fn: tp.Callable[..., tp.Any]) -> bool:
+    """Whether a callback was marked with every_event.
+
+    Args:
+        fn: The callback, or a bound method of a marked function
+
+    Returns:
+        True if events for it must not be merged
+    """
+    return bool(getattr(fn, _EVERY_EVENT_ATTR, False))
@@ -2,16 +2,61 @@
 
 from __future__ import annotations
 
+import inspect
 import typing as tp
 import weakref
 from abc import ABC, abstractmethod
 from enum import StrEnum
 
+from trellis.core.components.memo import PropsComparator
 from trellis.core.rendering.element import Element
 from trellis.core.rendering.session import get_render_session
+from trellis.core.state.stream import StreamBuffer
 from trellis.utils.logger import logger
 
-__all__ = ["Component"]
+if tp.TYPE_CHECKING:
+    from trellis.core.rendering.session import RenderSession
+
+__all__ = ["Component", "callback_props_from_signature", "stream_props_from_signature"]
+
+# Annotation fragments marking a prop that can carry callables or Mutables
+_CALLBACK_ANNOTATION_MARKERS = ("Callable", "Handler", "Mutable")
+
+
+def _props_annotated_with(signature: inspect.Signature, markers: tuple[str, ...]) -> frozenset[str]:
+    """Find parameters whose annotation mentions any of the given names."""
+    names = set()
+    for param in signature.parameters.values():
+        if param.annotation is inspect.Parameter.empty:
+            continue
+        annotation = str(param.annotation)
+        if any(marker in annotation for marker in markers):
+            names.add(param.name)
+    return frozenset(names)
+
+
+def callback_props_from_signature(signature: inspect.Signature) -> frozenset[str]:
+    """Find the parameters of a component function that can receive callbacks.
+
+    Args:
+        signature: Signature of the decorated component function
+
+    Returns:
+        Names of parameters annotated with a Callable, event handler, or Mutable type
+    """
+    return _props_annotated_with(signature, _CALLBACK_ANNOTATION_MARKERS)
+
+
+def stream_props_from_signature(signature: inspect.Signature) -> frozenset[str]:
+    """Find the parameters of a component function that can receive a StreamBuffer.
+
+    Args:
+        signature: Signature of the decorated component function
+
+    Returns:
+        Names of parameters annotated with a StreamBuffer type
+    """
+    return _props_annotated_with(signature, ("StreamBuffer",))
 
 
 class ElementKind(StrEnum):
@@ -27,6 +72,17 @@ class Component(ABC):
 
     name: str
     element_class: type[Element]
+    # Comparator deciding whether unchanged props let a placement be skipped.
+    # None uses full deep equality.
+    props_equal: PropsComparator | None = None
+    # Props whose declared type can hold callables or Mutables. Serializers
+    # build callback paths for these; other props are treated as plain data.
+    callback_props: frozenset[str] = frozenset()
+    # List/dict props diffed into path-based edits instead of being resent whole.
+    nested_diff_props: frozenset[str] = frozenset()
+    # Props that accept a StreamBuffer. Placement replaces a buffer passed here
+    # with a StreamWindow snapshot, so re-renders send only new samples.
+    stream_props: frozenset[str] = frozenset()
 
     def __init__(self, name: str, element_class: type[Element] = Element) -> None:
         self.name = name
@@ -56,6 +112,11 @@ class Component(ABC):
             raw_key = props.pop("key")
             if raw_key is not None:
                 key = str(raw_key)
+        if self.stream_props:
+            for name in self.stream_props:
+                value = props.get(name)
+                if isinstance(value, StreamBuffer):
+                    props[name] = value.window()
 
         # Ensure we're inside a render context - components cannot be created
         # in callbacks or other code outside of rendering
@@ -77,9 +138,9 @@ class Component(ABC):
         # We can only reuse if:
         # 1. Old element exists at this position
         # 2. Same component type
-        # 3. Same props
-        # 4. Element is mounted (has active ElementState with mounted=True)
-        # 5. Element is not dirty
+        # 3. Element is mounted (has active ElementState with mounted=True)
+        # 4. Element is not dirty
+        # 5. Same props (per the component's memo comparator, if it has one)
         old_element = session.elements.get(position_id)
         state = session.states.get(position_id)
         is_mounted = state is not None and state.mounted
@@ -88,9 +149,9 @@ class Component(ABC):
         if (
             old_element is not None
             and old_element.component == self
-            and old_element.props == props
             and is_mounted
             and not is_dirty
+            and self._props_unchanged(session, old_element.props, props)
         ):
             # For containers with `with` blocks, we must create a new element object.
             # The old_elements snapshot shares element references, so modifying
@@ -141,6 +202,26 @@ class Component(ABC):
 
         return element
 
+    def _props_unchanged(
+        self, session: RenderSession, old_props: dict[str, tp.Any], props: dict[str, tp.Any]
+    ) -> bool:
+        """Check whether new props let an existing element be reused.
+
+        Memoized components use their comparator, and each decision is
+        counted in the session's render stats.
+        """
+        if self.props_equal is None:
+            try:
+                return old_props == props
+            except ValueError:
+                # Array props (e.g. NumPy) have no single truth value; re-render
+                return False
+        if self.props_equal(old_props, props):
+            session.stats.memo_skips += 1
+            return True
+        session.stats.memo_misses += 1
+        return False
+
     def __call__(self, /, **props: tp.Any) -> Element:
         """Create an Element for this component invocation."""
         return self._place(**props)
@@ -7,6 +7,7 @@ import types
 import typing as tp
 
 from trellis.core.components.base import Component, ElementKind
+from trellis.core.components.memo import MemoOption, resolve_memo
 from trellis.core.rendering.element import ContainerElement, Element
 from trellis.core.rendering.traits import ContainerTrait
 from trellis.core.transforms import StateVarTransform, apply_transforms
@@ -37,6 +38,7 @@ class CompositionComponent(Component, tp.Generic[E_co]):
         render_func: RenderFunc,
         element_class: type[Element] | None = None,
         is_container: bool = False,
+        memo: MemoOption | None = None,
     ) -> None:
         if is_container:
             # Validate that the render function accepts a children parameter
@@ -66,6 +68,7 @@ class CompositionComponent(Component, tp.Generic[E_co]):
 
         super().__init__(name, element_class=resolved_class)
         self.render_func = render_func
+        self.props_equal = resolve_memo(memo)
 
     @property
     def is_container(self) -> bool:
@@ -98,6 +101,7 @@ def component(
     *,
     element_class: tp.Literal[None] = None,
     is_container: tp.Literal[True],
+    memo: MemoOption | None = None,
 ) -> tp.Callable[[RenderFunc], CompositionComponent[ContainerElement]]: ...
 
 
@@ -107,6 +111,7 @@ def component(
     *,
     element_class: tp.Literal[None] = None,
     is_container: tp.Literal[False] = False,
+    memo: MemoOption | None = None,
 ) -> tp.Callable[[RenderFunc], CompositionComponent[Element]]: ...
 
 
@@ -116,6 +121,7 @@ def component(
     *,
     element_class: type[E],
     is_container: bool = False,
+    memo: MemoOption | None = None,
 ) -> tp.Callable[[RenderFunc], CompositionComponent[E]]: ...
 
 
@@ -124,6 +130,7 @@ def component(
     *,
     element_class: type[E] | None = None,
     is_container: bool = False,
+    memo: MemoOption | None = None,
 ) -> CompositionComponent[Element] | tp.Callable[[RenderFunc], CompositionComponent[Element]]:
     """Decorator to create a component from a render function.
 
@@ -137,11 +144,24 @@ def component(
         @component(element_class=CustomElement)
         def MyWidget(): ...
 
+        @component(memo="identity")
+        def Row(cells: list[Cell]): ...
+
     Args:
         render_func: The render function (when used without parentheses).
         element_class: Optional Element subclass to use for this component's nodes.
         is_container: Whether this component accepts children via ``with`` blocks.
             When True, the render function must have a ``children`` parameter.
+        memo: How to decide that a placement's props are unchanged, so the
+            previous element is reused without re-executing. ``"identity"``
+            compares each prop with ``is``; ``"shallow"`` also accepts lists,
+            tuples and dicts holding the identical items; ``"version"``
+            compares only the ``version`` prop when present; a callable
+            ``(old_props, new_props) -> bool`` is used as-is. Defaults to full
+            deep equality.
+
+    Raises:
+        ValueError: If memo is an unknown comparator name.
     """
     _transforms = [StateVarTransform()]
 
@@ -149,14 +169,14 @@ def component(
         # Called without parentheses: @component
         transformed = tp.cast("RenderFunc", apply_transforms(render_func, _transforms))
         return CompositionComponent(
-            render_func.__name__, transformed, element_class, is_container=is_container
+            render_func.__name__, transformed, element_class, is_container=is_container, memo=memo
         )
 
     # Called with parentheses: @component(is_container=True, element_class=X)
     def decorator(func: RenderFunc) -> CompositionComponent[Element]:
         transformed = tp.cast("RenderFunc", apply_transforms(func, _transforms))
         return CompositionComponent(
-            func.__name__, transformed, element_class, is_container=is_container
+            func.__name__, transformed, element_class, is_container=is_container, memo=memo
         )
 
     return decorator
@@ -0,0 +1,123 @@
+"""Prop comparators for memoized components.
+
+A memoized component decides whether a placement can reuse the previous
+element using a comparator instead of full deep equality of its props. This
+lets components that receive large lists or dicts skip the O(n) compare (and
+the re-execution) when their inputs are unchanged by identity or by version.
+
+Comparators take the old and new props and return True when the component
+can be skipped.
+"""
+
+from __future__ import annotations
+
+import typing as tp
+from collections.abc import Callable, Mapping
+
+__all__ = [
+    "MemoOption",
+    "PropsComparator",
+    "identity_equal",
+    "resolve_memo",
+    "shallow_equal",
+    "version_equal",
+]
+
+type PropsComparator = Callable[[Mapping[str, tp.Any], Mapping[str, tp.Any]], bool]
+type MemoOption = tp.Literal["identity", "shallow", "version"] | PropsComparator
+
+
+def identity_equal(old: Mapping[str, tp.Any], new: Mapping[str, tp.Any]) -> bool:
+    """Props are equal if they have the same keys bound to the same objects.
+
+    Args:
+        old: Props from the previous placement
+        new: Props for this placement
+
+    Returns:
+        True if every prop value is the identical object
+    """
+    if old.keys() != new.keys():
+        return False
+    return all(old[key] is new[key] for key in new)
+
+
+def shallow_equal(old: Mapping[str, tp.Any], new: Mapping[str, tp.Any]) -> bool:
+    """Props are equal if they match one level deep.
+
+    Lists, tuples and dicts are equal if their items are the identical
+    objects, so a freshly built list of the same rows still matches without
+    comparing the rows themselves. Other values use ``==``.
+
+    Args:
+        old: Props from the previous placement
+        new: Props for this placement
+
+    Returns:
+        True if every prop value is shallowly equal
+    """
+    if old.keys() != new.keys():
+        return False
+    return all(_shallow_value_equal(old[key], new[key]) for key in new)
+
+
+def version_equal(old: Mapping[str, tp.Any], new: Mapping[str, tp.Any]) -> bool:
+    """Props are equal if they carry the same ``version`` stamp.
+
+    When both placements pass a ``version`` prop, only the versions are
+    compared and all other props are assumed unchanged. Without a version on
+    both sides this falls back to full equality.
+
+    Args:
+        old: Props from the previous placement
+        new: Props for this placement
+
+    Returns:
+        True if the versions match (or, without versions, the props are equal)
+    """
+    if "version" in old and "version" in new:
+        return bool(old["version"] == new["version"])
+    return bool(old == new)
+
+
+def resolve_memo(memo: MemoOption | None) -> PropsComparator | None:
+    """Resolve a ``memo=`` option to a comparator.
+
+    Args:
+        memo: A comparator name, a custom comparator, or None
+
+    Returns:
+        The comparator, or None to use the default deep equality
+
+    Raises:
+        ValueError: If memo is an unknown comparator name
+    """
+    if memo is None or callable(memo):
+        return memo
+    comparator = _NAMED_COMPARATORS.get(memo)
+    if comparator is None:
+        raise ValueError(
+            f"Unknown memo comparator {memo!r}. "
+            f"Expected one of {sorted(_NAMED_COMPARATORS)} or a callable."
+        )
+    return comparator
+
+
+def _shallow_value_equal(old: tp.Any, new: tp.Any) -> bool:
+    """Compare a single prop value one level deep."""
+    if old is new:
+        return True
+    if type(old) is not type(new):
+        return False
+    if isinstance(old, (list, tuple)):
+        return len(old) == len(new) and all(a is b for a, b in zip(old, new, strict=True))
+    if isinstance(old, dict):
+        return old.keys() == new.keys() and all(old[k] is new[k] for k in new)
+    return bool(old == new)
+
+
+_NAMED_COMPARATORS: dict[str, PropsComparator] = {
+    "identity": identity_equal,
+    "shallow": shallow_equal,
+    "version": version_equal,
+}
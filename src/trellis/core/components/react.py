@@ -9,7 +9,12 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Literal, ParamSpec
 
-from trellis.core.components.base import Component, ElementKind
+from trellis.core.components.base import (
+    Component,
+    ElementKind,
+    callback_props_from_signature,
+    stream_props_from_signature,
+)
 from trellis.core.rendering.element import ContainerElement, Element
 from trellis.core.rendering.traits import ContainerTrait
 from trellis.registry import ExportKind, registry
@@ -59,6 +64,7 @@ def react(
     is_container: Literal[True],
     packages: dict[str, str] | None = None,
     element_class: Literal[None] = None,
+    nested_diff_props: tp.Iterable[str] = (),
 ) -> Callable[[Callable[P, tp.Any]], Callable[P, ContainerElement]]: ...
 
 
@@ -70,6 +76,7 @@ def react(
     is_container: Literal[False] = ...,
     packages: dict[str, str] | None = None,
     element_class: Literal[None] = None,
+    nested_diff_props: tp.Iterable[str] = (),
 ) -> Callable[[Callable[P, tp.Any]], Callable[P, Element]]: ...
 
 
@@ -81,6 +88,7 @@ def react(
     is_container: bool = ...,
     packages: dict[str, str] | None = None,
     element_class: type[E],
+    nested_diff_props: tp.Iterable[str] = (),
 ) -> Callable[[Callable[P, tp.Any]], Callable[P, E]]: ...
 
 
@@ -91,6 +99,7 @@ def react(
     is_container: bool = False,
     packages: dict[str, str] | None = None,
     element_class: type[E] | None = None,
+    nested_diff_props: tp.Iterable[str] = (),
 ) -> Callable[[Callable[P, tp.Any]], Callable[P, Element | E]]:
     """Decorator that creates a React component wrapper and registers it with the bundler.
 
@@ -104,6 +113,9 @@ def react(
         is_container: Whether this component accepts children via ``with`` blocks.
         packages: NPM packages required by this component (name -> version).
         element_class: Element subclass to use for this component's nodes.
+        nested_diff_props: List or dict props that re-renders send as path-based
+            edits (set, delete, append, splice) instead of whole values. Suits
+            large data props that change a little at a time.
     """
     if element_class is not None:
         resolved_element_class: type[Element] = element_class
@@ -139,6 +151,16 @@ def react(
 
         # Create singleton instance
         _singleton = _Generated(func.__name__, element_class=resolved_element_class)
+        signature = inspect.signature(func)
+        _singleton.callback_props = callback_props_from_signature(signature)
+        _singleton.stream_props = stream_props_from_signature(signature)
+        nested = frozenset(nested_diff_props)
+        unknown = nested - signature.parameters.keys()
+        if unknown:
+            raise TypeError(
+                f"nested_diff_props names unknown props of {func.__name__}: {sorted(unknown)}"
+            )
+        _singleton.nested_diff_props = nested
 
         # Register module with the bundler
         module_name = f"{func.__module__}.{func.__qualname__}".replace(".", "-")
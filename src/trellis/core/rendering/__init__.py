@@ -1,11 +1,21 @@
 """Render pipeline for the Trellis UI framework."""
 
 from trellis.core.rendering.active import ActiveRender
+from trellis.core.rendering.batch import batch
+from trellis.core.rendering.callback_table import CallbackEntry, CallbackTable
 from trellis.core.rendering.child_ref import ChildRef
+from trellis.core.rendering.dependency_index import DependencyIndex
 from trellis.core.rendering.dirty_tracker import DirtyTracker
-from trellis.core.rendering.element import ContainerElement, Element, diff_props
+from trellis.core.rendering.element import (
+    ContainerElement,
+    Element,
+    PropOp,
+    PropOps,
+    diff_props,
+)
+from trellis.core.rendering.element_ids import ElementIdTable
 from trellis.core.rendering.element_state import ElementState, ElementStateStore
-from trellis.core.rendering.element_store import ElementStore
+from trellis.core.rendering.element_store import ElementSnapshot, ElementStore
 from trellis.core.rendering.frames import Frame, FrameStack
 from trellis.core.rendering.lifecycle import LifecycleTracker
 from trellis.core.rendering.on_key_trait import OnKeyTrait
@@ -17,7 +27,7 @@ from trellis.core.rendering.patches import (
     RenderUpdatePatch,
 )
 from trellis.core.rendering.reconcile import reconcile_children
-from trellis.core.rendering.render import render
+from trellis.core.rendering.render import PendingHooks, render, render_pass, render_sliced
 from trellis.core.rendering.session import (
     RenderSession,
     get_render_session,
@@ -25,15 +35,21 @@ from trellis.core.rendering.session import (
     is_render_active,
     set_render_session,
 )
+from trellis.core.rendering.stats import RenderStats
 from trellis.core.rendering.traits import ContainerTrait, KeyTrait
 
 __all__ = [
     "ActiveRender",
+    "CallbackEntry",
+    "CallbackTable",
     "ChildRef",
     "ContainerElement",
     "ContainerTrait",
+    "DependencyIndex",
     "DirtyTracker",
     "Element",
+    "ElementIdTable",
+    "ElementSnapshot",
     "ElementState",
     "ElementStateStore",
     "ElementStore",
@@ -43,16 +59,23 @@ __all__ = [
     "LifecycleTracker",
     "OnKeyTrait",
     "PatchCollector",
+    "PendingHooks",
+    "PropOp",
+    "PropOps",
     "RenderAddPatch",
     "RenderPatch",
     "RenderRemovePatch",
     "RenderSession",
+    "RenderStats",
     "RenderUpdatePatch",
+    "batch",
     "diff_props",
     "get_render_session",
     "get_session_registry",
     "is_render_active",
     "reconcile_children",
     "render",
+    "render_pass",
+    "render_sliced",
     "set_render_session",
 ]
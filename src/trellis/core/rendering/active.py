@@ -9,7 +9,7 @@ from __future__ import annotations
 import typing as tp
 from dataclasses import dataclass, field
 
-from trellis.core.rendering.element_store import ElementStore
+from trellis.core.rendering.element_store import ElementSnapshot
 from trellis.core.rendering.frames import FrameStack
 from trellis.core.rendering.lifecycle import LifecycleTracker
 from trellis.core.rendering.patches import PatchCollector
@@ -28,7 +28,7 @@ class ActiveRender:
         frames: Stack of Frames for collecting child element IDs
         patches: Collector for patches generated during this render
         lifecycle: Tracker for pending mount/unmount hooks
-        old_elements: Snapshot of elements from before render (for diffing)
+        old_elements: Copy-on-write snapshot of elements from before render (for diffing)
         current_element_id: ID of the element currently being executed
         last_property_access: Last Stateful property access (for mutable/callback capture)
     """
@@ -36,7 +36,7 @@ class ActiveRender:
     frames: FrameStack = field(default_factory=FrameStack)
     patches: PatchCollector = field(default_factory=PatchCollector)
     lifecycle: LifecycleTracker = field(default_factory=LifecycleTracker)
-    old_elements: ElementStore = field(default_factory=ElementStore)
+    old_elements: ElementSnapshot = field(default_factory=ElementSnapshot)
 
     # Execution context
     current_element_id: str | None = None
@@ -0,0 +1,133 @@
+"""Batched state transactions.
+
+Inside a batch() block, marking elements dirty is deferred: each
+DirtyTracker.mark() only records the element ID. When the outermost batch
+exits, the recorded IDs are deduplicated and flushed into each session's
+DirtyTracker with a single lock acquisition per session.
+
+Other work that should run once per batch rather than once per change
+(such as re-evaluating a computed value) can be deferred with defer_call().
+Deferred calls run first when the batch exits, and any marks they make are
+flushed with the rest.
+
+Callback dispatch wraps synchronous callbacks in a batch automatically, so
+a handler that updates hundreds of tracked values pays for one flush.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import typing as tp
+from collections.abc import Callable
+from contextlib import contextmanager
+
+if tp.TYPE_CHECKING:
+    from trellis.core.rendering.dirty_tracker import DirtyTracker
+
+__all__ = ["batch", "defer_call", "defer_mark", "in_batch"]
+
+
+class _Pending:
+    """Work deferred by the active batch."""
+
+    __slots__ = ("calls", "marks")
+
+    def __init__(self) -> None:
+        # DirtyTracker -> element IDs marked during the batch, in mark order
+        self.marks: dict[DirtyTracker, dict[str, None]] = {}
+        # Deferred calls, deduplicated, in first-deferred order
+        self.calls: dict[Callable[[], None], None] = {}
+
+
+_pending: contextvars.ContextVar[_Pending | None] = contextvars.ContextVar(
+    "trellis_batch", default=None
+)
+
+
+@contextmanager
+def batch() -> tp.Generator[None]:
+    """Coalesce dirty notifications until the block exits.
+
+    State changes inside the block take effect immediately, but the elements
+    that depend on them are marked dirty only once, when the outermost batch
+    exits (even if it exits with an exception). Nested batches join the
+    outermost one.
+
+    Batches are scoped to the current thread or asyncio task. Can also be
+    used as a decorator.
+
+    Example:
+        ```python
+        def on_refresh() -> None:
+            with batch():
+                for row in state.rows:
+                    row.selected = False
+        ```
+
+    Yields:
+        None
+    """
+    if _pending.get() is not None:
+        yield
+        return
+
+    pending = _Pending()
+    token = _pending.set(pending)
+    try:
+        yield
+    finally:
+        try:
+            # Deferred calls may mark elements or defer further calls
+            while pending.calls:
+                calls = list(pending.calls)
+                pending.calls.clear()
+                for call in calls:
+                    call()
+        finally:
+            _pending.reset(token)
+            for tracker, element_ids in pending.marks.items():
+                tracker.mark_many(element_ids)
+
+
+def in_batch() -> bool:
+    """Check whether a batch is active in the current context."""
+    return _pending.get() is not None
+
+
+def defer_mark(tracker: DirtyTracker, element_id: str) -> bool:
+    """Record a dirty mark for the active batch, if there is one.
+
+    Args:
+        tracker: The DirtyTracker the mark is destined for
+        element_id: The element to mark dirty
+
+    Returns:
+        True if the mark was deferred, False if no batch is active
+    """
+    pending = _pending.get()
+    if pending is None:
+        return False
+    element_ids = pending.marks.get(tracker)
+    if element_ids is None:
+        element_ids = pending.marks[tracker] = {}
+    element_ids[element_id] = None
+    return True
+
+
+def defer_call(call: Callable[[], None]) -> bool:
+    """Run call once when the active batch exits, if there is one.
+
+    Deferring the same callable (or an equal bound method) several times
+    runs it once.
+
+    Args:
+        call: The function to run
+
+    Returns:
+        True if the call was deferred, False if no batch is active
+    """
+    pending = _pending.get()
+    if pending is None:
+        return False
+    pending.calls[call] = None
+    return True
@@ -0,0 +1,172 @@
+"""Compact integer handles for callbacks.
+
+CallbackTable maps small, session-local integer handles to the element and
+prop path a callback lives at. Serialization sends the handle in place of the
+callback, and the client sends it back with each event. Paths are parsed once
+when a handle is allocated, so resolving an event is a dict lookup followed by
+a short walk of the element's props.
+"""
+
+from __future__ import annotations
+
+import re
+import typing as tp
+from collections.abc import Container
+
+__all__ = ["CallbackEntry", "CallbackTable", "parse_prop_path", "resolve_prop_path"]
+
+# Pattern to parse prop paths: matches "name", "[0]", or ".name" segments
+_PATH_SEGMENT_RE = re.compile(r"^([a-zA-Z_][a-zA-Z0-9_]*)|^\[(\d+)\]|^\.([a-zA-Z_][a-zA-Z0-9_]*)")
+
+
+def parse_prop_path(path: str) -> tuple[str | int, ...] | None:
+    """Split a prop path such as ``columns[1].render`` into its segments.
+
+    Args:
+        path: The prop path to parse
+
+    Returns:
+        Dict keys (str) and list indices (int) in order, or None if the path
+        is malformed
+    """
+    segments: list[str | int] = []
+    pos = 0
+    while pos < len(path):
+        match = _PATH_SEGMENT_RE.match(path[pos:])
+        if not match:
+            return None
+        if match.group(2) is not None:
+            segments.append(int(match.group(2)))
+        else:
+            segments.append(match.group(1) or match.group(3))
+        pos += match.end()
+    return tuple(segments)
+
+
+def resolve_prop_path(props: dict[str, tp.Any], segments: tuple[str | int, ...]) -> tp.Any:
+    """Resolve parsed path segments against a props dict.
+
+    Args:
+        props: The element's props
+        segments: Segments returned by parse_prop_path()
+
+    Returns:
+        The value at the path, or None if any segment is missing
+    """
+    value: tp.Any = props
+    for segment in segments:
+        if isinstance(segment, int):
+            if not isinstance(value, (list, tuple)) or segment >= len(value):
+                return None
+        elif not isinstance(value, dict) or segment not in value:
+            return None
+        value = value[segment]
+    return value
+
+
+class CallbackEntry(tp.NamedTuple):
+    """Where a callback handle points: an element and a prop path within it."""
+
+    element_id: str
+    path: str
+    # None if the path could not be parsed; such entries never resolve
+    segments: tuple[str | int, ...] | None
+
+    def lookup(self, props: dict[str, tp.Any]) -> tp.Callable[..., tp.Any] | None:
+        """Get the callable at this entry's path in the given props.
+
+        Args:
+            props: Current props of the entry's element
+
+        Returns:
+            The callable, or None if the path no longer holds one
+        """
+        if self.segments is None:
+            return None
+        value = resolve_prop_path(props, self.segments)
+        if value is not None and callable(value):
+            return tp.cast("tp.Callable[..., tp.Any]", value)
+        return None
+
+
+class CallbackTable:
+    """Session-local mapping between (element ID, prop path) and integer handles.
+
+    A path keeps its handle for as long as its element stays in the element
+    store, so re-serializing unchanged props yields identical handles. Handles
+    are never reused within a session, so an event for a removed callback can
+    never reach a newer one.
+
+    Like ElementIdTable, removed elements are released lazily: their handles
+    remain resolvable until the next collect().
+    """
+
+    __slots__ = ("_by_element", "_entries", "_handles", "_next_handle", "_released")
+
+    def __init__(self) -> None:
+        self._handles: dict[tuple[str, str], int] = {}
+        self._entries: dict[int, CallbackEntry] = {}
+        self._by_element: dict[str, list[int]] = {}
+        self._released: list[str] = []
+        # Start at 1 so a handle is never falsy on the client
+        self._next_handle = 1
+
+    def register(self, element_id: str, path: str) -> int:
+        """Get the handle for a callback path, allocating one if needed.
+
+        Args:
+            element_id: The ID of the element whose props hold the callback
+            path: Prop path of the callback (e.g. ``on_click`` or ``items[0].on_select``)
+
+        Returns:
+            The callback's integer handle
+        """
+        key = (element_id, path)
+        handle = self._handles.get(key)
+        if handle is None:
+            handle = self._next_handle
+            self._next_handle += 1
+            self._handles[key] = handle
+            self._entries[handle] = CallbackEntry(element_id, path, parse_prop_path(path))
+            self._by_element.setdefault(element_id, []).append(handle)
+        return handle
+
+    def resolve(self, handle: int) -> CallbackEntry | None:
+        """Get the element and path for a handle.
+
+        Args:
+            handle: An integer handle previously returned by register()
+
+        Returns:
+            The entry, or None if the handle is unknown or collected
+        """
+        return self._entries.get(handle)
+
+    def release(self, element_id: str) -> None:
+        """Mark an element's callback handles for removal at the next collect().
+
+        Args:
+            element_id: The ID of an element removed from the tree
+        """
+        if element_id in self._by_element:
+            self._released.append(element_id)
+
+    def collect(self, live: Container[str]) -> None:
+        """Drop handles of elements released since the last collect.
+
+        Elements that are live again (re-added after release) keep their handles.
+
+        Args:
+            live: Element IDs currently in the tree
+        """
+        for element_id in self._released:
+            if element_id in live:
+                continue
+            for handle in self._by_element.pop(element_id, ()):
+                entry = self._entries.pop(handle)
+                del self._handles[entry.element_id, entry.path]
+        self._released.clear()
+
+    def __len__(self) -> int:
+        """Return number of registered callback handles."""
+        return len(self._entries)
@@ -0,0 +1,278 @@
+"""Session-level index of state dependencies.
+
+DependencyIndex records which watchers (elements, or any other
+StateDependency) read which pieces of state during a render session, and
+answers "who depends on X" when that state changes. It replaces per-source
+WeakSets of watchers: an edge is a single int -> int dict entry instead of
+a weak reference, and re-executing an element invalidates all of its old
+edges at once by bumping a generation counter.
+"""
+
+from __future__ import annotations
+
+import typing as tp
+import weakref
+from collections.abc import Hashable
+
+if tp.TYPE_CHECKING:
+    from trellis.core.state.dependency import StateDependency
+
+__all__ = ["DependencyIndex"]
+
+# Stale edges are swept in bulk once there are more than this many and they
+# outnumber live edges
+_COMPACT_THRESHOLD = 1024
+
+
+class DependencyIndex:
+    """Session-scoped mapping from (source, key) to the watchers that read it.
+
+    Sources are the objects that own state: a Stateful instance keyed by
+    attribute name, or a tracked collection keyed by item. Watchers are
+    assigned compact integer slots; each element keeps its slot across
+    re-renders, with a generation counter that is bumped whenever the
+    element re-executes. An edge records the generation it was created in,
+    so edges from earlier executions are stale without being touched.
+
+    Stale edges are pruned lazily when their source changes, and swept in
+    bulk once there are enough of them. Edges of a source are dropped when
+    the source is garbage collected.
+
+    Sources remember which indexes hold edges for them, so a change to state
+    shared between sessions notifies every session that read it.
+    """
+
+    __slots__ = (
+        "__weakref__",
+        "_active",
+        "_active_slot",
+        "_dep_slots",
+        "_edges",
+        "_generations",
+        "_keys_by_source",
+        "_live",
+        "_live_counts",
+        "_next_slot",
+        "_slots",
+        "_sources",
+        "_stale",
+        "_watchers",
+    )
+
+    def __init__(self) -> None:
+        # (source id, key) -> {watcher slot: generation when read}
+        self._edges: dict[tuple[int, tp.Any], dict[int, int]] = {}
+        # Source id -> keys with edges, in first-read order
+        self._keys_by_source: dict[int, dict[tp.Any, None]] = {}
+        self._sources: dict[int, weakref.KeyedRef] = {}
+        # Watcher key (element ID, or the dependency itself) -> slot
+        self._slots: dict[Hashable, int] = {}
+        self._watchers: dict[int, StateDependency] = {}
+        # Latest dependency of each slot -> slot, for reads by a dependency
+        # other than the one that last started executing
+        self._dep_slots: dict[StateDependency, int] = {}
+        self._generations: dict[int, int] = {}
+        # Live edges per slot in its current generation
+        self._live_counts: dict[int, int] = {}
+        self._live = 0
+        self._stale = 0
+        self._next_slot = 0
+        # Cache for the dependency currently being executed
+        self._active: StateDependency | None = None
+        self._active_slot = -1
+
+    def watch(self, dep: StateDependency, key: Hashable | None = None) -> None:
+        """Start a new execution of a watcher, invalidating its previous reads.
+
+        Args:
+            dep: The dependency about to execute (and be notified on changes)
+            key: Stable identity of the watcher across re-renders, such as an
+                element ID. Defaults to the dependency itself.
+        """
+        slot = self._slot_of(dep, dep if key is None else key)
+        self._generations[slot] += 1
+        self._retire(self._live_counts[slot])
+        self._live_counts[slot] = 0
+        self._maybe_compact()
+
+    def drop(self, key: Hashable) -> None:
+        """Forget a watcher, e.g. when its element is removed from the tree.
+
+        Args:
+            key: The key the watcher was registered under
+        """
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            return
+        del self._dep_slots[self._watchers.pop(slot)]
+        del self._generations[slot]
+        self._retire(self._live_counts.pop(slot))
+        if self._active_slot == slot:
+            self._active = None
+            self._active_slot = -1
+        self._maybe_compact()
+
+    def add(self, source: object, key: tp.Any, dep: StateDependency) -> None:
+        """Record that dep read source[key].
+
+        Args:
+            source: The object owning the state (Stateful or tracked collection)
+            key: Which part of the source was read
+            dep: The active dependency doing the read
+        """
+        if dep is self._active:
+            slot = self._active_slot
+        else:
+            slot = self._dep_slots.get(dep)
+            if slot is None:
+                slot = self._slot_of(dep, dep)
+        source_id = id(source)
+        if source_id not in self._sources:
+            self._add_source(source, source_id)
+
+        edge_key = (source_id, key)
+        edges = self._edges.get(edge_key)
+        if edges is None:
+            edges = self._edges[edge_key] = {}
+            self._keys_by_source[source_id][key] = None
+
+        generation = self._generations[slot]
+        previous = edges.get(slot)
+        if previous == generation:
+            return
+        if previous is not None:
+            self._stale -= 1
+        edges[slot] = generation
+        self._live_counts[slot] += 1
+        self._live += 1
+
+    def notify(self, source: object, key: tp.Any) -> None:
+        """Notify the watchers that read source[key] in their latest execution.
+
+        Args:
+            source: The object owning the state that changed
+            key: Which part of the source changed
+        """
+        edges = self._edges.get((id(source), key))
+        if not edges:
+            return
+        generations = self._generations
+        for slot, generation in list(edges.items()):
+            if generations.get(slot) == generation:
+                self._watchers[slot].notify_dirty()
+            else:
+                del edges[slot]
+                self._stale -= 1
+
+    def watchers(self, source: object, key: tp.Any) -> list[StateDependency]:
+        """Get the watchers that read source[key] in their latest execution.
+
+        Args:
+            source: The object owning the state
+            key: Which part of the source
+
+        Returns:
+            The live watchers, in no particular order
+        """
+        edges = self._edges.get((id(source), key), {})
+        generations = self._generations
+        return [
+            self._watchers[slot]
+            for slot, generation in edges.items()
+            if generations.get(slot) == generation
+        ]
+
+    def keys(self, source: object) -> list[tp.Any]:
+        """Get the keys of source that have (possibly stale) edges.
+
+        Args:
+            source: The object owning the state
+
+        Returns:
+            Keys in first-read order
+        """
+        return list(self._keys_by_source.get(id(source), ()))
+
+    def compact(self) -> None:
+        """Drop all stale edges."""
+        generations = self._generations
+        for edge_key, edges in list(self._edges.items()):
+            for slot, generation in list(edges.items()):
+                if generations.get(slot) != generation:
+                    del edges[slot]
+            if not edges:
+                del self._edges[edge_key]
+                del self._keys_by_source[edge_key[0]][edge_key[1]]
+        self._stale = 0
+
+    @property
+    def edge_count(self) -> int:
+        """Number of live edges."""
+        return self._live
+
+    @property
+    def stale_count(self) -> int:
+        """Number of stale edges not yet pruned."""
+        return self._stale
+
+    def __len__(self) -> int:
+        """Return number of registered watchers."""
+        return len(self._watchers)
+
+    def _slot_of(self, dep: StateDependency, key: Hashable) -> int:
+        """Get the slot for a watcher, allocating one if needed."""
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._next_slot
+            self._next_slot += 1
+            self._slots[key] = slot
+            self._generations[slot] = 0
+            self._live_counts[slot] = 0
+        # Elements are replaced on re-render; notify the latest one
+        previous = self._watchers.get(slot)
+        if previous is not dep:
+            if previous is not None:
+                del self._dep_slots[previous]
+            self._watchers[slot] = dep
+            self._dep_slots[dep] = slot
+        self._active = dep
+        self._active_slot = slot
+        return slot
+
+    def _add_source(self, source: object, source_id: int) -> None:
+        """Start indexing a source and let it know to notify this index."""
+        self._sources[source_id] = weakref.KeyedRef(source, self._forget_source, source_id)
+        self._keys_by_source[source_id] = {}
+        indexes: weakref.WeakSet[DependencyIndex] | None = getattr(
+            source, "_dependency_indexes", None
+        )
+        if indexes is None:
+            indexes = weakref.WeakSet()
+            object.__setattr__(source, "_dependency_indexes", indexes)
+        indexes.add(self)
+
+    def _forget_source(self, ref: weakref.KeyedRef) -> None:
+        """Drop all edges of a source that was garbage collected."""
+        source_id = ref.key
+        if self._sources.get(source_id) is not ref:
+            return
+        del self._sources[source_id]
+        generations = self._generations
+        for key in self._keys_by_source.pop(source_id, ()):
+            edges = self._edges.pop((source_id, key), {})
+            for slot, generation in edges.items():
+                if generations.get(slot) == generation:
+                    self._live_counts[slot] -= 1
+                    self._live -= 1
+                else:
+                    self._stale -= 1
+
+    def _retire(self, count: int) -> None:
+        """Move a watcher's live edges to the stale count."""
+        self._live -= count
+        self._stale += count
+
+    def _maybe_compact(self) -> None:
+        """Sweep stale edges once they dominate the index."""
+        if self._stale > _COMPACT_THRESHOLD and self._stale > self._live:
+            self.compact()
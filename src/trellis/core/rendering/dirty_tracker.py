@@ -1,12 +1,16 @@
 """Dirty element tracking for incremental rendering.
 
-DirtyTracker manages the set of element IDs that need re-rendering.
+DirtyTracker manages the set of element IDs that need re-rendering and
+hands them out shallowest-first, so ancestors render before descendants.
 """
 
 from __future__ import annotations
 
+import heapq
 import threading
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator
+
+from trellis.core.rendering.batch import defer_mark
 
 __all__ = ["DirtyTracker"]
 
@@ -17,15 +21,32 @@ class DirtyTracker:
     Elements are marked dirty when their state changes. The render loop
     processes dirty elements and clears their dirty status.
 
+    Dirty IDs are queued in a heap keyed on tree depth (resolved via the
+    depth resolver installed by the session). pop() always returns the
+    shallowest dirty element, so when a parent and its children are both
+    dirty the parent renders first and re-renders the children inline,
+    clearing them before they would be popped on their own.
+
     The mark() method acquires the session lock to ensure that state
     updates from other threads block while a render is in progress.
+
+    An optional on-dirty callback is invoked whenever the tracker goes from
+    clean to dirty, letting the render loop sleep until there is work
+    instead of polling.
+
+    Inside a batch() block, mark() is deferred and the batch flushes all of
+    its marks through mark_many() when it exits.
     """
 
-    __slots__ = ("_dirty_ids", "_lock")
+    __slots__ = ("_depth_of", "_dirty_ids", "_heap", "_lock", "_on_dirty", "_seq")
 
     def __init__(self, lock: threading.RLock | None = None) -> None:
         self._dirty_ids: set[str] = set()
+        self._heap: list[tuple[int, int, str]] = []
+        self._seq = 0
         self._lock = lock
+        self._depth_of: Callable[[str], int] | None = None
+        self._on_dirty: Callable[[], None] | None = None
 
     def set_lock(self, lock: threading.RLock) -> None:
         """Set the lock to use for thread-safe mark() operations.
@@ -35,6 +56,25 @@ class DirtyTracker:
         """
         self._lock = lock
 
+    def set_depth_resolver(self, depth_of: Callable[[str], int]) -> None:
+        """Set the function used to order dirty elements by tree depth.
+
+        Args:
+            depth_of: Returns the depth of an element ID (root is 0)
+        """
+        self._depth_of = depth_of
+
+    def set_on_dirty(self, on_dirty: Callable[[], None] | None) -> None:
+        """Set the callback invoked when the tracker goes from clean to dirty.
+
+        The callback runs on the marking thread while the session lock is
+        held, so it must be cheap and must not render.
+
+        Args:
+            on_dirty: Callback to invoke, or None to remove it
+        """
+        self._on_dirty = on_dirty
+
     def mark(self, element_id: str) -> None:
         """Mark an element ID as dirty.
 
@@ -45,11 +85,39 @@ class DirtyTracker:
         Args:
             element_id: The ID of the element to mark dirty
         """
+        if defer_mark(self, element_id):
+            return
+        if self._lock is not None:
+            with self._lock:
+                self._push(element_id)
+        else:
+            self._push(element_id)
+
+    def mark_many(self, element_ids: Iterable[str]) -> None:
+        """Mark several element IDs as dirty under a single lock acquisition.
+
+        Args:
+            element_ids: The IDs of the elements to mark dirty
+        """
         if self._lock is not None:
             with self._lock:
-                self._dirty_ids.add(element_id)
+                for element_id in element_ids:
+                    self._push(element_id)
         else:
-            self._dirty_ids.add(element_id)
+            for element_id in element_ids:
+                self._push(element_id)
+
+    def _push(self, element_id: str) -> None:
+        """Add an element ID to the dirty set and depth queue."""
+        if element_id in self._dirty_ids:
+            return
+        was_clean = not self._dirty_ids
+        self._dirty_ids.add(element_id)
+        depth = self._depth_of(element_id) if self._depth_of is not None else 0
+        self._seq += 1
+        heapq.heappush(self._heap, (depth, self._seq, element_id))
+        if was_clean and self._on_dirty is not None:
+            self._on_dirty()
 
     def clear(self, element_id: str) -> None:
         """Clear dirty status for an element ID.
@@ -57,15 +125,25 @@ class DirtyTracker:
         Args:
             element_id: The ID of the element to clear
         """
-        self._dirty_ids.discard(element_id)
+        self.discard(element_id)
 
-    def discard(self, element_id: str) -> None:
-        """Remove an element ID from dirty set (alias for clear).
+    def discard(self, element_id: str) -> bool:
+        """Remove an element ID from dirty set.
+
+        The depth queue entry is dropped lazily when it reaches the front.
 
         Args:
             element_id: The ID of the element to remove
+
+        Returns:
+            True if the element was dirty, False otherwise
         """
+        if element_id not in self._dirty_ids:
+            return False
         self._dirty_ids.discard(element_id)
+        if not self._dirty_ids:
+            self._heap.clear()
+        return True
 
     def has_dirty(self) -> bool:
         """Check if there are any dirty elements.
@@ -79,20 +157,24 @@ class DirtyTracker:
         """Pop and return all dirty element IDs, clearing the set.
 
         Returns:
-            List of all dirty element IDs
+            List of all dirty element IDs, shallowest first
         """
-        ids = list(self._dirty_ids)
-        self._dirty_ids.clear()
+        ids: list[str] = []
+        while (element_id := self.pop()) is not None:
+            ids.append(element_id)
         return ids
 
     def pop(self) -> str | None:
-        """Pop and return one dirty ID, or None if empty.
+        """Pop and return the shallowest dirty ID, or None if empty.
 
         Returns:
             A dirty element ID, or None if no dirty elements
         """
-        if self._dirty_ids:
-            return self._dirty_ids.pop()
+        while self._heap:
+            _, _, element_id = heapq.heappop(self._heap)
+            if element_id in self._dirty_ids:
+                self._dirty_ids.discard(element_id)
+                return element_id
         return None
 
     def __contains__(self, element_id: str) -> bool:
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import typing as tp
 import weakref
+from collections.abc import Container
 from dataclasses import dataclass, field
 
 from trellis.core.rendering.on_key_trait import OnKeyTrait
 from trellis.core.rendering.traits import ContainerTrait, KeyTrait
 from trellis.core.state.mutable import Mutable
 from trellis.core.state.ref import RefTrait
+from trellis.core.state.stream import StreamWindow
 
 if tp.TYPE_CHECKING:
     from trellis.core.components.base import Component
@@ -17,6 +19,8 @@ __all__ = [
     "_REMOVED",
     "ContainerElement",
     "Element",
+    "PropOp",
+    "PropOps",
     "diff_props",
 ]
 
@@ -36,8 +40,8 @@ class Element(OnKeyTrait, KeyTrait, RefTrait):
     def __hash__(self) -> int:
         """Hash based on id, session, and render_count for stable identity.
 
-        This allows elements to be used in WeakSets for dependency tracking,
-        where identity matters more than content equality.
+        This allows elements to be used as set and dict keys (such as
+        context watchers), where identity matters more than content equality.
         """
         return hash(
             (self.id, id(self._session_ref()) if self._session_ref() else None, self.render_count)
@@ -89,23 +93,75 @@ _REMOVED = _RemovedType()
 _MISSING = object()
 
 
-def diff_props(old_props: dict[str, tp.Any], new_props: dict[str, tp.Any]) -> dict[str, tp.Any]:
+@dataclass(frozen=True, slots=True)
+class PropOp:
+    """One path-based edit inside a list or dict prop.
+
+    Attributes:
+        op: "set" stores value at path; "delete" removes the dict key at path;
+            "append" extends the list at path with items; "splice" replaces
+            ``delete`` items of the list at path, starting at index, with items
+        path: Dict keys (str) and list indices (int) from the prop value down
+        value: New value for "set"; the inserted items for "append" and "splice"
+        index: Position of the first inserted item for "append" and "splice"
+        delete: Number of items "splice" removes
+    """
+
+    op: tp.Literal["set", "delete", "append", "splice"]
+    path: tuple[str | int, ...]
+    value: tp.Any = None
+    index: int = 0
+    delete: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class PropOps:
+    """Diff entry for a nested prop: edits to apply to the old value in order."""
+
+    ops: tuple[PropOp, ...]
+
+
+def diff_props(
+    old_props: dict[str, tp.Any],
+    new_props: dict[str, tp.Any],
+    *,
+    nested: Container[str] = (),
+) -> dict[str, tp.Any]:
     """Compute the diff between old and new props dicts.
 
     Returns only changed/added/removed keys:
     - Added or changed keys map to their new value
     - Removed keys map to _REMOVED sentinel
+    - Changed keys listed in ``nested`` map to a PropOps when both values are
+      lists or both are dicts and the edits are much smaller than the new value
+    - Changed StreamWindows of the same buffer map to a PropOps that evicts
+      and appends just the items that left and entered the window
 
     Maintains the same semantics as the old props_equal:
     - All callables are considered equal (they serialize to {"__callback__": ...})
     - Mutables compare by snapshot (their __eq__)
     - Other values compare normally
+
+    Args:
+        old_props: Props from the previous render
+        new_props: Props from this render
+        nested: Keys that may be diffed structurally instead of replaced
     """
     diff: dict[str, tp.Any] = {}
 
     for key, new_val in new_props.items():
         old_val = old_props.get(key, _MISSING)
         if old_val is _MISSING or not _values_equal(old_val, new_val):
+            if type(new_val) is StreamWindow and type(old_val) is StreamWindow:
+                stream_ops = _diff_stream(old_val, new_val)
+                if stream_ops is not None:
+                    diff[key] = PropOps(tuple(stream_ops))
+                    continue
+            elif key in nested:
+                ops = _diff_nested(old_val, new_val, ())
+                if ops is not None:
+                    diff[key] = PropOps(tuple(ops))
+                    continue
             diff[key] = new_val
 
     for key in old_props:
@@ -115,6 +171,202 @@ def diff_props(old_props: dict[str, tp.Any], new_props: dict[str, tp.Any]) -> di
     return diff
 
 
+_LIST_TYPES = (list, tuple)
+
+
+def _diff_nested(old: tp.Any, new: tp.Any, path: tuple[str | int, ...]) -> list[PropOp] | None:
+    """Compute edits turning old into new, if cheaper than sending new whole.
+
+    Args:
+        old: Previous value
+        new: Current value, known to differ from old
+        path: Location of the values within the prop
+
+    Returns:
+        Edits in application order, or None if the values are not both lists
+        or both dicts, or the edits would carry at least half as many items
+        as new itself
+    """
+    ops: list[PropOp] = []
+    if isinstance(old, _LIST_TYPES) and isinstance(new, _LIST_TYPES):
+        _diff_list(old, new, path, ops)
+    elif isinstance(old, dict) and isinstance(new, dict):
+        _diff_dict(old, new, path, ops)
+    else:
+        return None
+    weight = sum(map(_op_weight, ops))
+    if not _exceeds(new, 2 * weight):
+        return None
+    return ops
+
+
+def _diff_stream(old: StreamWindow, new: StreamWindow) -> list[PropOp] | None:
+    """Compute the evict and append edits between two windows of a stream.
+
+    Columnar buffers get the same edits for each column.
+
+    Returns:
+        Edits in application order, or None if the whole window must be resent
+    """
+    delta = new.delta(old)
+    if delta is None:
+        return None
+    evicted, position, appended = delta
+    if new.buffer.columns is None:
+        paths: list[tuple[str | int, ...]] = [()]
+        columns = [appended]
+    else:
+        paths = [(index,) for index in range(len(appended))]
+        columns = appended
+    ops: list[PropOp] = []
+    for path, items in zip(paths, columns, strict=True):
+        if evicted:
+            ops.append(PropOp("splice", path, [], index=0, delete=evicted))
+        if items:
+            ops.append(PropOp("append", path, items, index=position))
+    return ops
+
+
+def _diff_list(
+    old: tp.Sequence[tp.Any],
+    new: tp.Sequence[tp.Any],
+    path: tuple[str | int, ...],
+    ops: list[PropOp],
+) -> None:
+    """Append edits for a list that kept a common prefix and suffix."""
+    old_len = len(old)
+    new_len = len(new)
+
+    # Streaming data usually grows at the end; check that with one C-level compare
+    if new_len > old_len and _items_equal(new[:old_len], old):
+        ops.append(PropOp("append", path, list(new[old_len:]), index=old_len))
+        return
+
+    # Sliding windows drop items from the front as they append at the end
+    if old_len and new_len:
+        shift = max(_index_of(old, new[0], 1), 0)
+        kept = old_len - shift
+        if shift and kept <= new_len and _items_equal(new[:kept], old[shift:]):
+            ops.append(PropOp("splice", path, [], index=0, delete=shift))
+            if new_len > kept:
+                ops.append(PropOp("append", path, list(new[kept:]), index=kept))
+            return
+
+    start = 0
+    limit = min(old_len, new_len)
+    while start < limit and (old[start] is new[start] or _values_equal(old[start], new[start])):
+        start += 1
+    old_end = old_len
+    new_end = new_len
+    while (
+        old_end > start
+        and new_end > start
+        and (
+            old[old_end - 1] is new[new_end - 1]
+            or _values_equal(old[old_end - 1], new[new_end - 1])
+        )
+    ):
+        old_end -= 1
+        new_end -= 1
+
+    if start == old_len:
+        ops.append(PropOp("append", path, list(new[start:]), index=start))
+    elif old_end - start == new_end - start:
+        # Same-size middle: edit changed positions in place
+        for index in range(start, old_end):
+            if not _values_equal(old[index], new[index]):
+                _diff_item(old[index], new[index], (*path, index), ops)
+    else:
+        ops.append(
+            PropOp("splice", path, list(new[start:new_end]), index=start, delete=old_end - start)
+        )
+
+
+def _index_of(items: tp.Sequence[tp.Any], value: tp.Any, start: int) -> int:
+    """Find value in items from start on, comparing arrays by content.
+
+    Returns:
+        The index of the first equal item, or -1 if there is none
+    """
+    try:
+        return items.index(value, start)
+    except ValueError:
+        pass
+    # list.index raises the same ValueError when comparing arrays, which have
+    # no truth value; only scan item by item if value is such an array
+    try:
+        memoryview(value)
+    except TypeError:
+        return -1
+    for index in range(start, len(items)):
+        if items[index] is value or _values_equal(items[index], value):
+            return index
+    return -1
+
+
+def _items_equal(old: tp.Sequence[tp.Any], new: tp.Sequence[tp.Any]) -> bool:
+    """Compare two same-length slices, falling back to per-item compares for arrays.
+
+    Comparing lists of NumPy arrays raises ValueError, since the arrays
+    compare elementwise; those items go through _values_equal one by one.
+    """
+    try:
+        return bool(old == new)
+    except ValueError:
+        return all(a is b or _values_equal(a, b) for a, b in zip(old, new, strict=True))
+
+
+def _diff_dict(
+    old: dict[str, tp.Any],
+    new: dict[str, tp.Any],
+    path: tuple[str | int, ...],
+    ops: list[PropOp],
+) -> None:
+    """Append edits for added, changed, and removed dict keys."""
+    for key, new_val in new.items():
+        old_val = old.get(key, _MISSING)
+        if old_val is _MISSING:
+            ops.append(PropOp("set", (*path, key), new_val))
+        elif not _values_equal(old_val, new_val):
+            _diff_item(old_val, new_val, (*path, key), ops)
+    ops.extend(PropOp("delete", (*path, key)) for key in old if key not in new)
+
+
+def _diff_item(old: tp.Any, new: tp.Any, path: tuple[str | int, ...], ops: list[PropOp]) -> None:
+    """Append edits for one changed item, recursing into containers."""
+    nested_ops = _diff_nested(old, new, path)
+    if nested_ops is None:
+        ops.append(PropOp("set", path, new))
+    else:
+        ops.extend(nested_ops)
+
+
+def _op_weight(op: PropOp) -> int:
+    """Approximate number of items an edit carries on the wire."""
+    value = op.value
+    if isinstance(value, (list, tuple, dict)):
+        return 1 + len(value)
+    return 1
+
+
+def _exceeds(value: tp.Any, limit: int) -> bool:
+    """Check whether a value holds more than limit items, counting nested containers.
+
+    Stops walking as soon as the count passes limit, so the cost is bounded
+    by limit rather than by the size of the value.
+    """
+    total = 0
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        items = current.values() if isinstance(current, dict) else current
+        total += len(items)
+        if total > limit:
+            return True
+        stack.extend(item for item in items if isinstance(item, (list, tuple, dict)))
+    return False
+
+
 def _values_equal(old: tp.Any, new: tp.Any) -> bool:
     """Compare values with callback-equivalence semantics.
 
@@ -136,5 +388,30 @@ def _values_equal(old: tp.Any, new: tp.Any) -> bool:
     if callable(old) and callable(new):
         return True
 
-    # Everything else: standard equality
-    return bool(old == new)
+    # Everything else: standard equality. Array types such as NumPy's compare
+    # elementwise and have no single truth value, so compare their buffers.
+    try:
+        return bool(old == new)
+    except ValueError:
+        pass
+    if isinstance(old, _LIST_TYPES) and isinstance(new, _LIST_TYPES):
+        return type(old) is type(new) and len(old) == len(new) and _items_equal(old, new)
+    if isinstance(old, dict) and isinstance(new, dict):
+        return old.keys() == new.keys() and all(
+            old[key] is new[key] or _values_equal(old[key], new[key]) for key in old
+        )
+    return _buffers_equal(old, new)
+
+
+def _buffers_equal(old: tp.Any, new: tp.Any) -> bool:
+    """Compare two buffer-protocol values by element type, shape and bytes."""
+    try:
+        old_view = memoryview(old)
+        new_view = memoryview(new)
+    except TypeError:
+        return False
+    return (
+        old_view.format == new_view.format
+        and old_view.shape == new_view.shape
+        and old_view.tobytes() == new_view.tobytes()
+    )
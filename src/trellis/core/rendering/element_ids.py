@@ -0,0 +1,108 @@
+"""Compact integer handles for element IDs.
+
+ElementIdTable interns position-based element IDs into small, session-local
+integer handles. Handles are used as the parent prefix for child position IDs
+(so IDs stay short regardless of tree depth) and are the only element
+identifiers sent over the wire.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Container
+
+__all__ = ["ElementIdTable"]
+
+
+class ElementIdTable:
+    """Session-local mapping between element IDs and integer handles.
+
+    Handles are allocated on first use and never reused within a session,
+    so a stale handle held by the client can never alias a newer element.
+    An element keeps its handle for as long as it stays in the element store,
+    which gives child IDs derived from it the same stability as before.
+
+    Removed elements are released lazily: their handles remain resolvable
+    until the next collect(), so patches describing the removal can still be
+    serialized after the render pass that removed them.
+    """
+
+    __slots__ = ("_handles", "_ids", "_next_handle", "_released")
+
+    def __init__(self) -> None:
+        self._handles: dict[str, int] = {}
+        self._ids: dict[int, str] = {}
+        self._released: list[str] = []
+        # Start at 1 so a handle is never falsy on the client
+        self._next_handle = 1
+
+    def intern(self, element_id: str) -> int:
+        """Get the handle for an element ID, allocating one if needed.
+
+        Args:
+            element_id: The element's position-based ID
+
+        Returns:
+            The element's integer handle
+        """
+        handle = self._handles.get(element_id)
+        if handle is None:
+            handle = self._next_handle
+            self._next_handle += 1
+            self._handles[element_id] = handle
+            self._ids[handle] = element_id
+        return handle
+
+    def handle_of(self, element_id: str) -> int | None:
+        """Get the handle for an element ID without allocating one.
+
+        Args:
+            element_id: The element's position-based ID
+
+        Returns:
+            The handle, or None if the ID has not been interned
+        """
+        return self._handles.get(element_id)
+
+    def resolve(self, handle: int) -> str | None:
+        """Get the element ID for a handle.
+
+        Args:
+            handle: An integer handle previously returned by intern()
+
+        Returns:
+            The element ID, or None if the handle is unknown or collected
+        """
+        return self._ids.get(handle)
+
+    def release(self, element_id: str) -> None:
+        """Mark an element ID's handle for removal at the next collect().
+
+        Args:
+            element_id: The ID of an element removed from the tree
+        """
+        if element_id in self._handles:
+            self._released.append(element_id)
+
+    def collect(self, live: Container[str]) -> None:
+        """Drop handles released since the last collect.
+
+        IDs that are live again (re-added after release) keep their handle.
+
+        Args:
+            live: Element IDs currently in the tree
+        """
+        for element_id in self._released:
+            if element_id in live:
+                continue
+            handle = self._handles.pop(element_id, None)
+            if handle is not None:
+                del self._ids[handle]
+        self._released.clear()
+
+    def __len__(self) -> int:
+        """Return number of interned element IDs."""
+        return len(self._handles)
+
+    def __contains__(self, element_id: str) -> bool:
+        """Check if an element ID has a handle."""
+        return element_id in self._handles
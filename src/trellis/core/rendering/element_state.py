@@ -1,6 +1,7 @@
 """State storage for element elements.
 
-ElementStateStore provides storage for ElementState objects, keyed by element ID.
+ElementStateStore provides storage for ElementState objects, keyed by element ID,
+and resolves `with state:` context lookups with a per-element cache.
 """
 
 from __future__ import annotations
@@ -26,7 +27,11 @@ class ElementState:
         state_call_count: Counter for consistent Stateful() instantiation ordering
         context: State context from `with state:` blocks
         parent_id: Parent element's ID (for context walking)
+        depth: Distance from the root element (for ordering dirty re-renders)
         element_type: Element class type, for trait hook dispatch after removal
+        context_cache: Resolved context lookups (type -> nearest provided
+            instance, or None), valid while context_epoch matches the store's
+        context_epoch: Store context epoch that context_cache was filled in
         _trait_state: Per-trait state keyed by state type
     """
 
@@ -35,7 +40,10 @@ class ElementState:
     state_call_count: int = 0
     context: dict[type, tp.Any] = field(default_factory=dict)
     parent_id: str | None = None
+    depth: int = 0
     element_type: type | None = None
+    context_cache: dict[type, tp.Any] | None = None
+    context_epoch: int = -1
     _trait_state: dict[type, tp.Any] = field(default_factory=dict)
 
     def trait(self, state_type: type[S]) -> S:
@@ -58,12 +66,25 @@ class ElementStateStore:
     ElementState holds mutable runtime state for each element (dirty flag,
     local_state, context, etc.). This class provides a clean interface
     for state CRUD operations.
+
+    Context lookups are cached on each element visited by the walk up the
+    parent chain. All caches are invalidated together, by bumping a context
+    epoch, whenever the answer to any lookup could change: a provider is
+    added or replaced, a provider is removed, or an element is re-parented.
+    In a stable tree lookups are O(1) amortized.
+
+    The store also indexes providers by context type, so code outside the
+    tree (message handlers, tools) can find e.g. the session's RouterState
+    without scanning every element.
     """
 
-    __slots__ = ("_state",)
+    __slots__ = ("_context_epoch", "_providers", "_state")
 
     def __init__(self) -> None:
         self._state: dict[str, ElementState] = {}
+        self._context_epoch = 0
+        # Context type -> IDs of elements providing it, in first-provided order
+        self._providers: dict[type, dict[str, None]] = {}
 
     def get(self, element_id: str) -> ElementState | None:
         """Get state for an element ID.
@@ -89,6 +110,18 @@ class ElementStateStore:
             self._state[element_id] = ElementState()
         return self._state[element_id]
 
+    def depth(self, element_id: str) -> int:
+        """Get the tree depth recorded for an element ID.
+
+        Args:
+            element_id: The element's ID
+
+        Returns:
+            The element's depth, or 0 if it has no state yet
+        """
+        state = self._state.get(element_id)
+        return state.depth if state is not None else 0
+
     def set(self, element_id: str, state: ElementState) -> None:
         """Set state for an element ID.
 
@@ -96,7 +129,12 @@ class ElementStateStore:
             element_id: The element's ID
             state: The ElementState to store
         """
+        previous = self._state.get(element_id)
+        if previous is not None and previous is not state and previous.context:
+            self._forget_providers(element_id, previous)
         self._state[element_id] = state
+        for ctx_type in state.context:
+            self._providers.setdefault(ctx_type, {})[element_id] = None
 
     def remove(self, element_id: str) -> None:
         """Remove state for an element ID.
@@ -104,7 +142,114 @@ class ElementStateStore:
         Args:
             element_id: The ID of the element whose state to remove
         """
-        self._state.pop(element_id, None)
+        state = self._state.pop(element_id, None)
+        if state is not None and state.context:
+            self._forget_providers(element_id, state)
+
+    def provide(self, element_id: str, instance: tp.Any) -> tp.Any | None:
+        """Provide instance as context for an element's subtree.
+
+        Args:
+            element_id: The providing element's ID
+            instance: The context value, keyed by its exact type
+
+        Returns:
+            The instance previously provided for that type by this element, if any
+        """
+        context = self.get_or_create(element_id).context
+        ctx_type = type(instance)
+        previous = context.get(ctx_type)
+        if previous is not instance:
+            context[ctx_type] = instance
+            self._providers.setdefault(ctx_type, {})[element_id] = None
+            self.invalidate_context()
+        return previous
+
+    def providers(self, ctx_type: type[S]) -> list[S]:
+        """Get every instance of a context type provided in the session.
+
+        Args:
+            ctx_type: The exact context type
+
+        Returns:
+            The provided instances, in the order their elements first provided them
+        """
+        provider_ids = self._providers.get(ctx_type, {})
+        return [self._state[element_id].context[ctx_type] for element_id in provider_ids]
+
+    def find_provider(self, ctx_type: type[S]) -> S | None:
+        """Get the first instance of a context type provided in the session.
+
+        Typically the app-wide instance, since the root provides first.
+
+        Args:
+            ctx_type: The exact context type
+
+        Returns:
+            The instance, or None if nothing provides ctx_type
+        """
+        provider_ids = self._providers.get(ctx_type)
+        if not provider_ids:
+            return None
+        return tp.cast("S", self._state[next(iter(provider_ids))].context[ctx_type])
+
+    def resolve_context(self, element_id: str | None, ctx_type: type[S]) -> S | None:
+        """Find the nearest instance of ctx_type provided at or above an element.
+
+        Walks up the parent chain until it finds a provider or an element
+        whose cache already knows the answer, then caches the result on every
+        element it visited.
+
+        Args:
+            element_id: The element to start from
+            ctx_type: The exact context type to look for
+
+        Returns:
+            The nearest provided instance, or None if there is none
+        """
+        epoch = self._context_epoch
+        path: list[ElementState] = []
+        result: S | None = None
+        while element_id is not None:
+            state = self._state.get(element_id)
+            if state is None:
+                break
+            cache = state.context_cache
+            if cache is not None and state.context_epoch == epoch and ctx_type in cache:
+                result = cache[ctx_type]
+                break
+            path.append(state)
+            if ctx_type in state.context:
+                result = state.context[ctx_type]
+                break
+            if len(path) > len(self._state):
+                break  # Cycle detected
+            element_id = state.parent_id
+
+        for state in path:
+            if state.context_cache is None or state.context_epoch != epoch:
+                state.context_cache = {}
+                state.context_epoch = epoch
+            state.context_cache[ctx_type] = result
+        return result
+
+    def _forget_providers(self, element_id: str, state: ElementState) -> None:
+        """Drop an element's provided contexts from the index."""
+        for ctx_type in state.context:
+            provider_ids = self._providers.get(ctx_type)
+            if provider_ids is not None:
+                provider_ids.pop(element_id, None)
+                if not provider_ids:
+                    del self._providers[ctx_type]
+        self.invalidate_context()
+
+    def invalidate_context(self) -> None:
+        """Invalidate every cached context lookup.
+
+        Called when a provider changes or is removed, or when an element is
+        re-parented.
+        """
+        self._context_epoch += 1
 
     def __contains__(self, element_id: str) -> bool:
         """Check if state exists for an element ID."""
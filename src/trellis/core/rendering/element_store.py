@@ -1,6 +1,8 @@
 """Element storage for the render tree.
 
 ElementStore provides flat storage for Element objects, keyed by ID.
+ElementSnapshot provides a copy-on-write view of a store as it was at
+the start of a render pass.
 """
 
 from __future__ import annotations
@@ -10,7 +12,7 @@ import typing as tp
 if tp.TYPE_CHECKING:
     from trellis.core.rendering.element import Element
 
-__all__ = ["ElementStore"]
+__all__ = ["ElementSnapshot", "ElementStore"]
 
 
 class ElementStore:
@@ -18,13 +20,14 @@ class ElementStore:
 
     Elements are stored in a dictionary and accessed by their position-based ID.
     This class provides a clean interface for element CRUD operations and
-    supports cloning for snapshot comparisons during reconciliation.
+    supports copy-on-write snapshots for comparisons during reconciliation.
     """
 
-    __slots__ = ("_elements",)
+    __slots__ = ("_elements", "_snapshot")
 
     def __init__(self) -> None:
         self._elements: dict[str, Element] = {}
+        self._snapshot: ElementSnapshot | None = None
 
     def get(self, element_id: str) -> Element | None:
         """Get an element by ID.
@@ -42,6 +45,8 @@ class ElementStore:
         Args:
             element: The element to store (must have id assigned)
         """
+        if self._snapshot is not None:
+            self._snapshot._preserve(element.id, self._elements.get(element.id))
         self._elements[element.id] = element
 
     def remove(self, element_id: str) -> None:
@@ -50,6 +55,8 @@ class ElementStore:
         Args:
             element_id: The ID of the element to remove
         """
+        if self._snapshot is not None:
+            self._snapshot._preserve(element_id, self._elements.get(element_id))
         self._elements.pop(element_id, None)
 
     def get_children(self, element: Element) -> list[Element]:
@@ -75,8 +82,42 @@ class ElementStore:
         new_store._elements = dict(self._elements)
         return new_store
 
+    def snapshot(self) -> ElementSnapshot:
+        """Start a copy-on-write snapshot of this store.
+
+        Unlike clone(), this does not copy the element dict. The snapshot
+        reads through to this store and only records an element's previous
+        value the first time it is replaced or removed, so the cost is
+        proportional to the number of elements touched while it is open.
+
+        Only one snapshot can be open at a time; call release_snapshot()
+        when done.
+
+        Returns:
+            New ElementSnapshot reflecting the current contents
+
+        Raises:
+            RuntimeError: If a snapshot is already open
+        """
+        if self._snapshot is not None:
+            raise RuntimeError("ElementStore already has an open snapshot")
+        self._snapshot = ElementSnapshot(self)
+        return self._snapshot
+
+    def release_snapshot(self) -> None:
+        """Stop recording changes for the open snapshot, if any.
+
+        The released snapshot is detached and must not be used afterwards.
+        """
+        if self._snapshot is not None:
+            self._snapshot._detach()
+            self._snapshot = None
+
     def clear(self) -> None:
         """Remove all elements from the store."""
+        if self._snapshot is not None:
+            for element_id, element in self._elements.items():
+                self._snapshot._preserve(element_id, element)
         self._elements.clear()
 
     def __len__(self) -> int:
@@ -94,3 +135,67 @@ class ElementStore:
     def items(self) -> tp.ItemsView[str, Element]:
         """Return items view of (element_id, element) pairs."""
         return self._elements.items()
+
+
+class ElementSnapshot:
+    """Copy-on-write view of an ElementStore at the time it was taken.
+
+    Reads fall through to the live store unless the element has since been
+    replaced or removed there, in which case the preserved value is returned.
+    Elements stored directly on the snapshot (to mark them as processed during
+    a render pass) shadow both.
+
+    Created by ElementStore.snapshot(). Cost grows with the number of elements
+    touched while the snapshot is open, not with the size of the tree.
+    """
+
+    __slots__ = ("_base", "_overrides", "_preserved")
+
+    def __init__(self, base: ElementStore | None = None) -> None:
+        self._base = base
+        self._preserved: dict[str, Element | None] = {}
+        self._overrides: dict[str, Element] = {}
+
+    def _preserve(self, element_id: str, element: Element | None) -> None:
+        """Record an element's value before the live store first changes it."""
+        if element_id not in self._preserved:
+            self._preserved[element_id] = element
+
+    def _detach(self) -> None:
+        """Disconnect from the live store once the snapshot is released."""
+        self._base = None
+
+    def get(self, element_id: str) -> Element | None:
+        """Get an element as of the snapshot.
+
+        Args:
+            element_id: The element's ID
+
+        Returns:
+            The Element, or None if it did not exist when the snapshot was taken
+        """
+        element = self._overrides.get(element_id)
+        if element is not None:
+            return element
+        if element_id in self._preserved:
+            return self._preserved[element_id]
+        if self._base is None:
+            return None
+        return self._base._elements.get(element_id)
+
+    def store(self, element: Element) -> None:
+        """Store an element in the snapshot without touching the live store.
+
+        Args:
+            element: The element to store (must have id assigned)
+        """
+        self._overrides[element.id] = element
+
+    @property
+    def touched_count(self) -> int:
+        """Number of element IDs changed on either side since the snapshot was taken."""
+        return len(self._preserved.keys() | self._overrides.keys())
+
+    def __contains__(self, element_id: str) -> bool:
+        """Check if an element ID exists in the snapshot."""
+        return self.get(element_id) is not None
@@ -11,6 +11,7 @@ from dataclasses import dataclass, field
 
 if tp.TYPE_CHECKING:
     from trellis.core.components.base import Component
+    from trellis.core.rendering.element_ids import ElementIdTable
 
 __all__ = ["Frame", "FrameStack"]
 
@@ -60,12 +61,17 @@ class FrameStack:
     Child elements created within that scope are added to the current Frame.
     When the `with` block exits, the Frame is popped and its child IDs
     are assigned to the container.
+
+    When given the session's ElementIdTable, child IDs are prefixed with the
+    parent's integer handle instead of the parent's full ID, so ID length
+    no longer grows with tree depth.
     """
 
-    __slots__ = ("_frames",)
+    __slots__ = ("_frames", "_ids")
 
-    def __init__(self) -> None:
+    def __init__(self, ids: ElementIdTable | None = None) -> None:
         self._frames: list[Frame] = []
+        self._ids = ids
 
     def push(self, parent_id: str) -> Frame:
         """Push a new frame for collecting child elements.
@@ -122,8 +128,11 @@ class FrameStack:
         """Get the next position-based ID for a child element.
 
         Position IDs encode tree position AND component identity:
-        - First child: "{parent_id}/0@{id(component)}"
-        - Keyed child: "{parent_id}/:key@{id(component)}"
+        - First child: "{parent}/0@{id(component)}"
+        - Keyed child: "{parent}/:key@{id(component)}"
+
+        where {parent} is the parent's handle from the ElementIdTable, or the
+        parent's full ID when the stack has no table.
 
         Args:
             component: The component being placed (for identity in ID)
@@ -136,7 +145,7 @@ class FrameStack:
             raise RuntimeError("next_child_id called with no active frame")
 
         frame = self._frames[-1]
-        parent_id = frame.parent_id
+        parent = frame.parent_id if self._ids is None else self._ids.intern(frame.parent_id)
         position = frame.position
         frame.position += 1
 
@@ -144,8 +153,8 @@ class FrameStack:
         escaped_key = _escape_key(key) if key else None
 
         if escaped_key:
-            return f"{parent_id}/:{escaped_key}@{comp_id}"
-        return f"{parent_id}/{position}@{comp_id}"
+            return f"{parent}/:{escaped_key}@{comp_id}"
+        return f"{parent}/{position}@{comp_id}"
 
     def root_id(self, component: Component) -> str:
         """Get the root element ID (for no-frame case).
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
+from dataclasses import dataclass
 
 from trellis.core.rendering.active import ActiveRender
 from trellis.core.rendering.child_ref import ChildRef
 from trellis.core.rendering.element import Element, diff_props
+from trellis.core.rendering.frames import FrameStack
 from trellis.core.rendering.lifecycle import invoke_lifecycle_hook
 from trellis.core.rendering.patches import (
     RenderAddPatch,
@@ -20,31 +23,120 @@ from trellis.core.rendering.traits import get_trait_hooks
 from trellis.utils.logger import logger
 
 __all__ = [
+    "DEFAULT_SLICE_BUDGET",
+    "PendingHooks",
     "render",
+    "render_pass",
+    "render_sliced",
 ]
 
+# Default time budget per slice for render_sliced(), in seconds
+DEFAULT_SLICE_BUDGET = 0.008
+
 
 # =============================================================================
 # Execution Functions (Free Functions)
 # =============================================================================
 
 
+@dataclass(frozen=True)
+class PendingHooks:
+    """Mount/unmount hooks collected by a render pass, run after it completes."""
+
+    session: RenderSession
+    mounts: list[str]
+    unmounts: list[str]
+
+    def run(self) -> None:
+        """Invoke the hooks (unmounts first, then mounts)."""
+        _process_pending_hooks(self.session, self.mounts, self.unmounts)
+
+
 def render(session: RenderSession) -> list[RenderPatch]:
     """Render the session and return patches."""
-    if get_render_session() is not session:
-        raise RuntimeError(
-            "render() called but the session is not bound to the current context. "
-            "Call set_render_session(session) first."
-        )
-    with session.lock:
-        patches, pending_mounts, pending_unmounts = _render_impl(session)
+    patches, hooks = render_pass(session)
 
     # Process hooks AFTER session.active is cleared and lock is released.
     # This allows hooks to safely modify state (which marks elements dirty).
+    hooks.run()
+    return patches
+
+
+def render_pass(session: RenderSession) -> tuple[list[RenderPatch], PendingHooks]:
+    """Render the session without running mount/unmount hooks.
+
+    Lets the caller run the pass on one thread and the hooks on another
+    (hooks may spawn asyncio tasks, so they belong on the event loop thread).
+    The session must be bound to the calling context, as with render().
+
+    Returns:
+        Tuple of (patches, hooks). Call hooks.run() once the pass is done.
+    """
+    _check_bound(session)
+    with session.lock:
+        patches, pending_mounts, pending_unmounts = _render_impl(session)
+    return patches, PendingHooks(session, pending_mounts, pending_unmounts)
+
+
+async def render_sliced(
+    session: RenderSession,
+    slice_budget: float = DEFAULT_SLICE_BUDGET,
+) -> list[RenderPatch]:
+    """Render the session in time-bounded slices, yielding between them.
+
+    Behaves like render(), but after each dirty element is re-rendered it
+    checks how long the current slice has run. Once slice_budget is used up
+    it yields to the event loop before continuing, so a large re-render does
+    not starve other sessions sharing the loop.
+
+    Slices are cut between dirty elements: an element's subtree always
+    renders in one go, and the initial render runs in a single slice. The
+    patches are returned only once the whole pass has completed, and
+    mount/unmount hooks run afterwards exactly as with render().
+
+    The session lock is held for the entire pass, including while yielded,
+    so marks from other threads still wait for the pass to finish. The lock
+    is re-entrant, though, so code running on the event loop thread is not
+    excluded: a callback or session task may run between slices unless the
+    caller gates it, as MessageHandler does with its render gate.
+
+    Args:
+        session: The session to render
+        slice_budget: Maximum time in seconds to render before yielding
+
+    Returns:
+        The patches for the full pass, in the same order render() produces
+    """
+    _check_bound(session)
+    with session.lock:
+        is_initial = _begin_pass(session)
+        try:
+            if is_initial:
+                _render_initial(session)
+            deadline = time.perf_counter() + slice_budget
+            while (element_id := session.dirty.pop()) is not None:
+                _render_dirty_element(session, element_id)
+                if time.perf_counter() >= deadline:
+                    session.stats.slices_yielded += 1
+                    await asyncio.sleep(0)
+                    deadline = time.perf_counter() + slice_budget
+            patches, pending_mounts, pending_unmounts = _finish_pass(session, is_initial)
+        finally:
+            _end_pass(session)
+
     _process_pending_hooks(session, pending_mounts, pending_unmounts)
     return patches
 
 
+def _check_bound(session: RenderSession) -> None:
+    """Ensure the session is bound to the current context before rendering."""
+    if get_render_session() is not session:
+        raise RuntimeError(
+            "render() called but the session is not bound to the current context. "
+            "Call set_render_session(session) first."
+        )
+
+
 def _render_impl(
     session: RenderSession,
 ) -> tuple[list[RenderPatch], list[str], list[str]]:
@@ -54,95 +146,131 @@ def _render_impl(
         Tuple of (patches, pending_mounts, pending_unmounts).
         Hooks are processed by the caller after session.active is cleared.
     """
+    is_initial = _begin_pass(session)
+    try:
+        if is_initial:
+            _render_initial(session)
+
+        # Process dirty elements one at a time, shallowest first. We pop
+        # individually because re-rendering a parent also renders its dirty
+        # descendants inline, clearing their dirty state before we get to them.
+        while (element_id := session.dirty.pop()) is not None:
+            _render_dirty_element(session, element_id)
+
+        return _finish_pass(session, is_initial)
+    finally:
+        _end_pass(session)
+
+
+def _begin_pass(session: RenderSession) -> bool:
+    """Set up render-scoped state for a new pass (called with lock held).
+
+    Returns:
+        True if this is the session's initial render
+    """
     if session.is_rendering():
         raise RuntimeError("Attempted to render while already rendering!")
 
     # Increment render count at the start of every render pass
     session.render_count += 1
 
-    # Create render-scoped state
-    session.active = ActiveRender(old_elements=session.elements.clone())
-    is_initial = session.root_element_id is None
-    root_element: Element | None = None
+    # Drop handles of elements removed by the previous pass (kept until now so
+    # their RemovePatches could still be serialized).
+    session.ids.collect(session.elements)
+    session.callbacks.collect(session.elements)
 
-    try:
-        if is_initial:
-            # Initial render - create root element (no execution yet)
-            start_time = time.perf_counter()
-            logger.debug("Initial render starting (root: %s)", session.root_component.name)
+    # Create render-scoped state. The snapshot is copy-on-write, so its cost
+    # scales with the elements touched this pass rather than the tree size.
+    session.active = ActiveRender(
+        frames=FrameStack(session.ids),
+        old_elements=session.elements.snapshot(),
+    )
+    return session.root_element_id is None
 
-            root_element = session.root_component()
-            session.root_element_id = root_element.id
 
-            # Execute the entire tree depth-first
-            _execute_tree(session, root_element.id, None)
+def _end_pass(session: RenderSession) -> None:
+    """Discard render-scoped state at the end of a pass."""
+    session.elements.release_snapshot()
+    session.active = None
 
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
-            logger.debug(
-                "Initial render complete: %d elements in %.2fms",
-                len(session.elements),
-                elapsed_ms,
-            )
 
-        # Process dirty elements one at a time. We pop individually because
-        # re-rendering a parent may also render its dirty children inline,
-        # clearing their dirty state before we get to them in the loop.
-        while session.dirty.has_dirty():
-            element_id = session.dirty.pop()
-            if element_id is None:
-                break
-
-            logger.debug("Rendering dirty element: %s", element_id)
-
-            state = session.states.get(element_id)
-            if state:
-                old_element = session.elements.get(element_id)
-                if old_element:
-                    # Create NEW element for re-render. This ensures the old element
-                    # can be GC'd and removed from any WeakSets (dependency tracking).
-                    # Preserve the element class from the component.
-                    element_class = old_element.component.element_class
-                    new_element = element_class(
-                        component=old_element.component,
-                        _session_ref=old_element._session_ref,
-                        render_count=session.render_count,
-                        props=old_element.props,
-                        _key=old_element._key,
-                        child_ids=list(old_element.child_ids),
-                        id=old_element.id,
-                    )
-                    session.elements.store(new_element)
-                _execute_tree(session, element_id, state.parent_id)
-        # Extract pending hooks before clearing session.active
-        pending_mounts = session.active.lifecycle.pop_mounts()
-        pending_unmounts = session.active.lifecycle.pop_unmounts()
-
-        # Build result patches
-        root_element = (
-            session.elements.get(session.root_element_id) if session.root_element_id else None
+def _render_initial(session: RenderSession) -> None:
+    """Create the root element and execute the entire tree."""
+    start_time = time.perf_counter()
+    logger.debug("Initial render starting (root: %s)", session.root_component.name)
+
+    root_element = session.root_component()
+    session.root_element_id = root_element.id
+
+    # Execute the entire tree depth-first
+    _execute_tree(session, root_element.id, None)
+
+    elapsed_ms = (time.perf_counter() - start_time) * 1000
+    logger.debug(
+        "Initial render complete: %d elements in %.2fms",
+        len(session.elements),
+        elapsed_ms,
+    )
+
+
+def _render_dirty_element(session: RenderSession, element_id: str) -> None:
+    """Re-render one dirty element and its subtree."""
+    logger.debug("Rendering dirty element: %s", element_id)
+
+    state = session.states.get(element_id)
+    if not state:
+        return
+    old_element = session.elements.get(element_id)
+    if old_element:
+        # Create NEW element for re-render. This ensures the old element
+        # can be GC'd and removed from any WeakSets (dependency tracking).
+        # Preserve the element class from the component.
+        element_class = old_element.component.element_class
+        new_element = element_class(
+            component=old_element.component,
+            _session_ref=old_element._session_ref,
+            render_count=session.render_count,
+            props=old_element.props,
+            _key=old_element._key,
+            child_ids=list(old_element.child_ids),
+            id=old_element.id,
         )
-        if is_initial and root_element is not None:
-            # Initial render: single RenderAddPatch with root element
-            return (
-                [
-                    RenderAddPatch(
-                        parent_id=None,
-                        children=(session.root_element_id,) if session.root_element_id else (),
-                        element=root_element,
-                    )
-                ],
-                pending_mounts,
-                pending_unmounts,
-            )
+        session.elements.store(new_element)
+    _execute_tree(session, element_id, state.parent_id)
 
-        # Incremental render: return accumulated patches
-        patches = session.active.patches.get_all()
-        if patches:
-            logger.debug("render complete: %d patches", len(patches))
-        return patches, pending_mounts, pending_unmounts
 
-    finally:
-        session.active = None
+def _finish_pass(
+    session: RenderSession,
+    is_initial: bool,
+) -> tuple[list[RenderPatch], list[str], list[str]]:
+    """Collect the pass's patches and pending hooks (before clearing session.active)."""
+    assert session.active is not None
+    pending_mounts = session.active.lifecycle.pop_mounts()
+    pending_unmounts = session.active.lifecycle.pop_unmounts()
+
+    # Build result patches
+    root_element = (
+        session.elements.get(session.root_element_id) if session.root_element_id else None
+    )
+    if is_initial and root_element is not None:
+        # Initial render: single RenderAddPatch with root element
+        return (
+            [
+                RenderAddPatch(
+                    parent_id=None,
+                    children=(session.root_element_id,) if session.root_element_id else (),
+                    element=root_element,
+                )
+            ],
+            pending_mounts,
+            pending_unmounts,
+        )
+
+    # Incremental render: return accumulated patches
+    patches = session.active.patches.get_all()
+    if patches:
+        logger.debug("render complete: %d patches", len(patches))
+    return patches, pending_mounts, pending_unmounts
 
 
 def _execute_single_element(
@@ -169,12 +297,18 @@ def _execute_single_element(
         state.mounted = True
         # Track mount hook (called after render completes)
         session.active.lifecycle.track_mount(element_id)
-    else:
-        # Re-executing existing element
+    elif state.parent_id != parent_id:
+        # Re-executing existing element under a new parent
         state.parent_id = parent_id
+        session.states.invalidate_context()
+    parent_state = session.states.get(parent_id) if parent_id is not None else None
+    state.depth = parent_state.depth + 1 if parent_state is not None else 0
 
-    # Clear from dirty tracker - we're executing now
-    session.dirty.discard(element_id)
+    # Clear from dirty tracker - we're executing now. If it was still dirty,
+    # an ancestor is re-rendering it inline, saving a separate execution.
+    if session.dirty.discard(element_id):
+        session.stats.redundant_executions_avoided += 1
+    session.stats.executions += 1
 
     # Store element early so get_element() works during render for dependency tracking
     session.elements.store(element)
@@ -196,6 +330,7 @@ def _execute_single_element(
     # Push a frame for child IDs created during execution
     session.active.frames.push(parent_id=element_id)
     try:
+        session.dependencies.watch(element, element_id)
         with session.tracking(element):
             # Execute the component - children are created via _place() but NOT executed yet
             element.component.execute(**props)
@@ -361,6 +496,9 @@ def _remove_element_tree(session: RenderSession, element_id: str) -> None:
         for child_id in element.child_ids:
             _remove_element_tree(session, child_id)
     session.elements.remove(element_id)
+    session.ids.release(element_id)
+    session.callbacks.release(element_id)
+    session.dependencies.drop(element_id)
 
 
 def _call_mount_hooks(session: RenderSession, element_id: str) -> None:
@@ -447,7 +585,9 @@ def _emit_update_patch_if_changed(session: RenderSession, element_id: str) -> No
         return
 
     # Compute prop diff (only changed/added/removed keys)
-    props_diff = diff_props(old_element.props, element.props)
+    props_diff = diff_props(
+        old_element.props, element.props, nested=element.component.nested_diff_props
+    )
     # Check if children order changed
     children_changed = old_element.child_ids != element.child_ids
 
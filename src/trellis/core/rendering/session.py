@@ -3,19 +3,27 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import contextlib
 import contextvars
 import logging
-import re
 import threading
 import typing as tp
 import weakref
 from collections.abc import Iterator
 from dataclasses import dataclass, field
 
+from trellis.core.rendering.callback_table import (
+    CallbackTable,
+    parse_prop_path,
+    resolve_prop_path,
+)
+from trellis.core.rendering.dependency_index import DependencyIndex
 from trellis.core.rendering.dirty_tracker import DirtyTracker
+from trellis.core.rendering.element_ids import ElementIdTable
 from trellis.core.rendering.element_state import ElementStateStore
 from trellis.core.rendering.element_store import ElementStore
+from trellis.core.rendering.stats import RenderStats
 
 if tp.TYPE_CHECKING:
     from trellis.core.components.base import Component
@@ -59,10 +67,6 @@ def is_render_active() -> bool:
     return session is not None and session.is_rendering()
 
 
-# Pattern to parse prop paths: matches "name", "[0]", or ".name" segments
-_PATH_SEGMENT_RE = re.compile(r"^([a-zA-Z_][a-zA-Z0-9_]*)|^\[(\d+)\]|^\.([a-zA-Z_][a-zA-Z0-9_]*)")
-
-
 @dataclass
 class RenderSession:
     """Session-scoped state container."""
@@ -74,6 +78,9 @@ class RenderSession:
     elements: ElementStore = field(default_factory=ElementStore)
     states: ElementStateStore = field(default_factory=ElementStateStore)
     dirty: DirtyTracker = field(default_factory=DirtyTracker)
+    ids: ElementIdTable = field(default_factory=ElementIdTable)
+    callbacks: CallbackTable = field(default_factory=CallbackTable)
+    dependencies: DependencyIndex = field(default_factory=DependencyIndex)
 
     # Render-scoped state (None when not rendering)
     active: ActiveRender | None = None
@@ -84,13 +91,20 @@ class RenderSession:
     # Render count - incremented at the start of each render pass
     render_count: int = 0
 
+    # Cumulative render counters (executions, redundant work avoided, ...)
+    stats: RenderStats = field(default_factory=RenderStats)
+
+    # Event loop the session's tasks run on. spawn() called from another
+    # thread (e.g. a render on a render_executor worker) schedules onto it.
+    loop: asyncio.AbstractEventLoop | None = None
+
     # Session-scoped async tasks for non-critical background work.
     _tasks: set[asyncio.Task[tp.Any]] = field(default_factory=set)
     _shutting_down: bool = False
 
     # The dependency (Element or ReactiveEffect) currently being executed.
     # Set during element execution and reactive effect execution so that
-    # Stateful.__getattribute__ can register watchers via the protocol.
+    # tracked Stateful attribute reads can register watchers via the protocol.
     active_dependency: StateDependency | None = None
 
     # Initial URL path from client HelloMessage (for routing)
@@ -98,14 +112,25 @@ class RenderSession:
 
     def __post_init__(self) -> None:
         self.dirty.set_lock(self.lock)
+        self.dirty.set_depth_resolver(self.states.depth)
 
     def spawn[T](
         self,
         coro: tp.Coroutine[tp.Any, tp.Any, T],
         *,
         label: str,
-    ) -> asyncio.Task[T]:
-        """Create and track a session-scoped task for non-critical background work."""
+    ) -> asyncio.Task[T] | concurrent.futures.Future[T]:
+        """Create and track a session-scoped task for non-critical background work.
+
+        Called on the event loop, the task starts right away. Called from a
+        thread without a running loop, it is scheduled onto the session's
+        loop, and a concurrent Future for it is returned instead; cancelling
+        that Future cancels the task.
+
+        Raises:
+            RuntimeError: If the session is shutting down, or if called off
+                the loop when the session has no loop
+        """
         if self._shutting_down:
             coro.close()
             raise RuntimeError("Cannot spawn task on a shutting down session.")
@@ -119,10 +144,41 @@ class RenderSession:
                 logger.exception("Error in %s", label)
                 return None
 
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            if self.loop is None:
+                coro.close()
+                raise
+            return self._spawn_threadsafe(run_managed_task(), self.loop)
+
         task = tp.cast("asyncio.Task[T]", asyncio.create_task(run_managed_task()))
+        self._track(task)
+        return task
+
+    def _spawn_threadsafe[T](
+        self, coro: tp.Coroutine[tp.Any, tp.Any, T | None], loop: asyncio.AbstractEventLoop
+    ) -> concurrent.futures.Future[T]:
+        """Start coro on loop from another thread, tracking its task there."""
+
+        async def run_tracked() -> T | None:
+            task = asyncio.current_task()
+            assert task is not None
+            if self._shutting_down:
+                # Shut down before the task got to start
+                coro.close()
+                return None
+            self._track(task)
+            return await coro
+
+        return tp.cast(
+            "concurrent.futures.Future[T]", asyncio.run_coroutine_threadsafe(run_tracked(), loop)
+        )
+
+    def _track(self, task: asyncio.Task[tp.Any]) -> None:
+        """Keep a session task referenced until it finishes."""
         self._tasks.add(task)
         task.add_done_callback(self._tasks.discard)
-        return task
 
     async def shutdown(self) -> None:
         """Cancel and await all remaining session-scoped tasks."""
@@ -168,7 +224,7 @@ class RenderSession:
         """Set the active dependency for the duration of a block.
 
         Used during element execution and reactive effect execution so that
-        Stateful.__getattribute__ registers the correct watcher.
+        tracked Stateful attribute reads register the correct watcher.
         """
         previous = self.active_dependency
         self.active_dependency = dep
@@ -183,45 +239,33 @@ class RenderSession:
         if element is None:
             return None
 
-        value = _resolve_prop_path(element.props, prop_name)
+        segments = parse_prop_path(prop_name)
+        value = resolve_prop_path(element.props, segments) if segments is not None else None
 
         if value is not None and callable(value):
             return tp.cast("tp.Callable[..., tp.Any]", value)
         return None
 
+    def resolve_callback(self, handle: int) -> tuple[str, str, tp.Callable[..., tp.Any]] | None:
+        """Resolve a callback handle sent by the client.
 
-def _resolve_prop_path(props: dict[str, tp.Any], path: str) -> tp.Any:
-    """Resolve a nested property path to its value."""
-    value: tp.Any = props
-    pos = 0
+        Args:
+            handle: A handle allocated by the session's CallbackTable
 
-    while pos < len(path):
-        match = _PATH_SEGMENT_RE.match(path[pos:])
-        if not match:
+        Returns:
+            (element ID, prop path, callback), or None if the handle is unknown
+            or its path no longer holds a callable
+        """
+        entry = self.callbacks.resolve(handle)
+        if entry is None:
             return None
-
-        if match.group(1) is not None:
-            # Initial identifier: props["name"]
-            key = match.group(1)
-            if not isinstance(value, dict) or key not in value:
-                return None
-            value = value[key]
-        elif match.group(2) is not None:
-            # Array index: [0]
-            idx = int(match.group(2))
-            if not isinstance(value, (list, tuple)) or idx >= len(value):
-                return None
-            value = value[idx]
-        elif match.group(3) is not None:
-            # Dot accessor: .name
-            key = match.group(3)
-            if not isinstance(value, dict) or key not in value:
-                return None
-            value = value[key]
-
-        pos += match.end()
-
-    return value
+        element = self.elements.get(entry.element_id)
+        if element is None:
+            return None
+        callback = entry.lookup(element.props)
+        if callback is None:
+            return None
+        return entry.element_id, entry.path, callback
 
 
 class SessionRegistry:
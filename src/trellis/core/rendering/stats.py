@@ -0,0 +1,43 @@
+"""Render statistics for a session.
+
+RenderStats accumulates counters across render passes so that callers can
+see how much work incremental rendering did and how much it avoided.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+__all__ = ["RenderStats"]
+
+
+@dataclass
+class RenderStats:
+    """Cumulative render counters for a RenderSession.
+
+    Attributes:
+        executions: Component executions across all render passes
+        redundant_executions_avoided: Dirty elements that were re-rendered
+            inline by a dirty ancestor instead of being executed on their own
+            first (and then again by the ancestor)
+        slices_yielded: Times render_sliced() yielded to the event loop
+            mid-pass because a slice used up its time budget
+        memo_skips: Placements of memoized components skipped because their
+            memo comparator found the props unchanged
+        memo_misses: Placements of memoized components re-executed because
+            their memo comparator found the props changed
+    """
+
+    executions: int = 0
+    redundant_executions_avoided: int = 0
+    slices_yielded: int = 0
+    memo_skips: int = 0
+    memo_misses: int = 0
+
+    def reset(self) -> None:
+        """Reset all counters to zero."""
+        self.executions = 0
+        self.redundant_executions_avoided = 0
+        self.slices_yielded = 0
+        self.memo_skips = 0
+        self.memo_misses = 0
@@ -2,32 +2,46 @@
 
 This package provides:
 - `Stateful`: Base class for reactive state with automatic dependency tracking
+- `Tracked`, `Opaque`, `Versioned`: Annotations controlling how attributes are tracked
+- `batch`: Transaction context that coalesces dirty notifications
+- `computed`: Cached derived properties on Stateful classes
 - `TrackedList`, `TrackedDict`, `TrackedSet`: Tracked collection types
+- `StreamBuffer`: Bounded ring buffer for streaming data props
 - `Mutable`: Fine-grained reactive properties for complex objects
 """
 
+from trellis.core.rendering.batch import batch
+from trellis.core.state.attribute import state_version
+from trellis.core.state.computed import computed
 from trellis.core.state.conversion import convert_to_tracked
 from trellis.core.state.dependency import StateDependency
 from trellis.core.state.mutable import Mutable, callback, mutable
 from trellis.core.state.ref import Ref, get_ref, set_ref
-from trellis.core.state.stateful import Stateful, Tracked
+from trellis.core.state.stateful import Opaque, Stateful, Tracked, Versioned
 from trellis.core.state.statevar import StateVar, state_var
+from trellis.core.state.stream import StreamBuffer
 from trellis.core.state.tracked import TrackedDict, TrackedList, TrackedSet
 
 __all__ = [
     "Mutable",
+    "Opaque",
     "Ref",
     "StateDependency",
     "StateVar",
     "Stateful",
+    "StreamBuffer",
     "Tracked",
     "TrackedDict",
     "TrackedList",
     "TrackedSet",
+    "Versioned",
+    "batch",
     "callback",
+    "computed",
     "convert_to_tracked",
     "get_ref",
     "mutable",
     "set_ref",
     "state_var",
+    "state_version",
 ]
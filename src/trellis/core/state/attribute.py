@@ -0,0 +1,253 @@
+"""Data descriptors for tracked Stateful attributes.
+
+Each tracked attribute of a Stateful subclass is backed by a TrackedAttribute
+installed on the class. Reads and writes of tracked attributes go through the
+descriptor, which registers dependencies and marks watchers dirty, while
+untracked attributes and methods use Python's native attribute lookup with no
+per-access overhead.
+
+Values live in the instance ``__dict__`` under the attribute's name, so
+``vars(state)``, copying and pickling see the same data as before.
+
+By default a change is an assignment of a value that is not ``==`` to the
+old one. Attributes annotated ``Opaque[T]`` compare by identity instead, and
+``Versioned[T]`` attributes treat every assignment as a change and count
+them; neither converts its value to tracked collections.
+"""
+
+from __future__ import annotations
+
+import logging
+import typing as tp
+from collections.abc import Mapping
+
+from trellis.core.rendering.session import get_render_session, is_render_active
+from trellis.core.state.conversion import convert_to_tracked
+
+if tp.TYPE_CHECKING:
+    from trellis.core.state.stateful import Stateful
+
+__all__ = [
+    "ChangeDetection",
+    "TrackedAttribute",
+    "install_tracked_attributes",
+    "read_untracked",
+    "state_version",
+]
+
+type ChangeDetection = tp.Literal["equality", "identity", "version"]
+
+logger = logging.getLogger(__name__)
+
+# Sentinel for a tracked attribute with no class-level default
+_NO_DEFAULT: tp.Any = object()
+
+
+class TrackedAttribute:
+    """Data descriptor for one tracked attribute of a Stateful class.
+
+    Reading the attribute while a dependency is active (during component or
+    reactive effect execution) records the read in the session's dependency
+    index and records the access for mutable()/callback(). Assigning a new value
+    converts plain collections to tracked ones and marks watchers dirty.
+
+    Attributes:
+        name: The attribute name
+        default: The class-level default value, if the class defines one
+        change_detection: How an assignment is judged to be a change:
+            ``"equality"`` (``==``, with tracked conversion), ``"identity"``
+            (``is``) or ``"version"`` (every assignment, counted)
+    """
+
+    __slots__ = ("change_detection", "default", "name")
+
+    def __init__(
+        self,
+        name: str,
+        default: tp.Any = _NO_DEFAULT,
+        change_detection: ChangeDetection = "equality",
+    ) -> None:
+        self.name = name
+        self.default = default
+        self.change_detection = change_detection
+
+    def __get__(self, instance: Stateful | None, owner: type | None = None) -> tp.Any:
+        """Read the attribute, registering the active dependency on it."""
+        if instance is None:
+            # Class access behaves like a plain class attribute holding the
+            # default, which is also what @dataclass expects of field defaults
+            if self.default is _NO_DEFAULT:
+                raise AttributeError(self.name)
+            return self.default
+
+        name = self.name
+        instance_dict = instance.__dict__
+        try:
+            value = instance_dict[name]
+        except KeyError:
+            value = self.peek(instance)
+
+        session = get_render_session()
+        if session is None:
+            return value
+        dep = session.active_dependency
+        # Callables are never tracked, matching method access
+        if dep is None or callable(value):
+            return value
+
+        session.dependencies.add(instance, name, dep)
+
+        # Record access for mutable() to capture
+        if session.active is not None:
+            session.active.last_property_access = (instance, name, value)
+
+        return value
+
+    def __set__(self, instance: Stateful, value: tp.Any) -> None:
+        """Assign the attribute, marking dependent elements as dirty.
+
+        Raises:
+            RuntimeError: If the value changes during component rendering.
+                State changes must happen outside render (in callbacks,
+                hooks, timers, etc.)
+        """
+        name = self.name
+        change_detection = self.change_detection
+
+        if change_detection == "equality":
+            # Auto-convert plain collections to tracked versions (nested ones lazily)
+            value = convert_to_tracked(value, owner=instance, attr=name)
+
+        # Only instance values count as modification, not class defaults
+        instance_dict = instance.__dict__
+        if name in instance_dict:
+            old_value = instance_dict[name]
+            if change_detection == "equality":
+                unchanged = old_value == value
+            else:
+                # Versioned attributes treat every assignment as a change
+                unchanged = change_detection == "identity" and old_value is value
+            if unchanged:
+                logger.debug("%s.%s unchanged, skipping", type(instance).__name__, name)
+                return  # Value unchanged, skip dirty marking
+
+            # Prevent state modifications during render (but allow initialization)
+            if is_render_active():
+                raise RuntimeError(
+                    f"Cannot modify state '{name}' during render. "
+                    f"State changes must happen outside of component execution "
+                    f"(e.g., in callbacks, mount/unmount hooks, or timers)."
+                )
+
+            instance_dict[name] = value
+            logger.debug("%s.%s = %r (was %r)", type(instance).__name__, name, value, old_value)
+        else:
+            instance_dict[name] = value
+
+        if change_detection == "version":
+            versions = instance_dict.setdefault("_state_versions", {})
+            versions[name] = versions.get(name, 0) + 1
+
+        # Notify every session that read this attribute
+        indexes = instance_dict.get("_dependency_indexes")
+        if indexes is not None:
+            for index in indexes:
+                index.notify(instance, name)
+
+    def __delete__(self, instance: Stateful) -> None:
+        """Delete the instance value, falling back to the class default."""
+        try:
+            del instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def peek(self, instance: Stateful) -> tp.Any:
+        """Read the attribute without registering a dependency.
+
+        Args:
+            instance: The Stateful instance to read from
+
+        Returns:
+            The instance value, or the class default if it has none
+
+        Raises:
+            AttributeError: If the attribute is unset and has no default
+        """
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            if self.default is _NO_DEFAULT:
+                raise AttributeError(
+                    f"{type(instance).__name__!r} object has no attribute {self.name!r}"
+                ) from None
+            return self.default
+
+
+def install_tracked_attributes(
+    cls: type,
+    names: tp.Iterable[str],
+    change_detection: Mapping[str, ChangeDetection] | None = None,
+) -> None:
+    """Install a TrackedAttribute on cls for each tracked attribute name.
+
+    The nearest class-level value for each name becomes the descriptor's
+    default. Names already backed by another data descriptor (a property or
+    a ``__slots__`` member) are left alone.
+
+    Args:
+        cls: The Stateful subclass to install descriptors on
+        names: The names of the class's tracked attributes
+        change_detection: Names that don't use equality-based change
+            detection, mapped to the mode they use
+    """
+    change_detection = change_detection or {}
+    for name in names:
+        default = _NO_DEFAULT
+        for klass in cls.__mro__:
+            if name in klass.__dict__:
+                default = klass.__dict__[name]
+                break
+
+        if isinstance(default, TrackedAttribute):
+            default = default.default
+        elif hasattr(type(default), "__set__"):
+            continue
+
+        setattr(
+            cls,
+            name,
+            TrackedAttribute(name, default, change_detection.get(name, "equality")),
+        )
+
+
+def read_untracked(obj: object, name: str) -> tp.Any:
+    """Read an attribute without registering a dependency on it.
+
+    Args:
+        obj: The object to read from (Stateful or not)
+        name: The attribute name
+
+    Returns:
+        The attribute value
+    """
+    attribute = type(obj).__dict__.get(name)
+    if isinstance(attribute, TrackedAttribute):
+        return attribute.peek(tp.cast("Stateful", obj))
+    return object.__getattribute__(obj, name)
+
+
+def state_version(obj: object, name: str) -> int:
+    """Get the number of assignments made to a ``Versioned[T]`` attribute.
+
+    Useful as a cheap change stamp, for example as the ``version`` prop of a
+    component memoized with ``memo="version"``.
+
+    Args:
+        obj: The Stateful instance
+        name: The attribute name
+
+    Returns:
+        The attribute's version, 0 if it was never assigned
+    """
+    versions: dict[str, int] = obj.__dict__.get("_state_versions", {})
+    return versions.get(name, 0)
@@ -0,0 +1,213 @@
+"""Computed (memoized derived) properties for Stateful classes.
+
+A ``@computed`` property caches the result of a method that derives a value
+from other state, such as a filtered or sorted view of a TrackedList. The
+method runs as its own StateDependency, so the reads it makes are recorded
+against the computed value rather than against every component that uses it.
+Components register a dependency on the computed property alone.
+
+When an input changes, the cached value is marked stale. If no component is
+watching the property, nothing else happens and the method re-runs on the
+next read. If components are watching, the method re-runs once (at the end
+of the current batch, if one is active) and the watchers are marked dirty
+only when the new value differs from the old one.
+
+Example:
+    ```python
+    @dataclass(kw_only=True)
+    class TodoState(Stateful):
+        todos: list[Todo] = field(default_factory=list)
+
+        @computed
+        def remaining(self) -> list[Todo]:
+            return [todo for todo in self.todos if not todo.done]
+    ```
+"""
+
+from __future__ import annotations
+
+import logging
+import typing as tp
+import weakref
+from collections.abc import Callable
+
+from trellis.core.rendering.batch import defer_call
+from trellis.core.rendering.session import get_render_session
+
+if tp.TYPE_CHECKING:
+    from trellis.core.rendering.dependency_index import DependencyIndex
+    from trellis.core.rendering.session import RenderSession
+
+__all__ = ["ComputedValue", "computed"]
+
+logger = logging.getLogger(__name__)
+
+
+class computed[T]:
+    """Decorator turning a Stateful method into a cached, tracked property.
+
+    The decorated method takes only ``self``. Its result is cached per
+    instance and recomputed only after state it read has changed. Computed
+    properties are read-only and may read other computed properties.
+
+    Outside a render session (for example in plain unit tests) there is
+    nowhere to record dependencies, so the method runs on every read.
+
+    Attributes:
+        fn: The method computing the value
+        name: The attribute name the property is bound to
+    """
+
+    def __init__(self, fn: Callable[[tp.Any], T]) -> None:
+        self.fn = fn
+        self.name = fn.__name__
+        self.__doc__ = fn.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @tp.overload
+    def __get__(self, instance: None, owner: type | None = None) -> tp.Self: ...
+
+    @tp.overload
+    def __get__(self, instance: object, owner: type | None = None) -> T: ...
+
+    def __get__(self, instance: object | None, owner: type | None = None) -> T | tp.Self:
+        """Return the cached value, recomputing it if stale."""
+        if instance is None:
+            return self
+        cell_name = f"_computed_{self.name}"
+        instance_dict = instance.__dict__
+        cell = instance_dict.get(cell_name)
+        if cell is None:
+            cell = instance_dict[cell_name] = ComputedValue(instance, self.name, self.fn)
+        return tp.cast("T", cell.get())
+
+    def __set__(self, instance: object, value: tp.Any) -> None:
+        """Reject assignment; computed properties are derived from other state.
+
+        Raises:
+            AttributeError: Always
+        """
+        raise AttributeError(
+            f"Cannot assign to computed property {type(instance).__name__}.{self.name}"
+        )
+
+
+class ComputedValue:
+    """Cached value of one computed property on one instance.
+
+    Acts as a StateDependency while the method runs, so the state it reads
+    notifies it on change. To the components reading the property, it is a
+    source keyed by the property name on the owning instance, notified through
+    the same dependency indexes as tracked attributes.
+    """
+
+    __slots__ = ("__weakref__", "_fn", "_index", "_name", "_owner", "_stale", "_value")
+
+    def __init__(self, owner: object, name: str, fn: Callable[[tp.Any], tp.Any]) -> None:
+        self._owner = weakref.ref(owner)
+        self._name = name
+        self._fn = fn
+        self._value: tp.Any = None
+        self._stale = True
+        # Index holding the edges of the last computation
+        self._index: weakref.ref[DependencyIndex] | None = None
+
+    def get(self) -> tp.Any:
+        """Return the current value, registering the active dependency on it."""
+        owner = self._owner()
+        session = get_render_session()
+        if self._is_current():
+            value = self._value
+        else:
+            value = self._compute(owner, session)
+
+        if session is not None:
+            dep = session.active_dependency
+            if dep is not None:
+                session.dependencies.add(owner, self._name, dep)
+        return value
+
+    def notify_dirty(self) -> None:
+        """Mark the value stale after one of its inputs changed.
+
+        Satisfies the StateDependency protocol.
+        """
+        if self._stale:
+            return
+        self._stale = True
+        if not defer_call(self._refresh):
+            self._refresh()
+
+    def _is_current(self) -> bool:
+        """Whether the cached value can be returned as-is."""
+        return not self._stale and self._index is not None and self._index() is not None
+
+    def _compute(self, owner: tp.Any, session: RenderSession | None) -> tp.Any:
+        """Run the method, recording what it reads."""
+        if session is None:
+            return self._fn(owner)
+
+        index = session.dependencies
+        index.watch(self)
+        with session.tracking(self):
+            value = self._fn(owner)
+
+        if self._index is None or self._index() is not index:
+            self._index = weakref.ref(index)
+            weakref.finalize(owner, _drop_watcher, self._index, self)
+        self._value = value
+        self._stale = False
+        return value
+
+    def _refresh(self) -> None:
+        """Recompute a stale value for its watchers, notifying them on change."""
+        owner = self._owner()
+        if owner is None or not self._stale:
+            return
+
+        indexes = owner.__dict__.get("_dependency_indexes")
+        if not indexes or not any(index.watchers(owner, self._name) for index in indexes):
+            # Nobody is watching; recompute on the next read
+            return
+
+        session = get_render_session()
+        changed = True
+        if session is not None:
+            old_value = self._value
+            try:
+                value = self._compute(owner, session)
+            except Exception:
+                # Let the watchers re-render and surface the error themselves
+                logger.debug("Computing %s.%s failed", type(owner).__name__, self._name)
+            else:
+                changed = _value_changed(old_value, value)
+
+        if not changed:
+            logger.debug("%s.%s unchanged, skipping", type(owner).__name__, self._name)
+            return
+        for index in list(indexes):
+            index.notify(owner, self._name)
+
+
+def _value_changed(old: tp.Any, new: tp.Any) -> bool:
+    """Whether a recomputed value differs from the cached one.
+
+    Array types such as NumPy's compare elementwise and have no single truth
+    value; such values are treated as changed rather than failing the state
+    assignment that triggered the recompute.
+    """
+    if new is old:
+        return False
+    try:
+        return bool(new != old)
+    except (ValueError, TypeError):
+        return True
+
+
+def _drop_watcher(index_ref: weakref.ref[DependencyIndex], value: ComputedValue) -> None:
+    """Forget a computed value once its owning instance is collected."""
+    index = index_ref()
+    if index is not None:
+        index.drop(value)
@@ -4,7 +4,9 @@ This module provides utilities to convert plain Python collections (list, dict,
 to their tracked equivalents (TrackedList, TrackedDict, TrackedSet) for use with
 Stateful objects.
 
-The conversion is recursive - nested collections are also converted.
+Only the top-level collection is converted. Nested plain collections are
+converted lazily by the tracked collections themselves, the first time they
+are read, so converting a large nested payload costs O(top-level size).
 """
 
 from __future__ import annotations
@@ -14,6 +16,7 @@ import typing as tp
 if tp.TYPE_CHECKING:
     from trellis.core.state.stateful import Stateful
 
+from trellis.core.state.stream import StreamBuffer
 from trellis.core.state.tracked import TrackedDict, TrackedList, TrackedSet
 
 __all__ = ["convert_to_tracked"]
@@ -24,10 +27,11 @@ def convert_to_tracked(
     owner: Stateful | None = None,
     attr: str = "",
 ) -> tp.Any:
-    """Recursively convert plain collections to tracked versions.
+    """Convert a plain collection to its tracked version.
 
     Converts list -> TrackedList, dict -> TrackedDict, set -> TrackedSet.
-    Nested collections are also converted recursively.
+    Nested collections are converted lazily, when first read through the
+    tracked collection, and share its owner.
 
     Already-tracked collections with no owner are bound to the new owner.
     Already-tracked collections that belong to another owner raise ValueError
@@ -48,16 +52,10 @@ def convert_to_tracked(
 
     # Fast path: exact type match for plain collections
     if val_type is list:
-        converted_list = [
-            convert_to_tracked(item, owner, f"{attr}[{i}]") for i, item in enumerate(value)
-        ]
-        return TrackedList(converted_list, owner=owner, attr=attr)
+        return TrackedList(value, owner=owner, attr=attr)
 
     if val_type is dict:
-        converted_dict = {
-            k: convert_to_tracked(v, owner, f"{attr}[{k!r}]") for k, v in value.items()
-        }
-        return TrackedDict(converted_dict, owner=owner, attr=attr)
+        return TrackedDict(value, owner=owner, attr=attr)
 
     if val_type is set:
         # Sets contain hashable items, which typically aren't collections
@@ -65,7 +63,7 @@ def convert_to_tracked(
         return TrackedSet(value, owner=owner, attr=attr)
 
     # Already a tracked collection - check ownership
-    if isinstance(value, (TrackedList, TrackedDict, TrackedSet)):
+    if isinstance(value, (TrackedList, TrackedDict, TrackedSet, StreamBuffer)):
         if owner is not None:
             existing_owner = value._owner() if value._owner else None
             if existing_owner is not None and existing_owner is not owner:
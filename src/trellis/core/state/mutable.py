@@ -28,6 +28,7 @@ from __future__ import annotations
 import typing as tp
 
 from trellis.core.rendering.session import get_render_session
+from trellis.core.state.attribute import read_untracked
 
 if tp.TYPE_CHECKING:
     from trellis.core.state.stateful import Stateful
@@ -37,17 +38,6 @@ T = tp.TypeVar("T")
 __all__ = ["Mutable", "callback", "mutable"]
 
 
-def record_property_access(owner: Stateful, attr: str, value: tp.Any) -> None:
-    """Record a property access for potential use by mutable().
-
-    Called by Stateful.__getattribute__ during render to track the most
-    recent property access. This enables mutable() to capture the reference.
-    """
-    session = get_render_session()
-    if session is not None and session.active is not None:
-        session.active.last_property_access = (owner, attr, value)
-
-
 def clear_property_access() -> None:
     """Clear the last recorded property access."""
     session = get_render_session()
@@ -89,12 +79,12 @@ class Mutable(tp.Generic[T]):
         self._attr = attr
         self._on_change = on_change
         # Capture value at creation time for change detection
-        self._snapshot: T = object.__getattribute__(owner, attr)
+        self._snapshot: T = read_untracked(owner, attr)
 
     @property
     def value(self) -> T:
         """Get the current value of the wrapped property."""
-        return object.__getattribute__(self._owner, self._attr)  # type: ignore
+        return tp.cast("T", read_untracked(self._owner, self._attr))
 
     @value.setter
     def value(self, new_value: T) -> None:
@@ -28,6 +28,7 @@ from dataclasses import dataclass, field
 
 from trellis.core.rendering.lifecycle import invoke_lifecycle_hook
 from trellis.core.rendering.session import get_render_session
+from trellis.core.state.attribute import read_untracked
 
 if tp.TYPE_CHECKING:
     from typing import Self
@@ -68,7 +69,7 @@ class _RefHolder(tp.Generic[T]):
     """Proxy that holds a reference to a child's exposed ref.
 
     Forwards attribute access to the underlying ref while bypassing
-    Stateful's dependency tracking (uses object.__getattribute__).
+    Stateful's dependency tracking (uses read_untracked).
     """
 
     __slots__ = ("_ref", "_ref_type")
@@ -88,8 +89,8 @@ class _RefHolder(tp.Generic[T]):
                 f"Ref holder for {ref_type.__name__} is not attached. "
                 f"Ensure the child component calls set_ref() and is mounted."
             )
-        # Bypass Stateful.__getattribute__ to avoid registering watchers
-        return object.__getattribute__(ref, name)
+        # Bypass tracked attributes to avoid registering watchers
+        return read_untracked(ref, name)
 
     def _attach(self, ref: T) -> None:
         ref_type = object.__getattribute__(self, "_ref_type")
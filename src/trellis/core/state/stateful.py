@@ -10,6 +10,9 @@ Key Features:
     - **Annotation-based tracking**: Only attributes with type annotations are
       tracked for reactivity. Private attributes (``_foo``) must opt in with
       ``Tracked[T]``.
+    - **Cheap large values**: ``Opaque[T]`` and ``Versioned[T]`` attributes skip
+      deep equality and tracked-collection conversion, for large lists or
+      arrays and data frames that can't be compared with ``==``
     - **Component-local caching**: State instances are cached per-component,
       similar to React hooks
     - **Context API**: Share state with descendants via `with state:` blocks
@@ -56,17 +59,15 @@ import logging
 import sys
 import typing as tp
 import weakref
-from dataclasses import dataclass, field
 from types import TracebackType
 
 if tp.TYPE_CHECKING:
     from trellis.core.rendering.session import RenderSession
 
 from trellis.core.callback_context import get_callback_node_id, get_callback_session
-from trellis.core.rendering.session import get_render_session, is_render_active
-from trellis.core.state.conversion import convert_to_tracked
+from trellis.core.rendering.session import get_render_session
+from trellis.core.state.attribute import ChangeDetection, install_tracked_attributes
 from trellis.core.state.dependency import StateDependency
-from trellis.core.state.mutable import record_property_access
 
 logger = logging.getLogger(__name__)
 
@@ -81,22 +82,55 @@ class _Missing:
 _MISSING = _Missing()
 
 _TRACKED_SENTINEL = object()
+_OPAQUE_SENTINEL = object()
+_VERSIONED_SENTINEL = object()
 type Tracked[T] = tp.Annotated[T, _TRACKED_SENTINEL]
 
-
-def _annotation_is_explicitly_tracked(annotation: tp.Any) -> bool:
-    """Return True when an annotation opts into tracked state explicitly."""
+# Tracked attribute whose changes are detected by identity: assigning the
+# same object is a no-op, any other object is a change. The value is stored
+# as-is, without converting collections to tracked ones.
+type Opaque[T] = tp.Annotated[T, _OPAQUE_SENTINEL]
+
+# Tracked attribute where every assignment is a change and bumps the
+# attribute's version (see state_version()). Reassign the same object after
+# mutating it in place to notify watchers. Stored as-is, like Opaque.
+type Versioned[T] = tp.Annotated[T, _VERSIONED_SENTINEL]
+
+_MARKER_ALIASES: dict[str, tp.Any] = {
+    "Tracked": _TRACKED_SENTINEL,
+    "Opaque": _OPAQUE_SENTINEL,
+    "Versioned": _VERSIONED_SENTINEL,
+}
+_MARKER_ORIGINS: dict[tp.Any, tp.Any] = {
+    Tracked: _TRACKED_SENTINEL,
+    Opaque: _OPAQUE_SENTINEL,
+    Versioned: _VERSIONED_SENTINEL,
+}
+_CHANGE_DETECTION: dict[tp.Any, ChangeDetection] = {
+    _OPAQUE_SENTINEL: "identity",
+    _VERSIONED_SENTINEL: "version",
+}
+
+
+def _annotation_marker(annotation: tp.Any) -> tp.Any:
+    """Return the tracking marker an annotation carries, if any."""
     if isinstance(annotation, str):
         normalized = annotation.replace(" ", "")
         head = normalized.split("[", 1)[0]
-        if head.rsplit(".", 1)[-1] == "Tracked":
-            return True
+        return _MARKER_ALIASES.get(head.rsplit(".", 1)[-1])
     annotation_origin = tp.get_origin(annotation)
-    if annotation_origin is Tracked:
-        return True
-    if annotation_origin is not tp.Annotated:
-        return False
-    return _TRACKED_SENTINEL in tp.get_args(annotation)[1:]
+    if annotation_origin is tp.Annotated:
+        markers = _MARKER_ORIGINS.values()
+        for metadata in tp.get_args(annotation)[1:]:
+            if any(metadata is marker for marker in markers):
+                return metadata
+        return None
+    return _MARKER_ORIGINS.get(annotation_origin)
+
+
+def _annotation_is_explicitly_tracked(annotation: tp.Any) -> bool:
+    """Return True when an annotation opts into tracked state explicitly."""
+    return _annotation_marker(annotation) is not None
 
 
 def _get_class_annotations(cls: type) -> dict[str, tp.Any]:
@@ -159,6 +193,24 @@ def _tracked_attributes(cls: type) -> frozenset[str]:
     return frozenset(tracked)
 
 
+@functools.cache
+def _change_detection(cls: type) -> dict[str, ChangeDetection]:
+    """Return the tracked attributes of a Stateful class that opt out of equality."""
+    detection: dict[str, ChangeDetection] = {}
+    for klass in reversed(cls.__mro__):
+        if klass is Stateful or klass is object:
+            continue
+
+        for name, annotation in _get_class_annotations(klass).items():
+            mode = _CHANGE_DETECTION.get(_annotation_marker(annotation))
+            if mode is None:
+                detection.pop(name, None)
+            else:
+                detection[name] = mode
+
+    return detection
+
+
 def _is_tracked_attribute(cls: type, name: str) -> bool:
     """Check if attribute should be tracked for reactivity."""
     return name in _tracked_attributes(cls)
@@ -186,26 +238,6 @@ def _mark_context_consumers_dirty(old_instance: Stateful) -> None:
         dep.notify_dirty()
 
 
-@dataclass(kw_only=True)
-class StatePropertyInfo:
-    """Tracks which elements depend on a specific state property.
-
-    When a component reads a state property during execution, the element
-    is added to this property's dependency set. When the property changes,
-    all dependent watchers are notified.
-
-    Uses WeakSet so dependencies are automatically cleaned up
-    when elements are replaced (on re-render) or removed (on unmount).
-
-    Attributes:
-        name: The property name being tracked
-        watchers: WeakSet of StateDependency objects that depend on this property
-    """
-
-    name: str
-    watchers: weakref.WeakSet[StateDependency] = field(default_factory=weakref.WeakSet)
-
-
 class Stateful:
     """Base class for reactive state objects.
 
@@ -223,9 +255,12 @@ class Stateful:
 
     State instances are cached per-component during render (like React hooks).
     Accessing state during render registers dependencies for fine-grained updates.
+
+    Tracked attributes are backed by TrackedAttribute descriptors installed on
+    the class at first instantiation; all other attributes and methods use
+    plain Python attribute access.
     """
 
-    _state_props: dict[str, StatePropertyInfo]
     _context_watchers: weakref.WeakSet[StateDependency]
     _input_versions: dict[str, int]
     _initialized: bool
@@ -246,10 +281,14 @@ class Stateful:
         Returns:
             A new or cached Stateful instance
         """
-        # One-time setup: wrap __init__ to skip re-initialization on cached instances.
-        # Done here (not __init_subclass__) so @dataclass has finished setting up __init__.
-        # Check __dict__ directly to avoid inheriting from parent class.
+        # One-time setup: wrap __init__ to skip re-initialization on cached instances,
+        # and back each tracked attribute with a TrackedAttribute descriptor.
+        # Done here (not __init_subclass__) so @dataclass has finished setting up
+        # __init__ and field defaults. Check __dict__ directly to avoid inheriting
+        # from parent class.
         if "_init_wrapped" not in cls.__dict__:
+            install_tracked_attributes(cls, _tracked_attributes(cls), _change_detection(cls))
+
             original_init = cls.__init__
 
             def wrapped_init(self: Stateful, *a: tp.Any, **kw: tp.Any) -> None:
@@ -295,138 +334,6 @@ class Stateful:
         state.local_state[key] = instance
         return instance
 
-    def __getattribute__(self, name: str) -> tp.Any:
-        """Get an attribute, tracking dependencies and recording access for mutable().
-
-        During component execution, property accesses are tracked for:
-        1. Dependency registration - so state changes trigger re-renders
-        2. Property recording - so mutable() can capture the reference
-
-        Only tracked attributes in subclasses participate in reactivity:
-        public annotated attributes and private ``Tracked[...]`` attributes.
-        Callables (methods) are never tracked.
-
-        Args:
-            name: The attribute name to access
-
-        Returns:
-            The actual attribute value
-        """
-        value = object.__getattribute__(self, name)
-
-        # Skip callables - methods shouldn't be tracked
-        if callable(value):
-            return value
-
-        # Only track type-annotated attributes in subclasses
-        if not _is_tracked_attribute(type(self), name):
-            return value
-
-        # Check for active dependency (element or reactive effect)
-        session = get_render_session()
-        if session is None:
-            return value
-        dep = session.active_dependency
-        if dep is None:
-            return value
-
-        # Lazy init _state_props (needed when @dataclass doesn't call super().__init__)
-        try:
-            deps = object.__getattribute__(self, "_state_props")
-        except AttributeError:
-            deps = {}
-            object.__setattr__(self, "_state_props", deps)
-
-        if name not in deps:
-            deps[name] = StatePropertyInfo(name=name)
-
-        deps[name].watchers.add(dep)
-        logger.debug("Dependency: %s reads %s.%s", dep, type(self).__name__, name)
-
-        # Record access for mutable() to capture
-        record_property_access(self, name, value)
-
-        return value
-
-    def __setattr__(self, name: str, value: tp.Any) -> None:
-        """Set an attribute, marking dependent elements as dirty.
-
-        When a tracked attribute is modified, all elements that previously
-        read that attribute are marked dirty and will re-render.
-
-        Only tracked attributes in subclasses trigger reactivity: public
-        annotated attributes and private ``Tracked[...]`` attributes.
-        Other attributes can be set but won't trigger re-renders.
-
-        Plain list/dict/set values are auto-converted to TrackedList/Dict/Set
-        for reactive collection tracking.
-
-        Args:
-            name: The attribute name to set
-            value: The new value
-
-        Raises:
-            RuntimeError: If called during component rendering. State changes
-                must happen outside render (in callbacks, hooks, timers, etc.)
-        """
-        # Only track type-annotated attributes in subclasses
-        if not _is_tracked_attribute(type(self), name):
-            object.__setattr__(self, name, value)
-            return
-
-        # Auto-convert plain collections to tracked versions (recursively)
-        value = convert_to_tracked(value, owner=self, attr=name)
-
-        # Check if this is initialization vs modification
-        # Use __dict__ to check instance attributes only (not class defaults from @dataclass)
-        instance_dict = object.__getattribute__(self, "__dict__")
-        if name in instance_dict:
-            old_value = instance_dict[name]
-            is_modification = True
-            # Check if value actually changed
-            if old_value == value:
-                logger.debug(
-                    "%s.%s unchanged, skipping",
-                    type(self).__name__,
-                    name,
-                )
-                return  # Value unchanged, skip dirty marking
-        else:
-            old_value = None
-            is_modification = False
-
-        # Prevent state modifications during render (but allow initialization)
-        if is_modification and is_render_active():
-            raise RuntimeError(
-                f"Cannot modify state '{name}' during render. "
-                f"State changes must happen outside of component execution "
-                f"(e.g., in callbacks, mount/unmount hooks, or timers)."
-            )
-
-        # Set the value
-        object.__setattr__(self, name, value)
-
-        if is_modification:
-            logger.debug(
-                "%s.%s = %r (was %r)",
-                type(self).__name__,
-                name,
-                value,
-                old_value,
-            )
-
-        # Mark dependent elements as dirty (if we have deps tracking initialized)
-        try:
-            deps = object.__getattribute__(self, "_state_props")
-        except AttributeError:
-            return  # Not initialized yet
-
-        if name in deps:
-            # Notify all watchers (WeakSet auto-skips dead refs)
-            for watcher in deps[name].watchers:
-                watcher.notify_dirty()
-                logger.debug("Marking dirty: %s", watcher)
-
     def on_mount(self) -> None | tp.Coroutine[tp.Any, tp.Any, None]:
         """Called after owning element mounts. Override for initialization.
 
@@ -476,16 +383,13 @@ class Stateful:
 
         element_id = session.current_element_id
         assert element_id is not None  # Guaranteed by is_executing() check above
-        state = session.states.get_or_create(element_id)
+        old_instance = session.states.provide(element_id, self)
 
         # If a different instance was previously providing context for this type,
         # mark all its consumers dirty so they re-execute and pick up the new instance.
-        ctx_type = type(self)
-        old_instance = state.context.get(ctx_type)
         if old_instance is not None and old_instance is not self:
             _mark_context_consumers_dirty(old_instance)
 
-        state.context[ctx_type] = self
         logger.debug("Providing %s context at %s", type(self).__name__, element_id)
         return self
 
@@ -519,8 +423,9 @@ class Stateful:
     def from_context(cls, *, default: tp.Self | None | _Missing = _MISSING) -> tp.Self | None:
         """Retrieve the nearest ancestor instance of this state type.
 
-        Walks up the element tree looking for context. Can be called during
-        component execution (render context) or within callback_context.
+        Walks up the element tree looking for context, caching the result on
+        the elements it passes so repeated lookups are O(1). Can be called
+        during component execution (render context) or within callback_context.
 
         Example:
             ```python
@@ -570,20 +475,12 @@ class Stateful:
         assert session is not None
         logger.debug("Looking up %s context", cls.__name__)
 
-        # Walk up the parent_id chain with cycle detection
-        visited: set[str] = set()
-        while element_id is not None:
-            if element_id in visited:
-                break  # Cycle detected
-            visited.add(element_id)
-            state = session.states.get(element_id)
-            if state is not None and cls in state.context:
-                instance = tp.cast("tp.Self", state.context[cls])
-                logger.debug("Found %s at ancestor %s", cls.__name__, element_id)
-                if is_render_context:
-                    _register_context_dependency(session, instance)
-                return instance
-            element_id = state.parent_id if state else None
+        instance = session.states.resolve_context(element_id, cls)
+        if instance is not None:
+            logger.debug("Found %s in context", cls.__name__)
+            if is_render_context:
+                _register_context_dependency(session, instance)
+            return instance
 
         # No context found - return default or raise
         logger.debug("No %s found in context", cls.__name__)
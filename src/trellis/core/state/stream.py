@@ -0,0 +1,246 @@
+"""Bounded append-only buffers for streaming data props.
+
+StreamBuffer keeps the most recent ``maxlen`` items of an unbounded stream,
+such as sensor samples. Appending evicts the oldest items once the buffer is
+full. Like the tracked collections, reading the buffer during render
+registers a dependency and appending marks those readers dirty.
+
+When a StreamBuffer is passed to a React component prop annotated with
+StreamBuffer, the prop holds a StreamWindow: a snapshot of which items were
+in the buffer at that render. Diffing two windows of the same buffer yields
+just the evicted count and the appended items, so update patches scale with
+the new samples rather than the window size, and the client keeps the window.
+
+Example:
+    @dataclass(kw_only=True)
+    class Sensors(Stateful):
+        samples: StreamBuffer[tuple[float, float, float]] = field(
+            default_factory=lambda: StreamBuffer(maxlen=36_000, columns=3)
+        )
+
+    # From a timer or callback: one row of (timestamp, temperature, humidity)
+    sensors.samples.append((time.time(), 21.5, 40.0))
+
+    @component
+    def Dashboard() -> None:
+        TimeSeriesChart(data=Sensors.from_context().samples)
+"""
+
+from __future__ import annotations
+
+import itertools
+import typing as tp
+from collections import deque
+from collections.abc import Iterable, Iterator
+
+from trellis.core.state.tracked import ITER_KEY, _TrackedMixin
+
+if tp.TYPE_CHECKING:
+    from trellis.core.state.stateful import Stateful
+
+__all__ = ["StreamBuffer", "StreamWindow"]
+
+T = tp.TypeVar("T")
+
+
+class StreamBuffer(_TrackedMixin, tp.Generic[T]):
+    """A reactive ring buffer holding the last ``maxlen`` items appended.
+
+    With ``columns=None`` each item is one value and the buffer serializes as
+    a flat list. With ``columns=n`` each appended item is a row of n values,
+    stored column by column, and the buffer serializes as n lists. That is
+    the layout TimeSeriesChart expects: timestamps first, then one list per
+    series.
+
+    Access tracking:
+    - `len(buf)`, iteration, and passing the buffer as a prop register ITER_KEY
+
+    Mutation effects:
+    - `append()`, `extend()` and `clear()` mark ITER_KEY dirty
+    """
+
+    def __init__(
+        self,
+        items: Iterable[T] = (),
+        *,
+        maxlen: int,
+        columns: int | None = None,
+        owner: Stateful | None = None,
+        attr: str = "",
+    ) -> None:
+        """Create a buffer.
+
+        Args:
+            items: Initial items, oldest first
+            maxlen: Number of most recent items the buffer keeps
+            columns: Values per item for a columnar buffer, or None for a flat one
+            owner: The Stateful instance that owns this buffer (optional)
+            attr: The attribute name on owner where this is stored
+        """
+        if maxlen < 1:
+            raise ValueError(f"StreamBuffer maxlen must be at least 1, got {maxlen}")
+        if columns is not None and columns < 1:
+            raise ValueError(f"StreamBuffer columns must be at least 1, got {columns}")
+        _TrackedMixin.__init__(self, owner, attr)
+        self._maxlen = maxlen
+        self._columns = columns
+        self._data: list[deque[tp.Any]] = [
+            deque(maxlen=maxlen) for _ in range(columns if columns is not None else 1)
+        ]
+        # Sequence number one past the newest item ever appended
+        self._end = 0
+        self._append_all(items)
+
+    @property
+    def maxlen(self) -> int:
+        """Number of most recent items the buffer keeps."""
+        return self._maxlen
+
+    @property
+    def columns(self) -> int | None:
+        """Values per item for a columnar buffer, or None for a flat one."""
+        return self._columns
+
+    def append(self, item: T) -> None:
+        """Append one item, evicting the oldest if the buffer is full.
+
+        Args:
+            item: A value, or a row of ``columns`` values for a columnar buffer
+        """
+        self._check_no_render_mutation()
+        self._append_all((item,))
+        self._mark_iter_dirty()
+
+    def extend(self, items: Iterable[T]) -> None:
+        """Append items in order, evicting the oldest as needed.
+
+        Args:
+            items: Values, or rows of ``columns`` values for a columnar buffer
+        """
+        self._check_no_render_mutation()
+        if self._append_all(items):
+            self._mark_iter_dirty()
+
+    def clear(self) -> None:
+        """Remove all items."""
+        self._check_no_render_mutation()
+        for column in self._data:
+            column.clear()
+        self._mark_iter_dirty()
+
+    def window(self) -> StreamWindow:
+        """Snapshot the items currently in the buffer.
+
+        Registers a dependency, so the caller re-renders when items are appended.
+        """
+        self._register_access(ITER_KEY)
+        return StreamWindow(self, self._end - len(self._data[0]), self._end)
+
+    def __len__(self) -> int:
+        self._register_access(ITER_KEY)
+        return len(self._data[0])
+
+    def __iter__(self) -> Iterator[tp.Any]:
+        """Iterate items oldest first; rows are tuples for a columnar buffer."""
+        self._register_access(ITER_KEY)
+        if self._columns is None:
+            return iter(list(self._data[0]))
+        return zip(*(list(column) for column in self._data), strict=True)
+
+    def __repr__(self) -> str:
+        return (
+            f"StreamBuffer(maxlen={self._maxlen}, columns={self._columns}, "
+            f"len={len(self._data[0])})"
+        )
+
+    def _append_all(self, items: Iterable[T]) -> int:
+        """Append items without tracking; returns how many were appended."""
+        rows: list[tp.Any] = list(items)
+        if self._columns is None:
+            self._data[0].extend(rows)
+        elif rows:
+            for row in rows:
+                if len(row) != self._columns:
+                    raise ValueError(
+                        f"StreamBuffer '{self._attr}' expects rows of {self._columns} values, "
+                        f"got {len(row)}"
+                    )
+            for column, values in zip(self._data, zip(*rows, strict=True), strict=True):
+                column.extend(values)
+        self._end += len(rows)
+        return len(rows)
+
+    def _values(self, start: int, end: int) -> list[tp.Any]:
+        """Get the still-buffered items with sequence numbers in [start, end).
+
+        Returns a flat list, or one list per column for a columnar buffer.
+        Costs O(end - start) for items at the newest end of the buffer.
+        """
+        buffered = len(self._data[0])
+        oldest = self._end - buffered
+        start = max(start, oldest)
+        if start >= end:
+            return [] if self._columns is None else [[] for _ in self._data]
+        if start == oldest and end == self._end:
+            sliced = [list(column) for column in self._data]
+        else:
+            # Walk from the newest end so short tails don't scan the whole deque
+            skip = self._end - end
+            count = end - start
+            sliced = [
+                list(itertools.islice(reversed(column), skip, skip + count))[::-1]
+                for column in self._data
+            ]
+        return sliced[0] if self._columns is None else sliced
+
+
+class StreamWindow:
+    """Immutable snapshot of the items a StreamBuffer held at one render.
+
+    Items are identified by sequence number: the window covers ``[start, end)``
+    of everything ever appended to the buffer. Windows compare equal when they
+    cover the same range of the same buffer.
+    """
+
+    __slots__ = ("buffer", "end", "start")
+
+    def __init__(self, buffer: StreamBuffer[tp.Any], start: int, end: int) -> None:
+        self.buffer = buffer
+        self.start = start
+        self.end = end
+
+    def values(self) -> list[tp.Any]:
+        """Get the window's items as a flat list, or one list per column."""
+        return self.buffer._values(self.start, self.end)
+
+    def delta(self, old: StreamWindow) -> tuple[int, int, list[tp.Any]] | None:
+        """Describe how to turn an older window of the same buffer into this one.
+
+        Args:
+            old: A window taken from the same buffer at an earlier render
+
+        Returns:
+            (evicted, position, appended): drop ``evicted`` items from the front,
+            then add ``appended`` (flat, or one list per column) at ``position``
+            of the new window. None if the windows share no items or come from
+            different buffers, in which case the whole window should be resent.
+        """
+        if old.buffer is not self.buffer or self.start < old.start or self.start >= old.end:
+            return None
+        evicted = self.start - old.start
+        position = old.end - self.start
+        return evicted, position, self.buffer._values(old.end, self.end)
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, StreamWindow):
+            return NotImplemented
+        return self.buffer is other.buffer and self.start == other.start and self.end == other.end
+
+    def __hash__(self) -> int:
+        return hash((id(self.buffer), self.start, self.end))
+
+    def __repr__(self) -> str:
+        return f"StreamWindow({self.buffer!r}, start={self.start}, end={self.end})"
@@ -10,8 +10,10 @@ Special tracking:
 - Mutations that change length/structure mark ITER_KEY dirty
 
 Auto-conversion:
-- Stateful.__setattr__ recursively converts collections on assignment
+- Assigning a tracked Stateful attribute converts the top-level collection
 - Plain list/dict/set values become TrackedList/Dict/Set automatically
+- Nested plain collections are converted lazily, the first time they are
+  read through indexing or iteration, so assignment costs O(top-level size)
 
 Example:
     @dataclass
@@ -32,14 +34,15 @@ from __future__ import annotations
 import logging
 import typing as tp
 import weakref
-from collections.abc import Iterable, Iterator
+from collections.abc import Callable, Hashable, Iterable, Iterator
 from typing import SupportsIndex
 
 if tp.TYPE_CHECKING:
+    from trellis.core.rendering.dependency_index import DependencyIndex
     from trellis.core.state.stateful import Stateful
 
+from trellis.core.rendering.batch import batch
 from trellis.core.rendering.session import get_render_session, is_render_active
-from trellis.core.state.dependency import StateDependency
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +55,12 @@ __all__ = ["ITER_KEY", "TrackedDict", "TrackedList", "TrackedSet"]
 # Special key for iteration/length tracking
 ITER_KEY = "__iter__"
 
+# Nested values of these exact types are wrapped on first access
+_PLAIN_COLLECTIONS = (list, dict, set)
+
+# Sentinel for a new item with no matching old item in reconcile()
+_NO_MATCH: tp.Any = object()
+
 
 class _TrackedMixin:
     """Mixin providing common tracking infrastructure for collections.
@@ -59,12 +68,12 @@ class _TrackedMixin:
     Attributes:
         _owner: Weak reference to the owning Stateful instance
         _attr: The attribute name on the owner this collection is stored in
-        _deps: Dict mapping dep_key -> WeakSet[StateDependency] for automatic cleanup
+    Which watchers read which keys is recorded in the dependency index of
+    each session that read the collection.
     """
 
     _owner: weakref.ref[Stateful] | None
     _attr: str
-    _deps: dict[tp.Any, weakref.WeakSet[StateDependency]]
 
     def __init__(self, owner: Stateful | None = None, attr: str = "") -> None:
         """Initialize tracking state.
@@ -75,16 +84,36 @@ class _TrackedMixin:
         """
         self._owner = weakref.ref(owner) if owner else None
         self._attr = attr
-        self._deps = {}
 
     def _bind(self, owner: Stateful, attr: str) -> None:
         """Bind this collection to an owner Stateful and attribute.
 
-        Called by Stateful.__setattr__ when assigning a collection.
+        Called when a collection is assigned to a tracked Stateful attribute.
         """
         self._owner = weakref.ref(owner)
         self._attr = attr
 
+    def _wrap_nested(self, value: tp.Any, path: str) -> tp.Any:
+        """Wrap a nested plain collection in its tracked counterpart.
+
+        The wrapper shares this collection's owner, and is itself shallow:
+        its own nested collections are wrapped when they are read.
+
+        Args:
+            value: A plain list, dict or set stored in this collection
+            path: Where value is stored, relative to this collection
+
+        Returns:
+            The tracked collection, to be stored in place of value
+        """
+        owner = self._owner() if self._owner else None
+        attr = f"{self._attr}{path}"
+        if type(value) is list:
+            return TrackedList(value, owner=owner, attr=attr)
+        if type(value) is dict:
+            return TrackedDict(value, owner=owner, attr=attr)
+        return TrackedSet(value, owner=owner, attr=attr)
+
     def _check_no_render_mutation(self) -> None:
         """Raise if trying to mutate during render."""
         if is_render_active():
@@ -107,10 +136,7 @@ class _TrackedMixin:
         if dep is None:
             return
 
-        deps = self._deps
-        if dep_key not in deps:
-            deps[dep_key] = weakref.WeakSet()
-        deps[dep_key].add(dep)
+        session.dependencies.add(self, dep_key, dep)
 
         logger.debug("Tracked[%s] access: key=%r by %s", self._attr, dep_key, dep)
 
@@ -119,17 +145,15 @@ class _TrackedMixin:
 
         Called when the collection is mutated at this key.
         """
-        deps = self._deps
-        if dep_key not in deps:
+        # Notify every session that read this collection
+        indexes: weakref.WeakSet[DependencyIndex] | None = getattr(
+            self, "_dependency_indexes", None
+        )
+        if indexes is None:
             return
-
-        for watcher in deps[dep_key]:
-            watcher.notify_dirty()
-            logger.debug("Tracked[%s] mutation at key=%r → dirty: %s", self._attr, dep_key, watcher)
-
-        # Remove empty dep_key entries
-        if not deps.get(dep_key):
-            deps.pop(dep_key, None)
+        for index in indexes:
+            index.notify(self, dep_key)
+        logger.debug("Tracked[%s] mutation at key=%r", self._attr, dep_key)
 
     def _mark_iter_dirty(self) -> None:
         """Mark elements that depend on iteration/length as dirty."""
@@ -153,10 +177,14 @@ class TrackedList(list[T], _TrackedMixin):
     - `lst.sort()` / `lst.reverse()` marks ITER_KEY dirty (order changed)
     - `lst += items` / `lst *= n` marks ITER_KEY dirty
     - `del lst[i]` marks id(old_item) and ITER_KEY dirty
+    - `lst.reconcile(items, key=...)` updates matched items in place and
+      marks ITER_KEY dirty only if items were added, removed or reordered
 
     Nested auto-conversion:
     - When accessing `lst[i]` where `lst[i]` is a plain list/dict/set,
       it is auto-converted to a Tracked version with the same owner.
+    - Slicing converts the sliced items, and iteration converts all items
+      the first time the list is iterated after it gained new items.
     """
 
     def __new__(
@@ -177,6 +205,8 @@ class TrackedList(list[T], _TrackedMixin):
     ) -> None:
         list.__init__(self, iterable)
         _TrackedMixin.__init__(self, owner=owner, attr=attr)
+        # Whether every nested plain collection has been wrapped
+        self._nested_wrapped = False
 
     @tp.overload
     def __getitem__(self, index: SupportsIndex) -> T: ...
@@ -188,12 +218,33 @@ class TrackedList(list[T], _TrackedMixin):
         if isinstance(index, slice):
             # Slice access - register ITER_KEY (iterating over range)
             self._register_access(ITER_KEY)
+            if not self._nested_wrapped:
+                for i in range(list.__len__(self))[index]:
+                    self._wrap_item(i)
             return list(super().__getitem__(index))
 
         value = super().__getitem__(index)
+        if type(value) in _PLAIN_COLLECTIONS:
+            value = self._wrap_item(index.__index__())
         self._register_access(id(value))
         return value
 
+    def _wrap_item(self, index: int) -> T:
+        """Replace a nested plain collection at index with its tracked version."""
+        value = list.__getitem__(self, index)
+        if type(value) in _PLAIN_COLLECTIONS:
+            value = self._wrap_nested(value, f"[{index % list.__len__(self)}]")
+            list.__setitem__(self, index, value)
+        return value
+
+    def _wrap_all(self) -> None:
+        """Wrap every nested plain collection."""
+        if self._nested_wrapped:
+            return
+        for i in range(list.__len__(self)):
+            self._wrap_item(i)
+        self._nested_wrapped = True
+
     @tp.overload
     def __setitem__(self, index: SupportsIndex, value: T) -> None: ...
 
@@ -203,6 +254,8 @@ class TrackedList(list[T], _TrackedMixin):
     def __setitem__(self, index: SupportsIndex | slice, value: T | Iterable[T]) -> None:
         self._check_no_render_mutation()
 
+        self._nested_wrapped = False
+
         if isinstance(index, slice):
             # Slice assignment - complex case, mark ITER_KEY
             old_items = list.__getitem__(self, index)
@@ -235,6 +288,7 @@ class TrackedList(list[T], _TrackedMixin):
 
     def __iter__(self) -> Iterator[T]:
         self._register_access(ITER_KEY)
+        self._wrap_all()
         return list.__iter__(self)
 
     def __len__(self) -> int:
@@ -259,6 +313,7 @@ class TrackedList(list[T], _TrackedMixin):
 
     def append(self, item: T) -> None:
         self._check_no_render_mutation()
+        self._nested_wrapped = False
         list.append(self, item)
         self._mark_dirty(id(item))
         self._mark_iter_dirty()
@@ -266,6 +321,7 @@ class TrackedList(list[T], _TrackedMixin):
     def extend(self, items: Iterable[T]) -> None:
         self._check_no_render_mutation()
         items_list = list(items)
+        self._nested_wrapped = False
         list.extend(self, items_list)
         for item in items_list:
             self._mark_dirty(id(item))
@@ -273,6 +329,7 @@ class TrackedList(list[T], _TrackedMixin):
 
     def insert(self, index: SupportsIndex, item: T) -> None:
         self._check_no_render_mutation()
+        self._nested_wrapped = False
         list.insert(self, index, item)
         self._mark_dirty(id(item))
         self._mark_iter_dirty()
@@ -307,6 +364,73 @@ class TrackedList(list[T], _TrackedMixin):
         list.reverse(self)
         self._mark_iter_dirty()
 
+    def reconcile(
+        self,
+        new_items: Iterable[T],
+        *,
+        key: Callable[[T], Hashable] | None = None,
+    ) -> None:
+        """Update the list to match new_items with as few notifications as possible.
+
+        Each new item is matched with an old item, by position or by key:
+
+        - Matched items that are equal keep the old object, so nothing that
+          depends on it is notified
+        - Matched dicts and lists that differ are updated in place (with
+          ``update_diff()`` / ``reconcile()``), so only the keys that changed
+          are notified and the item keeps its identity
+        - Other matched items that differ are replaced
+        - Unmatched old items are removed
+
+        ITER_KEY is marked dirty only if the resulting sequence of item
+        objects differs from the old one. All notifications are delivered
+        in a single batch.
+
+        Example:
+            ```python
+            def refresh(rows: list[dict[str, Any]]) -> None:
+                state.rows.reconcile(rows, key=lambda row: row["id"])
+            ```
+
+        Args:
+            new_items: The desired contents of the list
+            key: Function returning a stable identity for an item (such as a
+                database ID). If omitted, items are matched by position.
+        """
+        self._check_no_render_mutation()
+        new_list = list(new_items)
+        old_list = list(list.__iter__(self))
+
+        if key is None:
+            matches = old_list[: len(new_list)]
+            matches += [_NO_MATCH] * (len(new_list) - len(matches))
+        else:
+            old_by_key = {key(item): item for item in old_list}
+            # Popping ensures a duplicate key in new_items can't claim the same old item twice
+            matches = [old_by_key.pop(key(item), _NO_MATCH) for item in new_list]
+
+        with batch():
+            result: list[T] = []
+            for old, new in zip(matches, new_list, strict=True):
+                if old is _NO_MATCH or old is new:
+                    result.append(new)
+                elif _merge_in_place(old, new) or old == new:
+                    result.append(old)
+                else:
+                    result.append(new)
+
+            kept = {id(item) for item in result}
+            for item in old_list:
+                if id(item) not in kept:
+                    self._mark_dirty(id(item))
+
+            if len(result) != len(old_list) or any(
+                item is not old for item, old in zip(result, old_list, strict=False)
+            ):
+                self._nested_wrapped = False
+                list.__setitem__(self, slice(None), result)
+                self._mark_iter_dirty()
+
     def copy(self) -> list[T]:
         """Return a plain list copy (not tracked)."""
         return list(self)
@@ -363,6 +487,13 @@ class TrackedDict(dict[KT, VT], _TrackedMixin):
     - `d.clear()` marks all keys and ITER_KEY dirty
     - `d.update(...)` marks all affected keys and ITER_KEY dirty
     - `d.setdefault(key, val)` marks key and ITER_KEY dirty if key is new
+    - `d.update_diff(mapping)` marks only keys whose value changed, and
+      ITER_KEY only if keys were added (or removed)
+
+    Nested auto-conversion:
+    - When accessing `d[key]` / `d.get(key)` where the value is a plain
+      list/dict/set, it is auto-converted to a Tracked version with the same
+      owner. `d.values()` / `d.items()` convert all values.
     """
 
     def __new__(
@@ -385,14 +516,34 @@ class TrackedDict(dict[KT, VT], _TrackedMixin):
     ) -> None:
         dict.__init__(self, mapping, **kwargs)
         _TrackedMixin.__init__(self, owner=owner, attr=attr)
+        # Whether every nested plain collection has been wrapped
+        self._nested_wrapped = False
 
     def __getitem__(self, key: KT) -> VT:
         value = dict.__getitem__(self, key)
+        if type(value) in _PLAIN_COLLECTIONS:
+            value = self._wrap_value(key, value)
         self._register_access(key)
         return value
 
+    def _wrap_value(self, key: KT, value: VT) -> VT:
+        """Replace a nested plain collection at key with its tracked version."""
+        if type(value) in _PLAIN_COLLECTIONS:
+            value = self._wrap_nested(value, f"[{key!r}]")
+            dict.__setitem__(self, key, value)
+        return value
+
+    def _wrap_all(self) -> None:
+        """Wrap every nested plain collection."""
+        if self._nested_wrapped:
+            return
+        for key, value in list(dict.items(self)):
+            self._wrap_value(key, value)
+        self._nested_wrapped = True
+
     def __setitem__(self, key: KT, value: VT) -> None:
         self._check_no_render_mutation()
+        self._nested_wrapped = False
         is_new = key not in dict.keys(self)
         dict.__setitem__(self, key, value)
         self._mark_dirty(key)
@@ -429,7 +580,7 @@ class TrackedDict(dict[KT, VT], _TrackedMixin):
     def get(self, key: KT, default: VT | T | None = None, /) -> VT | T | None:
         self._register_access(key)
         if key in dict.keys(self):
-            return dict.__getitem__(self, key)
+            return self._wrap_value(key, dict.__getitem__(self, key))
         return default
 
     def keys(self) -> tp.KeysView[KT]:  # type: ignore[override]
@@ -438,10 +589,12 @@ class TrackedDict(dict[KT, VT], _TrackedMixin):
 
     def values(self) -> tp.ValuesView[VT]:  # type: ignore[override]
         self._register_access(ITER_KEY)
+        self._wrap_all()
         return dict.values(self)
 
     def items(self) -> tp.ItemsView[KT, VT]:  # type: ignore[override]
         self._register_access(ITER_KEY)
+        self._wrap_all()
         return dict.items(self)
 
     def pop(self, key: KT, *default: tp.Any) -> tp.Any:
@@ -486,6 +639,7 @@ class TrackedDict(dict[KT, VT], _TrackedMixin):
         new_keys.update(set(kwargs.keys()) - existing_keys)
         all_keys = other_keys | set(kwargs.keys())
 
+        self._nested_wrapped = False
         dict.update(self, other, **kwargs)
 
         for key in all_keys:
@@ -498,9 +652,58 @@ class TrackedDict(dict[KT, VT], _TrackedMixin):
         is_new = key not in self
         result = dict.setdefault(self, key, default)  # type: ignore[arg-type]
         if is_new:
+            self._nested_wrapped = False
             self._mark_dirty(key)
             self._mark_iter_dirty()
-        return result
+            return result
+        return self._wrap_value(key, result)  # type: ignore[arg-type]
+
+    def update_diff(
+        self,
+        mapping: tp.Mapping[KT, VT],
+        *,
+        remove_missing: bool = False,
+    ) -> None:
+        """Update the dict from mapping, notifying only keys whose value changed.
+
+        Unlike ``update()``, which marks every key it is given, values equal
+        to the current ones are skipped. Nested dicts and lists that differ
+        are updated in place (with ``update_diff()`` / ``reconcile()``), so
+        the nested collection keeps its identity and only what changed
+        inside it is notified. All notifications are delivered in a single
+        batch.
+
+        Args:
+            mapping: The new values
+            remove_missing: Also delete keys that are not in mapping, making
+                the dict equal to it
+        """
+        self._check_no_render_mutation()
+        with batch():
+            structural = False
+            for key, new in mapping.items():
+                if not dict.__contains__(self, key):
+                    self._nested_wrapped = False
+                    dict.__setitem__(self, key, new)
+                    self._mark_dirty(key)
+                    structural = True
+                    continue
+
+                old = dict.__getitem__(self, key)
+                if old is new or _merge_in_place(old, new) or old == new:
+                    continue
+                self._nested_wrapped = False
+                dict.__setitem__(self, key, new)
+                self._mark_dirty(key)
+
+            if remove_missing:
+                for key in [key for key in dict.keys(self) if key not in mapping]:
+                    dict.__delitem__(self, key)
+                    self._mark_dirty(key)
+                    structural = True
+
+            if structural:
+                self._mark_iter_dirty()
 
     def copy(self) -> dict[KT, VT]:
         """Return a plain dict copy (not tracked)."""
@@ -707,3 +910,23 @@ class TrackedSet(set[T], _TrackedMixin):
 
     def __repr__(self) -> str:
         return f"TrackedSet({set.__repr__(self)})"
+
+
+def _merge_in_place(old: tp.Any, new: tp.Any) -> bool:
+    """Update a tracked collection in place to match new, if they are compatible.
+
+    Args:
+        old: The current value
+        new: The value it should become
+
+    Returns:
+        True if old was a tracked dict or list and has been updated, False if
+        the caller must compare and replace the value itself
+    """
+    if isinstance(old, TrackedDict) and isinstance(new, dict):
+        old.update_diff(new, remove_missing=True)
+        return True
+    if isinstance(old, TrackedList) and isinstance(new, list):
+        old.reconcile(new)
+        return True
+    return False
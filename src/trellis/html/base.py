@@ -12,7 +12,7 @@ import typing as tp
 from collections.abc import Callable
 from typing import Literal, ParamSpec, TypeVar, overload
 
-from trellis.core.components.base import Component, ElementKind
+from trellis.core.components.base import Component, ElementKind, callback_props_from_signature
 from trellis.core.rendering.element import ContainerElement, Element
 from trellis.core.rendering.traits import ContainerTrait
 
@@ -211,6 +211,7 @@ def html_element(
 
         # Create singleton instance with explicit name and element_class
         _singleton = _Generated(element_name, element_class=resolved_element_class)
+        _singleton.callback_props = callback_props_from_signature(signature)
 
         @functools.wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> Element | E:
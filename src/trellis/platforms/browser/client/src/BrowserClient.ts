@@ -21,7 +21,7 @@ import {
   UrlChangedMessage,
 } from "@trellis/trellis-core/types";
 import { ClientMessageHandlerCallbacks } from "@trellis/trellis-core/ClientMessageHandler";
-import { TrellisStore } from "@trellis/trellis-core/core";
+import { TrellisStore, type CallbackId } from "@trellis/trellis-core/core";
 import { RoutingMode } from "@trellis/trellis-core/RouterManager";
 
 export type { ConnectionState };
@@ -109,7 +109,7 @@ export class BrowserClient extends BaseTrellisClient {
   }
 
   /** Send an event to invoke a callback in Python. */
-  sendEvent(callbackId: string, args: unknown[] = []): void {
+  sendEvent(callbackId: CallbackId, args: unknown[] = []): void {
     const msg: EventMessage = {
       type: MessageType.EVENT,
       callback_id: callbackId,
@@ -155,7 +155,12 @@ app = apploader.app
 def app_wrapper(_component, system_theme, theme_mode):
     return app.get_wrapped_top(system_theme, theme_mode)
 
-await apploader.platform.run(app.top, app_wrapper, batch_delay=config.batch_delay)
+await apploader.platform.run(
+    app.top,
+    app_wrapper,
+    batch_delay=config.batch_delay,
+    render_slice_budget=config.render_slice_budget,
+)
 `;
 
   pyodide
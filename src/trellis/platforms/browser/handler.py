@@ -9,6 +9,7 @@ from __future__ import annotations
 import asyncio
 import typing as tp
 from collections.abc import Callable
+from concurrent.futures import Executor
 
 import msgspec
 
@@ -16,6 +17,7 @@ from trellis.core.components.base import Component
 from trellis.core.protocol import Message, decode_message
 from trellis.platforms.common.handler import AppWrapper, MessageHandler
 from trellis.platforms.common.messages import EventMessage
+from trellis.platforms.common.typed_arrays import typed_array_view
 
 __all__ = ["BrowserMessageHandler"]
 
@@ -39,15 +41,28 @@ class BrowserMessageHandler(MessageHandler):
         root_component: Component,
         app_wrapper: AppWrapper,
         batch_delay: float = 1.0 / 30,
+        *,
+        render_slice_budget: float | None = None,
+        render_executor: Executor | None = None,
     ) -> None:
         """Create a browser message handler.
 
         Args:
             root_component: The root Trellis component to render
             app_wrapper: Callback to wrap component with TrellisApp
-            batch_delay: Time between render frames in seconds (default ~33ms for 30fps)
+            batch_delay: Minimum time between render frames in seconds (default ~33ms)
+            render_slice_budget: If set, re-render in time slices of this many
+                seconds, yielding to the event loop between them
+            render_executor: If set, re-render on this executor instead of
+                the event loop
         """
-        super().__init__(root_component, app_wrapper, batch_delay=batch_delay)
+        super().__init__(
+            root_component,
+            app_wrapper,
+            batch_delay=batch_delay,
+            render_slice_budget=render_slice_budget,
+            render_executor=render_executor,
+        )
         self._inbox = asyncio.Queue()
         self._send_callback = None
         # Default serializer just returns dict as-is (for tests)
@@ -99,11 +114,11 @@ class BrowserMessageHandler(MessageHandler):
         msg = _dict_to_message(msg_dict)
         self._inbox.put_nowait(msg)
 
-    def post_event(self, callback_id: str, args: list[tp.Any] | None = None) -> None:
+    def post_event(self, callback_id: int, args: list[tp.Any] | None = None) -> None:
         """Convenience method to post an event message.
 
         Args:
-            callback_id: The callback ID to invoke
+            callback_id: The callback handle to invoke
             args: Arguments to pass to the callback
         """
         self._inbox.put_nowait(EventMessage(callback_id=callback_id, args=args or []))
@@ -113,12 +128,22 @@ def _message_to_dict(msg: Message) -> dict[str, tp.Any]:
     """Convert a msgspec Message struct to a plain dict for JavaScript.
 
     Uses msgspec.to_builtins() for recursive conversion of nested structs,
-    which is required for postMessage to clone the object.
+    which is required for postMessage to clone the object. Typed array props
+    become typed memoryviews, which Pyodide converts to JS typed arrays.
     """
-    result: dict[str, tp.Any] = msgspec.to_builtins(msg)
+    result: dict[str, tp.Any] = msgspec.to_builtins(
+        msg, builtin_types=(memoryview,), enc_hook=_typed_array_hook
+    )
     return result
 
 
+def _typed_array_hook(value: tp.Any) -> tp.Any:
+    """Convert msgpack Ext values from typed array props for to_builtins()."""
+    if isinstance(value, msgspec.msgpack.Ext):
+        return typed_array_view(value)
+    raise NotImplementedError(f"Objects of type {type(value).__name__} are not supported")
+
+
 def _dict_to_message(msg_dict: dict[str, tp.Any]) -> Message:
     """Convert a dict from JavaScript to a protocol message struct."""
     return tp.cast("Message", decode_message(msg_dict))
@@ -44,6 +44,7 @@ class BrowserPlatform(Platform):
         app_wrapper: AppWrapper,
         *,
         batch_delay: float = 1.0 / 30,
+        render_slice_budget: float = 0.0,
         **kwargs: Any,
     ) -> None:
         """Run inside Pyodide using the JS bridge.
@@ -53,7 +54,9 @@ class BrowserPlatform(Platform):
         Args:
             root_component: The root Trellis component to render
             app_wrapper: Callback to wrap component with TrellisApp
-            batch_delay: Time between render frames in seconds (default ~33ms for 30fps)
+            batch_delay: Minimum time between render frames in seconds (default ~33ms)
+            render_slice_budget: Seconds a re-render runs before yielding to
+                the event loop (0 renders each pass in one go)
         """
         # Pyodide-only imports - these modules only exist inside the Pyodide runtime
         import js  # type: ignore[import-not-found]  # noqa: PLC0415
@@ -69,7 +72,12 @@ class BrowserPlatform(Platform):
 
         # Create handler and connect to bridge
         # root_component is typed as Callable but is actually Component at runtime
-        handler = BrowserMessageHandler(root_component, app_wrapper, batch_delay=batch_delay)  # type: ignore[arg-type]
+        handler = BrowserMessageHandler(
+            root_component,  # type: ignore[arg-type]
+            app_wrapper,
+            batch_delay=batch_delay,
+            render_slice_budget=render_slice_budget or None,
+        )
         handler.set_send_callback(bridge.send_message, serializer=pyodide_serializer)
 
         # Create a persistent proxy for the handler so JavaScript can keep a reference
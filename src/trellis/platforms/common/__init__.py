@@ -5,6 +5,7 @@ from pathlib import Path
 from trellis.platforms.common.base import Platform, PlatformArgumentError, PlatformType
 from trellis.platforms.common.handler import MessageHandler
 from trellis.platforms.common.messages import (
+    AckMessage,
     AddPatch,
     DebugConfig,
     ErrorMessage,
@@ -18,7 +19,7 @@ from trellis.platforms.common.messages import (
     UpdatePatch,
 )
 from trellis.platforms.common.ports import find_available_port
-from trellis.platforms.common.serialization import parse_callback_id, serialize_element
+from trellis.platforms.common.serialization import serialize_element
 from trellis.registry import registry
 
 # Register the trellis-core module with base_path pointing to the TypeScript
@@ -36,6 +37,7 @@ registry.register(
 )
 
 __all__ = [
+    "AckMessage",
     "AddPatch",
     "DebugConfig",
     "ErrorMessage",
@@ -52,6 +54,5 @@ __all__ = [
     "RemovePatch",
     "UpdatePatch",
     "find_available_port",
-    "parse_callback_id",
     "serialize_element",
 ]
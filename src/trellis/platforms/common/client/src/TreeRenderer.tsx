@@ -16,6 +16,8 @@ import {
   toReactDomProps,
   ElementKind,
   store,
+  type CallbackId,
+  type ElementId,
 } from "./core";
 import { KeyBindingRegistry } from "./core/keyBindingRegistry";
 import {
@@ -64,7 +66,7 @@ export function TreeRenderer(): React.ReactElement | null {
   const client = useTrellisClient();
   const { keyState, registry } = useKeyBindingRegistry(client);
 
-  if (!rootId) {
+  if (rootId === null) {
     return null;
   }
 
@@ -84,7 +86,7 @@ interface KeyBindingContextValue {
 const KeyBindingContext = React.createContext<KeyBindingContextValue | null>(null);
 
 interface NodeRendererProps {
-  id: string;
+  id: ElementId;
 }
 
 /**
@@ -209,7 +211,7 @@ function OnKeyWrapper({
 function normalizeBindings(rawBindings: unknown[]): NormalizedBinding[] {
   return rawBindings.map((raw) => {
     const entry = raw as Record<string, unknown>;
-    const callbackId = (entry.handler as { __callback__: string }).__callback__;
+    const callbackId = (entry.handler as { __callback__: CallbackId }).__callback__;
     const isSeq = isSequenceBinding(entry as any);
     return {
       id: isSeq ? `onkey-seq-${callbackId}` : `onkey-${callbackId}`,
@@ -248,7 +250,7 @@ function createOnKeyHandler(
 
 async function fireOnKeyEvent(
   client: TrellisClient,
-  callbackId: string,
+  callbackId: CallbackId,
   native: KeyboardEvent,
   reactEvent: React.KeyboardEvent
 ): Promise<void> {
@@ -276,7 +278,7 @@ function GlobalKeyRegistrar({
   registry,
   children,
 }: {
-  elementId: string;
+  elementId: ElementId;
   globalFilters: unknown[];
   registry: KeyBindingRegistry;
   children: React.ReactElement;
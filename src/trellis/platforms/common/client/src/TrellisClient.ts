@@ -3,7 +3,7 @@ import {
   ClientMessageHandlerCallbacks,
   ConnectionState,
 } from "./ClientMessageHandler";
-import { TrellisStore } from "./core";
+import { TrellisStore, type CallbackId } from "./core";
 import { RouterManager, RoutingMode } from "./RouterManager";
 import { UrlChangedMessage } from "./types";
 
@@ -32,10 +32,10 @@ const KEY_EVENT_TIMEOUT_MS = 5000;
 
 export interface TrellisClient {
   /** Send an event to the backend to invoke a callback. */
-  sendEvent(callbackId: string, args: unknown[]): void;
+  sendEvent(callbackId: CallbackId, args: unknown[]): void;
 
   /** Send a key event and wait for handled/pass response. */
-  sendKeyEvent(callbackId: string, requestId: string, args: unknown[]): Promise<boolean>;
+  sendKeyEvent(callbackId: CallbackId, requestId: string, args: unknown[]): Promise<boolean>;
 }
 
 /**
@@ -92,7 +92,7 @@ export abstract class BaseTrellisClient implements TrellisClient {
   protected abstract sendUrlChange(msg: UrlChangedMessage): void;
 
   /** Send an event to invoke a callback. Subclasses implement transport. */
-  abstract sendEvent(callbackId: string, args: unknown[]): void;
+  abstract sendEvent(callbackId: CallbackId, args: unknown[]): void;
 
   getConnectionState(): ConnectionState {
     return this.handler.getConnectionState();
@@ -117,7 +117,7 @@ export abstract class BaseTrellisClient implements TrellisClient {
    * Piggybacks on existing sendEvent transport — the server extracts the
    * request_id from the first arg and sends back a KeyEventResponseMessage.
    */
-  sendKeyEvent(callbackId: string, requestId: string, args: unknown[]): Promise<boolean> {
+  sendKeyEvent(callbackId: CallbackId, requestId: string, args: unknown[]): Promise<boolean> {
     return new Promise((resolve) => {
       const timeout = setTimeout(() => {
         this.handler.pendingKeyEvents.delete(requestId);
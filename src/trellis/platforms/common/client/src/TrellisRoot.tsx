@@ -76,7 +76,7 @@ function TrellisContent({
   const rootId = useRootId();
 
   // If we have a tree, render it
-  if (rootId) {
+  if (rootId !== null) {
     return <TreeRenderer />;
   }
 
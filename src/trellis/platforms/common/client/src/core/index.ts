@@ -1,11 +1,13 @@
 /** Core tree rendering - shared between server client and playground. */
 
 // Type-only exports (erased at runtime)
-export type { SerializedElement, CallbackRef, EventHandler } from "./types";
+export type { CallbackId, ElementId, SerializedElement, CallbackRef, EventHandler } from "./types";
 export type { WidgetComponent, WidgetRegistry } from "./renderTree";
 export type { NodeData } from "./store";
+export type { NumericArray } from "./typedArrays";
 
 // Value exports (exist at runtime)
 export { ElementKind, isCallbackRef } from "./types";
 export { applyCompiledStyleProps, renderNode, processProps, toReactDomProps } from "./renderTree";
 export { store, useNode, useRootId, TrellisStore } from "./store";
+export { typedArrayCodec } from "./typedArrays";
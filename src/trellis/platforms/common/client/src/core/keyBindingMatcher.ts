@@ -14,18 +14,19 @@ import {
   type SerializedSequenceBinding,
 } from "./keyFilters";
 import type { KeyState } from "./keyState";
+import type { CallbackId } from "./types";
 
 export interface NormalizedBinding {
   /** Caller-assigned ID for KeyState tracking (e.g. "global-seq-cb1") */
   id: string;
   /** Handler callback ID returned to the caller for dispatch */
-  callbackId: string;
+  callbackId: CallbackId;
   /** The underlying binding data */
   binding: SerializedKeyBinding | SerializedSequenceBinding;
 }
 
 export type MatchResult =
-  | { action: "fire"; callbackId: string; bindingIndex: number }
+  | { action: "fire"; callbackId: CallbackId; bindingIndex: number }
   | { action: "suppress" }
   | { action: "none" };
 
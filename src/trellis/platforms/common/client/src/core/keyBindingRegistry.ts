@@ -18,15 +18,16 @@ import {
   type NormalizedBinding,
 } from "./keyBindingMatcher";
 import type { KeyState } from "./keyState";
+import type { CallbackId, ElementId } from "./types";
 
 interface RegisteredBinding {
-  elementId: string;
+  elementId: ElementId;
   depth: number;
   binding: SerializedKeyBinding | SerializedSequenceBinding;
 }
 
 type SendKeyEvent = (
-  callbackId: string,
+  callbackId: CallbackId,
   requestId: string,
   args: unknown[]
 ) => Promise<boolean>;
@@ -46,7 +47,7 @@ export class KeyBindingRegistry {
   /**
    * Update bindings for an element. Replaces any previous bindings for that element.
    */
-  updateElement(elementId: string, rawGlobalKeyFilters: unknown[]): void {
+  updateElement(elementId: ElementId, rawGlobalKeyFilters: unknown[]): void {
     // Remove existing bindings for this element
     this.bindings = this.bindings.filter((b) => b.elementId !== elementId);
 
@@ -68,7 +69,7 @@ export class KeyBindingRegistry {
   /**
    * Remove all bindings for an element.
    */
-  removeElement(elementId: string): void {
+  removeElement(elementId: ElementId): void {
     this.bindings = this.bindings.filter((b) => b.elementId !== elementId);
     if (this.bindings.length === 0) {
       this.removeListeners();
@@ -128,7 +129,7 @@ export class KeyBindingRegistry {
   }
 
   private async fireAndChain(
-    callbackId: string,
+    callbackId: CallbackId,
     event: KeyboardEvent,
     fromIndex: number
   ): Promise<void> {
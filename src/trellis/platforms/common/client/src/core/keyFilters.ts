@@ -2,6 +2,8 @@
  * Shared key filter matching logic for both .on_key() and HotKey().
  */
 
+import type { CallbackId } from "./types";
+
 export interface SerializedKeyFilter {
   key: string;
   ctrl: boolean;
@@ -18,7 +20,7 @@ export interface SerializedSequence {
 
 export interface SerializedKeyBinding {
   filter: SerializedKeyFilter;
-  handler: { __callback__: string };
+  handler: { __callback__: CallbackId };
   event_type: "keydown" | "keyup";
   require_reset: boolean;
   ignore_in_inputs: boolean;
@@ -26,7 +28,7 @@ export interface SerializedKeyBinding {
 
 export interface SerializedSequenceBinding {
   sequence: SerializedSequence;
-  handler: { __callback__: string };
+  handler: { __callback__: CallbackId };
   event_type: "keydown" | "keyup";
   require_reset: boolean;
   ignore_in_inputs: boolean;
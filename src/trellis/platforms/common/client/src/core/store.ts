@@ -7,12 +7,13 @@
  */
 
 import { useCallback, useSyncExternalStore } from "react";
-import { SerializedElement, resetMutableStates } from "./types";
+import { ElementId, SerializedElement, resetMutableStates } from "./types";
 import {
   Patch,
   AddPatch,
   UpdatePatch,
   RemovePatch,
+  PropOp,
 } from "../types";
 import { debugLog } from "../debug";
 
@@ -22,7 +23,65 @@ export interface NodeData {
   type: string;
   name: string;
   props: Record<string, unknown>;
-  childIds: string[];
+  childIds: ElementId[];
+}
+
+type Container = Record<string | number, unknown>;
+
+/**
+ * Apply nested prop edits to a prop value without mutating it.
+ *
+ * Each list or dict on an edited path is copied once, so unchanged branches
+ * keep their identity and React memoization still works below them.
+ */
+export function applyPropOps(current: unknown, ops: PropOp[]): unknown {
+  if (current == null || typeof current !== "object") {
+    console.warn("[TrellisStore] Nested prop edits for a non-container value");
+    return current;
+  }
+  const copies = new Set<unknown>();
+  const copy = (value: unknown): Container => {
+    if (copies.has(value)) return value as Container;
+    const result = (Array.isArray(value) ? value.slice() : { ...(value as object) }) as Container;
+    copies.add(result);
+    return result;
+  };
+
+  const root = copy(current);
+  for (const op of ops) {
+    // set/delete address an item; append/splice address the list itself
+    const parentPath = op.op === "set" || op.op === "delete" ? op.path.slice(0, -1) : op.path;
+    let target = root;
+    for (const segment of parentPath) {
+      const child = copy(target[segment]);
+      target[segment] = child;
+      target = child;
+    }
+    const list = target as unknown as unknown[];
+    switch (op.op) {
+      case "set":
+        target[op.path[op.path.length - 1]] = op.value;
+        break;
+      case "delete":
+        delete target[op.path[op.path.length - 1]];
+        break;
+      case "append":
+        // push() per item: spreading very long arrays overflows the call stack
+        for (const item of op.items) list.push(item);
+        break;
+      case "splice": {
+        const tail = list.splice(op.index);
+        for (const item of op.items) list.push(item);
+        for (let i = op.delete; i < tail.length; i++) list.push(tail[i]);
+        break;
+      }
+    }
+  }
+  return root;
+}
+
+function isPropOps(value: unknown): value is { __ops__: PropOp[] } {
+  return value != null && typeof value === "object" && Array.isArray((value as Record<string, unknown>).__ops__);
 }
 
 /**
@@ -33,30 +92,28 @@ export interface NodeData {
  * - Per-node subscriptions for efficient React re-renders
  */
 export class TrellisStore {
-  private nodes: Map<string, NodeData> = new Map();
-  private nodeListeners: Map<string, Set<() => void>> = new Map();
+  private nodes: Map<ElementId, NodeData> = new Map();
+  private nodeListeners: Map<ElementId, Set<() => void>> = new Map();
   private globalListeners: Set<() => void> = new Set();
-  private rootId: string | null = null;
+  private rootId: ElementId | null = null;
 
   /** Get a node by ID. */
-  getNode(id: string): NodeData | undefined {
+  getNode(id: ElementId): NodeData | undefined {
     return this.nodes.get(id);
   }
 
   /** Get the root node ID. */
-  getRootId(): string | null {
+  getRootId(): ElementId | null {
     return this.rootId;
   }
 
   private addNodeRecursive(node: SerializedElement): void {
-    // key should always be present from server, but fall back to name if missing
-    const id = node.key ?? node.name ?? `unknown-${Math.random().toString(36).slice(2)}`;
-    this.nodes.set(id, {
+    this.nodes.set(node.key, {
       kind: node.kind,
       type: node.type,
       name: node.name,
       props: node.props,
-      childIds: node.children.map((c) => c.key ?? c.name ?? `unknown-${Math.random().toString(36).slice(2)}`),
+      childIds: node.children.map((c) => c.key),
     });
     for (const child of node.children) {
       this.addNodeRecursive(child);
@@ -69,7 +126,7 @@ export class TrellisStore {
    */
   applyPatches(patches: Patch[]): void {
     debugLog("store", `Applying ${patches.length} patches`);
-    const affectedIds = new Set<string>();
+    const affectedIds = new Set<ElementId>();
 
     for (const patch of patches) {
       switch (patch.op) {
@@ -96,8 +153,8 @@ export class TrellisStore {
     }
   }
 
-  private applyAdd(patch: AddPatch, affectedIds: Set<string>): void {
-    const nodeId = patch.element.key ?? patch.element.name ?? `unknown-${Math.random().toString(36).slice(2)}`;
+  private applyAdd(patch: AddPatch, affectedIds: Set<ElementId>): void {
+    const nodeId = patch.element.key;
     debugLog("store", `ADD: ${nodeId} under parent ${patch.parent_id}`);
 
     // Add the new node and all descendants
@@ -105,7 +162,7 @@ export class TrellisStore {
     affectedIds.add(nodeId);
 
     // Update parent's childIds if parent exists
-    if (patch.parent_id) {
+    if (patch.parent_id !== null) {
       const parent = this.nodes.get(patch.parent_id);
       if (!parent) {
         console.warn(`[TrellisStore] Cannot add node ${nodeId} - parent ${patch.parent_id} not found`);
@@ -131,7 +188,7 @@ export class TrellisStore {
     }
   }
 
-  private applyUpdate(patch: UpdatePatch, affectedIds: Set<string>): void {
+  private applyUpdate(patch: UpdatePatch, affectedIds: Set<ElementId>): void {
     const node = this.nodes.get(patch.id);
     if (!node) {
       console.warn(`[TrellisStore] Update for unknown node: ${patch.id}`);
@@ -149,6 +206,8 @@ export class TrellisStore {
       for (const [key, value] of Object.entries(patch.props)) {
         if (value != null && typeof value === "object" && (value as Record<string, unknown>).__removed__ === true) {
           delete newProps[key];
+        } else if (isPropOps(value)) {
+          newProps[key] = applyPropOps(node.props[key], value.__ops__);
         } else {
           newProps[key] = value;
         }
@@ -171,14 +230,14 @@ export class TrellisStore {
     affectedIds.add(patch.id);
   }
 
-  private applyRemove(patch: RemovePatch, affectedIds: Set<string>): void {
+  private applyRemove(patch: RemovePatch, affectedIds: Set<ElementId>): void {
     debugLog("store", `REMOVE: ${patch.id}`);
     // Remove node and all descendants
     this.removeNodeRecursive(patch.id);
     affectedIds.add(patch.id);
   }
 
-  private removeNodeRecursive(id: string): void {
+  private removeNodeRecursive(id: ElementId): void {
     const node = this.nodes.get(id);
     if (!node) return;
 
@@ -197,7 +256,7 @@ export class TrellisStore {
   // ===========================================================================
 
   /** Subscribe to changes for a specific node. */
-  subscribeToNode(id: string, listener: () => void): () => void {
+  subscribeToNode(id: ElementId, listener: () => void): () => void {
     if (!this.nodeListeners.has(id)) {
       this.nodeListeners.set(id, new Set());
     }
@@ -211,7 +270,7 @@ export class TrellisStore {
     return () => this.globalListeners.delete(listener);
   }
 
-  private notifyNode(id: string): void {
+  private notifyNode(id: ElementId): void {
     const listeners = this.nodeListeners.get(id);
     if (listeners && listeners.size > 0) {
       debugLog("store", `Notifying ${listeners.size} listeners for node ${id}`);
@@ -242,7 +301,7 @@ export const store = new TrellisStore();
  * Hook to subscribe to a specific node's data.
  * Re-renders only when that node's data changes.
  */
-export function useNode(id: string): NodeData | undefined {
+export function useNode(id: ElementId): NodeData | undefined {
   const subscribe = useCallback(
     (onStoreChange: () => void) => store.subscribeToNode(id, onStoreChange),
     [id]
@@ -256,7 +315,7 @@ export function useNode(id: string): NodeData | undefined {
  * Hook to get the root node ID.
  * Re-renders when root changes (initial render or full tree reset).
  */
-export function useRootId(): string | null {
+export function useRootId(): ElementId | null {
   const subscribe = useCallback(
     (onStoreChange: () => void) => store.subscribeGlobal(onStoreChange),
     []
@@ -0,0 +1,69 @@
+/**
+ * Decoding of binary typed-array props.
+ *
+ * The server sends NumPy arrays and array.array props as msgpack extension
+ * values: the extension type names the element type and the payload is the
+ * raw little-endian bytes. Decoding yields the matching typed array, so a
+ * 100k-point series arrives as one Float64Array instead of 100k numbers.
+ *
+ * Extension codes must match TYPED_ARRAY_EXT_CODES in typed_arrays.py.
+ */
+
+import { ExtensionCodec } from "@msgpack/msgpack";
+
+/** A numeric series as sent by the server: a plain list or a typed array. */
+export type NumericArray =
+  | number[]
+  | Float64Array
+  | Float32Array
+  | Int8Array
+  | Uint8Array
+  | Int16Array
+  | Uint16Array
+  | Int32Array
+  | Uint32Array;
+
+type TypedArrayConstructor = new (buffer: ArrayBuffer) => Exclude<NumericArray, number[]>;
+
+const EXT_TYPES: Record<number, TypedArrayConstructor> = {
+  1: Float64Array,
+  2: Float32Array,
+  3: Int8Array,
+  4: Uint8Array,
+  5: Int16Array,
+  6: Uint16Array,
+  7: Int32Array,
+  8: Uint32Array,
+};
+
+// 64-bit ints have no exact JS number form; they decode to Float64Array
+const EXT_INT64 = 9;
+const EXT_UINT64 = 10;
+
+/** Copy the payload into its own aligned buffer (it may sit at any offset). */
+function ownBuffer(data: Uint8Array): ArrayBuffer {
+  return data.slice().buffer;
+}
+
+/** msgpack extension codec that decodes typed-array props. */
+export const typedArrayCodec = new ExtensionCodec();
+
+for (const [code, ArrayType] of Object.entries(EXT_TYPES)) {
+  typedArrayCodec.register({
+    type: Number(code),
+    encode: () => null,
+    decode: (data: Uint8Array) => new ArrayType(ownBuffer(data)),
+  });
+}
+
+typedArrayCodec.register({
+  type: EXT_INT64,
+  encode: () => null,
+  decode: (data: Uint8Array) => Float64Array.from(new BigInt64Array(ownBuffer(data)), Number),
+});
+
+typedArrayCodec.register({
+  type: EXT_UINT64,
+  encode: () => null,
+  decode: (data: Uint8Array) => Float64Array.from(new BigUint64Array(ownBuffer(data)), Number),
+});
@@ -7,19 +7,36 @@ export enum ElementKind {
   TEXT = "text",
 }
 
+/**
+ * Element identifier on the wire.
+ *
+ * The server interns each element's position-based ID into a compact,
+ * session-local integer handle. Handles start at 1 and are never reused.
+ */
+export type ElementId = number;
+
 /** Serialized element tree node. */
 export interface SerializedElement {
   kind: ElementKind;
   type: string;
   name: string;
-  key: string | null;
+  key: ElementId;
   props: Record<string, unknown>;
   children: SerializedElement[];
 }
 
+/**
+ * Callback identifier on the wire.
+ *
+ * The server registers each callback's element and prop path in a
+ * session-local table and sends a compact integer handle in its place.
+ * Handles start at 1 and are never reused.
+ */
+export type CallbackId = number;
+
 /** Callback reference in props. */
 export interface CallbackRef {
-  __callback__: string;
+  __callback__: CallbackId;
 }
 
 export function isCallbackRef(value: unknown): value is CallbackRef {
@@ -27,13 +44,13 @@ export function isCallbackRef(value: unknown): value is CallbackRef {
     typeof value === "object" &&
     value !== null &&
     "__callback__" in value &&
-    typeof (value as CallbackRef).__callback__ === "string"
+    typeof (value as CallbackRef).__callback__ === "number"
   );
 }
 
 /** Mutable binding reference in props - for two-way data binding. */
 export interface MutableRef {
-  __mutable__: string;
+  __mutable__: CallbackId;
   value: unknown;
   version?: number;
 }
@@ -43,13 +60,13 @@ export function isMutableRef(value: unknown): value is MutableRef {
     typeof value === "object" &&
     value !== null &&
     "__mutable__" in value &&
-    typeof (value as MutableRef).__mutable__ === "string" &&
+    typeof (value as MutableRef).__mutable__ === "number" &&
     "value" in value
   );
 }
 
 /** Event handler function type - called when a callback is triggered. */
-export type EventHandler = (callbackId: string, args: unknown[]) => void;
+export type EventHandler = (callbackId: CallbackId, args: unknown[]) => void;
 
 /** Optimistic state for a single mutable binding. */
 interface MutableState {
@@ -59,7 +76,7 @@ interface MutableState {
 }
 
 /** Module-level registry of optimistic mutable state, keyed by mutable ID. */
-const mutableStates = new Map<string, MutableState>();
+const mutableStates = new Map<CallbackId, MutableState>();
 
 /** Reset all optimistic mutable state (called on full tree reset). */
 export function resetMutableStates(): void {
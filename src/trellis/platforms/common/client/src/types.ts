@@ -1,13 +1,14 @@
 /** Message types for WebSocket communication. */
 
 // Re-export core types for backward compatibility
-export type { SerializedElement, CallbackRef } from "./core";
+export type { CallbackId, ElementId, SerializedElement, CallbackRef } from "./core";
 export { isCallbackRef } from "./core";
 
 export const MessageType = {
   HELLO: "hello",
   HELLO_RESPONSE: "hello_response",
   PATCH: "patch",
+  ACK: "ack",
   EVENT: "event",
   ERROR: "error",
   HISTORY_PUSH: "history_push",
@@ -25,23 +26,38 @@ export const MessageType = {
 /** Add a new node to the tree. */
 export interface AddPatch {
   op: "add";
-  parent_id: string | null;
-  children: string[]; // Parent's new children list (for positioning)
+  parent_id: import("./core").ElementId | null;
+  children: import("./core").ElementId[]; // Parent's new children list (for positioning)
   element: import("./core").SerializedElement; // Full subtree for the new node
 }
 
 /** Update an existing node's props and/or children order. */
 export interface UpdatePatch {
   op: "update";
-  id: string;
+  id: import("./core").ElementId;
   props?: Record<string, unknown>; // Changed props only (omit if unchanged)
-  children?: string[]; // New children order (omit if unchanged)
+  children?: import("./core").ElementId[]; // New children order (omit if unchanged)
 }
 
+/** Dict keys and list indices leading from a prop value to a nested item. */
+export type PropPath = (string | number)[];
+
+/**
+ * One path-based edit to a list or dict prop.
+ *
+ * An updated prop of the form `{__ops__: PropOp[]}` is applied to the node's
+ * current value instead of replacing it.
+ */
+export type PropOp =
+  | { op: "set"; path: PropPath; value: unknown } // Store value at path
+  | { op: "delete"; path: PropPath } // Remove the dict key at path
+  | { op: "append"; path: PropPath; items: unknown[] } // Extend the list at path
+  | { op: "splice"; path: PropPath; index: number; delete: number; items: unknown[] }; // Replace a list range
+
 /** Remove a node from the tree. */
 export interface RemovePatch {
   op: "remove";
-  id: string;
+  id: import("./core").ElementId;
 }
 
 /** Union of all patch types. */
@@ -53,6 +69,10 @@ export interface HelloMessage {
   system_theme: "light" | "dark"; // Detected from OS preference
   theme_mode?: "system" | "light" | "dark"; // Host-controlled theme mode override
   path?: string;
+  compression?: string[]; // Encodings this client can decode
+  patch_acks?: boolean; // Client acknowledges patch messages with AckMessage
+  session_id?: string; // Session to resume after a reconnect
+  last_seq?: number; // Seq of the last patch message applied, when resuming
 }
 
 /** Debug configuration from the server. */
@@ -65,11 +85,13 @@ export interface HelloResponseMessage {
   session_id: string;
   server_version: string;
   debug?: DebugConfig;
+  compression?: string | null; // Encoding applied to large messages, if any
+  resumed?: boolean; // Reattached to the session named in the hello
 }
 
 export interface EventMessage {
   type: typeof MessageType.EVENT;
-  callback_id: string;
+  callback_id: import("./core").CallbackId;
   args: unknown[];
 }
 
@@ -83,6 +105,13 @@ export interface ErrorMessage {
 export interface PatchMessage {
   type: typeof MessageType.PATCH;
   patches: Patch[];
+  seq?: number; // Set for clients that acknowledge patches
+}
+
+/** Acknowledge patch messages up to seq. Sent from client to server. */
+export interface AckMessage {
+  type: typeof MessageType.ACK;
+  seq: number;
 }
 
 // ============================================================================
@@ -127,6 +156,7 @@ export type Message =
   | HelloMessage
   | HelloResponseMessage
   | PatchMessage
+  | AckMessage
   | EventMessage
   | ErrorMessage
   | HistoryPushMessage
@@ -7,30 +7,39 @@ Transport-specific subclasses implement send_message/receive_message.
 from __future__ import annotations
 
 import asyncio
+import collections
+import contextlib
+import contextvars
 import dataclasses
 import inspect
 import logging
+import math
 import traceback
 import types
 import typing as tp
 from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
 from importlib.metadata import version as get_package_version
 from uuid import uuid4
 
-from trellis.core.callback_context import callback_context
+from trellis.core.callback_context import callback_context, wants_every_event
 from trellis.core.components.base import Component
 from trellis.core.protocol import dispatch, set_message_handler
+from trellis.core.rendering.batch import batch
 from trellis.core.rendering.patches import (
     RenderAddPatch,
     RenderPatch,
     RenderRemovePatch,
     RenderUpdatePatch,
 )
-from trellis.core.rendering.render import render
+from trellis.core.rendering.render import PendingHooks, render, render_pass, render_sliced
 from trellis.core.rendering.session import RenderSession, get_session_registry, set_render_session
+from trellis.core.state.mutable import Mutable
 from trellis.html._generated_events import get_event_class
 from trellis.platforms.common.errors import SessionDisconnected
+from trellis.platforms.common.message_inbox import MessageInbox
 from trellis.platforms.common.messages import (
+    AckMessage,
     AddPatch,
     DebugConfig,
     ErrorMessage,
@@ -44,9 +53,9 @@ from trellis.platforms.common.messages import (
     RemovePatch,
     UpdatePatch,
 )
+from trellis.platforms.common.patch_coalescer import PatchCoalescer
 from trellis.platforms.common.serialization import (
     _serialize_props,
-    parse_callback_id,
     serialize_element,
 )
 from trellis.routing import RouterState
@@ -56,6 +65,19 @@ from trellis.utils.debug import get_enabled_categories
 logger = logging.getLogger(__name__)
 _DICT_ARG_COUNT = 2
 
+# Event props whose handlers only need the latest event of a burst
+_LATEST_WINS_EVENTS = frozenset(
+    {
+        "on_change",
+        "on_drag",
+        "on_drag_over",
+        "on_input",
+        "on_mouse_move",
+        "on_scroll",
+        "on_time_update",
+    }
+)
+
 
 def _get_version() -> str:
     """Get package version from metadata."""
@@ -68,6 +90,7 @@ def _get_version() -> str:
 __all__ = [
     "AppWrapper",
     "MessageHandler",
+    "create_render_executor",
 ]
 
 
@@ -76,6 +99,20 @@ __all__ = [
 AppWrapper = Callable[[Component, str, str | None], Component]
 
 
+def create_render_executor(render_workers: int) -> ThreadPoolExecutor | None:
+    """Create the executor a platform shares between its handlers' renders.
+
+    Args:
+        render_workers: Number of render threads; 0 renders on the event loop
+
+    Returns:
+        A ThreadPoolExecutor to pass as render_executor, or None for 0
+    """
+    if render_workers <= 0:
+        return None
+    return ThreadPoolExecutor(max_workers=render_workers, thread_name_prefix="trellis-render")
+
+
 # =============================================================================
 # Exception formatting
 # =============================================================================
@@ -221,13 +258,14 @@ def _serialize_patches(patches: list[RenderPatch], session: RenderSession) -> li
     Returns:
         List of wire-format Patch objects ready for transmission
     """
+    intern = session.ids.intern
     result: list[Patch] = []
     for patch in patches:
         if isinstance(patch, RenderAddPatch):
             result.append(
                 AddPatch(
-                    parent_id=patch.parent_id,
-                    children=list(patch.children),
+                    parent_id=intern(patch.parent_id) if patch.parent_id is not None else None,
+                    children=[intern(child_id) for child_id in patch.children],
                     element=serialize_element(patch.element, session),
                 )
             )
@@ -238,13 +276,15 @@ def _serialize_patches(patches: list[RenderPatch], session: RenderSession) -> li
                 props = _serialize_props(patch.props, session, patch.element_id)
             result.append(
                 UpdatePatch(
-                    id=patch.element_id,
+                    id=intern(patch.element_id),
                     props=props,
-                    children=list(patch.children) if patch.children else None,
+                    children=[intern(child_id) for child_id in patch.children]
+                    if patch.children
+                    else None,
                 )
             )
         elif isinstance(patch, RenderRemovePatch):
-            result.append(RemovePatch(id=patch.element_id))
+            result.append(RemovePatch(id=intern(patch.element_id)))
     return result
 
 
@@ -273,31 +313,79 @@ class MessageHandler:
     session: RenderSession | None
     session_id: str | None
     batch_delay: float
+    render_slice_budget: float | None
+    render_executor: Executor | None
+    max_unacked_patches: int
     message_send_queue: asyncio.Queue[Message]
     _root_component: Component
     _app_wrapper: AppWrapper
+    _render_wakeup: asyncio.Event
+    _render_gate: asyncio.Lock
+    _patch_acks: bool
+    _sent_seq: int
+    _acked_seq: int
+    _held_patches: PatchCoalescer
+    _replay: collections.deque[PatchMessage]
+    _received: MessageInbox
 
     def __init__(
         self,
         root_component: Component,
         app_wrapper: AppWrapper,
         batch_delay: float = 1.0 / 30,
+        *,
+        render_slice_budget: float | None = None,
+        render_executor: Executor | None = None,
+        max_unacked_patches: int = 2,
     ) -> None:
         """Create a new message handler.
 
         Args:
             root_component: The root Trellis component to render
             app_wrapper: Callback to wrap the component (e.g., with TrellisApp)
-            batch_delay: Time between render frames in seconds (default ~33ms for 30fps)
+            batch_delay: Minimum time between render frames in seconds (default ~33ms,
+                i.e. at most 30fps). Renders happen only when something is dirty.
+            render_slice_budget: If set, re-renders run via render_sliced() with
+                this per-slice budget in seconds, yielding to the event loop
+                between slices. None (default) renders each pass in one go.
+            render_executor: If set, re-renders and patch serialization run on
+                this executor (typically a bounded ThreadPoolExecutor shared by
+                all handlers) instead of the event loop. Pays off on
+                free-threaded builds or when components release the GIL.
+                Mutually exclusive with render_slice_budget.
+            max_unacked_patches: For clients that acknowledge patches, how
+                many patch messages may be in flight. Beyond that, frames are
+                merged into one net diff until the client catches up.
+
+        Raises:
+            ValueError: If both render_slice_budget and render_executor are set
         """
+        if render_slice_budget is not None and render_executor is not None:
+            raise ValueError("render_slice_budget and render_executor are mutually exclusive")
         self._root_component = root_component
         self._app_wrapper = app_wrapper
         self.session = None  # Created in handle_hello after receiving theme info
         self.session_id = None
         self.batch_delay = batch_delay
+        self.render_slice_budget = render_slice_budget
+        self.render_executor = render_executor
+        self.max_unacked_patches = max_unacked_patches
         self.message_send_queue = asyncio.Queue()
-
-    async def handle_hello(self) -> str:
+        self._render_wakeup = asyncio.Event()
+        # Held while an off-loop render owns session.lock (see _callback_scope)
+        self._render_gate = asyncio.Lock()
+        # Patch flow control, enabled by the client's hello
+        self._patch_acks = False
+        self._sent_seq = 0
+        self._acked_seq = 0
+        self._held_patches = PatchCoalescer()
+        # Numbered patch messages the client has not acknowledged yet, kept
+        # for replay if it reconnects (see resume_session)
+        self._replay = collections.deque()
+        # Messages read off the transport but not yet handled
+        self._received = MessageInbox()
+
+    async def handle_hello(self, msg: Message | None = None) -> str:
         """Handle hello handshake with client.
 
         Receives HelloMessage from client, generates session ID,
@@ -305,13 +393,18 @@ class MessageHandler:
         HelloResponseMessage. All platforms use this handshake for
         session initialization.
 
+        Args:
+            msg: The client's first message, if the transport has already
+                received it; otherwise it is received here
+
         Returns:
             The generated session ID
 
         Raises:
             ValueError: If received message is not HelloMessage
         """
-        msg = await self.receive_message()
+        if msg is None:
+            msg = await self.receive_message()
         if not isinstance(msg, HelloMessage):
             raise ValueError(f"Expected HelloMessage, got {type(msg).__name__}")
 
@@ -324,7 +417,7 @@ class MessageHandler:
             msg.system_theme,  # "light" or "dark"
             msg.theme_mode,  # "system", "light", "dark", or None
         )
-        self.session = RenderSession(wrapped)
+        self.session = RenderSession(wrapped, loop=asyncio.get_running_loop())
         set_render_session(self.session)
 
         # Register session with global registry (used by hot reload and other features)
@@ -334,19 +427,91 @@ class MessageHandler:
 
         # Store initial path for routing
         self.session.initial_path = msg.path
+        self._patch_acks = msg.patch_acks
 
+        await self.send_message(self._hello_response(msg))
+        logger.debug("Session initialized: session_id=%s", self.session_id)
+        return self.session_id
+
+    async def resume_session(self, msg: HelloMessage) -> None:
+        """Reattach a reconnecting client to this handler's session.
+
+        Sends the patch messages the client missed, or a snapshot of the
+        whole tree if they are no longer available or would outweigh it.
+        Component state, callbacks and element handles carry over.
+
+        Args:
+            msg: The reconnecting client's hello
+        """
+        assert self.session is not None, "resume_session requires an existing session"
+        set_render_session(self.session)
+        self._patch_acks = msg.patch_acks
+        await self.send_message(self._hello_response(msg, resumed=True))
+        for message in self._resume_messages(msg.last_seq):
+            await self.send_message(message)
+        logger.debug(
+            "Session resumed: session_id=%s last_seq=%d sent_seq=%d",
+            self.session_id,
+            msg.last_seq,
+            self._sent_seq,
+        )
+
+    def _hello_response(self, msg: HelloMessage, *, resumed: bool = False) -> HelloResponseMessage:
+        """Build the HelloResponseMessage answering a client's hello."""
+        assert self.session_id is not None
         # Include debug config if debug logging is enabled
         debug_categories = get_enabled_categories()
         debug_config = DebugConfig(categories=debug_categories) if debug_categories else None
-
-        response = HelloResponseMessage(
+        return HelloResponseMessage(
             session_id=self.session_id,
             server_version=_get_version(),
             debug=debug_config,
+            compression=self.select_compression(msg.compression),
+            resumed=resumed,
         )
-        await self.send_message(response)
-        logger.debug("Session initialized: session_id=%s", self.session_id)
-        return self.session_id
+
+    def _resume_messages(self, last_seq: int) -> list[PatchMessage]:
+        """Patch messages that bring a resuming client up to date.
+
+        Args:
+            last_seq: Seq of the last patch message the client applied
+
+        Returns:
+            The unacknowledged messages after last_seq, or a single snapshot
+            of the current tree
+        """
+        assert self.session is not None
+        session = self.session
+        # The replay log holds every message after the last ack, so any
+        # last_seq from there on can be caught up by replay alone
+        if self._patch_acks and self._acked_seq <= last_seq <= self._sent_seq:
+            self._acknowledge(last_seq)
+            missed = list(self._replay)
+            if sum(len(m.patches) for m in missed) <= len(session.elements):
+                return missed
+
+        # The snapshot covers everything sent or held so far
+        self._held_patches.flush(session)
+        self._replay.clear()
+        self._acked_seq = self._sent_seq
+        root = session.root_element
+        assert root is not None
+        snapshot = AddPatch(parent_id=None, children=[], element=serialize_element(root, session))
+        return [self._patch_message([snapshot])]
+
+    def select_compression(self, offered: list[str]) -> str | None:
+        """Pick the compression to apply to messages sent to this client.
+
+        Transports that can compress override this. The default sends
+        everything uncompressed.
+
+        Args:
+            offered: Encodings the client said it can decode
+
+        Returns:
+            The chosen encoding, or None for no compression
+        """
+        return None
 
     def initial_render(self) -> Message:
         """Generate initial render message.
@@ -363,7 +528,7 @@ class MessageHandler:
                 "Initial render complete, sending PatchMessage (%d elements)", element_count
             )
 
-            return PatchMessage(patches=wire_patches)
+            return self._patch_message(wire_patches)
         except Exception as e:
             logger.exception(f"Error during initial render: {e}")
             return ErrorMessage(error=_format_exception(e), context="render")
@@ -389,8 +554,14 @@ class MessageHandler:
                 logger.exception(f"Error in callback {msg.callback_id}: {e}")
                 return ErrorMessage(error=_format_exception(e), context="callback")
 
-            # Callback executed successfully. State changes mark elements dirty.
-            # The render loop will pick them up on the next frame.
+            # Callback executed successfully. State changes mark elements dirty,
+            # which wakes the render loop.
+            return None
+
+        if isinstance(msg, AckMessage):
+            self._acknowledge(msg.seq)
+            # Held frames can go out now that the client has caught up
+            self._render_wakeup.set()
             return None
 
         await dispatch(msg)
@@ -406,24 +577,14 @@ class MessageHandler:
             router_state._update_path_from_url(path)
 
     def _find_router_state(self) -> tp.Any:
-        """Find RouterState instance in session's element states.
-
-        Note: While this search is technically O(N) in the number of elements,
-        RouterState is typically placed on the root TrellisApp element, so in
-        practice it completes in O(1) as it's found immediately.
+        """Find the RouterState provided in this session.
 
         Returns:
             RouterState instance or None if not found
         """
         if self.session is None:
             return None
-
-        # Search through element states for RouterState in context
-        for element_id in self.session.states._state:
-            state = self.session.states.get(element_id)
-            if state is not None and RouterState in state.context:
-                return state.context[RouterState]
-        return None
+        return self.session.states.find_provider(RouterState)
 
     def _setup_router_callbacks(self) -> None:
         """Set up async callbacks on RouterState to send history messages."""
@@ -450,11 +611,30 @@ class MessageHandler:
             "__global_key_filters__"
         )
 
-    async def _invoke_callback(self, callback_id: str, args: list[tp.Any]) -> None:
+    def _is_mergeable_event(self, callback_id: int) -> bool:
+        """Check if only the latest of several queued events for a callback matters.
+
+        True for mutable bindings and continuous-input event handlers, unless
+        the callback (or a Mutable's on_change) is marked with every_event.
+        """
+        if self.session is None or self._render_gate.locked():
+            # A render in progress may be changing the callback table and
+            # element props; handle the event on its own rather than race it
+            return False
+        resolved = self.session.resolve_callback(callback_id)
+        if resolved is None:
+            return False
+        _element_id, prop_name, callback = resolved
+        if isinstance(callback, Mutable):
+            on_change = callback.on_change
+            return on_change is None or not wants_every_event(on_change)
+        return prop_name in _LATEST_WINS_EVENTS and not wants_every_event(callback)
+
+    async def _invoke_callback(self, callback_id: int, args: list[tp.Any]) -> None:
         """Invoke callback with event conversion.
 
         Args:
-            callback_id: The callback ID to invoke (format: element_id|prop_name)
+            callback_id: The callback handle to invoke
             args: Raw arguments from the client
 
         Raises:
@@ -462,10 +642,10 @@ class MessageHandler:
         """
         assert self.session is not None
         session = self.session  # Local var for closure capture
-        element_id, prop_name = parse_callback_id(callback_id)
-        callback = session.get_callback(element_id, prop_name)
-        if callback is None:
+        resolved = session.resolve_callback(callback_id)
+        if resolved is None:
             raise KeyError(f"Callback not found: {callback_id}")
+        element_id, prop_name, callback = resolved
 
         # Key event callbacks use a request-response protocol:
         # first arg is request_id, handler return value determines handled status.
@@ -479,8 +659,7 @@ class MessageHandler:
         if inspect.iscoroutinefunction(callback):
             # Async: wrap to provide callback context
             async def run_async_with_context() -> None:
-                with callback_context(session, element_id):
-                    await callback(*processed_args, **kwargs)
+                await self._callback_steps(session, element_id, callback(*processed_args, **kwargs))
 
             logger.debug("Callback %s is async, scheduled as task", callback_id)
             session.spawn(
@@ -488,13 +667,15 @@ class MessageHandler:
                 label=f"callback {callback_id}",
             )
         else:
-            # Sync: call with callback context
-            with callback_context(session, element_id):
-                callback(*processed_args, **kwargs)
+            # Sync: call with callback context, coalescing the dirty marks
+            # from all of its state changes into one flush
+            async with self._callback_scope(session, element_id):
+                with batch():
+                    callback(*processed_args, **kwargs)
 
     async def _invoke_key_callback(
         self,
-        callback_id: str,
+        callback_id: int,
         element_id: str,
         callback: tp.Callable[..., tp.Any],
         args: list[tp.Any],
@@ -531,11 +712,14 @@ class MessageHandler:
 
         handled = True
         try:
-            with callback_context(session, element_id):
-                if inspect.iscoroutinefunction(callback):
-                    result = await callback(*call_args, **call_kwargs)
-                else:
-                    result = callback(*call_args, **call_kwargs)
+            if inspect.iscoroutinefunction(callback):
+                result = await self._callback_steps(
+                    session, element_id, callback(*call_args, **call_kwargs)
+                )
+            else:
+                async with self._callback_scope(session, element_id):
+                    with batch():
+                        result = callback(*call_args, **call_kwargs)
             # None or True = handled, False = pass
             if result is False:
                 handled = False
@@ -552,39 +736,234 @@ class MessageHandler:
     async def _render_loop(self) -> None:
         """Background loop that renders when dirty elements exist.
 
-        This loop runs continuously, sleeping for the configured batch_delay,
-        then checking if any elements need re-rendering. If so, it renders
-        and sends patches to the client.
+        The loop sleeps until the session's DirtyTracker reports that it went
+        from clean to dirty, so an idle session costs no wake-ups. Once woken
+        it renders right away, unless the previous frame was less than
+        batch_delay ago; then it waits out the remainder and any changes made
+        in the meantime are coalesced into the same frame.
+
+        While a client that acknowledges patches is behind, frames are still
+        rendered but their patches are held and merged; the loop sends the
+        net change once an acknowledgement brings the client back in range.
         """
         assert self.session is not None
-        while True:
-            # Wait for frame period (configured via batch_delay)
-            await asyncio.sleep(self.batch_delay)
+        session = self.session
+        loop = asyncio.get_running_loop()
+        wakeup = self._render_wakeup
 
-            # Check if there are dirty elements to render
-            if not self.session.dirty.has_dirty():
-                continue
+        def on_dirty() -> None:
+            # mark() may be called from worker threads, and asyncio.Event is
+            # not thread-safe, so always hop onto the loop to set it.
+            loop.call_soon_threadsafe(wakeup.set)
 
-            dirty_count = len(self.session.dirty)
-            logger.debug("Render loop: %d dirty elements", dirty_count)
+        session.dirty.set_on_dirty(on_dirty)
+        last_frame = -math.inf
+        try:
+            while True:
+                if not (session.dirty.has_dirty() or self._can_flush_held_patches()):
+                    wakeup.clear()
+                    await wakeup.wait()
+
+                # Enforce the minimum frame interval (configured via batch_delay)
+                delay = last_frame + self.batch_delay - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                if session.dirty.has_dirty():
+                    dirty_count = len(session.dirty)
+                    logger.debug("Render loop: %d dirty elements", dirty_count)
+
+                    try:
+                        wire_patches = await self._render_frame(session)
+                    except Exception as e:
+                        try:
+                            await self.send_message(
+                                ErrorMessage(error=_format_exception(e), context="render")
+                            )
+                        except Exception:
+                            logger.exception("Error sending render failure message")
+                        raise
+                    last_frame = loop.time()
+                elif self._can_flush_held_patches():
+                    wire_patches = self._flush_held_patches(session)
+                else:
+                    continue
 
-            try:
-                render_patches = render(self.session)
-            except Exception as e:
-                try:
-                    await self.send_message(
-                        ErrorMessage(error=_format_exception(e), context="render")
-                    )
-                except Exception:
-                    logger.exception("Error sending render failure message")
-                raise
+                if not wire_patches:
+                    continue
+
+                logger.debug("Sending PatchMessage with %d patches", len(wire_patches))
+                await self.send_message(self._patch_message(wire_patches))
+        finally:
+            session.dirty.set_on_dirty(None)
+
+    async def _render_frame(self, session: RenderSession) -> list[Patch]:
+        """Run one render pass and serialize its patches for the wire."""
+        if self.render_executor is not None:
+            return await self._render_frame_off_loop(session, self.render_executor)
+        if self.render_slice_budget is not None:
+            # session.lock is re-entrant and callbacks run on this thread, so
+            # only the gate keeps them from running between slices.
+            async with self._render_gate:
+                render_patches = await render_sliced(session, self.render_slice_budget)
+        else:
+            render_patches = render(session)
+        return self._prepare_patches(render_patches, session)
+
+    async def _render_frame_off_loop(
+        self, session: RenderSession, executor: Executor
+    ) -> list[Patch]:
+        """Render and serialize on a worker thread, then run hooks on the loop.
+
+        The worker holds session.lock across both the pass and serialization.
+        Serialization reads props lazily (a StreamWindow reads its buffer) and
+        allocates callback handles, so releasing the lock in between would let
+        session tasks on the loop change what the pass rendered. Mount/unmount
+        hooks run back on the event loop thread because they may spawn
+        session tasks.
+        """
 
-            if not render_patches:
-                continue
+        def render_and_serialize() -> tuple[list[Patch], PendingHooks]:
+            with session.lock:
+                render_patches, hooks = render_pass(session)
+                return self._prepare_patches(render_patches, session), hooks
+
+        # Run in a copy of this task's context so the worker sees the session
+        # bound by set_render_session().
+        context = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+        async with self._render_gate:
+            wire_patches, hooks = await loop.run_in_executor(
+                executor, context.run, render_and_serialize
+            )
+        hooks.run()
+        return wire_patches
 
-            wire_patches = _serialize_patches(render_patches, self.session)
-            logger.debug("Sending PatchMessage with %d patches", len(wire_patches))
-            await self.send_message(PatchMessage(patches=wire_patches))
+    # -------------------------------------------------------------------------
+    # Patch flow control
+    # -------------------------------------------------------------------------
+
+    def _client_behind(self) -> bool:
+        """Whether the client has too many unacknowledged patch messages."""
+        return self._patch_acks and self._sent_seq - self._acked_seq >= self.max_unacked_patches
+
+    def _can_flush_held_patches(self) -> bool:
+        """Whether held frames are waiting and the client can take them."""
+        return bool(self._held_patches) and not self._client_behind()
+
+    def _prepare_patches(
+        self, render_patches: list[RenderPatch], session: RenderSession
+    ) -> list[Patch]:
+        """Serialize a frame's patches, or hold them while the client is behind.
+
+        Called right after the render pass, while handles of elements it
+        removed are still resolvable.
+
+        Args:
+            render_patches: Patches from the render pass just completed
+            session: The session that was rendered
+
+        Returns:
+            Wire patches to send now; empty while frames are being held
+        """
+        held = self._held_patches
+        if self._client_behind():
+            if render_patches:
+                held.add(render_patches, session)
+            return []
+        if not held:
+            return _serialize_patches(render_patches, session) if render_patches else []
+        held.add(render_patches, session)
+        return self._flush_held_patches(session)
+
+    def _flush_held_patches(self, session: RenderSession) -> list[Patch]:
+        """Serialize the merged change of all held frames."""
+        frames = self._held_patches.frames
+        removed, render_patches = self._held_patches.flush(session)
+        logger.debug("Client caught up, sending %d merged frames", frames)
+        return [RemovePatch(id=handle) for handle in removed] + _serialize_patches(
+            render_patches, session
+        )
+
+    def _patch_message(self, wire_patches: list[Patch]) -> PatchMessage:
+        """Wrap patches in a PatchMessage, numbered if the client acknowledges."""
+        if not self._patch_acks:
+            return PatchMessage(patches=wire_patches)
+        self._sent_seq += 1
+        msg = PatchMessage(patches=wire_patches, seq=self._sent_seq)
+        self._replay.append(msg)
+        return msg
+
+    def _acknowledge(self, seq: int) -> None:
+        """Record that the client applied patch messages up to seq."""
+        self._acked_seq = max(self._acked_seq, seq)
+        replay = self._replay
+        while replay and tp.cast("int", replay[0].seq) <= self._acked_seq:
+            replay.popleft()
+
+    @contextlib.asynccontextmanager
+    async def _callback_scope(
+        self, session: RenderSession, element_id: str
+    ) -> tp.AsyncIterator[None]:
+        """Enter callback_context without blocking the loop on an off-loop render.
+
+        callback_context takes session.lock, which a worker thread holds for
+        the whole of an off-loop render. Waiting on _render_gate first keeps
+        the event loop free to serve other sessions in the meantime. The gate
+        is also held across a sliced render, whose lock does not exclude
+        callbacks running on the loop thread between slices.
+        """
+        with contextlib.ExitStack() as stack:
+            async with self._render_gate:
+                stack.enter_context(callback_context(session, element_id))
+            yield
+
+    @types.coroutine
+    def _callback_steps(
+        self, session: RenderSession, element_id: str, coro: tp.Coroutine[tp.Any, tp.Any, tp.Any]
+    ) -> tp.Generator[tp.Any, tp.Any, tp.Any]:
+        """Await an async callback, in callback scope only while its code runs.
+
+        Each step of the coroutine (up to its next suspension) runs as a
+        _callback_scope of its own, so session.lock is released across every
+        await in the callback's body. Holding it for the whole callback would
+        leave an off-loop render blocked until the callback finished, and
+        with it every other session sharing the render executor.
+
+        Args:
+            session: The session the callback belongs to
+            element_id: The ID of the element that triggered the callback
+            coro: The coroutine returned by calling the callback
+
+        Returns:
+            The coroutine's result
+        """
+        gate = self._render_gate
+        send_value: tp.Any = None
+        error: BaseException | None = None
+        while True:
+            try:
+                yield from gate.acquire().__await__()
+            except BaseException:
+                coro.close()
+                raise
+            try:
+                with callback_context(session, element_id):
+                    if error is None:
+                        suspended_on = coro.send(send_value)
+                    else:
+                        suspended_on = coro.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                gate.release()
+            try:
+                send_value, error = (yield suspended_on), None
+            except GeneratorExit:
+                coro.close()
+                raise
+            except BaseException as e:  # e.g. the task was cancelled
+                send_value, error = None, e
 
     async def _drain_message_send_queue(self) -> None:
         """Send queued protocol messages over the transport."""
@@ -604,13 +983,35 @@ class MessageHandler:
         """Receive message from client. Override in subclass."""
         raise NotImplementedError
 
+    async def _receive_into_inbox(self) -> None:
+        """Read client messages into the inbox as soon as they arrive.
+
+        Reading ahead of handling lets take() see a whole burst of input
+        events and apply only the latest for each callback.
+        """
+        while True:
+            await self._received.put(await self.receive_message())
+
     async def _receive_message_or_critical(
-        self, critical_tasks: set[asyncio.Task[tp.Any]]
+        self,
+        critical_tasks: set[asyncio.Task[tp.Any]],
+        receiver: asyncio.Task[None],
     ) -> Message | None:
-        """Wait for the next client message or a critical task completion."""
-        receive_task = asyncio.create_task(self.receive_message())
+        """Wait for the next client message or a critical task completion.
+
+        Args:
+            critical_tasks: Tasks whose completion ends the message loop
+            receiver: The _receive_into_inbox() task; once it has stopped,
+                the messages it read are handed out before its exception
+                is raised
+        """
+        inbox = self._received
+        if receiver.done() and not inbox:
+            receiver.result()
+        receive_task = asyncio.create_task(inbox.take(self._is_mergeable_event))
         tasks = set(critical_tasks)
         tasks.add(receive_task)
+        tasks.add(receiver)
 
         try:
             done, _pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
@@ -619,49 +1020,73 @@ class MessageHandler:
             await asyncio.gather(receive_task, return_exceptions=True)
             raise
 
-        if any(task in done for task in critical_tasks):
+        if receive_task not in done:
             receive_task.cancel()
             await asyncio.gather(receive_task, return_exceptions=True)
+
+        if any(task in done for task in critical_tasks):
             for task in critical_tasks:
                 if task not in done:
                     continue
                 try:
                     task.result()
                 except SessionDisconnected:
-                    return None
+                    raise
                 except Exception:
                     logger.exception("Critical handler task failed")
                     return None
                 logger.error("Critical handler task exited unexpectedly")
                 return None
 
-        return receive_task.result()
+        if receive_task in done:
+            return receive_task.result()
+        if inbox:
+            return inbox.take_nowait(self._is_mergeable_event)
+        receiver.result()
+        return None
 
     # -------------------------------------------------------------------------
     # Main loop
     # -------------------------------------------------------------------------
 
-    async def run(self) -> None:
+    async def run(self, hello: Message | None = None) -> None:
         """Main message loop - hello, initial render, then event loop.
 
         1. Performs hello handshake with client
         2. Sends initial render (full tree)
-        3. Starts background render loop (30fps batched updates)
-        4. Loops receiving messages and sending responses
+        3. Starts background render loop (renders on demand, at most one
+           frame per batch_delay)
+        4. Loops receiving messages and sending responses. Messages are read
+           ahead into an inbox, so of a burst of input events for the same
+           mutable binding or continuous-input handler only the latest is
+           applied (see _is_mergeable_event)
+
+        If the handler already has a session (it was parked by park_session()
+        when its client disconnected), steps 1 and 2 are replaced by
+        resume_session().
+
+        Args:
+            hello: The client's first message, if the transport has already
+                received it
         """
+        disconnected = False
         try:
             set_message_handler(self)
-            await self.handle_hello()
-            await self.send_message(self.initial_render())
+            if self.session is not None and isinstance(hello, HelloMessage):
+                await self.resume_session(hello)
+            else:
+                await self.handle_hello(hello)
+                await self.send_message(self.initial_render())
             assert self.session is not None
 
             critical_tasks = {
                 asyncio.create_task(self._render_loop()),
                 asyncio.create_task(self._drain_message_send_queue()),
             }
+            receiver = asyncio.create_task(self._receive_into_inbox())
 
             while True:
-                msg = await self._receive_message_or_critical(critical_tasks)
+                msg = await self._receive_message_or_critical(critical_tasks, receiver)
                 if msg is None:
                     break
 
@@ -669,16 +1094,30 @@ class MessageHandler:
                 if response:
                     await self.send_message(response)
         except SessionDisconnected:
-            return
+            disconnected = True
         finally:
-            critical_tasks = locals().get("critical_tasks", set())
-            for task in critical_tasks:
+            tasks = set(locals().get("critical_tasks", ()))
+            if "receiver" in locals():
+                tasks.add(receiver)
+            for task in tasks:
                 task.cancel()
-            if critical_tasks:
-                await asyncio.gather(*critical_tasks, return_exceptions=True)
-            if self.session is not None:
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            if self.session is not None and not (disconnected and self.park_session()):
                 await self.session.shutdown()
 
+    def park_session(self) -> bool:
+        """Keep the session alive after the client disconnected.
+
+        Transports whose clients can reconnect override this to hold on to
+        the handler, so that a later run() with the client's new hello
+        resumes the session. The default ends the session.
+
+        Returns:
+            True if the session was kept and must not be shut down
+        """
+        return False
+
     def cleanup(self) -> None:
         """Clean up resources. Call when session ends."""
         # No explicit cleanup needed - callbacks are stored in element props
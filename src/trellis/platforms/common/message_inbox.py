@@ -0,0 +1,109 @@
+"""Buffering of client messages, with bursts of input events merged.
+
+Dragging a slider or typing into a bound input sends an EventMessage per
+input tick. Handling each in turn lets a burst queue up behind a slow
+callback, and the UI falls further behind the pointer the longer the burst
+lasts. MessageHandler therefore reads messages into a MessageInbox as they
+arrive and takes them out with take(), which drops events superseded by a
+later event for the same callback:
+
+- Only callbacks the handler deems mergeable are considered (Mutable
+  bindings and continuous-input events such as on_change; never clicks or
+  key presses)
+- An event is superseded only if nothing but mergeable events and acks come
+  between it and the later one, so an on_submit after typing still sees the
+  value typed before it
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import typing as tp
+
+from trellis.platforms.common.messages import AckMessage, EventMessage, Message
+
+__all__ = ["MessageInbox"]
+
+
+class MessageInbox:
+    """Bounded FIFO of received messages that merges bursts of events.
+
+    The mergeable predicate passed to take() is given a callback handle and
+    decides whether only the latest event for it matters.
+    """
+
+    __slots__ = ("_messages", "_ready", "limit", "merged")
+
+    def __init__(self, limit: int = 256) -> None:
+        """Create an empty inbox.
+
+        Args:
+            limit: Messages buffered before put() waits for take() to catch up
+        """
+        self.limit = limit
+        # Number of events dropped because a later one superseded them
+        self.merged = 0
+        self._messages: collections.deque[Message] = collections.deque()
+        self._ready = asyncio.Condition()
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    async def put(self, msg: Message) -> None:
+        """Append a received message, waiting while the inbox is full.
+
+        Args:
+            msg: The message, in the order it was received
+        """
+        async with self._ready:
+            await self._ready.wait_for(lambda: len(self._messages) < self.limit)
+            self._messages.append(msg)
+            self._ready.notify_all()
+
+    async def take(self, mergeable: tp.Callable[[int], bool]) -> Message:
+        """Remove and return the next message, waiting while the inbox is empty.
+
+        Args:
+            mergeable: Whether events for a callback handle may be merged
+
+        Returns:
+            The oldest message not superseded by a later one
+        """
+        async with self._ready:
+            await self._ready.wait_for(lambda: bool(self._messages))
+            msg = self.take_nowait(mergeable)
+            self._ready.notify_all()
+            return msg
+
+    def take_nowait(self, mergeable: tp.Callable[[int], bool]) -> Message:
+        """Remove and return the next message without waiting.
+
+        Args:
+            mergeable: Whether events for a callback handle may be merged
+
+        Returns:
+            The oldest message not superseded by a later one
+
+        Raises:
+            IndexError: If the inbox is empty
+        """
+        messages = self._messages
+        msg = messages.popleft()
+        while self._superseded(msg, mergeable):
+            self.merged += 1
+            msg = messages.popleft()
+        return msg
+
+    def _superseded(self, msg: Message, mergeable: tp.Callable[[int], bool]) -> bool:
+        """Whether a later buffered event for the same callback replaces msg."""
+        if not isinstance(msg, EventMessage) or not mergeable(msg.callback_id):
+            return False
+        for later in self._messages:
+            if isinstance(later, AckMessage):
+                continue
+            if not isinstance(later, EventMessage) or not mergeable(later.callback_id):
+                return False
+            if later.callback_id == msg.callback_id:
+                return True
+        return False
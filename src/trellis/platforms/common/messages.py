@@ -14,27 +14,30 @@ from trellis.core.protocol import Message, register_message_types
 # ============================================================================
 # Patch types for incremental updates
 # ============================================================================
+#
+# Elements are referenced by their integer handle (see ElementIdTable), not by
+# their full position-based ID.
 
 
 class UpdatePatch(msgspec.Struct, tag="update", tag_field="op"):
     """Update an existing element's props and/or children order."""
 
-    id: str
+    id: int
     props: dict[str, tp.Any] | None = None  # Changed props only
-    children: list[str] | None = None  # New children order
+    children: list[int] | None = None  # New children order
 
 
 class RemovePatch(msgspec.Struct, tag="remove", tag_field="op"):
     """Remove an element from the tree."""
 
-    id: str
+    id: int
 
 
 class AddPatch(msgspec.Struct, tag="add", tag_field="op"):
     """Add a new element to the tree."""
 
-    parent_id: str | None
-    children: list[str]  # Parent's new children list
+    parent_id: int | None
+    children: list[int]  # Parent's new children list
     element: dict[str, tp.Any]  # Full subtree for the new element
 
 
@@ -44,7 +47,7 @@ Patch = UpdatePatch | RemovePatch | AddPatch
 class EventMessage(Message, tag="event"):
     """Client event triggering a server callback."""
 
-    callback_id: str
+    callback_id: int  # Handle from the session's CallbackTable
     args: list[tp.Any] = msgspec.field(default_factory=list)
 
 
@@ -58,26 +61,46 @@ class ErrorMessage(Message, tag="error"):
     context: str  # "render" | "callback"
 
 
-class PatchMessage(Message, tag="patch"):
+class PatchMessage(Message, tag="patch", omit_defaults=True):
     """Incremental update sent to client.
 
     Contains a list of patches to apply to the client-side tree.
     See Patch type for the three patch operations (add, update, remove).
+    For clients that acknowledge patches, seq numbers the message.
     """
 
     patches: list[Patch]
+    seq: int | None = None  # Sequence number, acknowledged with an AckMessage
+
+
+class AckMessage(Message, tag="ack"):
+    """Client acknowledgement that patch messages up to seq have been applied.
+
+    Sent by clients that set patch_acks in their hello. The server stops
+    sending patches while too many are unacknowledged, and sends the merged
+    net change once the client catches up.
+    """
+
+    seq: int
 
 
 class HelloMessage(Message, tag="hello"):
     """Client hello message sent on connection.
 
-    All platforms use this message for session initialization.
+    All platforms use this message for session initialization. A client
+    reconnecting after a dropped connection passes its previous session_id
+    and the seq of the last patch message it applied, so the server can
+    resume the session instead of starting a new one.
     """
 
     client_id: str
     system_theme: Literal["light", "dark"] = "light"  # Detected from OS preference
     theme_mode: Literal["system", "light", "dark"] | None = None  # Host-controlled override
     path: str = "/"
+    compression: list[str] = msgspec.field(default_factory=list)  # Encodings the client decodes
+    patch_acks: bool = False  # Client acknowledges patch messages with AckMessage
+    session_id: str | None = None  # Session to resume after a reconnect
+    last_seq: int = 0  # Seq of the last patch message applied, when resuming
 
 
 class DebugConfig(msgspec.Struct):
@@ -94,12 +117,16 @@ class HelloResponseMessage(Message, tag="hello_response"):
     """Server response to client hello.
 
     Contains session ID for tracking and server version for compatibility.
-    Optionally includes debug configuration for client-side logging.
+    Optionally includes debug configuration for client-side logging, and the
+    compression the server picked from those the client offered. resumed is
+    set when the server reattached the client to its previous session.
     """
 
     session_id: str
     server_version: str
     debug: DebugConfig | None = None
+    compression: str | None = None  # Encoding the server applies to large messages
+    resumed: bool = False  # Client was reattached to the session it asked for
 
 
 class ReloadMessage(Message, tag="reload"):
@@ -128,6 +155,7 @@ register_message_types(
     HelloMessage,
     HelloResponseMessage,
     PatchMessage,
+    AckMessage,
     EventMessage,
     ErrorMessage,
     ReloadMessage,
@@ -0,0 +1,178 @@
+"""Merging of render patches held back from a slow client.
+
+When a client falls behind on acknowledging patch messages, MessageHandler
+keeps rendering but stops sending. The render patches of those frames go into
+a PatchCoalescer, which folds them into the net change from what the client
+last saw to the current tree:
+
+- An element added and then removed cancels out
+- An element added and then updated is sent once, as it is now
+- Updates to the same element fold into one, with each prop sent once
+- Updates to removed elements are dropped
+
+Once the client catches up, flush() returns that net change, so the client
+skips straight to the latest state instead of replaying every frame.
+"""
+
+from __future__ import annotations
+
+import typing as tp
+
+from trellis.core.rendering.element import _REMOVED
+from trellis.core.rendering.patches import (
+    RenderAddPatch,
+    RenderPatch,
+    RenderRemovePatch,
+    RenderUpdatePatch,
+)
+
+if tp.TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from trellis.core.rendering.session import RenderSession
+
+__all__ = ["PatchCoalescer"]
+
+
+class _HeldUpdate:
+    """Props and children changes held for one element."""
+
+    __slots__ = ("children", "folded", "props")
+
+    def __init__(self) -> None:
+        self.props: dict[str, tp.Any] = {}
+        # Keys changed in more than one held frame; their diff values were
+        # relative to different states, so they are resent whole on flush
+        self.folded: set[str] = set()
+        self.children = False
+
+
+class PatchCoalescer:
+    """Folds render patches from several frames into one net diff.
+
+    Patches must be added in the order they were rendered, each batch right
+    after its render pass: removed elements' handles are captured then, while
+    they are still resolvable.
+    """
+
+    __slots__ = ("_added", "_frames", "_removed", "_updated")
+
+    def __init__(self) -> None:
+        # Subtree roots added since the last flush, in order, with their parent
+        self._added: dict[str, str | None] = {}
+        # Element ID -> handle of elements the client has to drop
+        self._removed: dict[str, int] = {}
+        self._updated: dict[str, _HeldUpdate] = {}
+        self._frames = 0
+
+    def __bool__(self) -> bool:
+        """Whether any frame has been held since the last flush."""
+        return self._frames > 0
+
+    @property
+    def frames(self) -> int:
+        """Number of render passes folded since the last flush."""
+        return self._frames
+
+    def add(self, patches: Iterable[RenderPatch], session: RenderSession) -> None:
+        """Fold the patches of one render pass into the held changes.
+
+        Args:
+            patches: Render patches from a single render pass
+            session: The RenderSession the patches came from
+        """
+        self._frames += 1
+        for patch in patches:
+            if isinstance(patch, RenderAddPatch):
+                element_id = patch.element.id
+                self._added[element_id] = patch.parent_id
+                self._updated.pop(element_id, None)
+            elif isinstance(patch, RenderRemovePatch):
+                element_id = patch.element_id
+                self._updated.pop(element_id, None)
+                if element_id in self._added:
+                    # Never sent, so nothing to remove. A removal of an
+                    # earlier incarnation recorded before the add still stands.
+                    del self._added[element_id]
+                elif element_id not in self._removed:
+                    self._removed[element_id] = session.ids.intern(element_id)
+            elif isinstance(patch, RenderUpdatePatch):
+                self._hold_update(patch)
+
+    def _hold_update(self, patch: RenderUpdatePatch) -> None:
+        """Fold one update patch into the changes held for its element."""
+        element_id = patch.element_id
+        if element_id in self._added:
+            # The add will carry the element as it is at flush time
+            return
+        held = self._updated.get(element_id)
+        if held is None:
+            held = self._updated[element_id] = _HeldUpdate()
+        if patch.props is not None:
+            for key, value in patch.props.items():
+                if key in held.props:
+                    held.folded.add(key)
+                held.props[key] = value
+        if patch.children is not None:
+            held.children = True
+
+    def flush(self, session: RenderSession) -> tuple[list[int], list[RenderPatch]]:
+        """Return the net change since the last flush and start over.
+
+        Args:
+            session: The RenderSession the patches came from
+
+        Returns:
+            Handles of elements to remove, to be sent first, then add and
+            update patches describing the current tree
+        """
+        elements = session.elements
+        # Descendants of added subtrees go out inside their root's add
+        covered: set[str] = set()
+        for element_id in self._added:
+            element = elements.get(element_id)
+            if element is not None:
+                stack = list(element.child_ids)
+                while stack:
+                    child_id = stack.pop()
+                    covered.add(child_id)
+                    child = elements.get(child_id)
+                    if child is not None:
+                        stack.extend(child.child_ids)
+
+        patches: list[RenderPatch] = []
+        for element_id, parent_id in self._added.items():
+            element = elements.get(element_id)
+            if element is None or element_id in covered:
+                continue
+            parent = elements.get(parent_id) if parent_id is not None else None
+            patches.append(
+                RenderAddPatch(
+                    parent_id=parent_id,
+                    children=tuple(parent.child_ids) if parent is not None else (),
+                    element=element,
+                )
+            )
+
+        for element_id, held in self._updated.items():
+            element = elements.get(element_id)
+            if element is None or element_id in covered:
+                continue
+            props = {
+                key: element.props.get(key, _REMOVED) if key in held.folded else value
+                for key, value in held.props.items()
+            }
+            patches.append(
+                RenderUpdatePatch(
+                    element_id=element_id,
+                    props=props or None,
+                    children=tuple(element.child_ids) if held.children else None,
+                )
+            )
+
+        removed = list(self._removed.values())
+        self._added.clear()
+        self._removed.clear()
+        self._updated.clear()
+        self._frames = 0
+        return removed, patches
@@ -3,9 +3,23 @@
 This module converts the server-side Element trees to a JSON-serializable
 format that can be sent to the client for rendering.
 
-Callbacks are replaced with IDs (element_id|prop_name) that the client can use
-to invoke them via events. The callback is looked up from the element's props
-at invocation time.
+Elements are identified on the wire by their integer handle from the session's
+ElementIdTable rather than their full position-based ID.
+
+Callbacks are replaced with integer handles from the session's CallbackTable
+that the client can use to invoke them via events. The callback is looked up
+from the element's props at invocation time.
+
+Props are serialized by a per-component PropSerializer. Props that can carry
+callbacks or Mutables take the full walk that builds callback paths; all other
+props are copied as plain JSON data without per-item path bookkeeping.
+
+Update patches for nested diff props carry `{"__ops__": [...]}` in place of the
+value: path-based edits the client applies to its copy of the prop.
+
+NumPy arrays and ``array.array`` values are sent as msgpack extension values
+holding the raw array bytes (see typed_arrays.py); the client decodes them
+into typed arrays such as ``Float64Array``.
 
 Two modes:
 1. Full serialization via `serialize_element()` - for initial render
@@ -15,49 +29,196 @@ Two modes:
 from __future__ import annotations
 
 import typing as tp
+import weakref
 from collections.abc import Mapping
 
+from trellis.core.components.base import Component
 from trellis.core.components.composition import CompositionComponent
-from trellis.core.rendering.element import _RemovedType
+from trellis.core.rendering.element import PropOp, PropOps, _RemovedType
 from trellis.core.state.mutable import Mutable
+from trellis.core.state.stream import StreamWindow
 
 # TODO: clean this up when we have a proper serialization registry
 from trellis.html._style_compiler import compile_style_props
+from trellis.platforms.common.typed_arrays import encode_typed_array
 
 if tp.TYPE_CHECKING:
     from trellis.core.rendering.element import Element
     from trellis.core.rendering.session import RenderSession
 
 
-def _make_callback_id(element_id: str, prop_name: str) -> str:
-    """Create a callback ID from element_id and prop_name.
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+class _NeedsPaths(Exception):
+    """Raised by _serialize_plain when a value needs callback paths."""
+
+
+def _serialize_plain(value: tp.Any) -> tp.Any:  # noqa: PLR0911
+    """Serialize a value known to hold no callables, without building paths.
+
+    Lists and dicts whose items are all JSON scalars are copied in one step.
 
     Args:
-        element_id: The element's ID
-        prop_name: The property name
+        value: The value to serialize
 
     Returns:
-        Callback ID in format "element_id|prop_name"
+        A JSON-serializable version of the value
+
+    Raises:
+        _NeedsPaths: If a callable or Mutable is found anywhere in the value
+    """
+    cls = type(value)
+    if cls in _SCALAR_TYPES:
+        return value
+    if cls is list or cls is tuple:
+        if all(map(_SCALAR_TYPES.__contains__, map(type, value))):
+            return list(value)
+        return [_serialize_plain(v) for v in value]
+    if cls is dict:
+        if all(map(_SCALAR_TYPES.__contains__, map(type, value.values()))):
+            return dict(value)
+        return {k: _serialize_plain(v) for k, v in value.items()}
+    # Subclasses and other types follow the same order as _serialize_value
+    if cls is StreamWindow:
+        return _serialize_plain(value.values())
+    if callable(value):
+        raise _NeedsPaths
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_serialize_plain(v) for v in value]
+    if isinstance(value, Mapping):
+        return {k: _serialize_plain(v) for k, v in value.items()}
+    # Numeric arrays go out as binary typed arrays, anything else as a string
+    encoded = encode_typed_array(value)
+    return str(value) if encoded is None else encoded
+
+
+class PropSerializer:
+    """Serializes the props of one component's elements.
+
+    Starts from the props the component's signature declares as callbacks and
+    adds any prop in which a callable or Mutable is later observed. Those props
+    are serialized with callback paths; the rest go through _serialize_plain.
     """
-    return f"{element_id}|{prop_name}"
 
+    __slots__ = ("__weakref__", "path_props")
+
+    def __init__(self, callback_props: frozenset[str] = frozenset()) -> None:
+        self.path_props: set[str] = set(callback_props)
+
+    def serialize(
+        self, props: dict[str, tp.Any], session: RenderSession, element_id: str
+    ) -> dict[str, tp.Any]:
+        """Serialize a props dict for wire transmission.
+
+        Args:
+            props: Raw props dict to serialize
+            session: The RenderSession, used to intern element handles
+            element_id: The element ID for callback IDs
+
+        Returns:
+            Serialized props dict
+        """
+        path_props = self.path_props
+        result = {}
+        for key, value in compile_style_props(props).items():
+            if key == "child_ids":
+                continue
+            if isinstance(value, _RemovedType):
+                result[key] = {"__removed__": True}
+                continue
+            if isinstance(value, PropOps):
+                result[key] = {"__ops__": self._serialize_ops(value, session, element_id, key)}
+                continue
+            if key not in path_props:
+                try:
+                    result[key] = _serialize_plain(value)
+                    continue
+                except _NeedsPaths:
+                    path_props.add(key)
+            result[key] = _serialize_value(value, session, element_id, key)
+        return result
+
+    def _serialize_ops(
+        self, ops: PropOps, session: RenderSession, element_id: str, key: str
+    ) -> list[dict[str, tp.Any]]:
+        """Serialize the edits of a nested prop diff.
+
+        Values carried by the edits are serialized like the prop itself, with
+        callback paths pointing at their position in the new prop value.
+        """
+        if key not in self.path_props:
+            try:
+                return [
+                    _serialize_op(op, lambda value, _path: _serialize_plain(value))
+                    for op in ops.ops
+                ]
+            except _NeedsPaths:
+                self.path_props.add(key)
+
+        def serialize_at(value: tp.Any, path: tuple[str | int, ...]) -> tp.Any:
+            return _serialize_value(value, session, element_id, _format_prop_path(key, path))
+
+        return [_serialize_op(op, serialize_at) for op in ops.ops]
+
+
+def _format_prop_path(key: str, path: tuple[str | int, ...]) -> str:
+    """Format a prop key and nested path the way callback paths are written."""
+    return key + "".join(
+        f"[{segment}]" if isinstance(segment, int) else f".{segment}" for segment in path
+    )
+
+
+def _serialize_op(
+    op: PropOp, serialize: tp.Callable[[tp.Any, tuple[str | int, ...]], tp.Any]
+) -> dict[str, tp.Any]:
+    """Serialize one PropOp.
 
-def parse_callback_id(callback_id: str) -> tuple[str, str]:
-    """Parse a callback ID into element_id and prop_name.
     Args:
-        callback_id: The callback ID to parse
+        op: The edit to serialize
+        serialize: Serializes a carried value, given the value and its path
+            within the new prop value
 
     Returns:
-        Tuple of (element_id, prop_name)
+        Wire form of the edit
+    """
+    path = list(op.path)
+    if op.op == "set":
+        return {"op": "set", "path": path, "value": serialize(op.value, op.path)}
+    if op.op == "delete":
+        return {"op": "delete", "path": path}
+    items = [serialize(item, (*op.path, op.index + offset)) for offset, item in enumerate(op.value)]
+    if op.op == "append":
+        return {"op": "append", "path": path, "items": items}
+    return {"op": "splice", "path": path, "index": op.index, "delete": op.delete, "items": items}
 
-    Raises:
-        ValueError: If callback_id format is invalid
+
+_serializers: weakref.WeakKeyDictionary[Component, PropSerializer] = weakref.WeakKeyDictionary()
+
+
+def get_prop_serializer(component: Component) -> PropSerializer:
+    """Get the PropSerializer for a component, creating it on first use."""
+    serializer = _serializers.get(component)
+    if serializer is None:
+        serializer = PropSerializer(component.callback_props)
+        _serializers[component] = serializer
+    return serializer
+
+
+def _make_callback_id(session: RenderSession, element_id: str, prop_name: str) -> int:
+    """Get the callback handle for an element's prop path.
+
+    Args:
+        session: The render session whose CallbackTable assigns the handle
+        element_id: The element's ID
+        prop_name: The property path
+
+    Returns:
+        Integer callback handle
     """
-    # Find the last | since element_id may contain special characters
-    idx = callback_id.rfind("|")
-    if idx == -1:
-        raise ValueError(f"Invalid callback_id format: {callback_id}")
-    return callback_id[:idx], callback_id[idx + 1 :]
+    return session.callbacks.register(element_id, prop_name)
 
 
 def _serialize_value(
@@ -70,18 +231,22 @@ def _serialize_value(
 
     Args:
         value: The value to serialize
-        session: The render session (unused, kept for API compatibility)
+        session: The render session, used to intern element handles
         element_id: The element ID for callback IDs
         prop_name: The property name for callback IDs
 
     Returns:
         A JSON-serializable version of the value
     """
+    # Stream windows serialize as the items they cover
+    if isinstance(value, StreamWindow):
+        value = value.values()
+
     # Handle Mutable wrappers for two-way binding
     # Mutable has __call__ so it's callable - we serialize the current value
     # and provide a callback ID for updates
     if isinstance(value, Mutable):
-        cb_id = _make_callback_id(element_id, prop_name)
+        cb_id = _make_callback_id(session, element_id, prop_name)
         version = value._owner._input_versions.get(value._attr, 0)
         return {
             "__mutable__": cb_id,
@@ -91,7 +256,7 @@ def _serialize_value(
 
     if callable(value):
         # Create callback ID from element and prop
-        cb_id = _make_callback_id(element_id, prop_name)
+        cb_id = _make_callback_id(session, element_id, prop_name)
         return {"__callback__": cb_id}
     if isinstance(value, (str, int, float, bool, type(None))):
         return value
@@ -105,15 +270,16 @@ def _serialize_value(
             k: _serialize_value(v, session, element_id, f"{prop_name}.{k}")
             for k, v in value.items()
         }
-    # For other types, convert to string
-    return str(value)
+    # Numeric arrays go out as binary typed arrays, other types as a string
+    encoded = encode_typed_array(value)
+    return str(value) if encoded is None else encoded
 
 
 def serialize_element(element: Element, session: RenderSession) -> dict[str, tp.Any]:
     """Convert an Element to a serializable dict.
 
     The resulting structure can be JSON-encoded and sent to the client.
-    Callbacks are replaced with `{"__callback__": "cb_123"}` references.
+    Callbacks are replaced with `{"__callback__": 123}` handle references.
     Children are looked up from the flat element storage via child_ids.
 
     Args:
@@ -126,7 +292,7 @@ def serialize_element(element: Element, session: RenderSession) -> dict[str, tp.
             "kind": "react_component" | "jsx_element" | "text",
             "type": "ComponentOrTagName",  # The component/element to render
             "name": "PythonComponentName",  # For debugging
-            "key": "optional-key" or null,
+            "key": 12,  # Integer element handle
             "props": {...},
             "children": [...]
         }
@@ -145,7 +311,7 @@ def serialize_element(element: Element, session: RenderSession) -> dict[str, tp.
         "kind": element.component.element_kind.value,  # Element kind for client handling
         "type": element.component.element_name,  # Component/element type to render
         "name": element.component.name,  # Python component name for debugging
-        "key": element.id,  # Position-based ID (encodes position and user key)
+        "key": session.ids.intern(element.id),  # Compact handle for the position-based ID
         "props": props,
         "children": children,
     }
@@ -158,22 +324,17 @@ def _serialize_props(
 
     Args:
         props: Raw props dict to serialize
-        session: The RenderSession (unused, kept for API compatibility)
+        session: The RenderSession, used to intern element handles
         element_id: The element ID for callback IDs
 
     Returns:
         Serialized props dict
     """
-    compiled_props = compile_style_props(props)
-    result = {}
-    for key, value in compiled_props.items():
-        if key == "child_ids":
-            continue
-        if isinstance(value, _RemovedType):
-            result[key] = {"__removed__": True}
-        else:
-            result[key] = _serialize_value(value, session, element_id, key)
-    return result
+    element = session.elements.get(element_id)
+    if element is None:
+        # No component to learn from; walk every prop with callback paths
+        return PropSerializer(frozenset(props)).serialize(props, session, element_id)
+    return get_prop_serializer(element.component).serialize(props, session, element_id)
 
 
 def _serialize_element_props(element: Element, session: RenderSession) -> dict[str, tp.Any]:
@@ -194,7 +355,8 @@ def _serialize_element_props(element: Element, session: RenderSession) -> dict[s
 
     if isinstance(element.component, CompositionComponent):
         return key_filter_props
-    result = _serialize_props(element.properties, session, element.id)
+    serializer = get_prop_serializer(element.component)
+    result = serializer.serialize(element.properties, session, element.id)
     result.update(key_filter_props)
     return result
 
@@ -0,0 +1,115 @@
+"""Binary encoding of numeric arrays for wire transmission.
+
+Props holding NumPy arrays or ``array.array`` are sent as msgpack extension
+values instead of lists of numbers. The extension code names the element
+type and the payload is the array's raw little-endian bytes, taken from the
+buffer protocol without copying. The client decodes each one into the
+matching JavaScript typed array (``Float64Array`` for float64).
+
+Arrays with more than one dimension become nested lists of 1-D rows, so a
+``(3, n)`` array of chart columns arrives as three typed arrays.
+
+NumPy is not imported; any object exposing the buffer protocol through
+``__array_interface__`` is accepted.
+"""
+
+from __future__ import annotations
+
+import array
+import sys
+import typing as tp
+
+import msgspec
+
+__all__ = ["TYPED_ARRAY_EXT_CODES", "encode_typed_array", "typed_array_view"]
+
+# Extension codes by (kind, itemsize); kind is "f" float, "i" signed, "u" unsigned.
+# Must match EXT_TYPES in the client's typedArrays.ts.
+TYPED_ARRAY_EXT_CODES: dict[tuple[str, int], int] = {
+    ("f", 8): 1,  # Float64Array
+    ("f", 4): 2,  # Float32Array
+    ("i", 1): 3,  # Int8Array
+    ("u", 1): 4,  # Uint8Array
+    ("i", 2): 5,  # Int16Array
+    ("u", 2): 6,  # Uint16Array
+    ("i", 4): 7,  # Int32Array
+    ("u", 4): 8,  # Uint32Array
+    ("i", 8): 9,  # 64-bit ints arrive as Float64Array
+    ("u", 8): 10,  # 64-bit ints arrive as Float64Array
+}
+
+# struct format characters for each element type, used to view payloads again
+_EXT_FORMATS = {1: "d", 2: "f", 3: "b", 4: "B", 5: "h", 6: "H", 7: "i", 8: "I", 9: "q", 10: "Q"}
+
+_KINDS = {"d": "f", "f": "f", **dict.fromkeys("bhilq", "i"), **dict.fromkeys("BHILQ", "u")}
+
+# Byte order prefixes that mean little-endian on this machine
+_LITTLE_ENDIAN_PREFIXES = ("<", "=", "@", "") if sys.byteorder == "little" else ("<",)
+
+
+def encode_typed_array(value: tp.Any) -> tp.Any:
+    """Encode an array-like value for the wire.
+
+    Args:
+        value: Any value; only ``array.array`` and objects with
+            ``__array_interface__`` (e.g. NumPy arrays) are encoded
+
+    Returns:
+        A msgpack Ext for a 1-D array, nested lists of Ext for higher
+        dimensions, a plain list or scalar for arrays with no typed array
+        equivalent (bool, float16, big-endian, ...), or None if value is
+        not an array
+    """
+    if not isinstance(value, array.array) and not hasattr(type(value), "__array_interface__"):
+        return None
+    try:
+        view = memoryview(value)
+    except TypeError:
+        return None
+
+    fmt = view.format
+    prefix, char = (fmt[0], fmt[1:]) if fmt[0] in "<>=!@" else ("", fmt)
+    kind = _KINDS.get(char)
+    if kind is None or prefix not in _LITTLE_ENDIAN_PREFIXES or view.ndim == 0:
+        # No matching typed array: send the values as a list
+        return value.tolist() if hasattr(value, "tolist") else view.tolist()
+    code = TYPED_ARRAY_EXT_CODES[kind, view.itemsize]
+
+    # Strided views (e.g. a column slice) are copied once into C order
+    raw = view.cast("B") if view.c_contiguous else memoryview(view.tobytes())
+    return _split_rows(code, raw, view.itemsize, tuple(view.shape or ()), 0)
+
+
+def _split_rows(
+    code: int, raw: memoryview, itemsize: int, shape: tuple[int, ...], offset: int
+) -> tp.Any:
+    """Slice a C-ordered byte view into one Ext per innermost row."""
+    if len(shape) == 1:
+        return msgspec.msgpack.Ext(code, raw[offset : offset + shape[0] * itemsize])
+    step = itemsize
+    for size in shape[1:]:
+        step *= size
+    return [
+        _split_rows(code, raw, itemsize, shape[1:], offset + row * step) for row in range(shape[0])
+    ]
+
+
+def typed_array_view(ext: msgspec.msgpack.Ext) -> memoryview | list[int]:
+    """View an encoded typed array as a typed memoryview.
+
+    Used where messages are handed to JavaScript as objects instead of
+    msgpack (the browser platform), so the array converts to a typed array
+    there too. 64-bit ints become a list, since JavaScript numbers can't view
+    them directly.
+
+    Args:
+        ext: A value produced by encode_typed_array()
+
+    Returns:
+        A memoryview with the element format of the array, or a list for
+        64-bit ints
+    """
+    view = memoryview(ext.data).cast("B").cast(_EXT_FORMATS[ext.code])
+    if ext.code in (9, 10):
+        return view.tolist()
+    return view
@@ -21,7 +21,7 @@ import {
   BaseTrellisClient,
   ConnectionState,
 } from "@trellis/trellis-core/TrellisClient";
-import { TrellisStore } from "@trellis/trellis-core/core";
+import { TrellisStore, typedArrayCodec, type CallbackId } from "@trellis/trellis-core/core";
 import { RoutingMode } from "@trellis/trellis-core/RouterManager";
 
 export type { ConnectionState };
@@ -64,7 +64,7 @@ export class DesktopClient extends BaseTrellisClient {
 
       // Set up message handler for incoming messages from Python
       this.channel.onmessage = (data: ArrayBuffer) => {
-        const msg = decode(new Uint8Array(data)) as Message;
+        const msg = decode(new Uint8Array(data), { extensionCodec: typedArrayCodec }) as Message;
         this.handler.handleMessage(msg);
 
         // Resolve connect promise on HELLO_RESPONSE
@@ -111,7 +111,7 @@ export class DesktopClient extends BaseTrellisClient {
   }
 
   /** Send an event to the backend to invoke a callback. */
-  sendEvent(callbackId: string, args: unknown[] = []): void {
+  sendEvent(callbackId: CallbackId, args: unknown[] = []): void {
     const msg: EventMessage = {
       type: MessageType.EVENT,
       callback_id: callbackId,
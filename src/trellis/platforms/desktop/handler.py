@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import asyncio
 import typing as tp
+from concurrent.futures import Executor
 from typing import TYPE_CHECKING
 
 import msgspec
@@ -42,6 +43,9 @@ class PyTauriMessageHandler(MessageHandler):
         app_wrapper: AppWrapper,
         channel: Channel,
         batch_delay: float = 1.0 / 30,
+        *,
+        render_slice_budget: float | None = None,
+        render_executor: Executor | None = None,
     ) -> None:
         """Create a PyTauri message handler.
 
@@ -49,9 +53,19 @@ class PyTauriMessageHandler(MessageHandler):
             root_component: The root Trellis component to render
             app_wrapper: Callback to wrap component with TrellisApp
             channel: The PyTauri channel for sending messages to client
-            batch_delay: Time between render frames in seconds (default ~33ms for 30fps)
+            batch_delay: Minimum time between render frames in seconds (default ~33ms)
+            render_slice_budget: If set, re-render in time slices of this many
+                seconds, yielding to the event loop between them
+            render_executor: If set, re-render on this executor instead of
+                the event loop
         """
-        super().__init__(root_component, app_wrapper, batch_delay=batch_delay)
+        super().__init__(
+            root_component,
+            app_wrapper,
+            batch_delay=batch_delay,
+            render_slice_budget=render_slice_budget,
+            render_executor=render_executor,
+        )
         self._channel = channel
         self._queue = asyncio.Queue()
         self._encoder = msgspec.msgpack.Encoder()
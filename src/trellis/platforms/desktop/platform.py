@@ -19,10 +19,13 @@ from rich.console import Console
 from trellis.app.apploader import get_dist_dir
 from trellis.desktop.dialogs import _clear_dialog_runtime, _set_dialog_runtime
 from trellis.platforms.common.base import Platform
+from trellis.platforms.common.handler import create_render_executor
 from trellis.platforms.common.handler_registry import get_global_registry
 from trellis.platforms.desktop.handler import PyTauriMessageHandler
 
 if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
     from trellis.app.config import Config
     from trellis.bundler import BuildConfig
     from trellis.core.components.base import Component
@@ -70,6 +73,8 @@ class DesktopPlatform(Platform):
     _handler: PyTauriMessageHandler | None
     _handler_task: asyncio.Task[None] | None
     _batch_delay: float
+    _render_executor: ThreadPoolExecutor | None
+    _render_slice_budget: float | None
 
     def __init__(self) -> None:
         self._root_component = None
@@ -77,6 +82,8 @@ class DesktopPlatform(Platform):
         self._handler = None
         self._handler_task = None
         self._batch_delay = 1.0 / 30
+        self._render_executor = None
+        self._render_slice_budget = None
 
     @property
     def name(self) -> str:
@@ -201,6 +208,8 @@ class DesktopPlatform(Platform):
                 self._app_wrapper,  # type: ignore[arg-type]
                 channel,
                 batch_delay=self._batch_delay,
+                render_slice_budget=self._render_slice_budget,
+                render_executor=self._render_executor,
             )
             self._handler = handler
             get_global_registry().register(handler)
@@ -247,16 +256,33 @@ class DesktopPlatform(Platform):
         window_width: int = 1024,
         window_height: int = 768,
         batch_delay: float = 1.0 / 30,
+        render_workers: int = 0,
+        render_slice_budget: float = 0.0,
         hot_reload: bool = True,
         **_kwargs: Any,
     ) -> None:
-        """Start the desktop application in either dev or standalone mode."""
+        """Start the desktop application in either dev or standalone mode.
+
+        Args:
+            root_component: The root Trellis component to render
+            app_wrapper: Callback to wrap component with TrellisApp
+            window_title: Title of the application window
+            window_width: Initial window width in pixels
+            window_height: Initial window height in pixels
+            batch_delay: Minimum time between render frames in seconds (default ~33ms)
+            render_workers: Threads re-renders run on (0 renders on the event loop)
+            render_slice_budget: Seconds a re-render runs before yielding to
+                the event loop (0 renders each pass in one go)
+            hot_reload: Enable hot reload in development mode (default True)
+        """
         if not self.is_standalone:
             _print_startup_banner(window_title)
 
         self._root_component = root_component  # type: ignore[assignment]
         self._app_wrapper = app_wrapper
         self._batch_delay = batch_delay
+        self._render_executor = create_render_executor(render_workers)
+        self._render_slice_budget = render_slice_budget or None
 
         runtime = self._load_pytauri_runtime()
         commands = self._create_commands(runtime)
@@ -308,6 +334,9 @@ class DesktopPlatform(Platform):
             finally:
                 signal.signal(signal.SIGINT, prev_sigint)
                 _clear_dialog_runtime()
+                if self._render_executor is not None:
+                    self._render_executor.shutdown(wait=False, cancel_futures=True)
+                    self._render_executor = None
 
 
 __all__ = ["DesktopPlatform"]
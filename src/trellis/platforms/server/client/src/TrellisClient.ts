@@ -9,6 +9,7 @@ import { encode, decode } from "@msgpack/msgpack";
 import {
   Message,
   MessageType,
+  AckMessage,
   HelloMessage,
   HelloResponseMessage,
   EventMessage,
@@ -19,18 +20,33 @@ import {
   BaseTrellisClient,
   ConnectionState,
 } from "@trellis/trellis-core/TrellisClient";
-import { TrellisStore } from "@trellis/trellis-core/core";
+import { TrellisStore, typedArrayCodec, type CallbackId } from "@trellis/trellis-core/core";
 import { debugLog } from "@trellis/trellis-core/debug";
 import { RoutingMode } from "@trellis/trellis-core/RouterManager";
+import { inflate, isCompressed, supportedCompression } from "./compression";
 
 export type { ConnectionState };
 
+// Reconnect backoff after a dropped connection: doubles from base up to max
+const RECONNECT_BASE_DELAY_MS = 250;
+const RECONNECT_MAX_DELAY_MS = 5000;
+
 export interface TrellisClientCallbacks extends ClientMessageHandlerCallbacks {}
 
 export class ServerTrellisClient extends BaseTrellisClient {
   private ws: WebSocket | null = null;
   private connectResolver: ((response: HelloResponseMessage) => void) | null =
     null;
+  // Frames still being decompressed; later frames wait so messages stay in order
+  private pendingFrames = 0;
+  private frameQueue: Promise<void> = Promise.resolve();
+  // Latest patch seq waiting to be acknowledged, if an ack is scheduled
+  private ackSeq: number | null = null;
+  // Seq of the last patch message applied, sent when resuming the session
+  private lastSeq = 0;
+  private closedByClient = false;
+  private reconnectAttempts = 0;
+  private reconnectTimer: ReturnType<typeof setTimeout> | null = null;
 
   /**
    * Create a new server client.
@@ -47,53 +63,141 @@ export class ServerTrellisClient extends BaseTrellisClient {
   }
 
   async connect(): Promise<HelloResponseMessage> {
+    this.closedByClient = false;
     return new Promise((resolve, reject) => {
       this.connectResolver = resolve;
-      this.handler.setConnectionState("connecting");
-
-      const protocol = window.location.protocol === "https:" ? "wss:" : "ws:";
-      const wsUrl = `${protocol}//${window.location.host}/ws`;
-      debugLog("client", `Connecting to ${wsUrl}`);
-      this.ws = new WebSocket(wsUrl);
-      this.ws.binaryType = "arraybuffer";
-
-      this.ws.onopen = () => {
-        debugLog("client", "WebSocket opened, sending HELLO");
-        const systemTheme = window.matchMedia("(prefers-color-scheme: dark)")
-          .matches
-          ? "dark"
-          : "light";
-        const hello: HelloMessage = {
-          type: MessageType.HELLO,
-          client_id: this.clientId,
-          system_theme: systemTheme,
-          path: window.location.pathname,
-        };
-        this.send(hello);
+      this.open(() => reject(new Error("WebSocket connection failed")));
+    });
+  }
+
+  /**
+   * Open a WebSocket and say hello.
+   *
+   * Once a session exists, the hello asks to resume it, so after a dropped
+   * connection the server keeps component state and only sends the patches
+   * this client missed.
+   */
+  private open(onError?: () => void): void {
+    this.handler.setConnectionState("connecting");
+
+    const protocol = window.location.protocol === "https:" ? "wss:" : "ws:";
+    const wsUrl = `${protocol}//${window.location.host}/ws`;
+    debugLog("client", `Connecting to ${wsUrl}`);
+    this.ws = new WebSocket(wsUrl);
+    this.ws.binaryType = "arraybuffer";
+
+    this.ws.onopen = () => {
+      debugLog("client", "WebSocket opened, sending HELLO");
+      const systemTheme = window.matchMedia("(prefers-color-scheme: dark)")
+        .matches
+        ? "dark"
+        : "light";
+      const hello: HelloMessage = {
+        type: MessageType.HELLO,
+        client_id: this.clientId,
+        system_theme: systemTheme,
+        path: window.location.pathname,
+        compression: supportedCompression(),
+        patch_acks: true,
       };
+      const sessionId = this.handler.getSessionId();
+      if (sessionId !== null) {
+        hello.session_id = sessionId;
+        hello.last_seq = this.lastSeq;
+      }
+      this.send(hello);
+    };
 
-      this.ws.onmessage = (event) => {
-        const msg = decode(new Uint8Array(event.data)) as Message;
-        this.handler.handleMessage(msg);
+    this.ws.onmessage = (event) => {
+      const data = new Uint8Array(event.data);
+      if (!isCompressed(data) && this.pendingFrames === 0) {
+        this.receive(data);
+        return;
+      }
+      this.pendingFrames++;
+      this.frameQueue = this.frameQueue
+        .then(() => (isCompressed(data) ? inflate(data) : data))
+        .then((bytes) => this.receive(bytes))
+        .catch((error) => console.error("Failed to decode server message", error))
+        .finally(() => {
+          this.pendingFrames--;
+        });
+    };
 
-        // Resolve connect promise on HELLO_RESPONSE
-        if (msg.type === MessageType.HELLO_RESPONSE && this.connectResolver) {
-          this.connectResolver(msg);
-          this.connectResolver = null;
-        }
-      };
+    this.ws.onerror = () => {
+      debugLog("client", "WebSocket error");
+      this.handler.setConnectionState("disconnected");
+      onError?.();
+    };
 
-      this.ws.onerror = () => {
-        debugLog("client", "WebSocket error");
-        this.handler.setConnectionState("disconnected");
-        reject(new Error("WebSocket connection failed"));
-      };
+    this.ws.onclose = () => {
+      debugLog("client", "WebSocket closed");
+      this.handler.setConnectionState("disconnected");
+      this.scheduleReconnect();
+    };
+  }
 
-      this.ws.onclose = () => {
-        debugLog("client", "WebSocket closed");
-        this.handler.setConnectionState("disconnected");
-      };
-    });
+  /** Reconnect with exponential backoff unless the client disconnected itself. */
+  private scheduleReconnect(): void {
+    if (this.closedByClient || this.reconnectTimer !== null) return;
+    if (this.handler.getSessionId() === null) return;
+    const delay = Math.min(
+      RECONNECT_MAX_DELAY_MS,
+      RECONNECT_BASE_DELAY_MS * 2 ** this.reconnectAttempts
+    );
+    this.reconnectAttempts++;
+    debugLog("client", `Reconnecting in ${delay}ms`);
+    this.reconnectTimer = setTimeout(() => {
+      this.reconnectTimer = null;
+      this.open();
+    }, delay);
+  }
+
+  private receive(data: Uint8Array): void {
+    const msg = decode(data, { extensionCodec: typedArrayCodec }) as Message;
+    this.handler.handleMessage(msg);
+
+    if (msg.type === MessageType.PATCH && msg.seq !== undefined) {
+      this.lastSeq = msg.seq;
+      this.scheduleAck(msg.seq);
+    }
+
+    if (msg.type === MessageType.HELLO_RESPONSE) {
+      this.reconnectAttempts = 0;
+      if (!msg.resumed) {
+        // New session: its patches are numbered from the start
+        this.lastSeq = 0;
+      }
+      // Resolve connect promise on the first HELLO_RESPONSE
+      if (this.connectResolver) {
+        this.connectResolver(msg);
+        this.connectResolver = null;
+      }
+    }
+  }
+
+  /**
+   * Acknowledge patches on the next animation frame.
+   *
+   * Acking only once the browser gets to render paces the server to the
+   * client: while this tab is busy or hidden, the server merges frames
+   * instead of queueing them. Patches arriving before the ack goes out are
+   * covered by a single ack for the latest seq.
+   */
+  private scheduleAck(seq: number): void {
+    const scheduled = this.ackSeq !== null;
+    this.ackSeq = seq;
+    if (scheduled) return;
+    const flush = () => {
+      const ack: AckMessage = { type: MessageType.ACK, seq: this.ackSeq! };
+      this.ackSeq = null;
+      this.send(ack);
+    };
+    if (typeof requestAnimationFrame === "function") {
+      requestAnimationFrame(flush);
+    } else {
+      setTimeout(flush, 0);
+    }
   }
 
   private send(msg: Message): void {
@@ -103,7 +207,7 @@ export class ServerTrellisClient extends BaseTrellisClient {
   }
 
   /** Send an event to the server to invoke a callback. */
-  sendEvent(callbackId: string, args: unknown[] = []): void {
+  sendEvent(callbackId: CallbackId, args: unknown[] = []): void {
     debugLog("client", `sendEvent: ${callbackId} args=${JSON.stringify(args)}`);
     const msg: EventMessage = {
       type: MessageType.EVENT,
@@ -115,6 +219,11 @@ export class ServerTrellisClient extends BaseTrellisClient {
 
   disconnect(): void {
     debugLog("client", "Disconnecting");
+    this.closedByClient = true;
+    if (this.reconnectTimer !== null) {
+      clearTimeout(this.reconnectTimer);
+      this.reconnectTimer = null;
+    }
     if (this.ws) {
       this.ws.close();
       this.ws = null;
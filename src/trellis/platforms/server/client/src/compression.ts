@@ -0,0 +1,24 @@
+/**
+ * Decompression of large server messages.
+ *
+ * When the client offers "deflate" in its hello, the server sends messages
+ * above a size threshold as zlib streams. A zlib stream starts with 0x78,
+ * which never begins a msgpack-encoded message, so frames are told apart by
+ * their first byte. Decompression uses the browser's DecompressionStream.
+ */
+
+/** Encoding names this client can decode, offered in the hello message. */
+export function supportedCompression(): string[] {
+  return typeof DecompressionStream === "undefined" ? [] : ["deflate"];
+}
+
+/** Whether a frame holds a zlib stream rather than a msgpack message. */
+export function isCompressed(data: Uint8Array): boolean {
+  return data.length > 0 && data[0] === 0x78;
+}
+
+/** Inflate a zlib stream. */
+export async function inflate(data: Uint8Array): Promise<Uint8Array> {
+  const stream = new Blob([data]).stream().pipeThrough(new DecompressionStream("deflate"));
+  return new Uint8Array(await new Response(stream).arrayBuffer());
+}
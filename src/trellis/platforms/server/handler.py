@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import logging
 import typing as tp
+from concurrent.futures import Executor
 
 import msgspec
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
@@ -12,7 +14,11 @@ from trellis.core.protocol import decode_message
 from trellis.platforms.common.errors import SessionDisconnected
 from trellis.platforms.common.handler import AppWrapper, MessageHandler
 from trellis.platforms.common.handler_registry import get_global_registry
-from trellis.platforms.common.messages import Message
+from trellis.platforms.common.messages import HelloMessage, Message
+from trellis.platforms.server.compression import DEFLATE, CompressionStats, MessageCompressor
+from trellis.platforms.server.resume import ParkedSessions
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -30,11 +36,17 @@ class WebSocketMessageHandler(MessageHandler):
     """WebSocket transport with msgpack serialization.
 
     Uses the base MessageHandler's handle_hello() for session initialization.
+    With deflate compression, messages at or above the threshold are sent as
+    zlib streams to clients that offered "deflate" in their hello. With
+    parked_sessions, a dropped connection parks the handler so the client can
+    resume its session over a new WebSocket.
     """
 
     websocket: WebSocket
     _encoder: msgspec.msgpack.Encoder
     _decoder: msgspec.msgpack.Decoder[object]
+    _compressor: MessageCompressor
+    _parked_sessions: ParkedSessions | None
 
     def __init__(
         self,
@@ -42,6 +54,12 @@ class WebSocketMessageHandler(MessageHandler):
         app_wrapper: AppWrapper,
         websocket: WebSocket,
         batch_delay: float = 1.0 / 30,
+        *,
+        render_slice_budget: float | None = None,
+        render_executor: Executor | None = None,
+        compression: str = "none",
+        compression_threshold: int = 4096,
+        parked_sessions: ParkedSessions | None = None,
     ) -> None:
         """Create a WebSocket message handler.
 
@@ -49,17 +67,53 @@ class WebSocketMessageHandler(MessageHandler):
             root_component: The root Trellis component to render
             app_wrapper: Callback to wrap component with TrellisApp
             websocket: The FastAPI WebSocket connection
-            batch_delay: Time between render frames in seconds (default ~33ms for 30fps)
+            batch_delay: Minimum time between render frames in seconds (default ~33ms)
+            render_slice_budget: If set, re-render in time slices of this many
+                seconds, yielding to the event loop between them
+            render_executor: If set, re-render on this executor instead of
+                the event loop
+            compression: "deflate" to compress large messages for clients
+                that support it; any other mode sends messages as-is
+            compression_threshold: Smallest encoded message in bytes to compress
+            parked_sessions: Where to park the session when the client
+                disconnects, or None to end it right away
         """
-        super().__init__(root_component, app_wrapper, batch_delay=batch_delay)
+        super().__init__(
+            root_component,
+            app_wrapper,
+            batch_delay=batch_delay,
+            render_slice_budget=render_slice_budget,
+            render_executor=render_executor,
+        )
         self.websocket = websocket
         self._encoder = msgspec.msgpack.Encoder()
         self._decoder = msgspec.msgpack.Decoder()
+        self._compression = compression
+        self._compression_threshold = compression_threshold
+        # Counts every message; compresses once the client agrees to deflate
+        self._compressor = MessageCompressor()
+        self._parked_sessions = parked_sessions
+
+    @property
+    def compression_stats(self) -> CompressionStats:
+        """Message and byte counts for this session, before and after compression."""
+        return self._compressor.stats
+
+    def select_compression(self, offered: list[str]) -> str | None:
+        """Use deflate if it is enabled and the client can decode it."""
+        if self._compression != DEFLATE or DEFLATE not in offered:
+            return None
+        self._compressor.threshold = self._compression_threshold
+        return DEFLATE
+
+    def park_session(self) -> bool:
+        """Park the session until the client reconnects, if resume is enabled."""
+        return self._parked_sessions is not None and self._parked_sessions.park(self)
 
     async def send_message(self, msg: Message) -> None:
         """Send message to client via WebSocket."""
         try:
-            await self.websocket.send_bytes(self._encoder.encode(msg))
+            await self.websocket.send_bytes(self._compressor.compress(self._encoder.encode(msg)))
         except WebSocketDisconnect as exc:
             raise SessionDisconnected() from exc
         except RuntimeError as exc:
@@ -85,6 +139,9 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
     1. Hello handshake (session initialization)
     2. Initial render
     3. Event loop
+
+    A hello carrying the session_id of a parked session resumes that
+    session's handler over this WebSocket instead.
     """
     await websocket.accept()
 
@@ -97,19 +154,52 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
 
     # Get batch_delay from app state (defaults to 30fps if not set)
     batch_delay = getattr(websocket.app.state, "trellis_batch_delay", 1.0 / 30)
+    compression = getattr(websocket.app.state, "trellis_compression", "none")
+    compression_threshold = getattr(websocket.app.state, "trellis_compression_threshold", 4096)
+    render_executor = getattr(websocket.app.state, "trellis_render_executor", None)
+    render_slice_budget = getattr(websocket.app.state, "trellis_render_slice_budget", None)
+    parked_sessions = getattr(websocket.app.state, "trellis_parked_sessions", None)
 
     handler = WebSocketMessageHandler(
-        top_component, app_wrapper, websocket, batch_delay=batch_delay
+        top_component,
+        app_wrapper,
+        websocket,
+        batch_delay=batch_delay,
+        render_slice_budget=render_slice_budget,
+        render_executor=render_executor,
+        compression=compression,
+        compression_threshold=compression_threshold,
+        parked_sessions=parked_sessions,
     )
 
+    try:
+        hello = await handler.receive_message()
+    except SessionDisconnected:
+        return
+    if parked_sessions is not None and isinstance(hello, HelloMessage) and hello.session_id:
+        parked = parked_sessions.claim(hello.session_id)
+        if isinstance(parked, WebSocketMessageHandler):
+            parked.websocket = websocket
+            handler = parked
+
     # Register handler for broadcast (e.g., reload messages)
     registry = get_global_registry()
     registry.register(handler)
 
     try:
-        await handler.run()
+        await handler.run(hello)
     except WebSocketDisconnect:
         pass
     finally:
         registry.unregister(handler)
         handler.cleanup()
+        stats = handler.compression_stats
+        logger.debug(
+            "Session %s sent %d messages (%d compressed): %d -> %d bytes, ratio %.2f",
+            handler.session_id,
+            stats.messages,
+            stats.compressed_messages,
+            stats.raw_bytes,
+            stats.sent_bytes,
+            stats.ratio,
+        )
@@ -29,8 +29,10 @@ from trellis.bundler import (
 )
 from trellis.platforms.common import find_available_port
 from trellis.platforms.common.base import Platform
+from trellis.platforms.common.handler import create_render_executor
 from trellis.platforms.server.handler import router as ws_router
 from trellis.platforms.server.middleware import RequestLoggingMiddleware
+from trellis.platforms.server.resume import ParkedSessions
 from trellis.platforms.server.routes import create_static_dir, register_spa_fallback
 from trellis.platforms.server.routes import router as http_router
 from trellis.utils.hot_reload import get_or_create_hot_reload
@@ -95,7 +97,12 @@ class ServerPlatform(Platform):
         port: int | None = None,
         static_dir: Path | None = None,
         batch_delay: float = 1.0 / 30,
+        render_workers: int = 0,
+        render_slice_budget: float = 0.0,
         hot_reload: bool = True,
+        compression: str = "deflate",
+        compression_threshold: int = 4096,
+        resume_grace: float = 30.0,
         **_kwargs: Any,  # Ignore other platform args
     ) -> None:
         """Start FastAPI server with WebSocket support.
@@ -106,8 +113,19 @@ class ServerPlatform(Platform):
             host: Host to bind to
             port: Port to bind to (auto-find if None)
             static_dir: Custom static files directory
-            batch_delay: Time between render frames in seconds (default ~33ms for 30fps)
+            batch_delay: Minimum time between render frames in seconds (default ~33ms)
+            render_workers: Threads that all sessions' re-renders share
+                (0 renders on the event loop)
+            render_slice_budget: Seconds a re-render runs before yielding
+                to the event loop (0 renders each pass in one go)
             hot_reload: Enable hot reload (default True)
+            compression: "deflate" compresses messages at or above
+                compression_threshold bytes, "permessage-deflate" lets the
+                WebSocket layer compress every frame, "none" disables both
+            compression_threshold: Smallest encoded message in bytes that
+                "deflate" compresses
+            resume_grace: Seconds a disconnected session is kept for its
+                client to reconnect and resume (0 disables resume)
         """
         # Start hot reload if enabled
         if hot_reload:
@@ -128,6 +146,12 @@ class ServerPlatform(Platform):
         app.state.trellis_top_component = root_component
         app.state.trellis_app_wrapper = app_wrapper
         app.state.trellis_batch_delay = batch_delay
+        render_executor = create_render_executor(render_workers)
+        app.state.trellis_render_executor = render_executor
+        app.state.trellis_render_slice_budget = render_slice_budget or None
+        app.state.trellis_compression = compression
+        app.state.trellis_compression_threshold = compression_threshold
+        app.state.trellis_parked_sessions = ParkedSessions(resume_grace)
 
         # Set up static file serving
         static = static_dir or create_static_dir()
@@ -149,6 +173,12 @@ class ServerPlatform(Platform):
             port=port,
             log_config=None,  # Don't override logging config
             log_level="warning",  # Suppress uvicorn's info messages
+            # Thresholded deflate replaces transport compression of every frame
+            ws_per_message_deflate=compression == "permessage-deflate",
         )
         server = uvicorn.Server(config)
-        await server.serve()
+        try:
+            await server.serve()
+        finally:
+            if render_executor is not None:
+                render_executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,93 @@
+"""Sessions kept alive across dropped WebSocket connections.
+
+When a client's connection drops, its handler is parked here instead of
+shutting its session down. If the client reconnects within the grace period
+and asks for the same session_id, the endpoint hands the new WebSocket to the
+parked handler, which resumes the session: component state survives, and the
+client only receives the patches it missed (see MessageHandler.resume_session).
+Sessions nobody reclaims are shut down when their grace period runs out.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import typing as tp
+
+if tp.TYPE_CHECKING:
+    from trellis.platforms.common.handler import MessageHandler
+
+__all__ = ["ParkedSessions"]
+
+logger = logging.getLogger(__name__)
+
+
+class ParkedSessions:
+    """Handlers whose client disconnected, waiting for it to reconnect."""
+
+    __slots__ = ("_expiring", "_parked", "grace")
+
+    def __init__(self, grace: float) -> None:
+        """Create an empty set of parked sessions.
+
+        Args:
+            grace: Seconds a disconnected session is kept; 0 disables resume
+        """
+        self.grace = grace
+        self._parked: dict[str, tuple[MessageHandler, asyncio.TimerHandle]] = {}
+        # Shutdown tasks of expired sessions, referenced until they finish
+        self._expiring: set[asyncio.Task[None]] = set()
+
+    def __len__(self) -> int:
+        return len(self._parked)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._parked
+
+    def park(self, handler: MessageHandler) -> bool:
+        """Keep a handler's session until its client reconnects or grace expires.
+
+        Args:
+            handler: Handler whose client just disconnected
+
+        Returns:
+            True if the handler was parked, False if resume is disabled or
+            the handler has no session
+        """
+        session_id = handler.session_id
+        if self.grace <= 0 or session_id is None or handler.session is None:
+            return False
+        timer = asyncio.get_running_loop().call_later(self.grace, self._expire, session_id)
+        self._parked[session_id] = (handler, timer)
+        logger.debug("Parked session %s for %.1fs", session_id, self.grace)
+        return True
+
+    def claim(self, session_id: str) -> MessageHandler | None:
+        """Take a parked handler back for a reconnecting client.
+
+        Args:
+            session_id: The session the client asked to resume
+
+        Returns:
+            The parked handler, or None if there is no such session or its
+            grace period has run out
+        """
+        entry = self._parked.pop(session_id, None)
+        if entry is None:
+            return None
+        handler, timer = entry
+        timer.cancel()
+        logger.debug("Claimed parked session %s", session_id)
+        return handler
+
+    def _expire(self, session_id: str) -> None:
+        """Shut down a session whose client did not come back in time."""
+        entry = self._parked.pop(session_id, None)
+        if entry is None:
+            return
+        handler, _timer = entry
+        assert handler.session is not None
+        logger.debug("Parked session %s expired", session_id)
+        task = asyncio.get_running_loop().create_task(handler.session.shutdown())
+        self._expiring.add(task)
+        task.add_done_callback(self._expiring.discard)
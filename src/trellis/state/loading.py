@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import typing as tp
 import weakref
 from dataclasses import dataclass, field
 
 from trellis.core.callback_context import callback_context
+from trellis.core.rendering.batch import batch
 from trellis.core.rendering.session import RenderSession, get_render_session
 from trellis.core.state.stateful import Stateful
 
@@ -139,7 +141,7 @@ class _LoadState(Stateful):
     value: object | None
     error: Exception | None
 
-    _active_task: asyncio.Task[object] | None
+    _active_task: asyncio.Task[object] | concurrent.futures.Future[object] | None
     _args: tuple[object, ...]
     _element_id: str | None
     _fn: tp.Callable[..., tp.Awaitable[object]] | None
@@ -237,7 +239,7 @@ class _LoadState(Stateful):
 
         task = self._active_task
         if task is not None:
-            task.cancel()
+            _cancel(task)
 
         if not from_render:
             self._set_loading_state()
@@ -276,23 +278,27 @@ class _LoadState(Stateful):
         except Exception as exc:
             if request_generation != self._request_generation:
                 return
-            self.status = _STATUS_FAILED
-            self.value = None
-            self.error = exc
+            with batch():
+                self.status = _STATUS_FAILED
+                self.value = None
+                self.error = exc
             return
 
         if request_generation != self._request_generation:
             return
 
-        self.status = _STATUS_READY
-        self.value = value
-        self.error = None
+        # Publish the result as one change so readers re-render once
+        with batch():
+            self.status = _STATUS_READY
+            self.value = value
+            self.error = None
 
     def _set_loading_state(self) -> None:
         """Reset controller state before starting an explicit fresh request."""
-        self.status = _STATUS_LOADING
-        self.value = None
-        self.error = None
+        with batch():
+            self.status = _STATUS_LOADING
+            self.value = None
+            self.error = None
 
     def _session(self) -> RenderSession | None:
         if self._session_ref is None:
@@ -320,7 +326,25 @@ class _LoadState(Stateful):
         task = self._active_task
         self._active_task = None
         if task is not None:
-            task.cancel()
+            _cancel(task)
+
+
+def _cancel(task: asyncio.Task[object] | concurrent.futures.Future[object]) -> None:
+    """Cancel a request task from any thread.
+
+    A render on a render_executor worker may restart a request whose task
+    runs on the event loop, and asyncio tasks may only be cancelled there.
+    """
+    if isinstance(task, asyncio.Task):
+        loop = task.get_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is not loop:
+            loop.call_soon_threadsafe(task.cancel)
+            return
+    task.cancel()
 
 
 @tp.overload
@@ -5,6 +5,7 @@ from __future__ import annotations
 import typing as tp
 
 from trellis.core.components.react import react
+from trellis.core.state.stream import StreamBuffer
 from trellis.html._style_runtime import SpacingInput, StyleInput
 from trellis.widgets._style_props import widget_style_props
 
@@ -13,10 +14,10 @@ _UPLOT_PACKAGES = {"uplot": "1.6.31"}
 
 
 @widget_style_props("margin", "flex")
-@react("client/TimeSeriesChart.tsx", packages=_UPLOT_PACKAGES)
+@react("client/TimeSeriesChart.tsx", packages=_UPLOT_PACKAGES, nested_diff_props=["data"])
 def TimeSeriesChart(
     *,
-    data: list[list[float]] | None = None,
+    data: tp.Sequence[tp.Sequence[float]] | StreamBuffer[tp.Any] | None = None,
     series: list[dict[str, tp.Any]] | None = None,
     width: int | None = None,
     height: int = 200,
@@ -36,6 +37,10 @@ def TimeSeriesChart(
         data: Array of arrays where first array is timestamps (Unix seconds),
             and subsequent arrays are values for each series.
             Example: [[1700000000, 1700000001, ...], [10, 20, ...], [5, 15, ...]]
+            A columnar StreamBuffer (timestamp first in each row) keeps a
+            rolling window; updates then send only new and evicted samples.
+            Columns given as NumPy arrays or ``array.array`` (or a 2-D NumPy
+            array, one row per column) are sent as binary typed arrays.
         series: List of series configuration dicts. Each can contain:
             - label: Series name for legend
             - stroke: Line color (CSS color string)
@@ -70,7 +75,7 @@ def TimeSeriesChart(
 
 
 @widget_style_props("margin", "flex")
-@react("client/LineChart.tsx", packages=_RECHARTS_PACKAGES)
+@react("client/LineChart.tsx", packages=_RECHARTS_PACKAGES, nested_diff_props=["data"])
 def LineChart(
     *,
     data: list[dict[str, tp.Any]] | None = None,
@@ -125,7 +130,7 @@ def LineChart(
 
 
 @widget_style_props("margin", "flex")
-@react("client/BarChart.tsx", packages=_RECHARTS_PACKAGES)
+@react("client/BarChart.tsx", packages=_RECHARTS_PACKAGES, nested_diff_props=["data"])
 def BarChart(
     *,
     data: list[dict[str, tp.Any]] | None = None,
@@ -180,7 +185,7 @@ def BarChart(
 
 
 @widget_style_props("margin", "flex")
-@react("client/AreaChart.tsx", packages=_RECHARTS_PACKAGES)
+@react("client/AreaChart.tsx", packages=_RECHARTS_PACKAGES, nested_diff_props=["data"])
 def AreaChart(
     *,
     data: list[dict[str, tp.Any]] | None = None,
@@ -279,10 +284,10 @@ def PieChart(
 
 
 @widget_style_props("margin", "flex")
-@react("client/Sparkline.tsx")
+@react("client/Sparkline.tsx", nested_diff_props=["data"])
 def Sparkline(
     *,
-    data: list[float] | None = None,
+    data: tp.Sequence[float] | StreamBuffer[float] | None = None,
     width: int = 80,
     height: int = 24,
     color: str | None = None,
@@ -297,7 +302,8 @@ def Sparkline(
     Ideal for use in tables, cards, or alongside metrics.
 
     Args:
-        data: List of numeric values to plot.
+        data: List of numeric values to plot, a NumPy array or ``array.array``
+            (sent as a binary typed array), or a flat StreamBuffer of them.
         width: Chart width in pixels. Defaults to 80.
         height: Chart height in pixels. Defaults to 24.
         color: Line/area color. Defaults to theme accent color.
@@ -1,8 +1,9 @@
 import React from "react";
 import { colors } from "@trellis/trellis-core/theme";
+import type { NumericArray } from "@trellis/trellis-core/core/typedArrays";
 
 interface SparklineProps {
-  data?: number[];
+  data?: NumericArray;
   width?: number;
   height?: number;
   color?: string;
@@ -38,7 +39,8 @@ export function Sparkline({
   const chartHeight = height - padding * 2;
 
   // Generate path points
-  const points = data.map((value, index) => {
+  // Array.from rather than map: a typed array's map can only return numbers
+  const points = Array.from(data, (value, index) => {
     const x = padding + (index / (data.length - 1)) * chartWidth;
     const y = padding + chartHeight - ((value - min) / range) * chartHeight;
     return { x, y };
@@ -2,6 +2,7 @@ import React, { useRef, useEffect, useLayoutEffect, useCallback } from "react";
 import uPlot from "uplot";
 import "uplot/dist/uPlot.min.css";
 import { colors, typography } from "@trellis/trellis-core/theme";
+import type { NumericArray } from "@trellis/trellis-core/core/typedArrays";
 import { useResolvedTheme } from "./chartUtils";
 
 interface SeriesConfig {
@@ -12,7 +13,7 @@ interface SeriesConfig {
 }
 
 interface TimeSeriesChartProps {
-  data?: number[][];
+  data?: NumericArray[];
   series?: SeriesConfig[];
   width?: number;
   height?: number;
@@ -68,8 +68,7 @@ def HotKey(
     if element is None:
         return
 
-    # Compute tree depth from element ID (count "/" separators)
-    depth = element_id.count("/")
+    depth = session.states.depth(element_id)
 
     serialized = _serialize_binding(binding, 0)
     serialized["depth"] = depth
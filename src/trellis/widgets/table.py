@@ -115,7 +115,12 @@ def CellSlot(
     pass
 
 
-@react("client/Table.tsx", export_name="TableInner", is_container=True)
+@react(
+    "client/Table.tsx",
+    export_name="TableInner",
+    is_container=True,
+    nested_diff_props=["data"],
+)
 def _TableInner(
     *,
     columns: list[dict[str, tp.Any]],
@@ -7,7 +7,7 @@
  */
 
 import { vi, Mock } from "vitest";
-import { SerializedElement } from "@common/core/types";
+import { ElementId, SerializedElement } from "@common/core/types";
 import {
   MessageType,
   HelloResponseMessage,
@@ -26,14 +26,14 @@ import {
  * Create a minimal SerializedElement for testing.
  *
  * @example
- * const button = makeElement("btn-1", "Button", { text: "Click" });
- * const app = makeElement("root", "App", {}, [
- *   makeElement("header", "Header"),
- *   makeElement("content", "Content"),
+ * const button = makeElement(2, "Button", { text: "Click" });
+ * const app = makeElement(1, "App", {}, [
+ *   makeElement(3, "Header"),
+ *   makeElement(4, "Content"),
  * ]);
  */
 export function makeElement(
-  key: string,
+  key: ElementId,
   type: string,
   props: Record<string, unknown> = {},
   children: SerializedElement[] = []
@@ -57,8 +57,8 @@ export function makeElement(
  */
 export function makeAddPatch(
   element: SerializedElement,
-  parentId: string | null = null,
-  children: string[] = [element.key]
+  parentId: ElementId | null = null,
+  children: ElementId[] = [element.key]
 ): AddPatch {
   return {
     op: "add",
@@ -72,7 +72,7 @@ export function makeAddPatch(
  * Create an UpdatePatch for modifying props.
  */
 export function makeUpdatePatch(
-  id: string,
+  id: ElementId,
   props: Record<string, unknown>
 ): UpdatePatch {
   return {
@@ -85,7 +85,7 @@ export function makeUpdatePatch(
 /**
  * Create a RemovePatch for deleting a node.
  */
-export function makeRemovePatch(id: string): RemovePatch {
+export function makeRemovePatch(id: ElementId): RemovePatch {
   return {
     op: "remove",
     id,
@@ -26,7 +26,7 @@ function makeKeyEvent(overrides: Partial<KeyboardEvent> = {}): KeyboardEvent {
 }
 
 function makeSingleBinding(
-  callbackId: string,
+  callbackId: number,
   key: string,
   overrides: Partial<SerializedKeyBinding> = {}
 ): NormalizedBinding {
@@ -45,7 +45,7 @@ function makeSingleBinding(
 }
 
 function makeSequenceBinding(
-  callbackId: string,
+  callbackId: number,
   keys: string[],
   overrides: Partial<SerializedSequenceBinding> = {}
 ): NormalizedBinding {
@@ -85,7 +85,7 @@ describe("matchBindings", () => {
   });
 
   it("returns none when no bindings match", () => {
-    const bindings = [makeSingleBinding("cb-1", "Escape")];
+    const bindings = [makeSingleBinding(1, "Escape")];
     const event = makeKeyEvent({ key: "a" });
     expect(matchBindings(bindings, event, "keydown", false, keyState)).toEqual({
       action: "none",
@@ -93,24 +93,24 @@ describe("matchBindings", () => {
   });
 
   it("returns fire for matching single binding", () => {
-    const bindings = [makeSingleBinding("cb-1", "Escape")];
+    const bindings = [makeSingleBinding(1, "Escape")];
     const event = makeKeyEvent({ key: "Escape" });
     const result = matchBindings(bindings, event, "keydown", false, keyState);
-    expect(result).toEqual({ action: "fire", callbackId: "cb-1", bindingIndex: 0 });
+    expect(result).toEqual({ action: "fire", callbackId: 1, bindingIndex: 0 });
   });
 
   it("returns correct bindingIndex", () => {
     const bindings = [
-      makeSingleBinding("cb-1", "Enter"),
-      makeSingleBinding("cb-2", "Escape"),
+      makeSingleBinding(1, "Enter"),
+      makeSingleBinding(2, "Escape"),
     ];
     const event = makeKeyEvent({ key: "Escape" });
     const result = matchBindings(bindings, event, "keydown", false, keyState);
-    expect(result).toEqual({ action: "fire", callbackId: "cb-2", bindingIndex: 1 });
+    expect(result).toEqual({ action: "fire", callbackId: 2, bindingIndex: 1 });
   });
 
   it("returns fire for completed sequence", () => {
-    const bindings = [makeSequenceBinding("cb-seq", ["G", "G"])];
+    const bindings = [makeSequenceBinding(3, ["G", "G"])];
     const event = makeKeyEvent({ key: "g" });
 
     // First key — advances
@@ -119,13 +119,13 @@ describe("matchBindings", () => {
 
     // Second key — completes
     const r2 = matchBindings(bindings, event, "keydown", false, keyState);
-    expect(r2).toEqual({ action: "fire", callbackId: "cb-seq", bindingIndex: 0 });
+    expect(r2).toEqual({ action: "fire", callbackId: 3, bindingIndex: 0 });
   });
 
   it("sequence complete takes priority over single match", () => {
     const bindings = [
-      makeSequenceBinding("cb-seq", ["G", "G"]),
-      makeSingleBinding("cb-single", "G"),
+      makeSequenceBinding(3, ["G", "G"]),
+      makeSingleBinding(4, "G"),
     ];
     const event = makeKeyEvent({ key: "g" });
 
@@ -136,13 +136,13 @@ describe("matchBindings", () => {
 
     // Second G — sequence completes, fires sequence not single
     const result = matchBindings(bindings, event, "keydown", false, keyState);
-    expect(result).toEqual({ action: "fire", callbackId: "cb-seq", bindingIndex: 0 });
+    expect(result).toEqual({ action: "fire", callbackId: 3, bindingIndex: 0 });
   });
 
   it("sequence advanced suppresses single bindings", () => {
     const bindings = [
-      makeSequenceBinding("cb-seq", ["G", "I"]),
-      makeSingleBinding("cb-single", "G"),
+      makeSequenceBinding(3, ["G", "I"]),
+      makeSingleBinding(4, "G"),
     ];
     const event = makeKeyEvent({ key: "g" });
 
@@ -152,7 +152,7 @@ describe("matchBindings", () => {
   });
 
   it("skips bindings with wrong eventType", () => {
-    const bindings = [makeSingleBinding("cb-1", "Escape", { event_type: "keyup" })];
+    const bindings = [makeSingleBinding(1, "Escape", { event_type: "keyup" })];
     const event = makeKeyEvent({ key: "Escape" });
     expect(matchBindings(bindings, event, "keydown", false, keyState)).toEqual({
       action: "none",
@@ -160,7 +160,7 @@ describe("matchBindings", () => {
   });
 
   it("skips bindings with ignore_in_inputs when in text input", () => {
-    const bindings = [makeSingleBinding("cb-1", "K", { ignore_in_inputs: true })];
+    const bindings = [makeSingleBinding(1, "K", { ignore_in_inputs: true })];
     const event = makeKeyEvent({ key: "k" });
     expect(matchBindings(bindings, event, "keydown", true, keyState)).toEqual({
       action: "none",
@@ -168,14 +168,14 @@ describe("matchBindings", () => {
   });
 
   it("fires ignore_in_inputs binding when not in text input", () => {
-    const bindings = [makeSingleBinding("cb-1", "K", { ignore_in_inputs: true })];
+    const bindings = [makeSingleBinding(1, "K", { ignore_in_inputs: true })];
     const event = makeKeyEvent({ key: "k" });
     const result = matchBindings(bindings, event, "keydown", false, keyState);
     expect(result.action).toBe("fire");
   });
 
   it("returns suppress for repeat when require_reset is true", () => {
-    const bindings = [makeSingleBinding("cb-1", "Escape")];
+    const bindings = [makeSingleBinding(1, "Escape")];
     const event = makeKeyEvent({ key: "Escape" });
 
     // First press fires
@@ -197,7 +197,7 @@ describe("isSequenceBinding", () => {
   it("returns true for sequence binding", () => {
     const b = {
       sequence: { steps: [], timeout_ms: 1000 },
-      handler: { __callback__: "cb" },
+      handler: { __callback__: 5 },
       event_type: "keydown" as const,
       require_reset: true,
       ignore_in_inputs: false,
@@ -208,7 +208,7 @@ describe("isSequenceBinding", () => {
   it("returns false for single binding", () => {
     const b = {
       filter: { key: "A", ctrl: false, shift: false, alt: false, meta: false, mod: false },
-      handler: { __callback__: "cb" },
+      handler: { __callback__: 5 },
       event_type: "keydown" as const,
       require_reset: true,
       ignore_in_inputs: false,
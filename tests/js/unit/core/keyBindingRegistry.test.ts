@@ -3,7 +3,7 @@ import { KeyBindingRegistry } from "@common/core/keyBindingRegistry";
 import { KeyState } from "@common/core/keyState";
 
 function makeBinding(
-  callbackId: string,
+  callbackId: number,
   key: string,
   depth: number,
   overrides: Record<string, unknown> = {}
@@ -43,8 +43,8 @@ describe("KeyBindingRegistry", () => {
   });
 
   it("fires deepest binding first", () => {
-    const shallow = makeBinding("cb-shallow", "Escape", 1);
-    const deep = makeBinding("cb-deep", "Escape", 3);
+    const shallow = makeBinding(1, "Escape", 1);
+    const deep = makeBinding(2, "Escape", 3);
 
     registry.updateElement("el-1", [shallow]);
     registry.updateElement("el-2", [deep]);
@@ -55,12 +55,12 @@ describe("KeyBindingRegistry", () => {
 
     // Deep binding should fire first
     expect(sendKeyEvent).toHaveBeenCalledTimes(1);
-    expect(sendKeyEvent.mock.calls[0][0]).toBe("cb-deep");
+    expect(sendKeyEvent.mock.calls[0][0]).toBe(2);
   });
 
   it("updateElement replaces previous bindings", () => {
-    const binding1 = makeBinding("cb-1", "Escape", 1);
-    const binding2 = makeBinding("cb-2", "Enter", 1);
+    const binding1 = makeBinding(3, "Escape", 1);
+    const binding2 = makeBinding(4, "Enter", 1);
 
     registry.updateElement("el-1", [binding1]);
     registry.updateElement("el-1", [binding2]);
@@ -76,11 +76,11 @@ describe("KeyBindingRegistry", () => {
       new KeyboardEvent("keydown", { key: "Enter", bubbles: true })
     );
     expect(sendKeyEvent).toHaveBeenCalledTimes(1);
-    expect(sendKeyEvent.mock.calls[0][0]).toBe("cb-2");
+    expect(sendKeyEvent.mock.calls[0][0]).toBe(4);
   });
 
   it("removeElement cleans up", () => {
-    const binding = makeBinding("cb-1", "Escape", 1);
+    const binding = makeBinding(3, "Escape", 1);
     registry.updateElement("el-1", [binding]);
     registry.removeElement("el-1");
 
@@ -91,8 +91,8 @@ describe("KeyBindingRegistry", () => {
   });
 
   it("chains to shallower binding on pass", async () => {
-    const shallow = makeBinding("cb-shallow", "Escape", 1);
-    const deep = makeBinding("cb-deep", "Escape", 3);
+    const shallow = makeBinding(1, "Escape", 1);
+    const deep = makeBinding(2, "Escape", 3);
 
     // Deep handler returns false (pass)
     sendKeyEvent.mockResolvedValueOnce(false).mockResolvedValueOnce(true);
@@ -108,7 +108,7 @@ describe("KeyBindingRegistry", () => {
       expect(sendKeyEvent).toHaveBeenCalledTimes(2);
     });
 
-    expect(sendKeyEvent.mock.calls[0][0]).toBe("cb-deep");
-    expect(sendKeyEvent.mock.calls[1][0]).toBe("cb-shallow");
+    expect(sendKeyEvent.mock.calls[0][0]).toBe(2);
+    expect(sendKeyEvent.mock.calls[1][0]).toBe(1);
   });
 });
@@ -24,7 +24,7 @@ describe("processProps", () => {
     const onEvent = vi.fn();
     const props = {
       text: "Hello",
-      on_click: { __callback__: "cb_123" },
+      on_click: { __callback__: 1 },
     };
 
     const result = processProps(props, onEvent);
@@ -36,32 +36,32 @@ describe("processProps", () => {
   it("calls onEvent when callback function is invoked", () => {
     const onEvent = vi.fn();
     const props = {
-      on_click: { __callback__: "cb_456" },
+      on_click: { __callback__: 2 },
     };
 
     const result = processProps(props, onEvent);
     (result.on_click as () => void)();
 
-    expect(onEvent).toHaveBeenCalledWith("cb_456", []);
+    expect(onEvent).toHaveBeenCalledWith(2, []);
   });
 
   it("passes arguments through to onEvent", () => {
     const onEvent = vi.fn();
     const props = {
-      on_change: { __callback__: "cb_789" },
+      on_change: { __callback__: 3 },
     };
 
     const result = processProps(props, onEvent);
     (result.on_change as (value: string) => void)("new value");
 
-    expect(onEvent).toHaveBeenCalledWith("cb_789", ["new value"]);
+    expect(onEvent).toHaveBeenCalledWith(3, ["new value"]);
   });
 
   it("handles multiple callback refs in same props", () => {
     const onEvent = vi.fn();
     const props = {
-      on_click: { __callback__: "cb_1" },
-      on_hover: { __callback__: "cb_2" },
+      on_click: { __callback__: 4 },
+      on_hover: { __callback__: 5 },
       label: "Test",
     };
 
@@ -72,16 +72,16 @@ describe("processProps", () => {
     expect(result.label).toBe("Test");
 
     (result.on_click as () => void)();
-    expect(onEvent).toHaveBeenCalledWith("cb_1", []);
+    expect(onEvent).toHaveBeenCalledWith(4, []);
 
     (result.on_hover as () => void)();
-    expect(onEvent).toHaveBeenCalledWith("cb_2", []);
+    expect(onEvent).toHaveBeenCalledWith(5, []);
   });
 
   it("calls preventDefault on on_click handlers", () => {
     const onEvent = vi.fn();
     const props = {
-      on_click: { __callback__: "cb_click" },
+      on_click: { __callback__: 6 },
     };
 
     const result = processProps(props, onEvent);
@@ -94,13 +94,13 @@ describe("processProps", () => {
     (result.on_click as (e: unknown) => void)(mockEvent);
 
     expect(mockEvent.preventDefault).toHaveBeenCalled();
-    expect(onEvent).toHaveBeenCalledWith("cb_click", [expect.anything()]);
+    expect(onEvent).toHaveBeenCalledWith(6, [expect.anything()]);
   });
 
   it("calls preventDefault on on_submit handlers", () => {
     const onEvent = vi.fn();
     const props = {
-      on_submit: { __callback__: "cb_submit" },
+      on_submit: { __callback__: 7 },
     };
 
     const result = processProps(props, onEvent);
@@ -113,13 +113,13 @@ describe("processProps", () => {
     (result.on_submit as (e: unknown) => void)(mockEvent);
 
     expect(mockEvent.preventDefault).toHaveBeenCalled();
-    expect(onEvent).toHaveBeenCalledWith("cb_submit", [expect.anything()]);
+    expect(onEvent).toHaveBeenCalledWith(7, [expect.anything()]);
   });
 
   it("does not call preventDefault on other handlers", () => {
     const onEvent = vi.fn();
     const props = {
-      on_change: { __callback__: "cb_change" },
+      on_change: { __callback__: 8 },
     };
 
     const result = processProps(props, onEvent);
@@ -132,13 +132,13 @@ describe("processProps", () => {
     (result.on_change as (e: unknown) => void)(mockEvent);
 
     expect(mockEvent.preventDefault).not.toHaveBeenCalled();
-    expect(onEvent).toHaveBeenCalledWith("cb_change", [expect.anything()]);
+    expect(onEvent).toHaveBeenCalledWith(8, [expect.anything()]);
   });
 
   it("serializes mouse event payloads to snake_case", () => {
     const onEvent = vi.fn();
     const props = {
-      on_click: { __callback__: "cb_click" },
+      on_click: { __callback__: 6 },
     };
 
     const result = processProps(props, onEvent);
@@ -164,7 +164,7 @@ describe("processProps", () => {
     (result.on_click as (e: unknown) => void)(mockEvent);
 
     expect(onEvent).toHaveBeenCalledWith(
-      "cb_click",
+      6,
       [
         expect.objectContaining({
           type: "click",
@@ -186,7 +186,7 @@ describe("processProps", () => {
   it("serializes input events with source-native fields", () => {
     const onEvent = vi.fn();
     const props = {
-      on_input: { __callback__: "cb_input" },
+      on_input: { __callback__: 9 },
     };
 
     const result = processProps(props, onEvent);
@@ -207,7 +207,7 @@ describe("processProps", () => {
     (result.on_input as (e: unknown) => void)(mockEvent);
 
     expect(onEvent).toHaveBeenCalledWith(
-      "cb_input",
+      9,
       [
         expect.objectContaining({
           type: "input",
@@ -256,7 +256,7 @@ describe("processProps", () => {
 
     it("lets browser handle middle-click on anchor with href", () => {
       const onEvent = vi.fn();
-      const props = { on_click: { __callback__: "cb_click" } };
+      const props = { on_click: { __callback__: 6 } };
       const result = processProps(props, onEvent);
 
       const anchor = document.createElement("a");
@@ -273,7 +273,7 @@ describe("processProps", () => {
 
     it("lets browser handle Cmd/Meta+click on anchor with href", () => {
       const onEvent = vi.fn();
-      const props = { on_click: { __callback__: "cb_click" } };
+      const props = { on_click: { __callback__: 6 } };
       const result = processProps(props, onEvent);
 
       const anchor = document.createElement("a");
@@ -288,7 +288,7 @@ describe("processProps", () => {
 
     it("lets browser handle Ctrl+click on anchor with href", () => {
       const onEvent = vi.fn();
-      const props = { on_click: { __callback__: "cb_click" } };
+      const props = { on_click: { __callback__: 6 } };
       const result = processProps(props, onEvent);
 
       const anchor = document.createElement("a");
@@ -303,7 +303,7 @@ describe("processProps", () => {
 
     it("lets browser handle Shift+click on anchor with href", () => {
       const onEvent = vi.fn();
-      const props = { on_click: { __callback__: "cb_click" } };
+      const props = { on_click: { __callback__: 6 } };
       const result = processProps(props, onEvent);
 
       const anchor = document.createElement("a");
@@ -318,7 +318,7 @@ describe("processProps", () => {
 
     it("calls preventDefault on regular click on anchor with href", () => {
       const onEvent = vi.fn();
-      const props = { on_click: { __callback__: "cb_click" } };
+      const props = { on_click: { __callback__: 6 } };
       const result = processProps(props, onEvent);
 
       const anchor = document.createElement("a");
@@ -329,12 +329,12 @@ describe("processProps", () => {
 
       // Regular click should preventDefault and call handler
       expect(mockEvent.preventDefault).toHaveBeenCalled();
-      expect(onEvent).toHaveBeenCalledWith("cb_click", [expect.anything()]);
+      expect(onEvent).toHaveBeenCalledWith(6, [expect.anything()]);
     });
 
     it("calls preventDefault on click on anchor without href", () => {
       const onEvent = vi.fn();
-      const props = { on_click: { __callback__: "cb_click" } };
+      const props = { on_click: { __callback__: 6 } };
       const result = processProps(props, onEvent);
 
       const anchor = document.createElement("a");
@@ -345,12 +345,12 @@ describe("processProps", () => {
 
       // Even with modifier key, anchor without href should call handler
       expect(mockEvent.preventDefault).toHaveBeenCalled();
-      expect(onEvent).toHaveBeenCalledWith("cb_click", [expect.anything()]);
+      expect(onEvent).toHaveBeenCalledWith(6, [expect.anything()]);
     });
 
     it("calls preventDefault on click on non-anchor element", () => {
       const onEvent = vi.fn();
-      const props = { on_click: { __callback__: "cb_click" } };
+      const props = { on_click: { __callback__: 6 } };
       const result = processProps(props, onEvent);
 
       const button = document.createElement("button");
@@ -360,7 +360,7 @@ describe("processProps", () => {
 
       // Non-anchor elements always call preventDefault
       expect(mockEvent.preventDefault).toHaveBeenCalled();
-      expect(onEvent).toHaveBeenCalledWith("cb_click", [expect.anything()]);
+      expect(onEvent).toHaveBeenCalledWith(6, [expect.anything()]);
     });
   });
 });
@@ -569,7 +569,7 @@ describe("renderNode", () => {
       key: null,
       props: {
         _text: "Click mapped handler",
-        on_click: { __callback__: "mapped_click" },
+        on_click: { __callback__: 10 },
       },
       children: [],
     };
@@ -578,7 +578,7 @@ describe("renderNode", () => {
     render(element);
 
     screen.getByText("Click mapped handler").click();
-    expect(mockOnEvent).toHaveBeenCalledWith("mapped_click", [expect.anything()]);
+    expect(mockOnEvent).toHaveBeenCalledWith(10, [expect.anything()]);
   });
 
   it("renders custom widgets from registry", () => {
@@ -664,7 +664,7 @@ describe("renderNode", () => {
       key: null,
       props: {
         text: "Click me",
-        on_click: { __callback__: "btn_callback" },
+        on_click: { __callback__: 11 },
       },
       children: [],
     };
@@ -674,6 +674,6 @@ describe("renderNode", () => {
 
     screen.getByText("Click me").click();
 
-    expect(mockOnEvent).toHaveBeenCalledWith("btn_callback", [expect.anything()]);
+    expect(mockOnEvent).toHaveBeenCalledWith(11, [expect.anything()]);
   });
 });
@@ -1,6 +1,6 @@
 import { describe, it, expect, beforeEach, vi } from "vitest";
-import { TrellisStore, NodeData } from "@common/core/store";
-import { SerializedElement } from "@common/core/types";
+import { TrellisStore, NodeData, applyPropOps } from "@common/core/store";
+import { ElementId, SerializedElement } from "@common/core/types";
 import { AddPatch, UpdatePatch, RemovePatch } from "@common/types";
 
 describe("TrellisStore", () => {
@@ -12,7 +12,7 @@ describe("TrellisStore", () => {
 
   // Helper to create a minimal serialized element
   function makeElement(
-    key: string,
+    key: ElementId,
     type: string,
     props: Record<string, unknown> = {},
     children: SerializedElement[] = []
@@ -36,16 +36,16 @@ describe("TrellisStore", () => {
 
   describe("applyPatches - add (initial tree)", () => {
     it("sets root ID from tree", () => {
-      const tree = makeElement("root", "App");
+      const tree = makeElement(1, "App");
       initTree(tree);
-      expect(store.getRootId()).toBe("root");
+      expect(store.getRootId()).toBe(1);
     });
 
     it("populates node data for single node", () => {
-      const tree = makeElement("e1", "Button", { text: "Click me" });
+      const tree = makeElement(2, "Button", { text: "Click me" });
       initTree(tree);
 
-      const node = store.getNode("e1");
+      const node = store.getNode(2);
       expect(node).toBeDefined();
       expect(node?.type).toBe("Button");
       expect(node?.props).toEqual({ text: "Click me" });
@@ -53,36 +53,44 @@ describe("TrellisStore", () => {
     });
 
     it("populates node data recursively", () => {
-      const tree = makeElement("root", "App", {}, [
-        makeElement("e1", "Header", { title: "Hello" }),
-        makeElement("e2", "Content", {}, [
-          makeElement("e3", "Button", { text: "OK" }),
+      const tree = makeElement(1, "App", {}, [
+        makeElement(2, "Header", { title: "Hello" }),
+        makeElement(3, "Content", {}, [
+          makeElement(4, "Button", { text: "OK" }),
         ]),
       ]);
       initTree(tree);
 
-      expect(store.getNode("root")).toBeDefined();
-      expect(store.getNode("e1")?.props).toEqual({ title: "Hello" });
-      expect(store.getNode("e2")?.childIds).toEqual(["e3"]);
-      expect(store.getNode("e3")?.type).toBe("Button");
+      expect(store.getNode(1)).toBeDefined();
+      expect(store.getNode(2)?.props).toEqual({ title: "Hello" });
+      expect(store.getNode(3)?.childIds).toEqual([4]);
+      expect(store.getNode(4)?.type).toBe("Button");
     });
 
     it("clears previous data on new tree", () => {
-      initTree(makeElement("old", "OldApp"));
-      expect(store.getNode("old")).toBeDefined();
+      initTree(makeElement(10, "OldApp"));
+      expect(store.getNode(10)).toBeDefined();
 
-      initTree(makeElement("new", "NewApp"));
-      expect(store.getNode("old")).toBeUndefined();
-      expect(store.getNode("new")).toBeDefined();
-      expect(store.getRootId()).toBe("new");
+      initTree(makeElement(20, "NewApp"));
+      expect(store.getNode(10)).toBeUndefined();
+      expect(store.getNode(20)).toBeDefined();
+      expect(store.getRootId()).toBe(20);
+    });
+
+    it("keys nodes by integer element handle", () => {
+      initTree(makeElement(1, "App", {}, [makeElement(2, "Label")]));
+
+      expect(store.getRootId()).toBe(1);
+      expect(store.getNode(1)?.childIds).toEqual([2]);
+      expect(store.getNode(2)?.type).toBe("Label");
     });
   });
 
   describe("applyPatches - update", () => {
     beforeEach(() => {
       initTree(
-        makeElement("root", "App", {}, [
-          makeElement("e1", "Label", { text: "Hello", color: "red" }),
+        makeElement(1, "App", {}, [
+          makeElement(2, "Label", { text: "Hello", color: "red" }),
         ])
       );
     });
@@ -90,12 +98,12 @@ describe("TrellisStore", () => {
     it("updates props on existing node", () => {
       const patch: UpdatePatch = {
         op: "update",
-        id: "e1",
+        id: 2,
         props: { text: "World" },
       };
       store.applyPatches([patch]);
 
-      const node = store.getNode("e1");
+      const node = store.getNode(2);
       expect(node?.props.text).toBe("World");
       expect(node?.props.color).toBe("red"); // unchanged
     });
@@ -103,12 +111,12 @@ describe("TrellisStore", () => {
     it("removes props with __removed__ sentinel", () => {
       const patch: UpdatePatch = {
         op: "update",
-        id: "e1",
+        id: 2,
         props: { color: { __removed__: true } },
       };
       store.applyPatches([patch]);
 
-      const node = store.getNode("e1");
+      const node = store.getNode(2);
       expect(node?.props.color).toBeUndefined();
       expect(node?.props.text).toBe("Hello");
     });
@@ -116,12 +124,12 @@ describe("TrellisStore", () => {
     it("sets prop to null when value is null (not removal)", () => {
       const patch: UpdatePatch = {
         op: "update",
-        id: "e1",
+        id: 2,
         props: { color: null },
       };
       store.applyPatches([patch]);
 
-      const node = store.getNode("e1");
+      const node = store.getNode(2);
       expect(node?.props.color).toBeNull();
       expect(node?.props.text).toBe("Hello");
     });
@@ -129,33 +137,33 @@ describe("TrellisStore", () => {
     it("updates childIds when provided", () => {
       // First add more children
       initTree(
-        makeElement("root", "App", {}, [
-          makeElement("e1", "Container", {}, [
-            makeElement("e2", "Child1"),
-            makeElement("e3", "Child2"),
+        makeElement(1, "App", {}, [
+          makeElement(2, "Container", {}, [
+            makeElement(3, "Child1"),
+            makeElement(4, "Child2"),
           ]),
         ])
       );
 
       const patch: UpdatePatch = {
         op: "update",
-        id: "e1",
-        children: ["e3", "e2"], // reorder
+        id: 2,
+        children: [4, 3], // reorder
       };
       store.applyPatches([patch]);
 
-      expect(store.getNode("e1")?.childIds).toEqual(["e3", "e2"]);
+      expect(store.getNode(2)?.childIds).toEqual([4, 3]);
     });
 
     it("creates new object reference on update (immutability)", () => {
-      const nodeBefore = store.getNode("e1");
+      const nodeBefore = store.getNode(2);
       const patch: UpdatePatch = {
         op: "update",
-        id: "e1",
+        id: 2,
         props: { text: "Changed" },
       };
       store.applyPatches([patch]);
-      const nodeAfter = store.getNode("e1");
+      const nodeAfter = store.getNode(2);
 
       // Must be different object reference for React to detect change
       expect(nodeAfter).not.toBe(nodeBefore);
@@ -163,17 +171,17 @@ describe("TrellisStore", () => {
     });
 
     it("creates new props object on update", () => {
-      const nodeBefore = store.getNode("e1");
+      const nodeBefore = store.getNode(2);
       const propsBefore = nodeBefore?.props;
 
       const patch: UpdatePatch = {
         op: "update",
-        id: "e1",
+        id: 2,
         props: { text: "Changed" },
       };
       store.applyPatches([patch]);
 
-      const nodeAfter = store.getNode("e1");
+      const nodeAfter = store.getNode(2);
       expect(nodeAfter?.props).not.toBe(propsBefore);
     });
 
@@ -182,7 +190,7 @@ describe("TrellisStore", () => {
 
       const patch: UpdatePatch = {
         op: "update",
-        id: "unknown",
+        id: 99,
         props: { text: "test" },
       };
       store.applyPatches([patch]);
@@ -194,125 +202,205 @@ describe("TrellisStore", () => {
     });
   });
 
+  describe("applyPatches - nested prop ops", () => {
+    const rows = [
+      { id: 1, name: "a" },
+      { id: 2, name: "b" },
+      { id: 3, name: "c" },
+    ];
+
+    beforeEach(() => {
+      initTree(
+        makeElement(1, "App", {}, [
+          makeElement(2, "Table", { data: rows, meta: { total: 3, page: 1 } }),
+        ])
+      );
+    });
+
+    function update(props: Record<string, unknown>): void {
+      store.applyPatches([{ op: "update", id: 2, props }]);
+    }
+
+    it("sets a list item", () => {
+      update({ data: { __ops__: [{ op: "set", path: [1, "name"], value: "B" }] } });
+
+      const data = store.getNode(2)?.props.data as typeof rows;
+      expect(data[1]).toEqual({ id: 2, name: "B" });
+      expect(data[0]).toBe(rows[0]); // untouched rows keep identity
+      expect(rows[1].name).toBe("b"); // previous value is not mutated
+    });
+
+    it("appends to a list", () => {
+      update({ data: { __ops__: [{ op: "append", path: [], items: [{ id: 4, name: "d" }] }] } });
+
+      const data = store.getNode(2)?.props.data as typeof rows;
+      expect(data.map((r) => r.id)).toEqual([1, 2, 3, 4]);
+      expect(rows).toHaveLength(3);
+    });
+
+    it("splices a list range", () => {
+      update({
+        data: {
+          __ops__: [{ op: "splice", path: [], index: 1, delete: 1, items: [{ id: 9, name: "z" }, { id: 10, name: "y" }] }],
+        },
+      });
+
+      const data = store.getNode(2)?.props.data as typeof rows;
+      expect(data.map((r) => r.id)).toEqual([1, 9, 10, 3]);
+    });
+
+    it("sets and deletes dict keys", () => {
+      update({
+        meta: {
+          __ops__: [
+            { op: "set", path: ["page"], value: 2 },
+            { op: "delete", path: ["total"] },
+          ],
+        },
+      });
+
+      expect(store.getNode(2)?.props.meta).toEqual({ page: 2 });
+    });
+
+    it("applies a sliding window to nested series", () => {
+      const series = [
+        [1, 2, 3],
+        [10, 20, 30],
+      ];
+      const result = applyPropOps(series, [
+        { op: "splice", path: [0], index: 0, delete: 1, items: [] },
+        { op: "append", path: [0], items: [4] },
+        { op: "splice", path: [1], index: 0, delete: 1, items: [] },
+        { op: "append", path: [1], items: [40] },
+      ]);
+
+      expect(result).toEqual([
+        [2, 3, 4],
+        [20, 30, 40],
+      ]);
+      expect(series[0]).toEqual([1, 2, 3]);
+    });
+  });
+
   describe("applyPatches - add", () => {
     beforeEach(() => {
-      initTree(makeElement("root", "App", {}, []));
+      initTree(makeElement(1, "App", {}, []));
     });
 
     it("adds new node to store", () => {
       const patch: AddPatch = {
         op: "add",
-        parent_id: "root",
-        children: ["e1"],
-        element: makeElement("e1", "Button", { text: "New" }),
+        parent_id: 1,
+        children: [2],
+        element: makeElement(2, "Button", { text: "New" }),
       };
       store.applyPatches([patch]);
 
-      expect(store.getNode("e1")).toBeDefined();
-      expect(store.getNode("e1")?.props.text).toBe("New");
+      expect(store.getNode(2)).toBeDefined();
+      expect(store.getNode(2)?.props.text).toBe("New");
     });
 
     it("updates parent childIds", () => {
       const patch: AddPatch = {
         op: "add",
-        parent_id: "root",
-        children: ["e1", "e2"],
-        element: makeElement("e1", "Button"),
+        parent_id: 1,
+        children: [2, 3],
+        element: makeElement(2, "Button"),
       };
       store.applyPatches([patch]);
 
-      expect(store.getNode("root")?.childIds).toEqual(["e1", "e2"]);
+      expect(store.getNode(1)?.childIds).toEqual([2, 3]);
     });
 
     it("creates new parent reference on add (immutability)", () => {
       // Regression test: applyAdd must create a new parent object, not mutate.
       // React's useSyncExternalStore uses Object.is for change detection.
       // Same object reference = no re-render, even if contents changed.
-      const parentBefore = store.getNode("root");
+      const parentBefore = store.getNode(1);
 
       const patch: AddPatch = {
         op: "add",
-        parent_id: "root",
-        children: ["e1"],
-        element: makeElement("e1", "Button"),
+        parent_id: 1,
+        children: [2],
+        element: makeElement(2, "Button"),
       };
       store.applyPatches([patch]);
 
-      const parentAfter = store.getNode("root");
+      const parentAfter = store.getNode(1);
 
       // Must be different object reference for React to detect change
       expect(parentAfter).not.toBe(parentBefore);
-      expect(parentAfter?.childIds).toEqual(["e1"]);
+      expect(parentAfter?.childIds).toEqual([2]);
     });
 
     it("adds nested subtree recursively", () => {
       const patch: AddPatch = {
         op: "add",
-        parent_id: "root",
-        children: ["container"],
-        element: makeElement("container", "Container", {}, [
-          makeElement("child1", "Label", { text: "First" }),
-          makeElement("child2", "Label", { text: "Second" }),
+        parent_id: 1,
+        children: [5],
+        element: makeElement(5, "Container", {}, [
+          makeElement(6, "Label", { text: "First" }),
+          makeElement(7, "Label", { text: "Second" }),
         ]),
       };
       store.applyPatches([patch]);
 
-      expect(store.getNode("container")?.childIds).toEqual([
-        "child1",
-        "child2",
+      expect(store.getNode(5)?.childIds).toEqual([
+        6,
+        7,
       ]);
-      expect(store.getNode("child1")?.props.text).toBe("First");
-      expect(store.getNode("child2")?.props.text).toBe("Second");
+      expect(store.getNode(6)?.props.text).toBe("First");
+      expect(store.getNode(7)?.props.text).toBe("Second");
     });
   });
 
   describe("applyPatches - remove", () => {
     beforeEach(() => {
       initTree(
-        makeElement("root", "App", {}, [
-          makeElement("e1", "Container", {}, [
-            makeElement("e2", "Child"),
-            makeElement("e3", "Child"),
+        makeElement(1, "App", {}, [
+          makeElement(2, "Container", {}, [
+            makeElement(3, "Child"),
+            makeElement(4, "Child"),
           ]),
         ])
       );
     });
 
     it("removes node from store", () => {
-      expect(store.getNode("e2")).toBeDefined();
+      expect(store.getNode(3)).toBeDefined();
 
-      const patch: RemovePatch = { op: "remove", id: "e2" };
+      const patch: RemovePatch = { op: "remove", id: 3 };
       store.applyPatches([patch]);
 
-      expect(store.getNode("e2")).toBeUndefined();
+      expect(store.getNode(3)).toBeUndefined();
     });
 
     it("removes descendants recursively", () => {
-      expect(store.getNode("e1")).toBeDefined();
-      expect(store.getNode("e2")).toBeDefined();
-      expect(store.getNode("e3")).toBeDefined();
+      expect(store.getNode(2)).toBeDefined();
+      expect(store.getNode(3)).toBeDefined();
+      expect(store.getNode(4)).toBeDefined();
 
-      const patch: RemovePatch = { op: "remove", id: "e1" };
+      const patch: RemovePatch = { op: "remove", id: 2 };
       store.applyPatches([patch]);
 
-      expect(store.getNode("e1")).toBeUndefined();
-      expect(store.getNode("e2")).toBeUndefined();
-      expect(store.getNode("e3")).toBeUndefined();
+      expect(store.getNode(2)).toBeUndefined();
+      expect(store.getNode(3)).toBeUndefined();
+      expect(store.getNode(4)).toBeUndefined();
     });
   });
 
   describe("subscriptions", () => {
     beforeEach(() => {
       initTree(
-        makeElement("root", "App", {}, [makeElement("e1", "Label", { text: "Hello" })])
+        makeElement(1, "App", {}, [makeElement(2, "Label", { text: "Hello" })])
       );
     });
 
     it("notifies node listener on update", () => {
       const listener = vi.fn();
-      store.subscribeToNode("e1", listener);
+      store.subscribeToNode(2, listener);
 
-      store.applyPatches([{ op: "update", id: "e1", props: { text: "World" } }]);
+      store.applyPatches([{ op: "update", id: 2, props: { text: "World" } }]);
 
       expect(listener).toHaveBeenCalledTimes(1);
     });
@@ -320,10 +408,10 @@ describe("TrellisStore", () => {
     it("does not notify unrelated node listeners", () => {
       const e1Listener = vi.fn();
       const rootListener = vi.fn();
-      store.subscribeToNode("e1", e1Listener);
-      store.subscribeToNode("root", rootListener);
+      store.subscribeToNode(2, e1Listener);
+      store.subscribeToNode(1, rootListener);
 
-      store.applyPatches([{ op: "update", id: "e1", props: { text: "World" } }]);
+      store.applyPatches([{ op: "update", id: 2, props: { text: "World" } }]);
 
       expect(e1Listener).toHaveBeenCalledTimes(1);
       expect(rootListener).not.toHaveBeenCalled();
@@ -331,10 +419,10 @@ describe("TrellisStore", () => {
 
     it("unsubscribes correctly", () => {
       const listener = vi.fn();
-      const unsubscribe = store.subscribeToNode("e1", listener);
+      const unsubscribe = store.subscribeToNode(2, listener);
       unsubscribe();
 
-      store.applyPatches([{ op: "update", id: "e1", props: { text: "World" } }]);
+      store.applyPatches([{ op: "update", id: 2, props: { text: "World" } }]);
 
       expect(listener).not.toHaveBeenCalled();
     });
@@ -346,7 +434,7 @@ describe("TrellisStore", () => {
       freshStore.subscribeGlobal(listener);
 
       freshStore.applyPatches([
-        { op: "add", parent_id: null, children: ["new"], element: makeElement("new", "NewApp") },
+        { op: "add", parent_id: null, children: [20], element: makeElement(20, "NewApp") },
       ]);
 
       expect(listener).toHaveBeenCalled();
@@ -356,21 +444,21 @@ describe("TrellisStore", () => {
       const listener = vi.fn();
       store.subscribeGlobal(listener);
 
-      store.applyPatches([{ op: "update", id: "e1", props: { text: "World" } }]);
+      store.applyPatches([{ op: "update", id: 2, props: { text: "World" } }]);
 
       expect(listener).toHaveBeenCalled();
     });
 
     it("cleans up node listeners on remove", () => {
       const listener = vi.fn();
-      store.subscribeToNode("e1", listener);
+      store.subscribeToNode(2, listener);
 
       // Remove the node
-      store.applyPatches([{ op: "remove", id: "e1" }]);
+      store.applyPatches([{ op: "remove", id: 2 }]);
       listener.mockClear();
 
       // Try updating removed node - should not call listener
-      store.applyPatches([{ op: "update", id: "e1", props: { text: "test" } }]);
+      store.applyPatches([{ op: "update", id: 2, props: { text: "test" } }]);
       expect(listener).not.toHaveBeenCalled();
     });
   });
@@ -0,0 +1,46 @@
+import { describe, it, expect } from "vitest";
+import { decode, encode, ExtData } from "@msgpack/msgpack";
+import { typedArrayCodec } from "@common/core/typedArrays";
+
+function ext(code: number, array: ArrayBufferView): ExtData {
+  return new ExtData(code, new Uint8Array(array.buffer, array.byteOffset, array.byteLength));
+}
+
+function roundTrip(value: unknown): unknown {
+  return decode(encode(value), { extensionCodec: typedArrayCodec });
+}
+
+describe("typedArrayCodec", () => {
+  it("decodes float64 payloads into Float64Array", () => {
+    const decoded = roundTrip({ data: [ext(1, new Float64Array([1, 2.5, -3]))] }) as {
+      data: Float64Array[];
+    };
+
+    expect(decoded.data[0]).toBeInstanceOf(Float64Array);
+    expect(Array.from(decoded.data[0])).toEqual([1, 2.5, -3]);
+  });
+
+  it("decodes each element type", () => {
+    expect(roundTrip(ext(2, new Float32Array([0.5])))).toBeInstanceOf(Float32Array);
+    expect(roundTrip(ext(3, new Int8Array([-1])))).toBeInstanceOf(Int8Array);
+    expect(roundTrip(ext(4, new Uint8Array([1])))).toBeInstanceOf(Uint8Array);
+    expect(roundTrip(ext(5, new Int16Array([-1])))).toBeInstanceOf(Int16Array);
+    expect(roundTrip(ext(6, new Uint16Array([1])))).toBeInstanceOf(Uint16Array);
+    expect(roundTrip(ext(7, new Int32Array([-1])))).toBeInstanceOf(Int32Array);
+    expect(roundTrip(ext(8, new Uint32Array([1])))).toBeInstanceOf(Uint32Array);
+  });
+
+  it("decodes 64-bit ints into Float64Array", () => {
+    const decoded = roundTrip(ext(9, new BigInt64Array([-2n, 3n]))) as Float64Array;
+
+    expect(decoded).toBeInstanceOf(Float64Array);
+    expect(Array.from(decoded)).toEqual([-2, 3]);
+  });
+
+  it("decodes payloads at unaligned offsets", () => {
+    // A one-byte string before the array puts its payload at an odd offset
+    const decoded = roundTrip(["x", ext(1, new Float64Array([4, 5]))]) as [string, Float64Array];
+
+    expect(Array.from(decoded[1])).toEqual([4, 5]);
+  });
+});
@@ -3,8 +3,8 @@ import { isCallbackRef, ElementKind, Mutable, resetMutableStates } from "@common
 
 describe("isCallbackRef", () => {
   it("returns true for valid callback refs", () => {
-    expect(isCallbackRef({ __callback__: "cb_123" })).toBe(true);
-    expect(isCallbackRef({ __callback__: "" })).toBe(true);
+    expect(isCallbackRef({ __callback__: 123 })).toBe(true);
+    expect(isCallbackRef({ __callback__: 1 })).toBe(true);
   });
 
   it("returns false for non-objects", () => {
@@ -21,8 +21,8 @@ describe("isCallbackRef", () => {
     expect(isCallbackRef({ other: "value" })).toBe(false);
   });
 
-  it("returns false when __callback__ is not a string", () => {
-    expect(isCallbackRef({ __callback__: 123 })).toBe(false);
+  it("returns false when __callback__ is not a number", () => {
+    expect(isCallbackRef({ __callback__: "12|on_click" })).toBe(false);
     expect(isCallbackRef({ __callback__: null })).toBe(false);
     expect(isCallbackRef({ __callback__: {} })).toBe(false);
   });
@@ -44,21 +44,21 @@ describe("Mutable", () => {
   it("setValue sends value and version", () => {
     const onEvent = vi.fn();
     const m = new Mutable<string>(
-      { __mutable__: "test-id", value: "initial", version: 0 },
+      { __mutable__: 1, value: "initial", version: 0 },
       onEvent
     );
 
     m.setValue("x");
-    expect(onEvent).toHaveBeenCalledWith("test-id", ["x", 1]);
+    expect(onEvent).toHaveBeenCalledWith(1, ["x", 1]);
 
     m.setValue("y");
-    expect(onEvent).toHaveBeenCalledWith("test-id", ["y", 2]);
+    expect(onEvent).toHaveBeenCalledWith(1, ["y", 2]);
   });
 
   it("value returns optimistic value after setValue", () => {
     const onEvent = vi.fn();
     const m = new Mutable<string>(
-      { __mutable__: "test-id", value: "initial", version: 0 },
+      { __mutable__: 1, value: "initial", version: 0 },
       onEvent
     );
 
@@ -71,14 +71,14 @@ describe("Mutable", () => {
 
     // Simulate: client sends version 1, server echoes version 1
     const m1 = new Mutable<string>(
-      { __mutable__: "test-id", value: "old", version: 0 },
+      { __mutable__: 1, value: "old", version: 0 },
       onEvent
     );
     m1.setValue("new"); // localVersion becomes 1
 
     // Server responds with version 1 (acknowledging client's update)
     const m2 = new Mutable<string>(
-      { __mutable__: "test-id", value: "server-new", version: 1 },
+      { __mutable__: 1, value: "server-new", version: 1 },
       onEvent
     );
     expect(m2.value).toBe("server-new");
@@ -88,14 +88,14 @@ describe("Mutable", () => {
     const onEvent = vi.fn();
 
     const m1 = new Mutable<string>(
-      { __mutable__: "test-id", value: "old", version: 0 },
+      { __mutable__: 1, value: "old", version: 0 },
       onEvent
     );
     m1.setValue("new"); // localVersion becomes 1
 
     // Server responds with stale version 0 (hasn't seen client's update yet)
     const m2 = new Mutable<string>(
-      { __mutable__: "test-id", value: "stale-server", version: 0 },
+      { __mutable__: 1, value: "stale-server", version: 0 },
       onEvent
     );
     expect(m2.value).toBe("new"); // optimistic value preserved
@@ -106,7 +106,7 @@ describe("Mutable", () => {
 
     // Simulate prior interaction: client sent up to version 5
     const m1 = new Mutable<string>(
-      { __mutable__: "test-id", value: "old", version: 0 },
+      { __mutable__: 1, value: "old", version: 0 },
       onEvent
     );
     for (let i = 0; i < 5; i++) m1.setValue(`v${i}`);
@@ -114,7 +114,7 @@ describe("Mutable", () => {
 
     // Server acknowledges version 5
     const m2 = new Mutable<string>(
-      { __mutable__: "test-id", value: "server-v5", version: 5 },
+      { __mutable__: 1, value: "server-v5", version: 5 },
       onEvent
     );
     expect(m2.value).toBe("server-v5");
@@ -123,17 +123,17 @@ describe("Mutable", () => {
     resetMutableStates();
     // Server re-renders with version 5 still stored on the Stateful
     const m3 = new Mutable<string>(
-      { __mutable__: "test-id", value: "server-v5", version: 5 },
+      { __mutable__: 1, value: "server-v5", version: 5 },
       onEvent
     );
 
     // User types — should send version > 5, not version 1
     m3.setValue("after-reset");
-    expect(onEvent).toHaveBeenLastCalledWith("test-id", ["after-reset", 6]);
+    expect(onEvent).toHaveBeenLastCalledWith(1, ["after-reset", 6]);
 
     // A stale render with version 5 should NOT clear optimistic
     const m4 = new Mutable<string>(
-      { __mutable__: "test-id", value: "stale", version: 5 },
+      { __mutable__: 1, value: "stale", version: 5 },
       onEvent
     );
     expect(m4.value).toBe("after-reset");
@@ -143,14 +143,14 @@ describe("Mutable", () => {
     const onEvent = vi.fn();
 
     const m1 = new Mutable<string>(
-      { __mutable__: "shared-id", value: "v1", version: 0 },
+      { __mutable__: 2, value: "v1", version: 0 },
       onEvent
     );
     m1.setValue("optimistic");
 
     // New instance with same id shares the state
     const m2 = new Mutable<string>(
-      { __mutable__: "shared-id", value: "v1", version: 0 },
+      { __mutable__: 2, value: "v1", version: 0 },
       onEvent
     );
     expect(m2.value).toBe("optimistic");
@@ -22,7 +22,7 @@ describe("useTextValue", () => {
   it("renders mutable value", () => {
     const onEvent = vi.fn();
     const mutable = new Mutable<string>(
-      { __mutable__: "tv-id", value: "mutable-val", version: 0 },
+      { __mutable__: 1, value: "mutable-val", version: 0 },
       onEvent
     );
     render(<TestInput value={mutable} />);
@@ -39,13 +39,13 @@ describe("useTextValue", () => {
   it("sends value to server via mutable binding", () => {
     const onEvent = vi.fn();
     const mutable = new Mutable<string>(
-      { __mutable__: "tv-id", value: "initial", version: 0 },
+      { __mutable__: 1, value: "initial", version: 0 },
       onEvent
     );
     render(<TestInput value={mutable} />);
     const input = screen.getByRole("textbox");
     fireEvent.change(input, { target: { value: "updated" } });
-    expect(onEvent).toHaveBeenCalledWith("tv-id", ["updated", 1]);
+    expect(onEvent).toHaveBeenCalledWith(1, ["updated", 1]);
   });
 
   it("accepts new server value on rerender", () => {
@@ -0,0 +1,33 @@
+import { describe, it, expect } from "vitest";
+import { encode } from "@msgpack/msgpack";
+import {
+  inflate,
+  isCompressed,
+  supportedCompression,
+} from "@trellis/trellis-server/client/src/compression";
+
+async function deflate(data: Uint8Array): Promise<Uint8Array> {
+  const stream = new Blob([data]).stream().pipeThrough(new CompressionStream("deflate"));
+  return new Uint8Array(await new Response(stream).arrayBuffer());
+}
+
+describe("compression", () => {
+  it("tells zlib streams from msgpack messages", () => {
+    expect(isCompressed(encode({ type: "patch", patches: [] }))).toBe(false);
+    expect(isCompressed(new Uint8Array([0x78, 0x01]))).toBe(true);
+    expect(isCompressed(new Uint8Array())).toBe(false);
+  });
+
+  it("offers deflate when DecompressionStream exists", () => {
+    const expected = typeof DecompressionStream === "undefined" ? [] : ["deflate"];
+    expect(supportedCompression()).toEqual(expected);
+  });
+
+  it.skipIf(typeof CompressionStream === "undefined")("inflates zlib streams", async () => {
+    const message = encode({ type: "patch", patches: Array(100).fill({ op: "remove", id: 1 }) });
+    const compressed = await deflate(message);
+
+    expect(isCompressed(compressed)).toBe(true);
+    expect(await inflate(compressed)).toEqual(message);
+  });
+});
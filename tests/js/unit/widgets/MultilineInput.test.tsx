@@ -18,14 +18,14 @@ describe("MultilineInput", () => {
 
   it("supports mutable two-way binding", () => {
     const onEvent = vi.fn();
-    const mutable = new Mutable<string>({ __mutable__: "cb-id", value: "initial", version: 0 }, onEvent);
+    const mutable = new Mutable<string>({ __mutable__: 1, value: "initial", version: 0 }, onEvent);
 
     render(<MultilineInput value={mutable} />);
 
     const textarea = screen.getByRole("textbox");
     fireEvent.change(textarea, { target: { value: "updated text" } });
 
-    expect(onEvent).toHaveBeenCalledWith("cb-id", ["updated text", 1]);
+    expect(onEvent).toHaveBeenCalledWith(1, ["updated text", 1]);
   });
 
   it("supports disabled and read_only", () => {
@@ -99,7 +99,7 @@ describe("SplitPane", () => {
 
   it("calls Mutable setValue on drag completion (mouseUp)", () => {
     const onEvent = vi.fn();
-    const mutable = new Mutable<number>({ __mutable__: "split-cb", value: 0.5, version: 0 }, onEvent);
+    const mutable = new Mutable<number>({ __mutable__: 1, value: 0.5, version: 0 }, onEvent);
 
     render(
       <SplitPane split={mutable} min_size={50}>
@@ -132,7 +132,7 @@ describe("SplitPane", () => {
 
     // Release — setValue should fire
     fireEvent.mouseUp(window);
-    expect(onEvent).toHaveBeenCalledWith("split-cb", [0.75, 1]);
+    expect(onEvent).toHaveBeenCalledWith(1, [0.75, 1]);
   });
 
   it("works with a plain number split prop (no Mutable)", () => {
@@ -18,14 +18,14 @@ describe("TextInput", () => {
 
   it("supports mutable two-way binding", () => {
     const onEvent = vi.fn();
-    const mutable = new Mutable<string>({ __mutable__: "cb-id", value: "initial", version: 0 }, onEvent);
+    const mutable = new Mutable<string>({ __mutable__: 1, value: "initial", version: 0 }, onEvent);
 
     render(<TextInput value={mutable} />);
 
     const input = screen.getByRole("textbox");
     fireEvent.change(input, { target: { value: "updated text" } });
 
-    expect(onEvent).toHaveBeenCalledWith("cb-id", ["updated text", 1]);
+    expect(onEvent).toHaveBeenCalledWith(1, ["updated text", 1]);
   });
 
   it("supports disabled", () => {
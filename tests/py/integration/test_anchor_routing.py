@@ -10,7 +10,7 @@ from trellis.core.components.composition import component
 from trellis.core.rendering.session import RenderSession
 from trellis.html import MouseEvent
 from trellis.html.links import A
-from trellis.platforms.common.serialization import parse_callback_id, serialize_element
+from trellis.platforms.common.serialization import serialize_element
 from trellis.routing import RouterState
 
 
@@ -20,14 +20,14 @@ def has_router_link_marker(anchor: dict[str, tp.Any]) -> bool:
     return isinstance(data, dict) and data.get("trellis-router-link") == "true"
 
 
-def invoke_callback(session: RenderSession, cb_id: str, *args: tp.Any) -> None:
+def invoke_callback(session: RenderSession, cb_id: int, *args: tp.Any) -> None:
     """Invoke a callback with proper callback_context.
 
     Handles both sync and async callbacks.
     """
-    element_id, prop_name = parse_callback_id(cb_id)
-    callback = session.get_callback(element_id, prop_name)
-    assert callback is not None, f"Callback {cb_id} not found"
+    resolved = session.resolve_callback(cb_id)
+    assert resolved is not None, f"Callback {cb_id} not found"
+    element_id, _, callback = resolved
     with callback_context(session, element_id):
         result = callback(*args)
         # Handle async callbacks
@@ -0,0 +1,214 @@
+"""Tests for @computed properties on Stateful classes."""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import pytest
+
+from trellis.core.components.composition import component
+from trellis.core.rendering.batch import batch
+from trellis.core.state.computed import computed
+from trellis.core.state.stateful import Stateful
+
+if TYPE_CHECKING:
+    from tests.conftest import PatchCapture
+
+
+@dataclass(kw_only=True)
+class TodoState(Stateful):
+    items: list[int] = field(default_factory=list)
+    threshold: int = 0
+    _runs: int = 0
+
+    @computed
+    def large(self) -> list[int]:
+        self._runs += 1
+        return [item for item in self.items if item > self.threshold]
+
+    @computed
+    def large_count(self) -> int:
+        return len(self.large)
+
+
+class _Ambiguous:
+    """Elementwise comparison result with no single truth value, like NumPy's."""
+
+    def __bool__(self) -> bool:
+        raise ValueError("The truth value of an array is ambiguous")
+
+
+class _Column:
+    """Array-like value whose comparisons are elementwise."""
+
+    def __init__(self, values: list[int]) -> None:
+        self.values = values
+
+    def __eq__(self, other: object) -> _Ambiguous:  # type: ignore[override]
+        return _Ambiguous()
+
+    def __ne__(self, other: object) -> _Ambiguous:  # type: ignore[override]
+        return _Ambiguous()
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+@dataclass(kw_only=True)
+class ScaledState(Stateful):
+    n: int = 1
+
+    @computed
+    def column(self) -> _Column:
+        return _Column([i * self.n for i in range(3)])
+
+
+class TestComputed:
+    def test_recomputes_every_read_without_session(self) -> None:
+        """Outside a render session there is nothing to track, so nothing is cached."""
+        state = TodoState(items=[1, 5, 10], threshold=4)
+
+        assert state.large == [5, 10]
+        assert state.large == [5, 10]
+        assert state._runs == 2
+
+    def test_cannot_assign(self) -> None:
+        """Computed properties are read-only."""
+        state = TodoState()
+
+        with pytest.raises(AttributeError, match="Cannot assign to computed property"):
+            state.large = []  # type: ignore[misc]
+
+    def test_caches_across_renders(self, capture_patches: "type[PatchCapture]") -> None:
+        """The method runs once while its inputs are unchanged."""
+        state = TodoState(items=[1, 5, 10], threshold=4)
+
+        @component
+        def View() -> None:
+            _ = state.large
+            _ = state.large
+
+        capture = capture_patches(View)
+        capture.render()
+        capture.session.dirty.mark(capture.session.root_element.id)
+        capture.render_dirty()
+
+        assert state._runs == 1
+
+    def test_components_depend_on_computed_only(
+        self, capture_patches: "type[PatchCapture]"
+    ) -> None:
+        """Readers register on the computed property, not on its inputs."""
+        state = TodoState(items=[1, 5, 10], threshold=4)
+
+        @component
+        def View() -> None:
+            _ = state.large
+
+        capture = capture_patches(View)
+        capture.render()
+        dependencies = capture.session.dependencies
+
+        assert dependencies.watchers(state, "large") == [capture.session.root_element]
+        assert capture.session.root_element not in dependencies.watchers(state, "items")
+
+    def test_rerenders_only_when_value_changes(self, capture_patches: "type[PatchCapture]") -> None:
+        """An input change that leaves the value equal does not dirty readers."""
+        state = TodoState(items=[1, 5, 10], threshold=4)
+        renders = [0]
+
+        @component
+        def View() -> None:
+            renders[0] += 1
+            _ = state.large
+
+        capture = capture_patches(View)
+        capture.render()
+
+        state.threshold = 3  # Still [5, 10]
+        assert not capture.session.dirty.has_dirty()
+        assert state._runs == 2
+
+        state.threshold = 6  # Now [10]
+        assert capture.session.dirty.has_dirty()
+        capture.render_dirty()
+
+        assert renders[0] == 2
+        assert state._runs == 3
+
+    def test_unwatched_value_is_recomputed_lazily(
+        self, capture_patches: "type[PatchCapture]"
+    ) -> None:
+        """Without watchers, input changes only mark the value stale."""
+        state = TodoState(items=[1, 5, 10], threshold=4)
+
+        @component
+        def View() -> None:
+            pass
+
+        capture = capture_patches(View)
+        capture.render()
+        assert state.large == [5, 10]
+
+        state.threshold = 0
+        state.threshold = 1
+        assert state._runs == 1
+
+        assert state.large == [5, 10]
+        assert state._runs == 2
+
+    def test_batch_recomputes_once(self, capture_patches: "type[PatchCapture]") -> None:
+        """Several input changes inside a batch trigger a single recompute."""
+        state = TodoState(items=[1, 5, 10], threshold=4)
+
+        @component
+        def View() -> None:
+            _ = state.large
+
+        capture = capture_patches(View)
+        capture.render()
+
+        with batch():
+            state.threshold = 0
+            state.items = [1, 2, 3]
+            state.threshold = 1
+            assert state._runs == 1
+
+        assert state._runs == 2
+        assert state.large == [2, 3]
+        assert capture.session.dirty.has_dirty()
+
+    def test_chained_computed(self, capture_patches: "type[PatchCapture]") -> None:
+        """A computed property reading another updates through the chain."""
+        state = TodoState(items=[1, 5, 10], threshold=4)
+        seen: list[int] = []
+
+        @component
+        def View() -> None:
+            seen.append(state.large_count)
+
+        capture = capture_patches(View)
+        capture.render()
+
+        state.items = [5, 6, 7, 1]
+        capture.render_dirty()
+
+        assert seen == [2, 3]
+
+    def test_array_like_value_counts_as_changed(
+        self, capture_patches: "type[PatchCapture]"
+    ) -> None:
+        """A value without a single truth value for != re-renders its readers."""
+        state = ScaledState()
+        seen: list[list[int]] = []
+
+        @component
+        def View() -> None:
+            seen.append(state.column.values)
+
+        capture = capture_patches(View)
+        capture.render()
+
+        state.n = 5
+        assert capture.session.dirty.has_dirty()
+        capture.render_dirty()
+
+        assert seen == [[0, 1, 2], [0, 5, 10]]
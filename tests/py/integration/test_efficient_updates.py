@@ -3,14 +3,25 @@
 These tests ensure that the fine-grained reactivity system actually works:
 - Only components that read a specific state property re-render when it changes
 - Components with unchanged props skip execution entirely
+- Memoized components decide "unchanged" with their own comparator
 - Deeply nested components only re-render when their dependencies change
+- Render snapshots only pay for the elements a pass actually touches
 """
 
 from dataclasses import dataclass
 
+import pytest
+
 from tests.conftest import PatchCapture
 from trellis.core.components.composition import component
+from trellis.core.components.memo import (
+    MemoOption,
+    identity_equal,
+    shallow_equal,
+    version_equal,
+)
 from trellis.core.rendering.child_ref import ChildRef
+from trellis.core.rendering.element_store import ElementSnapshot, ElementStore
 from trellis.core.state.stateful import Stateful
 
 
@@ -253,6 +264,109 @@ class TestPropsUnchangedOptimization:
         assert render_counts == {"root": 2, "level1": 1, "level2": 1, "level3": 1, "leaf": 1}
 
 
+class TestMemoizedComponents:
+    """Tests for @component(memo=...) prop comparators."""
+
+    @staticmethod
+    def _render_twice(
+        capture_patches: "type[PatchCapture]", memo: MemoOption | None, make_props
+    ) -> tuple[int, PatchCapture]:
+        """Render a parent twice, placing a memoized child with fresh props each time."""
+        child_runs = [0]
+
+        @component(memo=memo)
+        def Child(**props: object) -> None:
+            child_runs[0] += 1
+
+        @component
+        def Parent() -> None:
+            Child(**make_props())
+
+        capture = capture_patches(Parent)
+        capture.render()
+        capture.session.dirty.mark(capture.session.root_element.id)
+        capture.render()
+        return child_runs[0], capture
+
+    def test_identity_skips_same_objects(self, capture_patches: "type[PatchCapture]") -> None:
+        """Identity memo reuses the element when each prop is the same object."""
+        rows = [{"id": i} for i in range(100)]
+
+        runs, capture = self._render_twice(capture_patches, "identity", lambda: {"rows": rows})
+
+        assert runs == 1
+        assert capture.session.stats.memo_skips == 1
+        assert capture.session.stats.memo_misses == 0
+
+    def test_identity_reexecutes_on_equal_copy(self, capture_patches: "type[PatchCapture]") -> None:
+        """Identity memo re-executes for an equal but distinct object."""
+        runs, capture = self._render_twice(capture_patches, "identity", lambda: {"rows": [1, 2, 3]})
+
+        assert runs == 2
+        assert capture.session.stats.memo_skips == 0
+        assert capture.session.stats.memo_misses == 1
+
+    def test_default_compares_deeply(self, capture_patches: "type[PatchCapture]") -> None:
+        """Without memo, an equal copy is skipped and nothing is counted."""
+        runs, capture = self._render_twice(capture_patches, None, lambda: {"rows": [1, 2, 3]})
+
+        assert runs == 1
+        assert capture.session.stats.memo_skips == 0
+        assert capture.session.stats.memo_misses == 0
+
+    def test_shallow_accepts_rebuilt_list(self, capture_patches: "type[PatchCapture]") -> None:
+        """Shallow memo matches a new list holding the same items."""
+        rows = [object() for _ in range(10)]
+
+        runs, _ = self._render_twice(capture_patches, "shallow", lambda: {"rows": list(rows)})
+
+        assert runs == 1
+
+    def test_version_ignores_other_props(self, capture_patches: "type[PatchCapture]") -> None:
+        """Version memo compares only the version stamp."""
+        runs, _ = self._render_twice(
+            capture_patches, "version", lambda: {"version": 3, "rows": [object()]}
+        )
+
+        assert runs == 1
+
+    def test_custom_comparator(self, capture_patches: "type[PatchCapture]") -> None:
+        """A callable comparator decides reuse."""
+        calls: list[tuple[dict, dict]] = []
+
+        def same_length(old: dict, new: dict) -> bool:
+            calls.append((dict(old), dict(new)))
+            return len(old["rows"]) == len(new["rows"])
+
+        runs, capture = self._render_twice(
+            capture_patches, same_length, lambda: {"rows": [object(), object()]}
+        )
+
+        assert runs == 1
+        assert len(calls) == 1
+        assert capture.session.stats.memo_skips == 1
+
+    def test_unknown_comparator_rejected(self) -> None:
+        """An unknown comparator name raises at decoration time."""
+        with pytest.raises(ValueError, match="Unknown memo comparator"):
+
+            @component(memo="deep")  # type: ignore[call-overload]
+            def Child() -> None:
+                pass
+
+    def test_comparators(self) -> None:
+        """Named comparators follow their documented semantics."""
+        item = object()
+        assert identity_equal({"a": item}, {"a": item})
+        assert not identity_equal({"a": item}, {"a": item, "b": 1})
+        assert shallow_equal({"a": [item], "b": 1}, {"a": [item], "b": 1})
+        assert not shallow_equal({"a": [[1]]}, {"a": [[1]]})
+        assert not shallow_equal({"a": [item]}, {"a": (item,)})
+        assert version_equal({"version": 1, "a": 1}, {"version": 1, "a": 2})
+        assert not version_equal({"version": 1}, {"version": 2})
+        assert version_equal({"a": [1]}, {"a": [1]})
+
+
 class TestDirtyMarkingBehavior:
     """Tests for dirty marking and render order."""
 
@@ -321,6 +435,45 @@ class TestDirtyMarkingBehavior:
         assert render_counts["parent"] == 1
         assert render_counts["child"] == 1
 
+    def test_dirty_ancestor_renders_before_descendant(
+        self, capture_patches: "type[PatchCapture]"
+    ) -> None:
+        """Dirty ancestors render first, so a dirty child is not executed twice."""
+        render_counts: dict[str, int] = {"parent": 0, "child": 0}
+
+        @dataclass(kw_only=True)
+        class CounterState(Stateful):
+            value: int = 0
+
+        state = CounterState()
+
+        @component
+        def Child(label: int) -> None:
+            render_counts["child"] += 1
+            _ = state.value
+
+        @component
+        def Middle() -> None:
+            Child(label=state.value)
+
+        @component
+        def Parent() -> None:
+            render_counts["parent"] += 1
+            Middle()
+
+        capture = capture_patches(Parent)
+        capture.render()
+        render_counts["child"] = 0
+
+        # Child subscribes before Middle, so it is marked dirty first
+        state.value = 1
+        ctx = capture.session
+        assert len(ctx.dirty) == 2
+        capture.render()
+
+        assert render_counts["child"] == 1
+        assert ctx.stats.redundant_executions_avoided == 1
+
     def test_child_dirty_cleared_by_parent_rerender(
         self, capture_patches: "type[PatchCapture]"
     ) -> None:
@@ -582,3 +735,54 @@ class TestStateWithMultipleComponents:
         capture.render()
 
         assert render_counts == {"a": 2, "b": 2}
+
+
+class TestSnapshotCost:
+    """Tests verifying render snapshots scale with work done, not tree size."""
+
+    def test_snapshot_touches_only_rerendered_elements(
+        self, capture_patches: "type[PatchCapture]", monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A single-leaf update should touch the same few elements at any tree size."""
+        snapshots: list[ElementSnapshot] = []
+        original_snapshot = ElementStore.snapshot
+
+        def recording_snapshot(self: ElementStore) -> ElementSnapshot:
+            snapshot = original_snapshot(self)
+            snapshots.append(snapshot)
+            return snapshot
+
+        monkeypatch.setattr(ElementStore, "snapshot", recording_snapshot)
+
+        def touched_after_leaf_update(width: int) -> int:
+            @dataclass(kw_only=True)
+            class CounterState(Stateful):
+                value: int = 0
+
+            counter = CounterState()
+
+            @component
+            def Counter() -> None:
+                _ = counter.value
+
+            @component
+            def Filler() -> None:
+                pass
+
+            @component
+            def App() -> None:
+                Counter()
+                for i in range(width):
+                    Filler(key=str(i))
+
+            capture = capture_patches(App)
+            capture.render()
+            counter.value += 1
+            capture.render()
+            return snapshots[-1].touched_count
+
+        small = touched_after_leaf_update(10)
+        large = touched_after_leaf_update(2000)
+
+        assert small == large
+        assert large <= 2
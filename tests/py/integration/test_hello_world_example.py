@@ -10,7 +10,7 @@ import pytest
 from tests.conftest import render_to_tree
 from trellis.core.rendering.render import render
 from trellis.core.rendering.session import RenderSession, set_render_session
-from trellis.platforms.common.serialization import parse_callback_id, serialize_element
+from trellis.platforms.common.serialization import serialize_element
 
 
 def _find_button_by_text(node: dict[str, Any], text: str) -> dict[str, Any] | None:
@@ -33,11 +33,10 @@ def _find_count_label(node: dict[str, Any]) -> dict[str, Any] | None:
     return None
 
 
-def _invoke_callback(session: RenderSession, callback_id: str) -> None:
-    element_id, prop_name = parse_callback_id(callback_id)
-    callback = session.get_callback(element_id, prop_name)
-    assert callback is not None
-    callback()
+def _invoke_callback(session: RenderSession, callback_id: int) -> None:
+    resolved = session.resolve_callback(callback_id)
+    assert resolved is not None
+    resolved[2]()
 
 
 class TestHelloWorldExample:
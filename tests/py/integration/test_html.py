@@ -5,7 +5,7 @@ import pytest
 from trellis import html as h
 from trellis.core.components.composition import component
 from trellis.core.rendering.element import ContainerElement
-from trellis.platforms.common.serialization import parse_callback_id, serialize_element
+from trellis.platforms.common.serialization import serialize_element
 
 
 class TestHtmlElements:
@@ -296,8 +296,9 @@ class TestHtmlSerialization:
 
         # Verify callback works
         cb_id = div_data["props"]["on_click"]["__callback__"]
-        node_id, prop_name = parse_callback_id(cb_id)
-        result.session.get_callback(node_id, prop_name)()
+        resolved = result.session.resolve_callback(cb_id)
+        assert resolved is not None
+        resolved[2]()
         assert clicked == [True]
 
     def test_serialize_link_props(self, rendered) -> None:
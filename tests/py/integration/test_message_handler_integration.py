@@ -14,6 +14,7 @@ from trellis.core.protocol import (
     register_message_types,
     send,
 )
+from trellis.core.rendering.batch import in_batch
 from trellis.core.rendering.patches import RenderUpdatePatch
 from trellis.core.rendering.render import render
 from trellis.core.rendering.session import set_render_session
@@ -167,13 +168,13 @@ class TestMessageHandler:
         init_handler_for_test(handler)
         handler.initial_render()
 
-        event_msg = EventMessage(callback_id="unknown|callback", args=[])
+        event_msg = EventMessage(callback_id=9999, args=[])
         response = asyncio.run(handler.handle_message(event_msg))
 
         # Returns ErrorMessage because callback not found
         assert isinstance(response, ErrorMessage)
         assert response.context == "callback"
-        assert "Callback not found: unknown|callback" in response.error
+        assert "Callback not found: 9999" in response.error
 
     def test_handle_message_with_state_update(self, app_wrapper: AppWrapper) -> None:
         """handle_message() marks nodes dirty, render() sends patches."""
@@ -226,6 +227,46 @@ class TestMessageHandler:
         props_patches = [p for p in update_patches if p.props and p.props.get("text") == "1"]
         assert len(props_patches) > 0
 
+    def test_sync_callback_runs_in_batch(self, app_wrapper: AppWrapper) -> None:
+        """Sync callbacks batch their dirty marks into a single flush."""
+
+        @dataclass(kw_only=True)
+        class RowState(Stateful):
+            value: int = 0
+
+        rows = [RowState() for _ in range(50)]
+        observed: list[tuple[bool, bool]] = []
+
+        @component
+        def Row(row: RowState) -> None:
+            Label(text=str(row.value))
+
+        @component
+        def Table() -> None:
+            def bump_all() -> None:
+                for row in rows:
+                    row.value += 1
+                observed.append((in_batch(), handler.session.dirty.has_dirty()))
+
+            Button(text="Bump", on_click=bump_all)
+            for row in rows:
+                Row(row=row)
+
+        handler = BrowserMessageHandler(Table, app_wrapper)
+        init_handler_for_test(handler)
+        tree = get_initial_tree(handler)
+
+        app_children = find_app_children(tree)
+        button = get_button_element(app_children[0])
+        cb_id = button["props"]["on_click"]["__callback__"]
+
+        asyncio.run(handler.handle_message(EventMessage(callback_id=cb_id, args=[])))
+
+        # Marks were deferred while the callback ran, then flushed together
+        assert observed == [(True, False)]
+        assert handler.session is not None
+        assert len(handler.session.dirty) == 50
+
     def test_handle_message_with_event_args(self, app_wrapper: AppWrapper) -> None:
         """handle_message() converts event args to dataclasses."""
         received = []
@@ -430,13 +471,13 @@ class TestBrowserMessageHandler:
 
         handler = BrowserMessageHandler(App, app_wrapper)
 
-        handler.post_event("test:callback", [1, 2, 3])
+        handler.post_event(7, [1, 2, 3])
 
         # Verify the message was queued
         assert not handler._inbox.empty()
         msg = handler._inbox.get_nowait()
         assert isinstance(msg, EventMessage)
-        assert msg.callback_id == "test:callback"
+        assert msg.callback_id == 7
         assert msg.args == [1, 2, 3]
 
     def test_receive_message_gets_from_queue(self, app_wrapper: AppWrapper) -> None:
@@ -449,12 +490,12 @@ class TestBrowserMessageHandler:
         handler = BrowserMessageHandler(App, app_wrapper)
 
         # Post an event
-        handler.post_event("test:callback", [])
+        handler.post_event(7, [])
 
         # Receive should get it
         msg = asyncio.run(handler.receive_message())
         assert isinstance(msg, EventMessage)
-        assert msg.callback_id == "test:callback"
+        assert msg.callback_id == 7
 
     def test_send_message_calls_send_callback(self, app_wrapper: AppWrapper) -> None:
         """send_message() calls registered send callback with message dict."""
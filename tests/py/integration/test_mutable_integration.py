@@ -11,13 +11,13 @@ from trellis.core.rendering.patches import RenderUpdatePatch
 from trellis.core.rendering.session import RenderSession, set_render_session
 from trellis.core.state.mutable import Mutable, callback, mutable
 from trellis.core.state.stateful import Stateful
-from trellis.platforms.common.serialization import parse_callback_id, serialize_element
+from trellis.platforms.common.serialization import serialize_element
 
 
-def get_callback_from_id(ctx: RenderSession, cb_id: str):
-    """Helper to get callback using the new two-arg API."""
-    node_id, prop_name = parse_callback_id(cb_id)
-    return ctx.get_callback(node_id, prop_name)
+def get_callback_from_id(ctx: RenderSession, cb_id: int):
+    """Helper to get the callback a handle resolves to."""
+    resolved = ctx.resolve_callback(cb_id)
+    return resolved[2] if resolved is not None else None
 
 
 class TestMutableFunction:
@@ -7,13 +7,17 @@ rather than the full props dict.
 from __future__ import annotations
 
 import typing as tp
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from tests.conftest import PatchCapture
 from trellis.core.components.composition import CompositionComponent, component
-from trellis.core.rendering.element import _REMOVED
+from trellis.core.components.react import react
+from trellis.core.rendering.element import _REMOVED, PropOps
 from trellis.core.rendering.patches import RenderUpdatePatch
 from trellis.core.state.stateful import Stateful
+from trellis.core.state.stream import StreamBuffer
+from trellis.platforms.common.handler import _serialize_patches
+from trellis.platforms.common.serialization import serialize_element
 from trellis.widgets.basic import Label
 from trellis.widgets.hot_key import HotKey
 
@@ -132,3 +136,143 @@ class TestPropDiffPatches:
         ]
         assert len(removal_patches) == 1
         assert removal_patches[0].props["__global_key_filters__"] is _REMOVED
+
+
+class TestNestedPropDiffPatches:
+    def test_appended_rows_serialize_as_ops(self, capture_patches: CapturePatches) -> None:
+        """Growing a nested diff prop sends only the new rows."""
+
+        @react("client/TestNestedGrid.tsx", nested_diff_props=["rows"])
+        def NestedGrid(*, rows: list[dict[str, tp.Any]]) -> None:
+            pass
+
+        @dataclass(kw_only=True)
+        class State(Stateful):
+            rows: list[dict[str, tp.Any]]
+
+        state = State(rows=[{"id": i} for i in range(40)])
+
+        @component
+        def App() -> None:
+            NestedGrid(rows=list(state.rows))
+
+        capture = capture_patches(App)
+        capture.render()
+
+        state.rows = [*state.rows, {"id": 40}]
+        patches = capture.render()
+
+        (update,) = [p for p in patches if isinstance(p, RenderUpdatePatch)]
+        assert update.props is not None
+        assert isinstance(update.props["rows"], PropOps)
+        (wire,) = _serialize_patches([update], capture.session)
+        assert wire.props == {
+            "rows": {"__ops__": [{"op": "append", "path": [], "items": [{"id": 40}]}]}
+        }
+
+    def test_callbacks_in_ops_get_item_paths(self, capture_patches: CapturePatches) -> None:
+        """Callables inside edited items resolve by their position in the new prop."""
+        calls: list[int] = []
+
+        @react("client/TestNestedMenu.tsx", nested_diff_props=["items"])
+        def NestedMenu(*, items: list[dict[str, tp.Any]]) -> None:
+            pass
+
+        @dataclass(kw_only=True)
+        class State(Stateful):
+            count: int = 30
+
+        state = State()
+
+        @component
+        def App() -> None:
+            NestedMenu(items=[{"id": i, "on_pick": calls.append} for i in range(state.count)])
+
+        capture = capture_patches(App)
+        capture.render()
+
+        state.count = 31
+        patches = capture.render()
+
+        (wire,) = _serialize_patches(
+            [p for p in patches if isinstance(p, RenderUpdatePatch)], capture.session
+        )
+        assert wire.props is not None
+        (op,) = wire.props["items"]["__ops__"]
+        handle = op["items"][0]["on_pick"]["__callback__"]
+        resolved = capture.session.resolve_callback(handle)
+        assert resolved is not None
+        _, path, callback = resolved
+        assert path == "items[30].on_pick"
+        callback(30)
+        assert calls == [30]
+
+
+class TestStreamPropPatches:
+    def test_appends_send_only_new_samples(self, capture_patches: CapturePatches) -> None:
+        """Appending to a StreamBuffer prop re-renders with evict/append edits."""
+
+        @react("client/TestStreamChart.tsx")
+        def StreamChart(*, data: list[list[float]] | StreamBuffer[tp.Any]) -> None:
+            pass
+
+        @dataclass(kw_only=True)
+        class Sensors(Stateful):
+            samples: StreamBuffer[tuple[int, int]] = field(
+                default_factory=lambda: StreamBuffer(maxlen=3, columns=2)
+            )
+
+        sensors = Sensors()
+        sensors.samples.extend([(0, 0), (1, 10)])
+
+        @component
+        def App() -> None:
+            StreamChart(data=sensors.samples)
+
+        capture = capture_patches(App)
+        capture.render()
+        chart = capture.session.elements.get(capture.session.root_element.child_ids[0])
+        assert serialize_element(chart, capture.session)["props"]["data"] == [[0, 1], [0, 10]]
+
+        sensors.samples.extend([(2, 20), (3, 30)])
+        patches = capture.render_dirty()
+
+        (update,) = [p for p in patches if isinstance(p, RenderUpdatePatch)]
+        (wire,) = _serialize_patches([update], capture.session)
+        assert wire.props == {
+            "data": {
+                "__ops__": [
+                    {"op": "splice", "path": [0], "index": 0, "delete": 1, "items": []},
+                    {"op": "append", "path": [0], "items": [2, 3]},
+                    {"op": "splice", "path": [1], "index": 0, "delete": 1, "items": []},
+                    {"op": "append", "path": [1], "items": [20, 30]},
+                ]
+            }
+        }
+
+    def test_unchanged_buffer_no_patch(self, capture_patches: CapturePatches) -> None:
+        """Re-rendering without new samples reuses the element."""
+
+        @react("client/TestStreamSpark.tsx")
+        def StreamSpark(*, data: StreamBuffer[float], label: str) -> None:
+            pass
+
+        @dataclass(kw_only=True)
+        class State(Stateful):
+            label: str = "a"
+
+        state = State()
+        buffer = StreamBuffer([1.0, 2.0], maxlen=10)
+
+        @component
+        def App() -> None:
+            StreamSpark(data=buffer, label=state.label)
+
+        capture = capture_patches(App)
+        capture.render()
+
+        state.label = "b"
+        patches = capture.render_dirty()
+
+        (update,) = [p for p in patches if isinstance(p, RenderUpdatePatch)]
+        assert update.props == {"label": "b"}
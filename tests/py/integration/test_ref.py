@@ -546,10 +546,9 @@ class TestRefEdgeCases:
         # Reading through holder should not create watchers on parent
         # INTERNAL TEST: verify no watchers registered through proxy
         ref = object.__getattribute__(holder, "_ref")
-        if hasattr(ref, "_state_props") and "_open" in ref._state_props:
-            watcher_ids = {e.id for e in ref._state_props["_open"].watchers}
-            parent_id = capture.session.root_element.id
-            assert parent_id not in watcher_ids
+        watcher_ids = {e.id for e in capture.session.dependencies.watchers(ref, "_open")}
+        parent_id = capture.session.root_element.id
+        assert parent_id not in watcher_ids
 
     def test_ref_holder_reattaches_on_child_rerender(self, capture_patches: CapturePatches) -> None:
         """Child re-renders, ref re-attaches to same holder."""
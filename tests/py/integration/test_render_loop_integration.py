@@ -1,32 +1,41 @@
 """Integration tests for render loop behavior and patch computation."""
 
 import asyncio
+import threading
+import time
 import typing as tp
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 
 import pytest
 
 from tests.conftest import bind_message_handler, get_button_element
-from trellis import on_mount
+from trellis import every_event, on_mount
 from trellis.core.components.base import Component
 from trellis.core.components.composition import CompositionComponent, component
+from trellis.core.rendering.dirty_tracker import DirtyTracker
 from trellis.core.rendering.patches import RenderAddPatch, RenderRemovePatch, RenderUpdatePatch
 from trellis.core.rendering.render import render
-from trellis.core.rendering.session import set_render_session
+from trellis.core.rendering.session import RenderSession, set_render_session
+from trellis.core.state.mutable import callback
 from trellis.core.state.stateful import Stateful
 from trellis.platforms.browser.handler import BrowserMessageHandler
+from trellis.platforms.common import handler as handler_module
 from trellis.platforms.common.errors import SessionDisconnected
-from trellis.platforms.common.handler import AppWrapper, MessageHandler
+from trellis.platforms.common.handler import AppWrapper, MessageHandler, create_render_executor
 from trellis.platforms.common.messages import (
+    AckMessage,
     AddPatch,
     ErrorMessage,
     EventMessage,
     HelloMessage,
+    HelloResponseMessage,
     Message,
     PatchMessage,
     UpdatePatch,
 )
-from trellis.widgets import Button, Card, Label
+from trellis.state.loading import Ready, load
+from trellis.widgets import Button, Card, Label, Slider
 
 
 def _make_test_wrapper() -> AppWrapper:
@@ -371,6 +380,676 @@ class TestRenderLoop:
         asyncio.run(run_test())
 
 
+class _QueueHandler(MessageHandler):
+    """Handler fed from an in-memory inbox that records sent messages."""
+
+    def __init__(
+        self, root: Component, batch_delay: float, *, patch_acks: bool = False, **options: tp.Any
+    ) -> None:
+        super().__init__(root, _make_test_wrapper(), batch_delay=batch_delay, **options)
+        self.patch_acks = patch_acks
+        self.sent: list[Message] = []
+        self._hello_sent = False
+        self._inbox: asyncio.Queue[Message] = asyncio.Queue()
+
+    async def send_message(self, msg: Message) -> None:
+        self.sent.append(msg)
+
+    async def receive_message(self) -> Message:
+        if not self._hello_sent:
+            self._hello_sent = True
+            return HelloMessage(client_id="test", patch_acks=self.patch_acks)
+        return await self._inbox.get()
+
+    def post(self, msg: Message) -> None:
+        self._inbox.put_nowait(msg)
+
+    @property
+    def patch_messages(self) -> list[PatchMessage]:
+        return [m for m in self.sent if isinstance(m, PatchMessage)]
+
+    def click_callback_id(self) -> str:
+        tree = self.patch_messages[0].patches[0].element
+        button = get_button_element(find_app_children(tree)[1])
+        return button["props"]["on_click"]["__callback__"]
+
+
+@dataclass(kw_only=True)
+class _ClickState(Stateful):
+    count: int = 0
+
+
+def _make_click_counter() -> CompositionComponent:
+    state = _ClickState()
+
+    @component
+    def Counter() -> None:
+        def increment() -> None:
+            state.count += 1
+
+        Label(text=str(state.count))
+        Button(text="+", on_click=increment)
+
+    return Counter
+
+
+async def _stop(task: asyncio.Task[None]) -> None:
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+class TestEventDrivenRenderLoop:
+    """The render loop sleeps until something is dirty."""
+
+    def test_idle_loop_does_not_poll(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """With nothing dirty, the loop stays asleep instead of ticking every frame."""
+        checks = 0
+        original = DirtyTracker.has_dirty
+
+        def counting_has_dirty(self: DirtyTracker) -> bool:
+            nonlocal checks
+            checks += 1
+            return original(self)
+
+        async def run_test() -> None:
+            handler = _QueueHandler(_make_click_counter(), batch_delay=0.01)
+            run_task = asyncio.create_task(handler.run())
+            await asyncio.sleep(0.02)
+
+            monkeypatch.setattr(DirtyTracker, "has_dirty", counting_has_dirty)
+            await asyncio.sleep(0.2)  # ~20 frames at the old polling rate
+            assert checks == 0
+
+            await _stop(run_task)
+
+        asyncio.run(run_test())
+
+    def test_event_renders_without_waiting_for_frame(self) -> None:
+        """The first change after an idle period renders immediately."""
+
+        async def run_test() -> None:
+            handler = _QueueHandler(_make_click_counter(), batch_delay=5.0)
+            run_task = asyncio.create_task(handler.run())
+            await asyncio.sleep(0.02)
+
+            handler.post(EventMessage(callback_id=handler.click_callback_id(), args=[]))
+            await asyncio.sleep(0.05)
+            assert len(handler.patch_messages) == 2
+
+            await _stop(run_task)
+
+        asyncio.run(run_test())
+
+    def test_burst_is_coalesced_into_one_frame(self) -> None:
+        """Changes within the minimum frame interval are rendered together."""
+
+        async def run_test() -> None:
+            handler = _QueueHandler(_make_click_counter(), batch_delay=0.2)
+            run_task = asyncio.create_task(handler.run())
+            await asyncio.sleep(0.02)
+            cb_id = handler.click_callback_id()
+
+            handler.post(EventMessage(callback_id=cb_id, args=[]))
+            await asyncio.sleep(0.02)
+            assert len(handler.patch_messages) == 2
+
+            for _ in range(3):
+                handler.post(EventMessage(callback_id=cb_id, args=[]))
+            await asyncio.sleep(0.02)
+            assert len(handler.patch_messages) == 2  # Still inside the frame interval
+
+            await asyncio.sleep(0.3)
+            assert len(handler.patch_messages) == 3
+            last = handler.patch_messages[-1].patches
+            assert [p.props for p in last if isinstance(p, UpdatePatch)] == [{"text": "4"}]
+
+            await _stop(run_task)
+
+        asyncio.run(run_test())
+
+    def test_marks_from_other_threads_wake_the_loop(self) -> None:
+        """DirtyTracker.mark from a worker thread wakes the loop thread-safely."""
+
+        async def run_test() -> None:
+            handler = _QueueHandler(_make_click_counter(), batch_delay=5.0)
+            run_task = asyncio.create_task(handler.run())
+            await asyncio.sleep(0.02)
+            assert handler.session is not None
+            session = handler.session
+
+            await asyncio.to_thread(session.dirty.mark, session.root_element_id)
+            await asyncio.sleep(0.05)
+            assert not session.dirty.has_dirty()
+            assert session.render_count == 2
+
+            await _stop(run_task)
+
+        asyncio.run(run_test())
+
+    def test_slice_budget_renders_in_slices(self) -> None:
+        """With render_slice_budget set, the loop renders via render_sliced()."""
+
+        async def run_test() -> None:
+            handler = _QueueHandler(_make_click_counter(), batch_delay=0.01, render_slice_budget=0)
+            run_task = asyncio.create_task(handler.run())
+            await asyncio.sleep(0.02)
+            assert handler.session is not None
+
+            handler.post(EventMessage(callback_id=handler.click_callback_id(), args=[]))
+            await asyncio.sleep(0.05)
+            assert len(handler.patch_messages) == 2
+            assert handler.session.stats.slices_yielded == 1
+
+            await _stop(run_task)
+
+        asyncio.run(run_test())
+
+    def test_callback_waits_for_sliced_render(self) -> None:
+        """A callback arriving between slices runs only once the pass is done."""
+        state = _ClickState()
+        sessions: list[RenderSession] = []
+        probe_rendering: list[bool] = []
+        # (handler, event) to post from inside the sliced pass
+        pending_probe: list[tuple[_QueueHandler, EventMessage]] = []
+
+        def probe() -> None:
+            probe_rendering.append(sessions[0].is_rendering())
+
+        @component
+        def Item(index: int) -> None:
+            if index == 0 and pending_probe:
+                # Reaches the handler while the pass yields between items
+                handler, event = pending_probe.pop()
+                handler.post(event)
+            Label(text=f"{index}: {state.count}")
+
+        @component
+        def App() -> None:
+            def increment() -> None:
+                state.count += 1
+
+            # Reads no state, so each Item is re-rendered as its own slice
+            Label(text="items")
+            Button(text="+", on_click=increment)
+            Button(text="?", on_click=probe)
+            for index in range(20):
+                Item(index=index)
+
+        async def run_test() -> None:
+            handler = _QueueHandler(App, batch_delay=0.01, render_slice_budget=0)
+            run_task = asyncio.create_task(handler.run())
+            await asyncio.sleep(0.02)
+            assert handler.session is not None
+            sessions.append(handler.session)
+            tree = handler.patch_messages[0].patches[0].element
+            probe_button = get_button_element(find_app_children(tree)[2])
+            probe_id = probe_button["props"]["on_click"]["__callback__"]
+            pending_probe.append((handler, EventMessage(callback_id=probe_id, args=[])))
+
+            handler.post(EventMessage(callback_id=handler.click_callback_id(), args=[]))
+            await asyncio.sleep(0.05)
+            assert handler.session.stats.slices_yielded > 1
+            assert probe_rendering == [False]
+
+            await _stop(run_task)
+
+        asyncio.run(run_test())
+
+
+class TestPatchFlowControl:
+    """Clients that acknowledge patches get merged frames while behind."""
+
+    def test_patches_are_unnumbered_without_acks(self) -> None:
+        async def run_test() -> None:
+            handler = _QueueHandler(_make_click_counter(), batch_delay=0.01)
+            run_task = asyncio.create_task(handler.run())
+            await asyncio.sleep(0.02)
+
+            handler.post(EventMessage(callback_id=handler.click_callback_id(), args=[]))
+            await asyncio.sleep(0.05)
+            assert [m.seq for m in handler.patch_messages] == [None, None]
+
+            await _stop(run_task)
+
+        asyncio.run(run_test())
+
+    def test_frames_merge_while_client_is_behind(self) -> None:
+        async def run_test() -> None:
+            handler = _QueueHandler(
+                _make_click_counter(), batch_delay=0.01, patch_acks=True, max_unacked_patches=1
+            )
+            run_task = asyncio.create_task(handler.run())
+            await asyncio.sleep(0.02)
+            assert [m.seq for m in handler.patch_messages] == [1]
+            cb_id = handler.click_callback_id()
+
+            # Initial render unacknowledged: frames render but are held
+            for _ in range(3):
+                handler.post(EventMessage(callback_id=cb_id, args=[]))
+                await asyncio.sleep(0.03)
+            assert handler.session is not None
+            assert handler.session.render_count == 4
+            assert len(handler.patch_messages) == 1
+
+            handler.post(AckMessage(seq=1))
+            await asyncio.sleep(0.03)
+            assert [m.seq for m in handler.patch_messages] == [1, 2]
+            merged = handler.patch_messages[-1].patches
+            assert [p.props for p in merged if isinstance(p, UpdatePatch)] == [{"text": "3"}]
+
+            # Caught up again: the next frame goes out on its own
+            handler.post(AckMessage(seq=2))
+            handler.post(EventMessage(callback_id=cb_id, args=[]))
+            await asyncio.sleep(0.03)
+            assert [m.seq for m in handler.patch_messages] == [1, 2, 3]
+
+            await _stop(run_task)
+
+        asyncio.run(run_test())
+
+
+@dataclass(kw_only=True)
+class _SliderState(Stateful):
+    value: float = 0
+    applied: list[float] = field(default_factory=list)
+    submitted: list[float] = field(default_factory=list)
+
+
+def _make_slider(*, every: bool = False) -> tuple[CompositionComponent, _SliderState]:
+    state = _SliderState()
+
+    @component
+    def Form() -> None:
+        def set_value(value: float) -> None:
+            state.applied.append(value)
+            state.value = value
+
+        def submit() -> None:
+            state.submitted.append(state.value)
+
+        on_change = every_event(set_value) if every else set_value
+        Slider(value=callback(state.value, on_change))
+        Button(text="Submit", on_click=submit)
+
+    return Form, state
+
+
+class TestEventMerging:
+    """Of a burst of input events for one binding, only the latest is applied."""
+
+    async def _start(self, handler: _QueueHandler) -> tuple[asyncio.Task[None], int, int]:
+        run_task = asyncio.create_task(handler.run())
+        await asyncio.sleep(0.02)
+        slider, button = find_app_children(handler.patch_messages[0].patches[0].element)
+        value_id = slider["props"]["value"]["__mutable__"]
+        submit_id = get_button_element(button)["props"]["on_click"]["__callback__"]
+        return run_task, value_id, submit_id
+
+    def test_burst_applies_latest_value(self) -> None:
+        async def run_test() -> None:
+            root, state = _make_slider()
+            handler = _QueueHandler(root, batch_delay=0.01)
+            run_task, value_id, _ = await self._start(handler)
+
+            for version, value in enumerate([10, 20, 30, 40], start=1):
+                handler.post(EventMessage(callback_id=value_id, args=[value, version]))
+            await asyncio.sleep(0.05)
+            assert state.applied == [40]
+            assert handler._received.merged == 3
+
+            await _stop(run_task)
+
+        asyncio.run(run_test())
+
+    def test_every_event_opts_out(self) -> None:
+        async def run_test() -> None:
+            root, state = _make_slider(every=True)
+            handler = _QueueHandler(root, batch_delay=0.01)
+            run_task, value_id, _ = await self._start(handler)
+
+            for version, value in enumerate([10, 20, 30], start=1):
+                handler.post(EventMessage(callback_id=value_id, args=[value, version]))
+            await asyncio.sleep(0.05)
+            assert state.applied == [10, 20, 30]
+
+            await _stop(run_task)
+
+        asyncio.run(run_test())
+
+    def test_other_events_keep_their_place(self) -> None:
+        """A click sees the value set before it, not one set after."""
+
+        async def run_test() -> None:
+            root, state = _make_slider()
+            handler = _QueueHandler(root, batch_delay=0.01)
+            run_task, value_id, submit_id = await self._start(handler)
+
+            handler.post(EventMessage(callback_id=value_id, args=[10, 1]))
+            handler.post(EventMessage(callback_id=value_id, args=[20, 2]))
+            handler.post(EventMessage(callback_id=submit_id, args=[]))
+            handler.post(EventMessage(callback_id=value_id, args=[30, 3]))
+            handler.post(EventMessage(callback_id=submit_id, args=[]))
+            await asyncio.sleep(0.05)
+            assert state.applied == [20, 30]
+            assert state.submitted == [20, 30]
+
+            await _stop(run_task)
+
+        asyncio.run(run_test())
+
+    def test_events_are_not_merged_during_a_render(self) -> None:
+        """An event taken while a render holds the gate is handled on its own."""
+
+        async def run_test() -> None:
+            root, state = _make_slider()
+            handler = _QueueHandler(root, batch_delay=0.01)
+            run_task, value_id, _ = await self._start(handler)
+
+            async with handler._render_gate:
+                for version, value in enumerate([10, 20, 30], start=1):
+                    handler.post(EventMessage(callback_id=value_id, args=[value, version]))
+                await asyncio.sleep(0.02)
+            await asyncio.sleep(0.05)
+            assert state.applied == [10, 30]
+
+            await _stop(run_task)
+
+        asyncio.run(run_test())
+
+
+class _Drop(Message, tag="test_drop"):
+    """Makes _ResumableHandler's transport report a dropped connection."""
+
+
+class _ResumableHandler(_QueueHandler):
+    """Acknowledging handler whose session is parked when the client drops."""
+
+    def __init__(self, root: Component) -> None:
+        super().__init__(root, batch_delay=0.01, patch_acks=True)
+        self.parked = False
+
+    async def receive_message(self) -> Message:
+        msg = await super().receive_message()
+        if isinstance(msg, _Drop):
+            raise SessionDisconnected()
+        return msg
+
+    def park_session(self) -> bool:
+        self.parked = True
+        return True
+
+    def resume_hello(self, last_seq: int) -> HelloMessage:
+        return HelloMessage(
+            client_id="test", patch_acks=True, session_id=self.session_id, last_seq=last_seq
+        )
+
+
+class TestSessionResume:
+    """A parked handler resumes its session for a reconnecting client."""
+
+    async def _drop_after_unacked_click(self, handler: _ResumableHandler) -> None:
+        """Run until seq 2 is sent but unacknowledged, then drop the connection."""
+        run_task = asyncio.create_task(handler.run())
+        await asyncio.sleep(0.02)
+        handler.post(AckMessage(seq=1))
+        handler.post(EventMessage(callback_id=handler.click_callback_id(), args=[]))
+        await asyncio.sleep(0.03)
+        assert [m.seq for m in handler.patch_messages] == [1, 2]
+
+        handler.post(_Drop())
+        await asyncio.wait_for(run_task, timeout=1.0)
+        assert handler.parked
+        assert handler.session is not None
+        assert not handler.session._shutting_down
+
+    def test_missed_patches_are_replayed(self) -> None:
+        async def run_test() -> None:
+            handler = _ResumableHandler(_make_click_counter())
+            await self._drop_after_unacked_click(handler)
+            cb_id = handler.click_callback_id()
+            missed = handler.patch_messages[1]
+            render_count = handler.session.render_count
+            handler.sent.clear()
+
+            run_task = asyncio.create_task(handler.run(handler.resume_hello(last_seq=1)))
+            await asyncio.sleep(0.02)
+            response = handler.sent[0]
+            assert isinstance(response, HelloResponseMessage)
+            assert response.resumed
+            assert handler.patch_messages == [missed]
+            assert handler.session.render_count == render_count
+
+            # State and callbacks carry over
+            handler.post(AckMessage(seq=2))
+            handler.post(EventMessage(callback_id=cb_id, args=[]))
+            await asyncio.sleep(0.03)
+            last = handler.patch_messages[-1]
+            assert last.seq == 3
+            assert [p.props for p in last.patches if isinstance(p, UpdatePatch)] == [{"text": "2"}]
+
+            await _stop(run_task)
+
+        asyncio.run(run_test())
+
+    def test_unknown_position_gets_a_snapshot(self) -> None:
+        async def run_test() -> None:
+            handler = _ResumableHandler(_make_click_counter())
+            await self._drop_after_unacked_click(handler)
+            handler.sent.clear()
+
+            # Seq 1 was acknowledged, so a client claiming seq 0 cannot be replayed to
+            run_task = asyncio.create_task(handler.run(handler.resume_hello(last_seq=0)))
+            await asyncio.sleep(0.02)
+            [snapshot] = handler.patch_messages
+            assert snapshot.seq == 3
+            [patch] = snapshot.patches
+            assert isinstance(patch, AddPatch)
+            assert patch.parent_id is None
+            label = find_app_children(patch.element)[0]
+            assert label["props"]["text"] == "1"
+
+            await _stop(run_task)
+
+        asyncio.run(run_test())
+
+
+class TestOffLoopRendering:
+    """render_executor moves render + serialization onto a worker thread."""
+
+    def test_render_runs_on_worker_and_loop_stays_responsive(self) -> None:
+        """The loop keeps running while a slow render executes on the executor."""
+        render_threads: list[str] = []
+        mount_threads: list[str] = []
+
+        @dataclass(kw_only=True)
+        class Slow(Stateful):
+            count: int = 0
+
+        @dataclass(kw_only=True)
+        class Mounted(Stateful):
+            def on_mount(self) -> None:
+                mount_threads.append(threading.current_thread().name)
+
+        state = Slow()
+
+        @component
+        def Extra() -> None:
+            Mounted()
+
+        @component
+        def App() -> None:
+            render_threads.append(threading.current_thread().name)
+            if state.count:
+                time.sleep(0.1)  # Releases the GIL, like NumPy-heavy work
+                Extra()
+
+            def increment() -> None:
+                state.count += 1
+
+            Label(text=str(state.count))
+            Button(text="+", on_click=increment)
+
+        async def run_test() -> None:
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="render") as executor:
+                handler = _QueueHandler(App, batch_delay=0.01, render_executor=executor)
+                run_task = asyncio.create_task(handler.run())
+                await asyncio.sleep(0.02)
+
+                handler.post(EventMessage(callback_id=handler.click_callback_id(), args=[]))
+                ticks = 0
+                while len(handler.patch_messages) < 2 and ticks < 1000:
+                    ticks += 1
+                    await asyncio.sleep(0.001)
+
+                assert len(handler.patch_messages) == 2
+                assert ticks > 10  # The loop was not blocked for the whole render
+                await _stop(run_task)
+
+        asyncio.run(run_test())
+
+        main = threading.main_thread().name
+        assert render_threads[0] == main  # Initial render stays on the loop
+        assert render_threads[-1].startswith("render")
+        assert mount_threads == [main]  # Hooks run back on the loop thread
+
+    def test_load_in_off_loop_render(self) -> None:
+        """load() started by a render on the worker runs its request on the loop."""
+        request_threads: list[str] = []
+
+        async def fetch(count: int) -> str:
+            request_threads.append(threading.current_thread().name)
+            return f"loaded {count}"
+
+        @component
+        def Loaded(count: int) -> None:
+            result = load(fetch, count)
+            Label(text=result.value if isinstance(result, Ready) else "loading")
+
+        state = _ClickState()
+
+        @component
+        def App() -> None:
+            def increment() -> None:
+                state.count += 1
+
+            Label(text=str(state.count))
+            Button(text="+", on_click=increment)
+            if state.count:
+                Loaded(count=state.count)
+
+        async def run_test() -> None:
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="render") as executor:
+                handler = _QueueHandler(App, batch_delay=0.01, render_executor=executor)
+                run_task = asyncio.create_task(handler.run())
+                await asyncio.sleep(0.02)
+                cb_id = handler.click_callback_id()
+
+                # Mounts the loader, then changes its args on a later render
+                for _ in range(2):
+                    handler.post(EventMessage(callback_id=cb_id, args=[]))
+                    await asyncio.sleep(0.1)
+
+                assert not run_task.done()
+                texts = [
+                    p.props.get("text")
+                    for m in handler.patch_messages[1:]
+                    for p in m.patches
+                    if isinstance(p, UpdatePatch) and p.props
+                ]
+                assert texts[-1] == "loaded 2"
+                assert handler.session is not None
+                assert handler.session.render_count >= 4
+                await _stop(run_task)
+
+        asyncio.run(run_test())
+        assert request_threads == [threading.main_thread().name] * len(request_threads)
+
+    def test_async_callback_releases_lock_while_awaiting(self) -> None:
+        """State set before an await is rendered while the callback waits."""
+        state = _ClickState()
+        released = asyncio.Event()
+
+        @component
+        def App() -> None:
+            async def increment() -> None:
+                state.count += 1
+                await released.wait()
+                state.count += 1
+
+            Label(text=str(state.count))
+            Button(text="+", on_click=increment)
+
+        async def run_test() -> None:
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="render") as executor:
+                handler = _QueueHandler(App, batch_delay=0.01, render_executor=executor)
+                run_task = asyncio.create_task(handler.run())
+                await asyncio.sleep(0.02)
+
+                handler.post(EventMessage(callback_id=handler.click_callback_id(), args=[]))
+                for _ in range(200):
+                    if len(handler.patch_messages) >= 2:
+                        break
+                    await asyncio.sleep(0.001)
+                frames_while_awaiting = len(handler.patch_messages)
+
+                released.set()
+                await asyncio.sleep(0.05)
+                frames_after = len(handler.patch_messages)
+                await _stop(run_task)
+
+            assert frames_while_awaiting == 2  # Sent before the await finished
+            assert frames_after == 3
+
+        asyncio.run(run_test())
+
+    def test_serializes_under_session_lock(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Patches are serialized before the worker releases session.lock."""
+        lock_held: list[bool] = []
+        serialize = handler_module._serialize_patches
+
+        def recording_serialize(patches: list[tp.Any], session: RenderSession) -> list[tp.Any]:
+            lock_held.append(session.lock._is_owned())  # type: ignore[attr-defined]
+            return serialize(patches, session)
+
+        monkeypatch.setattr(handler_module, "_serialize_patches", recording_serialize)
+
+        async def run_test() -> None:
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="render") as executor:
+                handler = _QueueHandler(
+                    _make_click_counter(), batch_delay=0.01, render_executor=executor
+                )
+                run_task = asyncio.create_task(handler.run())
+                await asyncio.sleep(0.02)
+
+                handler.post(EventMessage(callback_id=handler.click_callback_id(), args=[]))
+                await asyncio.sleep(0.05)
+                assert len(handler.patch_messages) == 2
+                await _stop(run_task)
+
+        asyncio.run(run_test())
+        assert lock_held[1:] == [True]  # The initial render stays on the loop
+
+    def test_create_render_executor(self) -> None:
+        assert create_render_executor(0) is None
+        executor = create_render_executor(2)
+        assert isinstance(executor, ThreadPoolExecutor)
+        assert executor._max_workers == 2
+        executor.shutdown()
+
+    def test_slice_budget_and_executor_are_exclusive(self) -> None:
+        with (
+            ThreadPoolExecutor(max_workers=1) as executor,
+            pytest.raises(ValueError, match="mutually exclusive"),
+        ):
+            _QueueHandler(
+                _make_click_counter(),
+                batch_delay=0.01,
+                render_slice_budget=0.01,
+                render_executor=executor,
+            )
+
+
 class TestPatchComputation:
     """Tests for patch computation edge cases."""
 
@@ -0,0 +1,168 @@
+"""Tests for time-sliced rendering via render_sliced()."""
+
+from __future__ import annotations
+
+import asyncio
+import typing as tp
+from dataclasses import dataclass
+
+from tests.conftest import PatchCapture
+from trellis.core.components.composition import component
+from trellis.core.rendering.patches import RenderAddPatch, RenderRemovePatch, RenderUpdatePatch
+from trellis.core.rendering.render import render_sliced
+from trellis.core.state.stateful import Stateful
+from trellis.widgets import Label
+
+WIDTH = 20
+
+
+@dataclass(kw_only=True)
+class CellState(Stateful):
+    value: int = 0
+
+
+def _make_grid(cells: list[CellState]) -> tp.Callable[..., None]:
+    @component
+    def Cell(index: int) -> None:
+        Label(text=f"{index}:{cells[index].value}")
+
+    @component
+    def Grid() -> None:
+        for i in range(WIDTH):
+            Cell(index=i, key=str(i))
+
+    return Grid
+
+
+class TestRenderSliced:
+    def test_yields_between_dirty_elements(self, capture_patches: type[PatchCapture]) -> None:
+        """With a zero budget, every dirty element gets its own slice."""
+        cells = [CellState() for _ in range(WIDTH)]
+        capture = capture_patches(_make_grid(cells))
+        capture.render()
+        session = capture.session
+
+        for cell in cells:
+            cell.value += 1
+
+        ticks: list[int] = []
+
+        async def ticker() -> None:
+            while True:
+                ticks.append(len(session.dirty))
+                await asyncio.sleep(0)
+
+        async def run() -> list:
+            task = asyncio.create_task(ticker())
+            await asyncio.sleep(0)
+            try:
+                return await render_sliced(session, slice_budget=0)
+            finally:
+                task.cancel()
+
+        patches = asyncio.run(run())
+
+        # Other tasks ran while the pass was in progress
+        assert any(0 < remaining < WIDTH for remaining in ticks)
+        assert session.stats.slices_yielded == WIDTH
+        assert not session.dirty.has_dirty()
+
+        texts = sorted(
+            p.props["text"] for p in patches if isinstance(p, RenderUpdatePatch) and p.props
+        )
+        assert texts == sorted(f"{i}:1" for i in range(WIDTH))
+
+    def test_matches_synchronous_render(self, capture_patches: type[PatchCapture]) -> None:
+        """A sliced pass produces the same patches, in the same order, as render()."""
+
+        @dataclass(kw_only=True)
+        class ListState(Stateful):
+            items: list[int]
+
+        def make_app(state: ListState) -> tp.Callable[..., None]:
+            @component
+            def App() -> None:
+                for item in state.items:
+                    Label(text=str(item), key=str(item))
+
+            return App
+
+        def describe(patches: list) -> list[tuple]:
+            result = []
+            for p in patches:
+                if isinstance(p, RenderAddPatch):
+                    result.append(("add", p.element.props.get("text")))
+                elif isinstance(p, RenderUpdatePatch):
+                    result.append(("update", p.props, p.children is not None))
+                elif isinstance(p, RenderRemovePatch):
+                    result.append(("remove",))
+            return result
+
+        sync_state = ListState(items=[1, 2, 3, 4])
+        sync = capture_patches(make_app(sync_state))
+        sync.render()
+        sync_state.items = [4, 5, 1, 3]
+        expected = describe(sync.render())
+
+        sliced_state = ListState(items=[1, 2, 3, 4])
+        sliced = capture_patches(make_app(sliced_state))
+        sliced.render()
+        sliced_state.items = [4, 5, 1, 3]
+        actual = describe(asyncio.run(render_sliced(sliced.session, slice_budget=0)))
+
+        assert actual == expected
+
+    def test_hooks_run_after_the_whole_pass(self, capture_patches: type[PatchCapture]) -> None:
+        """Mount/unmount hooks fire once the pass completes, never mid-pass."""
+        events: list[str] = []
+
+        @dataclass(kw_only=True)
+        class Toggle(Stateful):
+            on: bool = False
+
+        @dataclass(kw_only=True)
+        class Tracked(Stateful):
+            name: str
+
+            def on_mount(self) -> None:
+                events.append(f"mount {self.name}")
+
+            def on_unmount(self) -> None:
+                events.append(f"unmount {self.name}")
+
+        toggles = [Toggle(on=i % 2 == 0) for i in range(4)]
+
+        @component
+        def Child(name: str) -> None:
+            Tracked(name=name)
+
+        @component
+        def Slot(index: int) -> None:
+            if toggles[index].on:
+                Child(name=str(index))
+
+        @component
+        def App() -> None:
+            for i in range(4):
+                Slot(index=i, key=str(i))
+
+        capture = capture_patches(App)
+        capture.render()
+        assert sorted(events) == ["mount 0", "mount 2"]
+        events.clear()
+
+        for toggle in toggles:
+            toggle.on = not toggle.on
+
+        async def run() -> None:
+            task = asyncio.create_task(render_sliced(capture.session, slice_budget=0))
+            while not task.done():
+                assert events == []
+                await asyncio.sleep(0)
+            await task
+
+        asyncio.run(run())
+
+        # Unmounts are processed before mounts, as with render()
+        assert sorted(events[:2]) == ["unmount 0", "unmount 2"]
+        assert sorted(events[2:]) == ["mount 1", "mount 3"]
@@ -1,12 +1,19 @@
 """Tests for Element tree serialization."""
 
+import array
 import typing as tp
+from dataclasses import dataclass
+
+import msgspec
 
 import trellis.html as h
 from trellis.core.components.composition import component
 from trellis.core.components.react import react
-from trellis.platforms.common.serialization import parse_callback_id, serialize_element
+from trellis.core.rendering.patches import RenderRemovePatch
+from trellis.core.state.stateful import Stateful
+from trellis.platforms.common.serialization import get_prop_serializer, serialize_element
 from trellis.widgets.basic import Button
+from trellis.widgets.charts import TimeSeriesChart
 
 
 class TestSerializeNode:
@@ -23,9 +30,10 @@ class TestSerializeNode:
 
         assert result.tree["type"] == "CompositionComponent"  # React component type
         assert result.tree["name"] == "Simple"  # Python component name
-        # Nodes have position-based IDs with component identity: /@{id}
-        assert result.tree["key"] is not None
-        assert result.tree["key"].startswith("/@")  # Position-based IDs start with "/@"
+        # Nodes are keyed on the wire by the integer handle of their position-based ID
+        assert isinstance(result.tree["key"], int)
+        assert result.session.ids.resolve(result.tree["key"]) == result.root_element.id
+        assert result.root_element.id.startswith("/@")  # Root position IDs start with "/@"
         assert result.tree["props"] == {}
         assert result.tree["children"] == []
 
@@ -68,8 +76,8 @@ class TestSerializeNode:
         child_serialized = serialize_element(child, result.session)
 
         # Position-based IDs include user key with :key@ prefix
-        # Format: /{parent_path}/:my-key@{component_id}
-        assert ":my-key@" in child_serialized["key"]
+        # Format: {parent_handle}/:my-key@{component_id}
+        assert ":my-key@" in result.session.ids.resolve(child_serialized["key"])
 
     def test_serialize_nested_children(self, rendered) -> None:
         """Nested nodes serialize with children inline."""
@@ -127,10 +135,11 @@ class TestSerializeNode:
         cb_id = button_serialized["props"]["on_click"]["__callback__"]
 
         # Should be able to look up and invoke the callback
-        # parse_callback_id returns (node_id, prop_name)
-        node_id, prop_name = parse_callback_id(cb_id)
-        callback = result.session.get_callback(node_id, prop_name)
-        assert callback is not None
+        resolved = result.session.resolve_callback(cb_id)
+        assert resolved is not None
+        element_id, prop_name, callback = resolved
+        assert element_id == button_element.id
+        assert prop_name == "on_click"
         callback()
         assert called == [True]
 
@@ -196,10 +205,10 @@ class TestSerializeNode:
         assert "__callback__" in handlers[1]
 
         # Verify callbacks work
-        node_id_0, prop_name_0 = parse_callback_id(handlers[0]["__callback__"])
-        result.session.get_callback(node_id_0, prop_name_0)()
-        node_id_1, prop_name_1 = parse_callback_id(handlers[1]["__callback__"])
-        result.session.get_callback(node_id_1, prop_name_1)()
+        for handler in handlers:
+            resolved = result.session.resolve_callback(handler["__callback__"])
+            assert resolved is not None
+            resolved[2]()
         assert handler1_calls == [1]
         assert handler2_calls == [2]
 
@@ -221,3 +230,168 @@ class TestSerializeNode:
         id_b = child_serialized["props"]["on_mouse_enter"]["__callback__"]
 
         assert id_a != id_b
+
+
+class TestPropSerializer:
+    """Per-component serializers skip callback paths for plain data props."""
+
+    def test_signature_declares_callback_props(self) -> None:
+        """Props annotated with callables or Mutables are known up front."""
+
+        @react("client/TestSignatureProps.tsx")
+        def SignatureProps(
+            *,
+            rows: list[dict[str, int]],
+            on_select: tp.Callable[[int], None],
+        ) -> None:
+            pass
+
+        component = SignatureProps._component  # type: ignore[attr-defined]
+        assert component.callback_props == frozenset({"on_select"})
+        assert get_prop_serializer(component).path_props == {"on_select"}
+
+    def test_plain_data_props_serialize_as_copies(self, rendered) -> None:
+        """Nested lists, tuples and dicts of scalars serialize to plain JSON."""
+        samples = [[0.0, 1.5], (2, 3)]
+        rows = [{"name": "a", "cpu": 1, "tags": ["x", None]}]
+
+        @react("client/TestPlainData.tsx")
+        def PlainData(*, samples: list[list[float]], rows: list[dict[str, tp.Any]]) -> None:
+            pass
+
+        @component
+        def App() -> None:
+            PlainData(samples=samples, rows=rows)
+
+        result = rendered(App)
+
+        child = result.session.elements.get(result.root_element.child_ids[0])
+        props = serialize_element(child, result.session)["props"]
+
+        assert props["samples"] == [[0.0, 1.5], [2, 3]]
+        assert props["rows"] == rows
+        assert props["rows"][0] is not rows[0]
+        assert get_prop_serializer(child.component).path_props == set()
+
+    def test_observed_callback_in_data_prop(self, rendered) -> None:
+        """A callable found in an untyped prop gets a path and is remembered."""
+        calls = []
+
+        @react("client/TestObservedCallbacks.tsx")
+        def ObservedCallbacks(*, columns: list[dict[str, tp.Any]]) -> None:
+            pass
+
+        @component
+        def App() -> None:
+            ObservedCallbacks(columns=[{"label": "a"}, {"label": "b", "render": calls.append}])
+
+        result = rendered(App)
+
+        child = result.session.elements.get(result.root_element.child_ids[0])
+        columns = serialize_element(child, result.session)["props"]["columns"]
+
+        assert columns[0] == {"label": "a"}
+        resolved = result.session.resolve_callback(columns[1]["render"]["__callback__"])
+        assert resolved is not None
+        _, prop_name, callback = resolved
+        assert prop_name == "columns[1].render"
+        callback(1)
+        assert calls == [1]
+        assert get_prop_serializer(child.component).path_props == {"columns"}
+
+    def test_array_props_serialize_as_typed_arrays(self, rendered) -> None:
+        """array.array columns go out as msgpack extensions over their buffers."""
+        timestamps = array.array("d", range(1000))
+        values = array.array("f", [0.5] * 1000)
+
+        @component
+        def App() -> None:
+            TimeSeriesChart(data=[timestamps, values])
+
+        result = rendered(App)
+
+        child = result.session.elements.get(result.root_element.child_ids[0])
+        data = serialize_element(child, result.session)["props"]["data"]
+
+        assert [ext.code for ext in data] == [1, 2]
+        assert data[0].data.obj is timestamps
+        assert len(msgspec.msgpack.encode(data)) < 12 * 1000 + 32
+
+
+class TestCompactElementIds:
+    """Elements are identified by compact integer handles on the wire."""
+
+    def test_ids_do_not_grow_with_depth(self, rendered) -> None:
+        """Position IDs stay short in deep trees because parents are interned."""
+
+        @component
+        def Nest(levels: int) -> None:
+            if levels:
+                Nest(levels=levels - 1)
+
+        @component
+        def App() -> None:
+            Nest(levels=60)
+
+        result = rendered(App)
+
+        ids = list(result.session.elements)
+        assert len(ids) == 62
+        assert max(len(element_id) for element_id in ids) < 50
+
+        # Every key on the wire is an int handle that resolves to a live element
+        node = result.tree
+        while node["children"]:
+            (node,) = node["children"]
+            assert isinstance(node["key"], int)
+            assert result.session.ids.resolve(node["key"]) in result.session.elements
+
+    def test_removed_handles_survive_until_next_render(self, capture_patches) -> None:
+        """A removed element's handle resolves for its RemovePatch, then is dropped."""
+
+        @dataclass(kw_only=True)
+        class Toggle(Stateful):
+            show: bool = True
+
+        toggle = Toggle()
+
+        @component
+        def Child() -> None:
+            pass
+
+        @component
+        def App() -> None:
+            if toggle.show:
+                Child()
+
+        capture = capture_patches(App)
+        capture.render()
+        child_id = capture.session.root_element.child_ids[0]
+        # Leaf elements get a handle when serialized for the wire
+        handle = capture.session.ids.intern(child_id)
+
+        toggle.show = False
+        patches = capture.render_dirty()
+        assert any(isinstance(p, RenderRemovePatch) for p in patches)
+        assert capture.session.ids.resolve(handle) == child_id
+
+        capture.render_dirty()
+        assert capture.session.ids.resolve(handle) is None
+
+    def test_callback_handles_are_stable_integers(self, rendered) -> None:
+        """Callbacks serialize to integer handles that survive re-serialization."""
+
+        @component
+        def App() -> None:
+            with h.Div(on_click=lambda: None):
+                pass
+
+        result = rendered(App)
+
+        child = result.session.elements.get(result.root_element.child_ids[0])
+        first = serialize_element(child, result.session)["props"]["on_click"]["__callback__"]
+        second = serialize_element(child, result.session)["props"]["on_click"]["__callback__"]
+
+        assert isinstance(first, int)
+        assert first == second
+        assert len(result.session.callbacks) == 1
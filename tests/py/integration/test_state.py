@@ -1,7 +1,6 @@
 """Tests for trellis.core.state module."""
 
 import asyncio
-import gc
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -43,10 +42,8 @@ class TestStateful:
         result = rendered(MyComponent)
 
         # INTERNAL TEST: Verify dependency tracking internals - no public API to inspect watchers
-        state_info = state._state_props["text"]
-        assert len(state_info.watchers) == 1
-        # Keep result alive to prevent GC of Element
-        assert result.root_element is not None
+        watchers = result.session.dependencies.watchers(state, "text")
+        assert watchers == [result.root_element]
 
     def test_stateful_marks_dirty_on_change(self, capture_patches: "type[PatchCapture]") -> None:
         """Changing state marks dependent elements as dirty."""
@@ -393,11 +390,11 @@ class TestStateDependencyTracking:
     """Tests for state dependency tracking internals.
 
     INTERNAL TEST: These tests verify the internal dependency tracking mechanism
-    (_state_props, watchers WeakSet, _session_ref) which has no public API.
+    (the session's DependencyIndex, _session_ref) which has no public API.
     """
 
-    def test_watchers_weakset_populated(self, rendered: "type[RenderResult]") -> None:
-        """Accessing state property populates watchers WeakSet."""
+    def test_dependency_index_populated(self, rendered: "type[RenderResult]") -> None:
+        """Accessing state property records the reader in the dependency index."""
 
         @dataclass(kw_only=True)
         class MyState(Stateful):
@@ -412,11 +409,10 @@ class TestStateDependencyTracking:
 
         result = rendered(Consumer)
 
-        # Check that node was recorded in state deps
-        assert "value" in state._state_props
-        deps = state._state_props["value"]
-        # WeakSet contains the Element
-        watchers_list = list(deps.watchers)
+        # Check that node was recorded in the session's index
+        deps = result.session.dependencies
+        assert deps.keys(state) == ["value"]
+        watchers_list = deps.watchers(state, "value")
         assert len(watchers_list) == 1
         assert watchers_list[0].id == result.root_element.id
 
@@ -465,8 +461,8 @@ class TestStateDependencyTracking:
         child_id = result.root_element.child_ids[0]
 
         # Both nodes should be tracked
-        deps = state._state_props["value"]
-        watcher_ids = {node.id for node in deps.watchers}
+        deps = result.session.dependencies
+        watcher_ids = {node.id for node in deps.watchers(state, "value")}
         assert parent_id in watcher_ids
         assert child_id in watcher_ids
         assert len(watcher_ids) == 2
@@ -529,7 +525,7 @@ class TestStateDependencyTracking:
         node_id = ctx.root_element.id
 
         # Verify dependency exists
-        watcher_ids = {node.id for node in state._state_props["value"].watchers}
+        watcher_ids = {node.id for node in ctx.dependencies.watchers(state, "value")}
         assert node_id in watcher_ids
 
         # Re-render
@@ -537,7 +533,7 @@ class TestStateDependencyTracking:
         capture.render()
 
         # Dependency should still exist (may be a different node object but same id)
-        watcher_ids = {node.id for node in state._state_props["value"].watchers}
+        watcher_ids = {node.id for node in ctx.dependencies.watchers(state, "value")}
         assert node_id in watcher_ids
 
     def test_multiple_properties_tracked_independently(
@@ -571,19 +567,18 @@ class TestStateDependencyTracking:
         count_id = result.root_element.child_ids[1]
 
         # Check name deps
-        name_deps = state._state_props["name"]
-        name_watcher_ids = {node.id for node in name_deps.watchers}
+        deps = result.session.dependencies
+        name_watcher_ids = {node.id for node in deps.watchers(state, "name")}
         assert name_id in name_watcher_ids
         assert count_id not in name_watcher_ids
 
         # Check count deps
-        count_deps = state._state_props["count"]
-        count_watcher_ids = {node.id for node in count_deps.watchers}
+        count_watcher_ids = {node.id for node in deps.watchers(state, "count")}
         assert count_id in count_watcher_ids
         assert name_id not in count_watcher_ids
 
     def test_dependency_cleanup_on_unmount(self, capture_patches: "type[PatchCapture]") -> None:
-        """Dependencies are cleaned up when component is unmounted (via WeakSet GC)."""
+        """Dependencies are dropped when component is unmounted."""
 
         @dataclass(kw_only=True)
         class MyState(Stateful):
@@ -609,7 +604,7 @@ class TestStateDependencyTracking:
         consumer_id = ctx.root_element.child_ids[0]
 
         # Verify consumer is tracking state
-        watcher_ids = {node.id for node in state._state_props["value"].watchers}
+        watcher_ids = {node.id for node in ctx.dependencies.watchers(state, "value")}
         assert consumer_id in watcher_ids
 
         # Unmount Consumer by removing it
@@ -617,18 +612,15 @@ class TestStateDependencyTracking:
         ctx.dirty.mark(ctx.root_element.id)
         capture.render()
 
-        # Force garbage collection to clean up WeakSet
-        gc.collect()
-
-        # Consumer's dependency should be cleaned up (WeakSet auto-removes dead refs)
-        watcher_ids = {node.id for node in state._state_props["value"].watchers}
+        # Consumer's dependency should be dropped with the element
+        watcher_ids = {node.id for node in ctx.dependencies.watchers(state, "value")}
         assert consumer_id not in watcher_ids
 
     def test_dependency_cleanup_on_rerender_without_read(self) -> None:
-        """Dependencies are cleaned up when component stops reading state (via WeakSet GC).
+        """Dependencies are invalidated when component stops reading state.
 
         NOTE: This test uses RenderSession directly because it's testing internal
-        WeakSet GC behavior that's sensitive to reference retention patterns.
+        dependency index behavior.
         """
 
         @dataclass(kw_only=True)
@@ -650,7 +642,7 @@ class TestStateDependencyTracking:
         node_id = ctx.root_element.id
 
         # Initially tracking
-        watcher_ids = {node.id for node in state._state_props["value"].watchers}
+        watcher_ids = {node.id for node in ctx.dependencies.watchers(state, "value")}
         assert node_id in watcher_ids
 
         # Stop reading state and re-render
@@ -658,14 +650,11 @@ class TestStateDependencyTracking:
         ctx.dirty.mark(node_id)
         render(ctx)
 
-        # Force garbage collection
-        gc.collect()
-
-        # The old node is replaced by a new one that doesn't read state
-        # WeakSet should no longer contain the old node (GC'd), and new node
-        # doesn't register because it doesn't read state.value
-        watcher_ids = {node.id for node in state._state_props["value"].watchers}
+        # Re-executing bumped the element's generation, so the edge from the
+        # previous execution is stale, and the new execution didn't read state.value
+        watcher_ids = {node.id for node in ctx.dependencies.watchers(state, "value")}
         assert node_id not in watcher_ids
+        assert ctx.dependencies.stale_count == 1
 
 
 class TestLifecycleHooksWithContext:
@@ -938,10 +927,9 @@ class TestAttributeTracking:
 
         result = rendered(MyComponent)
 
-        # INTERNAL TEST: annotated attribute should be tracked
-        assert "annotated" in state._state_props
-        # Non-annotated attribute should NOT be tracked
-        assert "unannotated" not in state._state_props
+        # INTERNAL TEST: annotated attribute should be tracked,
+        # non-annotated attribute should NOT be tracked
+        assert result.session.dependencies.keys(state) == ["annotated"]
         assert result.root_element is not None
 
     def test_private_annotated_attributes_not_tracked(self, rendered: "type[RenderResult]") -> None:
@@ -960,11 +948,10 @@ class TestAttributeTracking:
 
         result = rendered(MyComponent)
 
-        assert not hasattr(state, "_state_props")
-        assert result.root_element is not None
+        assert result.session.dependencies.keys(state) == []
 
     def test_stateful_internal_attrs_not_tracked(self, rendered: "type[RenderResult]") -> None:
-        """Internal Stateful attributes (_state_props, _initialized) are NOT tracked."""
+        """Internal Stateful attributes (_initialized, _input_versions) are NOT tracked."""
 
         @dataclass(kw_only=True)
         class MyState(Stateful):
@@ -978,12 +965,9 @@ class TestAttributeTracking:
             _ = state.value
             # These are internal Stateful attrs, not tracked
             _ = state._initialized
-            _ = state._state_props
+            _ = state._input_versions
 
         result = rendered(MyComponent)
 
         # INTERNAL TEST: only user-defined annotated attrs should be tracked
-        assert "value" in state._state_props
-        assert "_initialized" not in state._state_props
-        assert "_state_props" not in state._state_props
-        assert result.root_element is not None
+        assert result.session.dependencies.keys(state) == ["value"]
@@ -11,17 +11,15 @@ from trellis import widgets as w
 from trellis.core.rendering.render import render
 from trellis.core.rendering.session import RenderSession, set_render_session
 from trellis.core.state import state_var as core_state_var
-from trellis.platforms.common.serialization import parse_callback_id
 
 if TYPE_CHECKING:
     from tests.conftest import PatchCapture
 
 
-def _get_callback(session: RenderSession, callback_id: str):
-    element_id, prop_name = parse_callback_id(callback_id)
-    callback = session.get_callback(element_id, prop_name)
-    assert callback is not None
-    return callback
+def _get_callback(session: RenderSession, callback_id: int):
+    resolved = session.resolve_callback(callback_id)
+    assert resolved is not None
+    return resolved[2]
 
 
 class TestStateHelper:
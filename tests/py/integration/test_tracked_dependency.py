@@ -1,6 +1,5 @@
 """Integration tests for tracked collection dependency tracking and fine-grained reactivity."""
 
-import gc
 from dataclasses import dataclass, field
 
 from tests.conftest import PatchCapture
@@ -12,8 +11,8 @@ from trellis.core.state.tracked import ITER_KEY, TrackedDict, TrackedList
 class TestDependencyTracking:
     """Tests for dependency tracking during render.
 
-    INTERNAL TEST: These tests verify the internal dependency graph (_deps)
-    which has no public API for inspection.
+    INTERNAL TEST: These tests verify the internal dependency graph (the
+    session's DependencyIndex) which has no public API for inspection.
     """
 
     def test_list_getitem_tracks_by_item_identity(
@@ -38,8 +37,8 @@ class TestDependencyTracking:
         # Check that dependency was registered for id("b")
         tracked_list = state.items
         item_b = list.__getitem__(tracked_list, 1)
-        assert id(item_b) in tracked_list._deps
-        assert capture.session.root_element in tracked_list._deps[id(item_b)]
+        deps = capture.session.dependencies
+        assert deps.watchers(tracked_list, id(item_b)) == [capture.session.root_element]
 
     def test_list_iteration_tracks_iter_key(self, capture_patches: "type[PatchCapture]") -> None:
         """Iterating over list registers dependency on ITER_KEY."""
@@ -61,8 +60,8 @@ class TestDependencyTracking:
 
         # Check ITER_KEY dependency
         tracked_list = state.items
-        assert ITER_KEY in tracked_list._deps
-        assert capture.session.root_element in tracked_list._deps[ITER_KEY]
+        deps = capture.session.dependencies
+        assert deps.watchers(tracked_list, ITER_KEY) == [capture.session.root_element]
 
     def test_dict_getitem_tracks_by_key(self, capture_patches: "type[PatchCapture]") -> None:
         """Accessing dict[key] registers dependency on that key."""
@@ -83,8 +82,8 @@ class TestDependencyTracking:
 
         # Check dependency on key "x"
         tracked_dict = state.data
-        assert "x" in tracked_dict._deps
-        assert capture.session.root_element in tracked_dict._deps["x"]
+        deps = capture.session.dependencies
+        assert deps.watchers(tracked_dict, "x") == [capture.session.root_element]
 
     def test_set_contains_tracks_by_value(self, capture_patches: "type[PatchCapture]") -> None:
         """item in set registers dependency on the value itself."""
@@ -105,8 +104,8 @@ class TestDependencyTracking:
 
         # Check dependency on the value "python" (not id)
         tracked_set = state.tags
-        assert "python" in tracked_set._deps
-        assert capture.session.root_element in tracked_set._deps["python"]
+        deps = capture.session.dependencies
+        assert deps.watchers(tracked_set, "python") == [capture.session.root_element]
 
     def test_list_sort_marks_iter_dirty(self, capture_patches: "type[PatchCapture]") -> None:
         """Sorting a list marks ITER_KEY dirty."""
@@ -357,8 +356,8 @@ class TestFineGrainedReactivity:
 class TestDependencyCleanup:
     """Tests for dependency cleanup on unmount and re-render.
 
-    INTERNAL TEST: These tests verify the internal dependency graph (_deps)
-    cleanup behavior which has no public API for inspection.
+    INTERNAL TEST: These tests verify the internal dependency graph (the
+    session's DependencyIndex) cleanup behavior which has no public API for inspection.
     """
 
     def test_list_dependency_cleaned_on_unmount(
@@ -394,7 +393,7 @@ class TestDependencyCleanup:
         item_a = list.__getitem__(tracked_list, 0)
 
         # Verify consumer is tracking (check by node ID since object identity may differ)
-        dep_node_ids = {n.id for n in tracked_list._deps[id(item_a)]}
+        dep_node_ids = {n.id for n in ctx.dependencies.watchers(tracked_list, id(item_a))}
         assert consumer_id in dep_node_ids
 
         # Unmount Consumer
@@ -402,13 +401,9 @@ class TestDependencyCleanup:
         ctx.dirty.mark(ctx.root_element.id)
         capture.render()
 
-        # Force GC so WeakSet can remove dead references
-        gc.collect()
-
-        # Dependency should be cleaned up (WeakSet auto-removes dead refs after GC)
-        if id(item_a) in tracked_list._deps:
-            dep_node_ids = {n.id for n in tracked_list._deps[id(item_a)]}
-            assert consumer_id not in dep_node_ids
+        # Dependency should be dropped with the element
+        dep_node_ids = {n.id for n in ctx.dependencies.watchers(tracked_list, id(item_a))}
+        assert consumer_id not in dep_node_ids
 
     def test_dict_dependency_cleaned_on_unmount(
         self, capture_patches: "type[PatchCapture]"
@@ -442,7 +437,7 @@ class TestDependencyCleanup:
         tracked_dict = state.data
 
         # Verify consumer is tracking (check by node ID since object identity may differ)
-        dep_node_ids = {n.id for n in tracked_dict._deps["x"]}
+        dep_node_ids = {n.id for n in ctx.dependencies.watchers(tracked_dict, "x")}
         assert consumer_id in dep_node_ids
 
         # Unmount Consumer
@@ -450,13 +445,9 @@ class TestDependencyCleanup:
         ctx.dirty.mark(ctx.root_element.id)
         capture.render()
 
-        # Force GC so WeakSet can remove dead references
-        gc.collect()
-
-        # Dependency should be cleaned up (WeakSet auto-removes dead refs after GC)
-        if "x" in tracked_dict._deps:
-            dep_node_ids = {n.id for n in tracked_dict._deps["x"]}
-            assert consumer_id not in dep_node_ids
+        # Dependency should be dropped with the element
+        dep_node_ids = {n.id for n in ctx.dependencies.watchers(tracked_dict, "x")}
+        assert consumer_id not in dep_node_ids
 
 
 class TestTrackedWithStatefulItems:
@@ -624,6 +615,129 @@ class TestDeeplyNested:
         assert renders[0] == 2
 
 
+class TestKeyedDiffUpdates:
+    """Tests for TrackedList.reconcile() and TrackedDict.update_diff()."""
+
+    @staticmethod
+    def _render_rows(
+        capture_patches: "type[PatchCapture]", state: Stateful
+    ) -> tuple[PatchCapture, list[int], dict[int, int]]:
+        """Render a table that iterates state.rows into one Row per row."""
+        table_renders = [0]
+        row_renders: dict[int, int] = {}
+
+        @component
+        def Row(row: TrackedDict[str, int]) -> None:
+            row_renders[row["id"]] = row_renders.get(row["id"], 0) + 1
+            _ = row["value"]
+
+        @component
+        def Table() -> None:
+            table_renders[0] += 1
+            for row in state.rows:  # type: ignore[attr-defined]
+                Row(row=row, key=str(row["id"]))
+
+        capture = capture_patches(Table)
+        capture.render()
+        return capture, table_renders, row_renders
+
+    def test_reconcile_rerenders_only_changed_rows(
+        self, capture_patches: "type[PatchCapture]"
+    ) -> None:
+        """Refreshing 2,000 rows where 3 changed re-renders only those 3 rows."""
+
+        @dataclass
+        class MyState(Stateful):
+            rows: list[dict[str, int]] = field(default_factory=list)
+
+        state = MyState()
+        state.rows = [{"id": i, "value": i} for i in range(2000)]
+        capture, table_renders, row_renders = self._render_rows(capture_patches, state)
+
+        fresh = [{"id": i, "value": i} for i in range(2000)]
+        for i in (5, 500, 1999):
+            fresh[i]["value"] = -1
+        state.rows.reconcile(fresh, key=lambda row: row["id"])
+        capture.render()
+
+        assert table_renders[0] == 1
+        assert sorted(i for i, count in row_renders.items() if count == 2) == [5, 500, 1999]
+        assert [row["value"] for row in state.rows][500] == -1
+
+    def test_reconcile_structural_change_marks_iteration(
+        self, capture_patches: "type[PatchCapture]"
+    ) -> None:
+        """Adding, removing or reordering rows re-renders iterating components."""
+
+        @dataclass
+        class MyState(Stateful):
+            rows: list[dict[str, int]] = field(default_factory=list)
+
+        state = MyState()
+        state.rows = [{"id": i, "value": i} for i in range(3)]
+        capture, table_renders, row_renders = self._render_rows(capture_patches, state)
+        first = state.rows[0]
+
+        state.rows.reconcile(
+            [{"id": 2, "value": 2}, {"id": 0, "value": 0}, {"id": 3, "value": 3}],
+            key=lambda row: row["id"],
+        )
+        capture.render()
+
+        assert table_renders[0] == 2
+        assert [row["id"] for row in state.rows] == [2, 0, 3]
+        # Matched rows kept their identity and didn't change, so they were reused
+        assert state.rows[1] is first
+        assert row_renders[0] == 1
+        assert row_renders[3] == 1
+
+    def test_update_diff_marks_only_changed_keys(
+        self, capture_patches: "type[PatchCapture]"
+    ) -> None:
+        """update_diff() skips keys whose value is unchanged."""
+
+        @dataclass
+        class MyState(Stateful):
+            labels: dict[str, str] = field(default_factory=dict)
+
+        state = MyState()
+        state.labels = {"a": "A", "b": "B"}
+        renders = {"a": 0, "b": 0, "keys": 0}
+
+        @component
+        def LabelA() -> None:
+            renders["a"] += 1
+            _ = state.labels["a"]
+
+        @component
+        def LabelB() -> None:
+            renders["b"] += 1
+            _ = state.labels.get("b")
+
+        @component
+        def Keys() -> None:
+            renders["keys"] += 1
+            _ = list(state.labels)
+
+        @component
+        def App() -> None:
+            LabelA()
+            LabelB()
+            Keys()
+
+        capture = capture_patches(App)
+        capture.render()
+
+        state.labels.update_diff({"a": "A", "b": "B2"})
+        capture.render()
+        assert renders == {"a": 1, "b": 2, "keys": 1}
+
+        state.labels.update_diff({"a": "A"}, remove_missing=True)
+        capture.render()
+        assert renders == {"a": 1, "b": 3, "keys": 2}
+        assert dict(state.labels) == {"a": "A"}
+
+
 class TestSetValueTracking:
     """Tests for set value-based tracking (vs id-based)."""
 
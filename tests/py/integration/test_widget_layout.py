@@ -9,7 +9,6 @@ from trellis.core.components.composition import component
 from trellis.core.rendering.session import RenderSession, set_render_session
 from trellis.core.state.mutable import mutable
 from trellis.core.state.stateful import Stateful
-from trellis.platforms.common.serialization import parse_callback_id
 from trellis.widgets import Button, Column, Label, Row, SplitPane
 
 
@@ -151,7 +150,7 @@ class TestLayoutWidgets:
         assert split_prop["value"] == 0.3
 
         # Invoke the callback to simulate a drag
-        node_id, prop_name = parse_callback_id(split_prop["__mutable__"])
-        cb = ctx.get_callback(node_id, prop_name)
-        cb(0.6)
+        resolved = ctx.resolve_callback(split_prop["__mutable__"])
+        assert resolved is not None
+        resolved[2](0.6)
         assert state_ref[0].ratio == 0.6
@@ -49,11 +49,11 @@ class TestDictToMessage:
         """_dict_to_message should parse event messages correctly."""
         msg_dict = {
             "type": "event",
-            "callback_id": "cb_123",
+            "callback_id": 123,
             "args": ["arg1", 42],
         }
         msg = _dict_to_message(msg_dict)
 
         assert isinstance(msg, EventMessage)
-        assert msg.callback_id == "cb_123"
+        assert msg.callback_id == 123
         assert msg.args == ["arg1", 42]
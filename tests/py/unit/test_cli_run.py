@@ -399,6 +399,8 @@ class TestBuildRunKwargs:
         assert kwargs["port"] is None
         assert kwargs["batch_delay"] == pytest.approx(1 / 30)
         assert kwargs["hot_reload"] is True
+        assert kwargs["render_workers"] == 0
+        assert kwargs["render_slice_budget"] == 0.0
         assert "window_title" not in kwargs
 
     def test_desktop_with_explicit_size(self) -> None:
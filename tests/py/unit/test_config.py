@@ -117,6 +117,34 @@ class TestConfigValidation:
         with pytest.raises(ValueError, match="Invalid window size"):
             Config(name="myapp", module="main", window_size="invalid")
 
+    def test_invalid_compression_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unknown compression mode"):
+            Config(name="myapp", module="main", compression="gzip")
+
+    def test_negative_resume_grace_raises(self) -> None:
+        with pytest.raises(ValueError, match="must be non-negative"):
+            Config(name="myapp", module="main", resume_grace=-1.0)
+
+    def test_negative_render_workers_raises(self) -> None:
+        with pytest.raises(ValueError, match="must be non-negative"):
+            Config(name="myapp", module="main", render_workers=-1)
+
+    def test_render_workers_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("TRELLIS_RENDER_WORKERS", "4")
+        assert Config(name="myapp", module="main").render_workers == 4
+
+    def test_negative_render_slice_budget_raises(self) -> None:
+        with pytest.raises(ValueError, match="must be non-negative"):
+            Config(name="myapp", module="main", render_slice_budget=-0.01)
+
+    def test_slice_budget_and_render_workers_are_exclusive(self) -> None:
+        with pytest.raises(ValueError, match="mutually exclusive"):
+            Config(name="myapp", module="main", render_workers=2, render_slice_budget=0.01)
+
+    def test_compression_is_normalized(self) -> None:
+        config = Config(name="myapp", module="main", compression="PerMessage-Deflate")
+        assert config.compression == "permessage-deflate"
+
     def test_invalid_batch_delay_raises(self) -> None:
         with pytest.raises(ValueError, match="batch_delay must be"):
             Config(name="myapp", module="main", batch_delay=0.0001)
@@ -326,6 +354,8 @@ class TestConfigToJson:
             "force_build",
             "watch",
             "batch_delay",
+            "render_workers",
+            "render_slice_budget",
             "hot_reload",
             "routing_mode",
             "debug",
@@ -335,6 +365,9 @@ class TestConfigToJson:
             "library",
             "host",
             "port",
+            "compression",
+            "compression_threshold",
+            "resume_grace",
             "window_size",
             "identifier",
             "version",
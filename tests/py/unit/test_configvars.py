@@ -14,6 +14,8 @@ from trellis.app.configvars import (
     get_config_vars,
     validate_batch_delay,
     validate_debug_categories,
+    validate_non_negative_float,
+    validate_non_negative_int,
     validate_port_or_none,
     validate_positive_float,
     validate_positive_int,
@@ -239,6 +241,30 @@ class TestPositiveFloatValidation:
             validate_positive_float(-0.5)
 
 
+class TestNonNegativeFloatValidation:
+    """Test non-negative float validation."""
+
+    def test_zero_and_positive_pass(self) -> None:
+        assert validate_non_negative_float(0.0) == 0.0
+        assert validate_non_negative_float(30.0) == 30.0
+
+    def test_negative_raises(self) -> None:
+        with pytest.raises(ValueError, match="must be non-negative"):
+            validate_non_negative_float(-1.0)
+
+
+class TestNonNegativeIntValidation:
+    """Test non-negative integer validation."""
+
+    def test_zero_and_positive_pass(self) -> None:
+        assert validate_non_negative_int(0) == 0
+        assert validate_non_negative_int(8) == 8
+
+    def test_negative_raises(self) -> None:
+        with pytest.raises(ValueError, match="must be non-negative"):
+            validate_non_negative_int(-1)
+
+
 class TestDebugCategoriesValidation:
     """Test debug categories validation."""
 
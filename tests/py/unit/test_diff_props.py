@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from unittest.mock import Mock
 
-from trellis.core.rendering.element import _REMOVED, _RemovedType, diff_props
+from trellis.core.rendering.element import _REMOVED, PropOp, PropOps, _RemovedType, diff_props
 from trellis.core.state.mutable import Mutable
 
 
@@ -82,3 +82,89 @@ class TestRemovedSentinel:
 
     def test_repr(self) -> None:
         assert repr(_REMOVED) == "_REMOVED"
+
+
+def _rows(count: int) -> list[dict[str, int]]:
+    return [{"id": i, "value": i * 10} for i in range(count)]
+
+
+class TestNestedDiffProps:
+    def test_not_nested_by_default(self) -> None:
+        old = {"data": _rows(50)}
+        new = {"data": [*old["data"], {"id": 50, "value": 0}]}
+        assert diff_props(old, new) == {"data": new["data"]}
+
+    def test_append(self) -> None:
+        old = {"data": _rows(50)}
+        new = {"data": [*old["data"], {"id": 50, "value": 0}]}
+        result = diff_props(old, new, nested={"data"})
+        assert result == {
+            "data": PropOps((PropOp("append", (), [{"id": 50, "value": 0}], index=50),))
+        }
+
+    def test_changed_field_of_wide_row(self) -> None:
+        def wide_rows() -> list[dict[str, int]]:
+            return [{"id": i, "a": 1, "b": 2, "c": 3, "d": 4} for i in range(50)]
+
+        new_rows = wide_rows()
+        new_rows[7]["c"] = -1
+        result = diff_props({"data": wide_rows()}, {"data": new_rows}, nested={"data"})
+        assert result == {"data": PropOps((PropOp("set", (7, "c"), -1),))}
+
+    def test_changed_narrow_row_is_set_whole(self) -> None:
+        new_rows = _rows(50)
+        new_rows[7]["value"] = -1
+        result = diff_props({"data": _rows(50)}, {"data": new_rows}, nested={"data"})
+        assert result == {"data": PropOps((PropOp("set", (7,), {"id": 7, "value": -1}),))}
+
+    def test_replaced_item_is_set_whole(self) -> None:
+        old = {"data": _rows(50)}
+        new_rows = _rows(50)
+        new_rows[3] = {"other": True}
+        result = diff_props(old, {"data": new_rows}, nested={"data"})
+        assert result == {"data": PropOps((PropOp("set", (3,), {"other": True}),))}
+
+    def test_removed_range_is_spliced(self) -> None:
+        old = {"data": _rows(50)}
+        new = {"data": old["data"][:10] + old["data"][12:]}
+        result = diff_props(old, new, nested={"data"})
+        assert result == {"data": PropOps((PropOp("splice", (), [], index=10, delete=2),))}
+
+    def test_sliding_window_per_series(self) -> None:
+        old = {"data": [list(range(100)), list(range(100))]}
+        new = {"data": [list(range(1, 101)), list(range(1, 101))]}
+        ops = diff_props(old, new, nested={"data"})["data"].ops
+        assert ops == (
+            PropOp("splice", (0,), [], index=0, delete=1),
+            PropOp("append", (0,), [100], index=99),
+            PropOp("splice", (1,), [], index=0, delete=1),
+            PropOp("append", (1,), [100], index=99),
+        )
+
+    def test_dict_keys_set_and_deleted(self) -> None:
+        old = {"data": {f"k{i}": i for i in range(20)}}
+        new_data = dict(old["data"])
+        del new_data["k0"]
+        new_data["k1"] = -1
+        new_data["extra"] = 5
+        result = diff_props(old, {"data": new_data}, nested={"data"})
+        assert set(result["data"].ops) == {
+            PropOp("delete", ("k0",)),
+            PropOp("set", ("k1",), -1),
+            PropOp("set", ("extra",), 5),
+        }
+
+    def test_small_values_sent_whole(self) -> None:
+        old = {"data": [1, 2, 3]}
+        new = {"data": [1, 2, 3, 4]}
+        assert diff_props(old, new, nested={"data"}) == {"data": [1, 2, 3, 4]}
+
+    def test_large_change_sent_whole(self) -> None:
+        old = {"data": list(range(100))}
+        new = {"data": [-i for i in range(100)]}
+        assert diff_props(old, new, nested={"data"}) == new
+
+    def test_type_change_sent_whole(self) -> None:
+        old = {"data": list(range(100))}
+        new = {"data": {"a": 1}}
+        assert diff_props(old, new, nested={"data"}) == new
@@ -1,9 +1,14 @@
-"""Tests for ElementStore and ElementStateStore classes."""
+"""Tests for ElementStore, ElementSnapshot, and ElementStateStore classes."""
 
 import weakref
 from dataclasses import replace
 
+import pytest
+
+from trellis.core.rendering.callback_table import CallbackTable
+from trellis.core.rendering.dependency_index import DependencyIndex
 from trellis.core.rendering.element import Element
+from trellis.core.rendering.element_ids import ElementIdTable
 from trellis.core.rendering.element_state import ElementState, ElementStateStore
 from trellis.core.rendering.element_store import ElementStore
 
@@ -158,6 +163,206 @@ class TestElementStore:
         assert items["e2"] is node2
 
 
+class _Theme:
+    pass
+
+
+class TestContextResolution:
+    @staticmethod
+    def _chain(store: ElementStateStore, length: int) -> list[str]:
+        """Create a parent chain e0 <- e1 <- ... and return the IDs."""
+        ids = [f"e{i}" for i in range(length)]
+        for i, element_id in enumerate(ids):
+            store.set(element_id, ElementState(parent_id=ids[i - 1] if i else None))
+        return ids
+
+    def test_resolves_nearest_provider(self):
+        store = ElementStateStore()
+        ids = self._chain(store, 4)
+        outer, inner = _Theme(), _Theme()
+        store.provide(ids[0], outer)
+        store.provide(ids[2], inner)
+
+        assert store.resolve_context(ids[3], _Theme) is inner
+        assert store.resolve_context(ids[1], _Theme) is outer
+        assert store.resolve_context(ids[3], int) is None
+
+    def test_lookup_is_cached_along_the_path(self):
+        store = ElementStateStore()
+        ids = self._chain(store, 50)
+        theme = _Theme()
+        store.provide(ids[0], theme)
+
+        assert store.resolve_context(ids[-1], _Theme) is theme
+        # Every element on the way now answers from its own cache
+        assert all(store.get(element_id).context_cache == {_Theme: theme} for element_id in ids[1:])
+
+    def test_new_provider_invalidates_cached_lookups(self):
+        store = ElementStateStore()
+        ids = self._chain(store, 3)
+        assert store.resolve_context(ids[2], _Theme) is None
+
+        theme = _Theme()
+        assert store.provide(ids[1], theme) is None
+        assert store.resolve_context(ids[2], _Theme) is theme
+
+        # Providing the same instance again keeps the caches
+        store.provide(ids[1], theme)
+        assert store.get(ids[2]).context_epoch == store.get(ids[1]).context_epoch
+
+    def test_removed_provider_invalidates_cached_lookups(self):
+        store = ElementStateStore()
+        ids = self._chain(store, 3)
+        store.provide(ids[0], _Theme())
+        store.provide(ids[1], theme := _Theme())
+        assert store.resolve_context(ids[2], _Theme) is theme
+
+        store.remove(ids[1])
+        store.get(ids[2]).parent_id = ids[0]
+
+        assert store.resolve_context(ids[2], _Theme) is not theme
+
+    def test_cycle_terminates(self):
+        store = ElementStateStore()
+        store.set("a", ElementState(parent_id="b"))
+        store.set("b", ElementState(parent_id="a"))
+
+        assert store.resolve_context("a", _Theme) is None
+
+
+class TestProviderIndex:
+    def test_find_provider_and_providers(self):
+        store = ElementStateStore()
+        first, second = _Theme(), _Theme()
+        store.provide("e1", first)
+        store.provide("e2", second)
+
+        assert store.find_provider(_Theme) is first
+        assert store.providers(_Theme) == [first, second]
+        assert store.find_provider(int) is None
+        assert store.providers(int) == []
+
+    def test_replacing_instance_keeps_one_entry(self):
+        store = ElementStateStore()
+        store.provide("e1", _Theme())
+        store.provide("e1", theme := _Theme())
+
+        assert store.providers(_Theme) == [theme]
+
+    def test_remove_drops_provider(self):
+        store = ElementStateStore()
+        store.provide("e1", _Theme())
+        store.provide("e2", theme := _Theme())
+
+        store.remove("e1")
+        assert store.providers(_Theme) == [theme]
+        store.remove("e2")
+        assert store.find_provider(_Theme) is None
+
+    def test_set_replacing_state_drops_provider(self):
+        store = ElementStateStore()
+        store.provide("e1", _Theme())
+
+        store.set("e1", ElementState())
+        assert store.find_provider(_Theme) is None
+
+
+# =============================================================================
+# ElementSnapshot Tests
+# =============================================================================
+
+
+class TestElementSnapshot:
+    def test_reads_through_to_live_store(self):
+        store = ElementStore()
+        node = make_node("e1")
+        store.store(node)
+
+        snapshot = store.snapshot()
+
+        assert snapshot.get("e1") is node
+        assert "e1" in snapshot
+        assert snapshot.touched_count == 0
+
+    def test_preserves_replaced_element(self):
+        store = ElementStore()
+        old = make_node("e1")
+        store.store(old)
+        snapshot = store.snapshot()
+
+        new = make_node("e1")
+        store.store(new)
+        store.store(make_node("e1"))
+
+        assert snapshot.get("e1") is old
+        assert snapshot.touched_count == 1
+
+    def test_preserves_removed_element(self):
+        store = ElementStore()
+        node = make_node("e1")
+        store.store(node)
+        snapshot = store.snapshot()
+
+        store.remove("e1")
+
+        assert store.get("e1") is None
+        assert snapshot.get("e1") is node
+
+    def test_element_added_after_snapshot_is_absent(self):
+        store = ElementStore()
+        snapshot = store.snapshot()
+
+        store.store(make_node("e1"))
+
+        assert snapshot.get("e1") is None
+        assert "e1" not in snapshot
+
+    def test_clear_preserves_all_elements(self):
+        store = ElementStore()
+        node1 = make_node("e1")
+        node2 = make_node("e2")
+        store.store(node1)
+        store.store(node2)
+        snapshot = store.snapshot()
+
+        store.clear()
+
+        assert snapshot.get("e1") is node1
+        assert snapshot.get("e2") is node2
+
+    def test_store_on_snapshot_does_not_touch_live_store(self):
+        store = ElementStore()
+        old = make_node("e1")
+        store.store(old)
+        snapshot = store.snapshot()
+
+        processed = make_node("e1")
+        snapshot.store(processed)
+
+        assert snapshot.get("e1") is processed
+        assert store.get("e1") is old
+
+    def test_only_one_snapshot_at_a_time(self):
+        store = ElementStore()
+        store.snapshot()
+
+        with pytest.raises(RuntimeError, match="open snapshot"):
+            store.snapshot()
+
+        store.release_snapshot()
+        store.snapshot()
+
+    def test_released_snapshot_stops_recording(self):
+        store = ElementStore()
+        store.store(make_node("e1"))
+        snapshot = store.snapshot()
+        store.release_snapshot()
+
+        store.store(make_node("e1"))
+
+        assert snapshot.touched_count == 0
+
+
 # =============================================================================
 # ElementStateStore Tests
 # =============================================================================
@@ -223,3 +428,236 @@ class TestElementStateStore:
 
         ids = list(store)
         assert set(ids) == {"e1", "e2"}
+
+
+class TestElementIdTable:
+    def test_intern_allocates_stable_handles(self):
+        ids = ElementIdTable()
+        first = ids.intern("/@1")
+        second = ids.intern("1/0@2")
+
+        assert first == 1
+        assert second == 2
+        assert ids.intern("/@1") == first
+        assert ids.resolve(second) == "1/0@2"
+
+    def test_handle_of_does_not_allocate(self):
+        ids = ElementIdTable()
+        assert ids.handle_of("/@1") is None
+        assert "/@1" not in ids
+        assert len(ids) == 0
+
+    def test_released_handle_resolves_until_collect(self):
+        ids = ElementIdTable()
+        handle = ids.intern("e1")
+
+        ids.release("e1")
+        assert ids.resolve(handle) == "e1"
+
+        ids.collect(set())
+        assert ids.resolve(handle) is None
+        assert "e1" not in ids
+
+    def test_collect_keeps_ids_that_are_live_again(self):
+        ids = ElementIdTable()
+        handle = ids.intern("e1")
+
+        ids.release("e1")
+        ids.collect({"e1"})
+
+        assert ids.resolve(handle) == "e1"
+
+    def test_handles_are_not_reused(self):
+        ids = ElementIdTable()
+        old = ids.intern("e1")
+        ids.release("e1")
+        ids.collect(set())
+
+        assert ids.intern("e1") != old
+        assert ids.resolve(old) is None
+
+
+class TestCallbackTable:
+    def test_register_allocates_stable_handles(self):
+        callbacks = CallbackTable()
+        first = callbacks.register("e1", "on_click")
+        second = callbacks.register("e1", "items[0].on_select")
+
+        assert first == 1
+        assert second == 2
+        assert callbacks.register("e1", "on_click") == first
+        entry = callbacks.resolve(second)
+        assert entry is not None
+        assert (entry.element_id, entry.path) == ("e1", "items[0].on_select")
+        assert entry.segments == ("items", 0, "on_select")
+
+    def test_lookup_follows_current_props(self):
+        callbacks = CallbackTable()
+        handle = callbacks.register("e1", "items[1].on_select")
+        entry = callbacks.resolve(handle)
+        assert entry is not None
+
+        def on_select() -> None:
+            pass
+
+        assert entry.lookup({"items": [{}, {"on_select": on_select}]}) is on_select
+        assert entry.lookup({"items": [{}]}) is None
+        assert entry.lookup({"items": [{}, {"on_select": "not callable"}]}) is None
+
+    def test_unparseable_path_never_resolves(self):
+        callbacks = CallbackTable()
+        entry = callbacks.resolve(callbacks.register("e1", "data.my-key"))
+
+        assert entry is not None
+        assert entry.lookup({"data": {"my-key": lambda: None}}) is None
+
+    def test_released_handles_resolve_until_collect(self):
+        callbacks = CallbackTable()
+        handle = callbacks.register("e1", "on_click")
+        kept = callbacks.register("e2", "on_click")
+
+        callbacks.release("e1")
+        assert callbacks.resolve(handle) is not None
+
+        callbacks.collect({"e2"})
+        assert callbacks.resolve(handle) is None
+        assert callbacks.resolve(kept) is not None
+        assert len(callbacks) == 1
+
+    def test_handles_are_not_reused(self):
+        callbacks = CallbackTable()
+        old = callbacks.register("e1", "on_click")
+        callbacks.release("e1")
+        callbacks.collect(set())
+
+        assert callbacks.register("e1", "on_click") != old
+        assert callbacks.resolve(old) is None
+
+
+class _Watcher:
+    """StateDependency stand-in that counts notifications."""
+
+    def __init__(self) -> None:
+        self.notified = 0
+
+    def notify_dirty(self) -> None:
+        self.notified += 1
+
+
+class _Source:
+    """Weak-referenceable state owner."""
+
+
+class TestDependencyIndex:
+    def test_notify_reaches_readers_of_key(self) -> None:
+        index = DependencyIndex()
+        source = _Source()
+        a, b = _Watcher(), _Watcher()
+        index.watch(a, "a")
+        index.add(source, "x", a)
+        index.watch(b, "b")
+        index.add(source, "y", b)
+
+        index.notify(source, "x")
+
+        assert (a.notified, b.notified) == (1, 0)
+        assert index.watchers(source, "x") == [a]
+        assert index.keys(source) == ["x", "y"]
+
+    def test_rewatch_invalidates_previous_reads(self) -> None:
+        index = DependencyIndex()
+        source = _Source()
+        watcher = _Watcher()
+        index.watch(watcher, "e1")
+        index.add(source, "x", watcher)
+        assert index.edge_count == 1
+
+        # Re-execution that doesn't read "x" again
+        index.watch(watcher, "e1")
+        index.notify(source, "x")
+
+        assert watcher.notified == 0
+        assert index.edge_count == 0
+        # The stale edge was pruned by notify()
+        assert index.stale_count == 0
+
+    def test_nested_watch_keeps_outer_slot(self) -> None:
+        index = DependencyIndex()
+        source = _Source()
+        outer, inner = _Watcher(), _Watcher()
+        index.watch(outer, "e1")
+        index.add(source, "x", outer)
+        # A nested dependency starts executing mid-render, then the outer resumes
+        index.watch(inner)
+        index.add(source, "y", inner)
+        index.add(source, "z", outer)
+
+        assert len(index) == 2
+        assert index.watchers(source, "z") == [outer]
+
+        index.watch(outer, "e1")
+        assert index.watchers(source, "x") == []
+        assert index.watchers(source, "z") == []
+
+    def test_rewatch_keeps_slot_and_notifies_latest_dependency(self) -> None:
+        index = DependencyIndex()
+        source = _Source()
+        old, new = _Watcher(), _Watcher()
+        index.watch(old, "e1")
+        index.add(source, "x", old)
+        index.watch(new, "e1")
+        index.add(source, "x", new)
+
+        index.notify(source, "x")
+
+        assert (old.notified, new.notified) == (0, 1)
+        assert len(index) == 1
+        assert index.stale_count == 0
+
+    def test_drop_forgets_watcher(self) -> None:
+        index = DependencyIndex()
+        source = _Source()
+        watcher = _Watcher()
+        index.watch(watcher, "e1")
+        index.add(source, "x", watcher)
+
+        index.drop("e1")
+        index.notify(source, "x")
+
+        assert watcher.notified == 0
+        assert len(index) == 0
+        assert index.edge_count == 0
+
+    def test_collected_source_drops_edges(self) -> None:
+        index = DependencyIndex()
+        source = _Source()
+        watcher = _Watcher()
+        index.watch(watcher, "e1")
+        index.add(source, "x", watcher)
+
+        del source
+
+        assert index.edge_count == 0
+        assert index.keys(_Source()) == []
+
+    def test_source_knows_its_indexes(self) -> None:
+        first, second = DependencyIndex(), DependencyIndex()
+        source = _Source()
+        first.add(source, "x", _Watcher())
+        second.add(source, "x", _Watcher())
+
+        assert set(source._dependency_indexes) == {first, second}  # type: ignore[attr-defined]
+
+    def test_compact_sweeps_stale_edges_in_bulk(self) -> None:
+        index = DependencyIndex()
+        sources = [_Source() for _ in range(2000)]
+        watcher = _Watcher()
+        index.watch(watcher, "e1")
+        for source in sources:
+            index.add(source, "x", watcher)
+
+        # Dropping the only reader makes every edge stale, triggering a sweep
+        index.drop("e1")
+
+        assert index.stale_count == 0
+        assert index.keys(sources[0]) == []
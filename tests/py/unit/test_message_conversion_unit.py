@@ -95,8 +95,8 @@ class TestDictToMessage:
 
     def test_converts_event(self) -> None:
         """_dict_to_message converts event message dict to EventMessage."""
-        result = _dict_to_message({"type": "event", "callback_id": "cb-1", "args": [1, 2]})
+        result = _dict_to_message({"type": "event", "callback_id": 1, "args": [1, 2]})
 
         assert isinstance(result, EventMessage)
-        assert result.callback_id == "cb-1"
+        assert result.callback_id == 1
         assert result.args == [1, 2]
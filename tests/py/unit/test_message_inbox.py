@@ -0,0 +1,80 @@
+"""Unit tests for buffering client messages and merging event bursts."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from trellis.platforms.common.message_inbox import MessageInbox
+from trellis.platforms.common.messages import AckMessage, EventMessage, Message
+
+_SLIDER = 1
+_TEXT = 2
+_BUTTON = 3
+
+
+def _mergeable(callback_id: int) -> bool:
+    return callback_id in (_SLIDER, _TEXT)
+
+
+def _event(callback_id: int, value: object = None) -> EventMessage:
+    return EventMessage(callback_id=callback_id, args=[value])
+
+
+def _drain(messages: list[Message]) -> tuple[list[Message], MessageInbox]:
+    async def run() -> tuple[list[Message], MessageInbox]:
+        inbox = MessageInbox()
+        for msg in messages:
+            await inbox.put(msg)
+        taken = []
+        while inbox:
+            taken.append(await inbox.take(_mergeable))
+        return taken, inbox
+
+    return asyncio.run(run())
+
+
+class TestMessageInbox:
+    def test_burst_keeps_latest_event(self) -> None:
+        taken, inbox = _drain([_event(_SLIDER, v) for v in (1, 2, 3)])
+        assert taken == [_event(_SLIDER, 3)]
+        assert inbox.merged == 2
+
+    def test_unmergeable_events_are_all_kept(self) -> None:
+        messages: list[Message] = [_event(_BUTTON), _event(_BUTTON)]
+        taken, _ = _drain(messages)
+        assert taken == messages
+
+    def test_interleaved_bindings_merge_separately(self) -> None:
+        taken, _ = _drain(
+            [_event(_SLIDER, 1), _event(_TEXT, "a"), _event(_SLIDER, 2), _event(_TEXT, "ab")]
+        )
+        assert taken == [_event(_SLIDER, 2), _event(_TEXT, "ab")]
+
+    def test_acks_do_not_split_a_burst(self) -> None:
+        taken, _ = _drain([_event(_SLIDER, 1), AckMessage(seq=1), _event(_SLIDER, 2)])
+        assert taken == [AckMessage(seq=1), _event(_SLIDER, 2)]
+
+    def test_other_messages_split_a_burst(self) -> None:
+        messages: list[Message] = [_event(_SLIDER, 1), _event(_BUTTON), _event(_SLIDER, 2)]
+        taken, _ = _drain(messages)
+        assert taken == messages
+
+    def test_take_nowait_on_empty_inbox_raises(self) -> None:
+        with pytest.raises(IndexError):
+            MessageInbox().take_nowait(_mergeable)
+
+    def test_put_waits_while_full(self) -> None:
+        async def run() -> None:
+            inbox = MessageInbox(limit=1)
+            await inbox.put(_event(_BUTTON))
+            put = asyncio.create_task(inbox.put(_event(_SLIDER)))
+            await asyncio.sleep(0)
+            assert not put.done()
+
+            assert await inbox.take(_mergeable) == _event(_BUTTON)
+            await asyncio.wait_for(put, timeout=1.0)
+            assert len(inbox) == 1
+
+        asyncio.run(run())
@@ -4,6 +4,7 @@ import msgspec
 
 from trellis.core.protocol import decode_message
 from trellis.platforms.common.messages import (
+    AckMessage,
     EventMessage,
     HelloMessage,
     HelloResponseMessage,
@@ -18,37 +19,37 @@ class TestEventMessage:
 
     def test_event_message_creation(self) -> None:
         """EventMessage can be created with callback_id and args."""
-        msg = EventMessage(callback_id="cb_1", args=[1, 2, 3])
-        assert msg.callback_id == "cb_1"
+        msg = EventMessage(callback_id=1, args=[1, 2, 3])
+        assert msg.callback_id == 1
         assert msg.args == [1, 2, 3]
 
     def test_event_message_default_args(self) -> None:
         """EventMessage args defaults to empty list."""
-        msg = EventMessage(callback_id="cb_1")
+        msg = EventMessage(callback_id=1)
         assert msg.args == []
 
     def test_event_message_msgpack_roundtrip(self) -> None:
         """EventMessage survives msgpack encode/decode."""
         encoder = msgspec.msgpack.Encoder()
 
-        original = EventMessage(callback_id="cb_42", args=["hello", 123, True])
+        original = EventMessage(callback_id=42, args=["hello", 123, True])
         encoded = encoder.encode(original)
         decoded = decode_message(msgspec.msgpack.decode(encoded))
 
         assert isinstance(decoded, EventMessage)
-        assert decoded.callback_id == "cb_42"
+        assert decoded.callback_id == 42
         assert decoded.args == ["hello", 123, True]
 
     def test_event_message_has_type_tag(self) -> None:
         """EventMessage includes type tag for dispatch."""
         encoder = msgspec.msgpack.Encoder()
-        msg = EventMessage(callback_id="cb_1")
+        msg = EventMessage(callback_id=1)
         encoded = encoder.encode(msg)
 
         # Decode as raw dict to check structure
         raw = msgspec.msgpack.decode(encoded)
         assert raw["type"] == "event"
-        assert raw["callback_id"] == "cb_1"
+        assert raw["callback_id"] == 1
 
 
 class TestReloadMessage:
@@ -122,15 +123,33 @@ class TestMessageDecoding:
         assert isinstance(decoded, PatchMessage)
         assert decoded.patches == []
 
+    def test_patch_message_seq_is_omitted_unless_set(self) -> None:
+        """PatchMessage only carries seq for clients that acknowledge patches."""
+        encoder = msgspec.msgpack.Encoder()
+
+        assert "seq" not in msgspec.msgpack.decode(encoder.encode(PatchMessage(patches=[])))
+        decoded = decode_message(
+            msgspec.msgpack.decode(encoder.encode(PatchMessage(patches=[], seq=3)))
+        )
+        assert isinstance(decoded, PatchMessage)
+        assert decoded.seq == 3
+
+    def test_decode_ack_message(self) -> None:
+        """AckMessage decodes correctly from the message registry."""
+        decoded = decode_message({"type": "ack", "seq": 7})
+
+        assert isinstance(decoded, AckMessage)
+        assert decoded.seq == 7
+
     def test_decode_event_message(self) -> None:
         """EventMessage decodes correctly from the message registry."""
         encoder = msgspec.msgpack.Encoder()
 
-        original = EventMessage(callback_id="cb_99", args=[{"key": "value"}])
+        original = EventMessage(callback_id=99, args=[{"key": "value"}])
         decoded = decode_message(msgspec.msgpack.decode(encoder.encode(original)))
 
         assert isinstance(decoded, EventMessage)
-        assert decoded.callback_id == "cb_99"
+        assert decoded.callback_id == 99
         assert decoded.args == [{"key": "value"}]
 
     def test_all_message_types_distinguishable(self) -> None:
@@ -141,7 +160,7 @@ class TestMessageDecoding:
             HelloMessage(client_id="c1"),
             HelloResponseMessage(session_id="s1", server_version="1.0"),
             PatchMessage(patches=[]),
-            EventMessage(callback_id="cb_1"),
+            EventMessage(callback_id=1),
             ReloadMessage(),
         ]
 
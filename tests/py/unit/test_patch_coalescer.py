@@ -0,0 +1,220 @@
+"""Unit tests for merging held render patches into one net diff."""
+
+from __future__ import annotations
+
+import typing as tp
+from dataclasses import dataclass, field
+
+import pytest
+
+from trellis.core.components.composition import component
+from trellis.core.rendering.element import _REMOVED, PropOp, PropOps
+from trellis.core.rendering.patches import RenderAddPatch, RenderRemovePatch, RenderUpdatePatch
+from trellis.core.rendering.render import render
+from trellis.core.rendering.session import RenderSession, set_render_session
+from trellis.platforms.common.handler import _serialize_patches
+from trellis.platforms.common.messages import AddPatch, Patch, RemovePatch, UpdatePatch
+from trellis.platforms.common.patch_coalescer import PatchCoalescer
+from trellis.platforms.common.serialization import serialize_element
+from trellis.widgets import Column, Label
+
+
+@dataclass
+class _Scene:
+    title: str = "title"
+    items: list[str] = field(default_factory=lambda: ["a", "b"])
+    nested: bool = False
+
+
+class _ClientTree:
+    """Applies wire patches the way the client store does."""
+
+    def __init__(self) -> None:
+        self.nodes: dict[int, dict[str, tp.Any]] = {}
+
+    def _add(self, element: dict[str, tp.Any]) -> None:
+        self.nodes[element["key"]] = {
+            "props": dict(element["props"]),
+            "children": [child["key"] for child in element["children"]],
+        }
+        for child in element["children"]:
+            self._add(child)
+
+    def _remove(self, handle: int) -> None:
+        node = self.nodes.pop(handle, None)
+        if node is not None:
+            for child in node["children"]:
+                self._remove(child)
+
+    def apply(self, patches: list[Patch]) -> None:
+        for patch in patches:
+            if isinstance(patch, AddPatch):
+                self._add(patch.element)
+                if patch.parent_id is not None:
+                    self.nodes[patch.parent_id]["children"] = list(patch.children)
+            elif isinstance(patch, UpdatePatch):
+                node = self.nodes[patch.id]
+                for key, value in (patch.props or {}).items():
+                    if value == {"__removed__": True}:
+                        node["props"].pop(key, None)
+                    else:
+                        node["props"][key] = value
+                if patch.children is not None:
+                    node["children"] = list(patch.children)
+            elif isinstance(patch, RemovePatch):
+                self._remove(patch.id)
+
+
+def _client_tree_of(session: RenderSession) -> dict[int, dict[str, tp.Any]]:
+    assert session.root_element is not None
+    tree = _ClientTree()
+    tree._add(serialize_element(session.root_element, session))
+    return tree.nodes
+
+
+@pytest.fixture
+def scene() -> tp.Iterator[tuple[_Scene, RenderSession]]:
+    scene = _Scene()
+
+    @component
+    def App() -> None:
+        Label(text=scene.title)
+        with Column():
+            for item in scene.items:
+                if scene.nested and item == "a":
+                    with Column(key=item):
+                        Label(text="inner")
+                else:
+                    Label(text=item, key=item)
+
+    session = RenderSession(App)
+    set_render_session(session)
+    yield scene, session
+    set_render_session(None)
+
+
+def _rerender(session: RenderSession) -> list[tp.Any]:
+    assert session.root_element is not None
+    session.dirty.mark(session.root_element.id)
+    return render(session)
+
+
+class TestPatchCoalescer:
+    def test_empty_until_a_frame_is_held(self, scene: tuple[_Scene, RenderSession]) -> None:
+        _, session = scene
+        render(session)
+        coalescer = PatchCoalescer()
+
+        assert not coalescer
+        coalescer.add([], session)
+        assert coalescer
+        assert coalescer.frames == 1
+
+        assert coalescer.flush(session) == ([], [])
+        assert not coalescer
+
+    def test_updates_fold_to_latest_value(self, scene: tuple[_Scene, RenderSession]) -> None:
+        state, session = scene
+        render(session)
+        coalescer = PatchCoalescer()
+
+        for title in ("one", "two", "three"):
+            state.title = title
+            coalescer.add(_rerender(session), session)
+
+        removed, patches = coalescer.flush(session)
+        assert removed == []
+        assert len(patches) == 1
+        assert isinstance(patches[0], RenderUpdatePatch)
+        assert patches[0].props == {"text": "three"}
+
+    def test_repeated_key_is_resent_whole(self, scene: tuple[_Scene, RenderSession]) -> None:
+        _, session = scene
+        render(session)
+        label_id = session.root_element.child_ids[0]
+        ops = PropOps((PropOp(op="append", path=(), value=["!"]),))
+        coalescer = PatchCoalescer()
+
+        # Each diff is relative to the frame before it, so they cannot be
+        # sent one after the other as a single update
+        coalescer.add([RenderUpdatePatch(label_id, {"text": ops}, None)], session)
+        coalescer.add([RenderUpdatePatch(label_id, {"text": ops}, None)], session)
+        coalescer.add([RenderUpdatePatch(label_id, {"extra": _REMOVED}, None)], session)
+
+        _, patches = coalescer.flush(session)
+        assert patches == [RenderUpdatePatch(label_id, {"text": "title", "extra": _REMOVED}, None)]
+
+    def test_add_then_remove_cancels(self, scene: tuple[_Scene, RenderSession]) -> None:
+        state, session = scene
+        render(session)
+        coalescer = PatchCoalescer()
+
+        state.items = ["a", "b", "c"]
+        coalescer.add(_rerender(session), session)
+        state.items = ["a", "b"]
+        coalescer.add(_rerender(session), session)
+
+        removed, patches = coalescer.flush(session)
+        assert removed == []
+        assert not [p for p in patches if isinstance(p, (RenderAddPatch, RenderRemovePatch))]
+
+    def test_removed_handles_survive_collection(self, scene: tuple[_Scene, RenderSession]) -> None:
+        state, session = scene
+        render(session)
+        column = session.elements.get(session.root_element.child_ids[1])
+        b_handle = session.ids.intern(column.child_ids[1])
+        coalescer = PatchCoalescer()
+
+        state.items = ["a"]
+        coalescer.add(_rerender(session), session)
+        state.title = "later"
+        coalescer.add(_rerender(session), session)  # Collects b's handle
+
+        removed, _ = coalescer.flush(session)
+        assert removed == [b_handle]
+
+    def test_added_subtree_is_sent_once_as_it_is_now(
+        self, scene: tuple[_Scene, RenderSession]
+    ) -> None:
+        state, session = scene
+        render(session)
+        coalescer = PatchCoalescer()
+
+        state.items = ["a", "b", "c"]
+        coalescer.add(_rerender(session), session)
+        state.items = ["a", "b", "c", "d"]
+        coalescer.add(_rerender(session), session)
+
+        _, patches = coalescer.flush(session)
+        adds = [p for p in patches if isinstance(p, RenderAddPatch)]
+        column = session.elements.get(session.root_element.child_ids[1])
+        assert [p.element.id for p in adds] == column.child_ids[2:]
+        assert all(p.children == tuple(column.child_ids) for p in adds)
+
+    @pytest.mark.parametrize(
+        "steps",
+        [
+            [{"title": "x"}, {"items": ["b", "a"]}, {"title": "y"}],
+            [{"items": ["a", "b", "c"]}, {"nested": True}, {"items": ["c", "a"]}],
+            [{"nested": True}, {"items": []}, {"items": ["a"]}, {"nested": False}],
+            [{"items": ["c"]}, {"items": ["a", "b", "c"]}, {"title": ""}],
+        ],
+    )
+    def test_flush_brings_client_to_current_tree(
+        self, scene: tuple[_Scene, RenderSession], steps: list[dict[str, tp.Any]]
+    ) -> None:
+        state, session = scene
+        client = _ClientTree()
+        client.apply(_serialize_patches(render(session), session))
+        coalescer = PatchCoalescer()
+
+        for step in steps:
+            for name, value in step.items():
+                setattr(state, name, value)
+            coalescer.add(_rerender(session), session)
+
+        removed, patches = coalescer.flush(session)
+        client.apply([RemovePatch(id=handle) for handle in removed])
+        client.apply(_serialize_patches(patches, session))
+
+        assert client.nodes == _client_tree_of(session)
@@ -99,6 +99,23 @@ class TestReactDecoratorBasics:
 
         assert Custom._component.element_class is CustomElement
 
+    def test_nested_diff_props(self) -> None:
+        """nested_diff_props is recorded on the component."""
+
+        @react("client/Grid.tsx", nested_diff_props=["rows"])
+        def Grid(*, rows: list[dict[str, int]], title: str = "") -> None:
+            pass
+
+        assert Grid._component.nested_diff_props == frozenset({"rows"})
+
+    def test_nested_diff_props_must_be_params(self) -> None:
+        """Naming a prop the function doesn't take is an error."""
+        with pytest.raises(TypeError, match="unknown props"):
+
+            @react("client/Grid.tsx", nested_diff_props=["missing"])
+            def Grid(*, rows: list[int]) -> None:
+                pass
+
     def test_exposes_component_for_introspection(self) -> None:
         """Decorated function has a _component attribute."""
 
@@ -71,22 +71,15 @@ class TestRefHolder:
         state = TrackedState()
         state.count = 5
 
-        # Manually init _state_props so we can check watchers
-        try:
-            _ = state._state_props
-        except AttributeError:
-            pass
-
         holder: _RefHolder[TrackedState] = _RefHolder(TrackedState)
         holder._attach(state)
 
-        # Access through holder — should bypass Stateful.__getattribute__
+        # Access through holder — should bypass tracked attribute reads
         val = holder.count
         assert val == 5
 
-        # No watchers should have been registered
-        if hasattr(state, "_state_props") and "count" in state._state_props:
-            assert len(state._state_props["count"].watchers) == 0
+        # No dependency index should have recorded a read
+        assert not hasattr(state, "_dependency_indexes")
 
 
 class TestRefBaseClass:
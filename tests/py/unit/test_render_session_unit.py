@@ -13,7 +13,9 @@ from trellis.core.rendering.dirty_tracker import DirtyTracker
 from trellis.core.rendering.element import Element
 from trellis.core.rendering.element_state import ElementStateStore
 from trellis.core.rendering.element_store import ElementStore
-from trellis.core.rendering.session import RenderSession
+from trellis.core.rendering.render import render
+from trellis.core.rendering.session import RenderSession, set_render_session
+from trellis.core.rendering.stats import RenderStats
 
 if TYPE_CHECKING:
     from trellis.core.components.composition import CompositionComponent
@@ -61,8 +63,18 @@ class TestRenderSession:
         assert isinstance(session.elements, ElementStore)
         assert isinstance(session.states, ElementStateStore)
         assert isinstance(session.dirty, DirtyTracker)
+        assert session.stats == RenderStats()
         assert session.active is None
 
+    def test_stats_count_executions(self, noop_component: "CompositionComponent") -> None:
+        session = RenderSession(root_component=noop_component)
+        set_render_session(session)
+
+        render(session)
+
+        assert session.stats.executions == 1
+        assert session.stats.redundant_executions_avoided == 0
+
     def test_is_rendering(self, noop_component: "CompositionComponent") -> None:
         session = RenderSession(root_component=noop_component)
 
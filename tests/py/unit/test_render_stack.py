@@ -3,7 +3,7 @@
 import pytest
 
 from trellis.core.rendering.active import ActiveRender
-from trellis.core.rendering.element_store import ElementStore
+from trellis.core.rendering.element_store import ElementSnapshot
 from trellis.core.rendering.frames import Frame, FrameStack
 from trellis.core.rendering.lifecycle import LifecycleTracker
 from trellis.core.rendering.patches import PatchCollector
@@ -225,7 +225,7 @@ class TestActiveRender:
         assert isinstance(active.frames, FrameStack)
         assert isinstance(active.patches, PatchCollector)
         assert isinstance(active.lifecycle, LifecycleTracker)
-        assert isinstance(active.old_elements, ElementStore)
+        assert isinstance(active.old_elements, ElementSnapshot)
         assert active.current_element_id is None
         assert active.last_property_access is None
 
@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+import zlib
 
+import msgspec
 import pytest
 from fastapi import WebSocketDisconnect
 
+from trellis.core.rendering.session import RenderSession
 from trellis.platforms.common.errors import SessionDisconnected
-from trellis.platforms.common.messages import PatchMessage
+from trellis.platforms.common.messages import ErrorMessage, PatchMessage
+from trellis.platforms.server.compression import MessageCompressor
 from trellis.platforms.server.handler import WebSocketMessageHandler
+from trellis.platforms.server.resume import ParkedSessions
 
 
 class _FakeWebSocket:
@@ -18,10 +23,12 @@ class _FakeWebSocket:
     def __init__(self) -> None:
         self.send_error: BaseException | None = None
         self.receive_error: BaseException | None = None
+        self.sent: list[bytes] = []
 
     async def send_bytes(self, data: bytes) -> None:
         if self.send_error is not None:
             raise self.send_error
+        self.sent.append(data)
 
     async def receive_bytes(self) -> bytes:
         if self.receive_error is not None:
@@ -66,3 +73,154 @@ class TestWebSocketMessageHandler:
 
         with pytest.raises(SessionDisconnected):
             asyncio.run(handler.receive_message())
+
+
+class TestMessageCompressor:
+    """Tests for size-thresholded deflate of outgoing messages."""
+
+    def test_compresses_at_or_above_threshold(self) -> None:
+        compressor = MessageCompressor(threshold=100)
+        payload = b"component-name " * 10
+
+        compressed = compressor.compress(payload)
+
+        assert compressed[0] == 0x78
+        assert zlib.decompress(compressed) == payload
+
+    def test_small_messages_are_sent_as_is(self) -> None:
+        compressor = MessageCompressor(threshold=100)
+        assert compressor.compress(b"x" * 99) == b"x" * 99
+
+    def test_incompressible_messages_are_sent_as_is(self) -> None:
+        payload = bytes(range(256))
+        assert MessageCompressor(threshold=1).compress(payload) == payload
+
+    def test_stats_count_every_message(self) -> None:
+        compressor = MessageCompressor(threshold=100)
+        compressor.compress(b"a" * 1000)
+        compressor.compress(b"b" * 10)
+
+        stats = compressor.stats
+        assert stats.messages == 2
+        assert stats.compressed_messages == 1
+        assert stats.raw_bytes == 1010
+        assert stats.sent_bytes < 100
+        assert stats.ratio > 10
+
+    def test_disabled_compressor_still_counts(self) -> None:
+        compressor = MessageCompressor()
+        assert compressor.compress(b"a" * 1000) == b"a" * 1000
+        assert compressor.stats.ratio == 1.0
+
+
+class TestWebSocketCompression:
+    """Tests for compression negotiation in the WebSocket handler."""
+
+    def _send_large_message(self, handler: WebSocketMessageHandler) -> None:
+        asyncio.run(handler.send_message(ErrorMessage(error="row " * 2000, context="render")))
+
+    def test_deflate_applies_when_client_offers_it(self, noop_component, app_wrapper) -> None:
+        websocket = _FakeWebSocket()
+        handler = WebSocketMessageHandler(
+            noop_component,
+            app_wrapper,
+            websocket,  # type: ignore[arg-type]
+            compression="deflate",
+            compression_threshold=1024,
+        )
+
+        assert handler.select_compression(["deflate"]) == "deflate"
+        self._send_large_message(handler)
+        asyncio.run(handler.send_message(PatchMessage(patches=[])))
+
+        large, small = websocket.sent
+        assert msgspec.msgpack.decode(zlib.decompress(large))["error"] == "row " * 2000
+        assert msgspec.msgpack.decode(small) == {"type": "patch", "patches": []}
+        assert handler.compression_stats.compressed_messages == 1
+
+    def test_no_compression_without_client_support(self, noop_component, app_wrapper) -> None:
+        websocket = _FakeWebSocket()
+        handler = WebSocketMessageHandler(
+            noop_component,
+            app_wrapper,
+            websocket,  # type: ignore[arg-type]
+            compression="deflate",
+        )
+
+        assert handler.select_compression([]) is None
+        self._send_large_message(handler)
+
+        assert msgspec.msgpack.decode(websocket.sent[0])["type"] == "error"
+        assert handler.compression_stats.messages == 1
+
+    def test_no_compression_when_disabled(self, noop_component, app_wrapper) -> None:
+        handler = WebSocketMessageHandler(
+            noop_component,
+            app_wrapper,
+            _FakeWebSocket(),  # type: ignore[arg-type]
+            compression="none",
+        )
+
+        assert handler.select_compression(["deflate"]) is None
+
+
+class TestParkedSessions:
+    """Tests for keeping disconnected sessions for a reconnecting client."""
+
+    def _handler(self, component, app_wrapper, parked: ParkedSessions) -> WebSocketMessageHandler:
+        handler = WebSocketMessageHandler(
+            component,
+            app_wrapper,
+            _FakeWebSocket(),  # type: ignore[arg-type]
+            parked_sessions=parked,
+        )
+        handler.session = RenderSession(component)
+        handler.session_id = "session-1"
+        return handler
+
+    def test_claim_returns_parked_handler(self, noop_component, app_wrapper) -> None:
+        async def run_test() -> None:
+            parked = ParkedSessions(grace=10.0)
+            handler = self._handler(noop_component, app_wrapper, parked)
+
+            assert handler.park_session()
+            assert "session-1" in parked
+            assert parked.claim("session-1") is handler
+            assert parked.claim("session-1") is None
+            assert len(parked) == 0
+
+        asyncio.run(run_test())
+
+    def test_zero_grace_disables_parking(self, noop_component, app_wrapper) -> None:
+        async def run_test() -> None:
+            parked = ParkedSessions(grace=0)
+            handler = self._handler(noop_component, app_wrapper, parked)
+
+            assert not handler.park_session()
+            assert len(parked) == 0
+
+        asyncio.run(run_test())
+
+    def test_handler_without_parked_sessions_is_not_parked(
+        self, noop_component, app_wrapper
+    ) -> None:
+        handler = WebSocketMessageHandler(noop_component, app_wrapper, _FakeWebSocket())  # type: ignore[arg-type]
+
+        assert not handler.park_session()
+
+    def test_unclaimed_session_shuts_down_after_grace(self, noop_component, app_wrapper) -> None:
+        async def run_test() -> None:
+            parked = ParkedSessions(grace=0.01)
+            handler = self._handler(noop_component, app_wrapper, parked)
+            assert handler.session is not None
+            task = handler.session.spawn(asyncio.Event().wait(), label="idle")
+
+            assert handler.park_session()
+            await asyncio.sleep(0.05)
+
+            assert "session-1" not in parked
+            assert parked.claim("session-1") is None
+            assert handler.session._shutting_down
+            assert task.done()
+
+        asyncio.run(run_test())
@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+import typing as tp
 from dataclasses import dataclass
 
 from trellis import Tracked as RootTracked
+from trellis.core.rendering.session import RenderSession, set_render_session
 from trellis.core.state import Tracked as PackageTracked
-from trellis.core.state.stateful import Stateful, Tracked, _is_tracked_attribute
+from trellis.core.state.attribute import TrackedAttribute, read_untracked, state_version
+from trellis.core.state.stateful import (
+    Opaque,
+    Stateful,
+    Tracked,
+    Versioned,
+    _is_tracked_attribute,
+)
+from trellis.core.state.tracked import TrackedList
 
 
 class TestTrackedAttributeDetection:
@@ -59,3 +69,191 @@ class TestTrackedAttributeDetection:
             other: int = 0
 
         assert _is_tracked_attribute(ChildState, "_value") is True
+
+
+class TestTrackedAttributeDescriptors:
+    def test_descriptors_installed_on_first_instantiation(self) -> None:
+        @dataclass(kw_only=True)
+        class MyState(Stateful):
+            value: int = 0
+            _private: int = 0
+
+        MyState()
+
+        assert isinstance(MyState.__dict__["value"], TrackedAttribute)
+        assert MyState.__dict__["_private"] == 0
+
+    def test_class_default_preserved(self) -> None:
+        class MyState(Stateful):
+            value: int = 5
+
+        state = MyState()
+
+        assert state.value == 5
+        assert MyState.value == 5
+        state.value = 6
+        assert vars(state)["value"] == 6
+        del state.value
+        assert state.value == 5
+
+    def test_missing_value_raises_attribute_error(self) -> None:
+        class MyState(Stateful):
+            value: int
+
+        state = MyState()
+
+        assert not hasattr(state, "value")
+
+    def test_subclass_inherits_parent_defaults(self) -> None:
+        @dataclass(kw_only=True)
+        class BaseState(Stateful):
+            value: int = 1
+
+        BaseState()
+
+        @dataclass(kw_only=True)
+        class ChildState(BaseState):
+            other: int = 2
+
+        child = ChildState()
+
+        assert (child.value, child.other) == (1, 2)
+        assert ChildState(value=3).value == 3
+
+    def test_read_untracked_registers_no_dependency(self) -> None:
+        @dataclass(kw_only=True)
+        class MyState(Stateful):
+            value: int = 0
+
+        class Dependency:
+            def notify_dirty(self) -> None:
+                pass
+
+        state = MyState(value=4)
+        session = RenderSession(tp.cast("tp.Any", None))
+        dependency = Dependency()
+        set_render_session(session)
+        try:
+            with session.tracking(dependency):
+                assert read_untracked(state, "value") == 4
+                assert session.dependencies.keys(state) == []
+                assert state.value == 4
+        finally:
+            set_render_session(None)
+
+        assert session.dependencies.watchers(state, "value") == [dependency]
+
+
+class _Array:
+    """Stand-in for an array type whose == is elementwise and can't be used as a bool."""
+
+    def __init__(self, size: int) -> None:
+        self.data = list(range(size))
+
+    def __eq__(self, other: object) -> bool:
+        raise ValueError("The truth value of an array is ambiguous")
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class _Watcher:
+    def __init__(self) -> None:
+        self.notified = 0
+
+    def notify_dirty(self) -> None:
+        self.notified += 1
+
+
+def _watch(state: Stateful, name: str) -> _Watcher:
+    """Read state.name as a fresh dependency and return it."""
+    session = RenderSession(tp.cast("tp.Any", None))
+    watcher = _Watcher()
+    set_render_session(session)
+    try:
+        session.dependencies.watch(watcher)
+        with session.tracking(watcher):
+            getattr(state, name)
+    finally:
+        set_render_session(None)
+    # Keep the session's index alive for as long as the watcher
+    watcher.session = session  # type: ignore[attr-defined]
+    return watcher
+
+
+class TestChangeDetection:
+    def test_opaque_and_versioned_private_attributes_are_tracked(self) -> None:
+        @dataclass(kw_only=True)
+        class MyState(Stateful):
+            _frame: Opaque[object] = None
+            _rows: Versioned[list[int] | None] = None
+
+        assert _is_tracked_attribute(MyState, "_frame") is True
+        assert _is_tracked_attribute(MyState, "_rows") is True
+
+    def test_opaque_compares_by_identity(self) -> None:
+        @dataclass(kw_only=True)
+        class MyState(Stateful):
+            frame: Opaque[_Array]
+
+        array = _Array(3)
+        state = MyState(frame=array)
+        watcher = _watch(state, "frame")
+
+        state.frame = array  # Same object: no change, and no == call
+        assert watcher.notified == 0
+
+        state.frame = _Array(3)
+        assert watcher.notified == 1
+
+    def test_opaque_skips_tracked_conversion(self) -> None:
+        @dataclass(kw_only=True)
+        class MyState(Stateful):
+            rows: Opaque[list[int]]
+            tracked_rows: list[int]
+
+        rows = [1, 2, 3]
+        state = MyState(rows=rows, tracked_rows=rows)
+
+        assert state.rows is rows
+        assert isinstance(state.tracked_rows, TrackedList)
+
+    def test_versioned_counts_every_assignment(self) -> None:
+        @dataclass(kw_only=True)
+        class MyState(Stateful):
+            frame: Versioned[_Array]
+
+        array = _Array(3)
+        state = MyState(frame=array)
+        assert state_version(state, "frame") == 1
+        watcher = _watch(state, "frame")
+
+        # Mutate in place, then reassign to publish the change
+        array.data.append(3)
+        state.frame = array
+
+        assert watcher.notified == 1
+        assert state_version(state, "frame") == 2
+        assert state.frame is array
+
+    def test_state_version_defaults_to_zero(self) -> None:
+        class MyState(Stateful):
+            frame: Versioned[object] = None
+
+        state = MyState()
+        assert state_version(state, "frame") == 0
+
+        state.frame = object()
+        assert state_version(state, "frame") == 1
+
+    def test_subclass_can_override_change_detection(self) -> None:
+        @dataclass(kw_only=True)
+        class BaseState(Stateful):
+            rows: Opaque[list[int]] = None  # type: ignore[assignment]
+
+        @dataclass(kw_only=True)
+        class ChildState(BaseState):
+            rows: list[int] = None  # type: ignore[assignment]
+
+        rows = [1, 2]
+        assert ChildState(rows=rows).rows is not rows
+        assert BaseState(rows=rows).rows is rows
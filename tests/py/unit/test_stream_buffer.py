@@ -0,0 +1,111 @@
+"""Unit tests for StreamBuffer and StreamWindow - basic operations without render context."""
+
+from dataclasses import dataclass, field
+
+import pytest
+
+from trellis.core.rendering.element import PropOp, PropOps, diff_props
+from trellis.core.state.stateful import Stateful
+from trellis.core.state.stream import StreamBuffer
+
+
+class TestStreamBuffer:
+    def test_keeps_most_recent_items(self) -> None:
+        buffer = StreamBuffer(range(5), maxlen=3)
+        assert list(buffer) == [2, 3, 4]
+        assert len(buffer) == 3
+
+    def test_columnar_rows(self) -> None:
+        buffer = StreamBuffer([(0, 1.0), (1, 2.0)], maxlen=10, columns=2)
+        buffer.append((2, 3.0))
+        assert list(buffer) == [(0, 1.0), (1, 2.0), (2, 3.0)]
+        assert buffer.window().values() == [[0, 1, 2], [1.0, 2.0, 3.0]]
+
+    def test_columnar_row_length_checked(self) -> None:
+        buffer = StreamBuffer(maxlen=10, columns=2)
+        with pytest.raises(ValueError, match="rows of 2 values"):
+            buffer.append((1, 2, 3))
+
+    def test_maxlen_must_be_positive(self) -> None:
+        with pytest.raises(ValueError, match="maxlen"):
+            StreamBuffer(maxlen=0)
+
+    def test_stateful_field_binds_buffer(self) -> None:
+        @dataclass(kw_only=True)
+        class Sensors(Stateful):
+            samples: StreamBuffer[float] = field(default_factory=lambda: StreamBuffer(maxlen=5))
+
+        sensors = Sensors()
+        sensors.samples.append(1.0)
+        assert sensors.samples._attr == "samples"
+        assert list(sensors.samples) == [1.0]
+
+
+class TestStreamWindow:
+    def test_windows_compare_by_range(self) -> None:
+        buffer = StreamBuffer([1, 2], maxlen=5)
+        assert buffer.window() == buffer.window()
+        before = buffer.window()
+        buffer.append(3)
+        assert buffer.window() != before
+
+    def test_window_values_are_a_snapshot(self) -> None:
+        buffer = StreamBuffer([1, 2], maxlen=5)
+        window = buffer.window()
+        buffer.append(3)
+        assert window.values() == [1, 2]
+
+    def test_delta_evicts_and_appends(self) -> None:
+        buffer = StreamBuffer(range(4), maxlen=4)
+        old = buffer.window()
+        buffer.extend([4, 5])
+        assert buffer.window().delta(old) == (2, 2, [4, 5])
+
+    def test_delta_none_when_window_fully_replaced(self) -> None:
+        buffer = StreamBuffer(range(4), maxlen=4)
+        old = buffer.window()
+        buffer.extend(range(4, 9))
+        assert buffer.window().delta(old) is None
+
+    def test_delta_none_after_clear(self) -> None:
+        buffer = StreamBuffer(range(4), maxlen=4)
+        old = buffer.window()
+        buffer.clear()
+        assert buffer.window().delta(old) is None
+
+
+class TestStreamDiffProps:
+    def test_flat_window_diff(self) -> None:
+        buffer = StreamBuffer(range(3), maxlen=3)
+        old = {"data": buffer.window()}
+        buffer.append(3)
+        new = {"data": buffer.window()}
+        assert diff_props(old, new) == {
+            "data": PropOps(
+                (
+                    PropOp("splice", (), [], index=0, delete=1),
+                    PropOp("append", (), [3], index=2),
+                )
+            )
+        }
+
+    def test_columnar_window_diff_per_column(self) -> None:
+        buffer = StreamBuffer([(0, 10)], maxlen=5, columns=2)
+        old = {"data": buffer.window()}
+        buffer.append((1, 11))
+        ops = diff_props(old, {"data": buffer.window()})["data"].ops
+        assert ops == (
+            PropOp("append", (0,), [1], index=1),
+            PropOp("append", (1,), [11], index=1),
+        )
+
+    def test_unchanged_window_no_diff(self) -> None:
+        buffer = StreamBuffer(range(3), maxlen=3)
+        assert diff_props({"data": buffer.window()}, {"data": buffer.window()}) == {}
+
+    def test_replaced_window_sent_whole(self) -> None:
+        buffer = StreamBuffer(range(3), maxlen=3)
+        old = {"data": buffer.window()}
+        buffer.extend(range(3, 6))
+        new = {"data": buffer.window()}
+        assert diff_props(old, new) == new
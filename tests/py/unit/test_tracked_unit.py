@@ -1,5 +1,6 @@
 """Unit tests for TrackedList, TrackedDict, TrackedSet - basic operations without render context."""
 
+import typing as tp
 from dataclasses import dataclass, field
 
 import pytest
@@ -300,6 +301,99 @@ class TestAutoConversion:
         assert isinstance(db_config, TrackedDict)
         assert db_config["port"] == 5432
 
+    def test_nested_conversion_is_lazy(self) -> None:
+        """Assignment converts only the top level; nested values wait for access."""
+
+        @dataclass
+        class MyState(Stateful):
+            rows: list[dict[str, list[int]]] = field(default_factory=list)
+
+        rows = [{"values": [i]} for i in range(3)]
+        state = MyState()
+        state.rows = rows
+
+        assert all(type(row) is dict for row in list.__iter__(state.rows))
+
+        first = state.rows[0]
+        assert isinstance(first, TrackedDict)
+        assert type(dict.__getitem__(first, "values")) is list
+        # The wrapper is stored, so later reads see the same object
+        assert state.rows[0] is first
+        assert type(list.__getitem__(state.rows, 1)) is dict
+
+    def test_iteration_converts_nested_values(self) -> None:
+        """Iterating a tracked collection yields tracked nested values."""
+        lst: TrackedList[tp.Any] = TrackedList([[1], {"a": 1}, {2}, 3])
+        assert [type(item) for item in lst] == [TrackedList, TrackedDict, TrackedSet, int]
+
+        lst.append([4])
+        assert isinstance(lst[-1], TrackedList)
+        assert isinstance(lst[1:][-1], TrackedList)
+
+        d: TrackedDict[str, tp.Any] = TrackedDict({"a": [1], "b": {"c": 2}})
+        assert all(isinstance(value, (TrackedList, TrackedDict)) for value in d.values())
+
+    def test_lazily_converted_values_share_owner(self) -> None:
+        """Nested wrappers are bound to the Stateful that owns the outer collection."""
+
+        @dataclass
+        class MyState(Stateful):
+            config: dict[str, dict[str, int]] = field(default_factory=dict)
+
+        state = MyState()
+        state.config = {"db": {"port": 5432}}
+
+        db_config = state.config.get("db")
+        assert isinstance(db_config, TrackedDict)
+        assert db_config._owner is not None
+        assert db_config._owner() is state
+        assert db_config._attr == "config['db']"
+
+
+class TestKeyedDiff:
+    """Tests for reconcile() and update_diff() results."""
+
+    def test_reconcile_by_position(self) -> None:
+        """Without a key, items are matched by position."""
+        lst: TrackedList[int] = TrackedList([1, 2, 3])
+        lst.reconcile([1, 5])
+        assert list(lst) == [1, 5]
+
+        lst.reconcile([1, 5, 6, 7])
+        assert list(lst) == [1, 5, 6, 7]
+
+    def test_reconcile_updates_matched_dicts_in_place(self) -> None:
+        """Matched dict items keep their identity and take the new values."""
+        lst: TrackedList[tp.Any] = TrackedList([{"id": 1, "v": 1, "old": True}])
+        row = lst[0]
+
+        lst.reconcile([{"id": 1, "v": 2}], key=lambda item: item["id"])
+
+        assert lst[0] is row
+        assert dict(row) == {"id": 1, "v": 2}
+
+    def test_reconcile_duplicate_keys_do_not_share_item(self) -> None:
+        """A duplicated key in the new items only claims the old item once."""
+        lst: TrackedList[tp.Any] = TrackedList([{"id": 1}])
+        lst.reconcile([{"id": 1}, {"id": 1}], key=lambda item: item["id"])
+
+        assert len(lst) == 2
+        assert lst[0] is not lst[1]
+
+    def test_update_diff_merges_nested_collections(self) -> None:
+        """Nested tracked dicts and lists are updated rather than replaced."""
+        d: TrackedDict[str, tp.Any] = TrackedDict({"cfg": {"a": 1, "b": 2}, "xs": [1, 2]})
+        cfg = d["cfg"]
+        xs = d["xs"]
+
+        d.update_diff({"cfg": {"a": 1}, "xs": [1, 3], "new": 0})
+
+        assert d["cfg"] is cfg
+        assert d["xs"] is xs
+        assert dict(cfg) == {"a": 1}
+        assert list(xs) == [1, 3]
+        assert d["new"] == 0
+
 
 class TestEdgeCases:
     """Tests for edge cases and special scenarios."""
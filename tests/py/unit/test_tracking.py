@@ -1,5 +1,10 @@
 """Tests for DirtyTracker and LifecycleTracker classes."""
 
+import threading
+
+import pytest
+
+from trellis.core.rendering.batch import batch, in_batch
 from trellis.core.rendering.dirty_tracker import DirtyTracker
 from trellis.core.rendering.lifecycle import LifecycleTracker
 
@@ -55,6 +60,49 @@ class TestDirtyTracker:
         assert not tracker.has_dirty()
         assert len(tracker) == 0
 
+    def test_pop_returns_shallowest_first(self):
+        tracker = DirtyTracker()
+        depths = {"leaf": 3, "root": 0, "middle": 1}
+        tracker.set_depth_resolver(depths.__getitem__)
+
+        tracker.mark("leaf")
+        tracker.mark("root")
+        tracker.mark("middle")
+
+        assert tracker.pop() == "root"
+        assert tracker.pop() == "middle"
+        assert tracker.pop() == "leaf"
+        assert tracker.pop() is None
+
+    def test_pop_is_fifo_without_depth_resolver(self):
+        tracker = DirtyTracker()
+        tracker.mark("e2")
+        tracker.mark("e1")
+        tracker.mark("e3")
+
+        assert tracker.pop_all() == ["e2", "e1", "e3"]
+
+    def test_pop_skips_discarded_ids(self):
+        tracker = DirtyTracker()
+        tracker.mark("e1")
+        tracker.mark("e2")
+
+        assert tracker.discard("e1") is True
+        assert tracker.discard("e1") is False
+
+        assert tracker.pop() == "e2"
+        assert tracker.pop() is None
+
+    def test_remark_after_discard_pops_once(self):
+        tracker = DirtyTracker()
+        tracker.mark("e1")
+        tracker.mark("e2")
+        tracker.discard("e1")
+        tracker.mark("e1")
+
+        assert sorted(tracker.pop_all()) == ["e1", "e2"]
+        assert not tracker.has_dirty()
+
     def test_len(self):
         tracker = DirtyTracker()
         assert len(tracker) == 0
@@ -68,6 +116,101 @@ class TestDirtyTracker:
         tracker.mark("e2")
         assert len(tracker) == 2
 
+    def test_on_dirty_fires_on_clean_to_dirty_transition(self):
+        tracker = DirtyTracker()
+        calls = []
+        tracker.set_on_dirty(lambda: calls.append(len(tracker)))
+
+        tracker.mark("e1")
+        tracker.mark("e2")
+        tracker.mark("e1")
+        assert calls == [1]
+
+        tracker.pop_all()
+        tracker.mark("e3")
+        assert calls == [1, 1]
+
+        tracker.set_on_dirty(None)
+        tracker.pop_all()
+        tracker.mark("e4")
+        assert calls == [1, 1]
+
+
+class _CountingLock:
+    """RLock wrapper that counts acquisitions."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self.acquisitions = 0
+
+    def __enter__(self) -> None:
+        self.acquisitions += 1
+        self._lock.acquire()
+
+    def __exit__(self, *exc: object) -> None:
+        self._lock.release()
+
+
+class TestBatch:
+    def test_marks_are_deferred_until_exit(self):
+        tracker = DirtyTracker()
+
+        with batch():
+            assert in_batch()
+            tracker.mark("e1")
+            tracker.mark("e2")
+            assert not tracker.has_dirty()
+
+        assert not in_batch()
+        assert tracker.pop_all() == ["e1", "e2"]
+
+    def test_flush_dedupes_and_takes_lock_once(self):
+        lock = _CountingLock()
+        tracker = DirtyTracker(lock)  # type: ignore[arg-type]
+
+        with batch():
+            for _ in range(3):
+                for i in range(100):
+                    tracker.mark(f"e{i}")
+
+        assert lock.acquisitions == 1
+        assert len(tracker) == 100
+
+    def test_nested_batches_flush_at_outermost_exit(self):
+        tracker = DirtyTracker()
+
+        with batch():
+            with batch():
+                tracker.mark("e1")
+            assert not tracker.has_dirty()
+            tracker.mark("e2")
+
+        assert tracker.pop_all() == ["e1", "e2"]
+
+    def test_flushes_on_exception(self):
+        tracker = DirtyTracker()
+
+        def fail() -> None:
+            with batch():
+                tracker.mark("e1")
+                raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            fail()
+
+        assert "e1" in tracker
+
+    def test_flushes_per_tracker(self):
+        first = DirtyTracker()
+        second = DirtyTracker()
+
+        with batch():
+            first.mark("a")
+            second.mark("b")
+
+        assert first.pop_all() == ["a"]
+        assert second.pop_all() == ["b"]
+
 
 # =============================================================================
 # LifecycleTracker Tests
@@ -0,0 +1,159 @@
+"""Unit tests for binary typed-array encoding."""
+
+import array
+
+import msgspec
+import pytest
+
+from trellis.core.rendering.element import diff_props
+from trellis.platforms.browser.handler import _message_to_dict
+from trellis.platforms.common.messages import PatchMessage, UpdatePatch
+from trellis.platforms.common.typed_arrays import encode_typed_array, typed_array_view
+
+
+class TestEncodeTypedArray:
+    def test_float64_array_is_ext_over_the_same_buffer(self) -> None:
+        values = array.array("d", [1.0, 2.5, -3.0])
+        encoded = encode_typed_array(values)
+
+        assert isinstance(encoded, msgspec.msgpack.Ext)
+        assert encoded.code == 1
+        assert isinstance(encoded.data, memoryview)
+        assert encoded.data.obj is values
+        assert bytes(encoded.data) == values.tobytes()
+
+    @pytest.mark.parametrize(
+        ("typecode", "code"),
+        [("f", 2), ("b", 3), ("B", 4), ("h", 5), ("H", 6), ("i", 7), ("I", 8), ("q", 9), ("Q", 10)],
+    )
+    def test_element_type_codes(self, typecode: str, code: int) -> None:
+        encoded = encode_typed_array(array.array(typecode, [1, 2, 3]))
+        assert encoded.code == code
+
+    def test_non_arrays_are_not_encoded(self) -> None:
+        assert encode_typed_array([1.0, 2.0]) is None
+        assert encode_typed_array(b"bytes") is None
+        assert encode_typed_array(object()) is None
+
+    def test_msgpack_round_trip(self) -> None:
+        values = array.array("d", [0.5] * 1000)
+        payload = msgspec.msgpack.encode({"data": encode_typed_array(values)})
+        decoded = msgspec.msgpack.decode(payload)
+
+        assert decoded["data"].code == 1
+        assert decoded["data"].data == values.tobytes()
+        assert len(payload) < 8 * 1000 + 16
+
+    def test_typed_array_view(self) -> None:
+        view = typed_array_view(encode_typed_array(array.array("i", [1, -2, 3])))
+        assert isinstance(view, memoryview)
+        assert view.format == "i"
+        assert view.tolist() == [1, -2, 3]
+
+    def test_typed_array_view_64_bit_ints_are_lists(self) -> None:
+        assert typed_array_view(encode_typed_array(array.array("q", [1, 2]))) == [1, 2]
+
+
+class TestNumpyArrays:
+    def test_1d_array_is_zero_copy(self) -> None:
+        np = pytest.importorskip("numpy")
+        values = np.linspace(0.0, 1.0, 100)
+        encoded = encode_typed_array(values)
+
+        assert encoded.code == 1
+        assert encoded.data.obj is values
+        assert np.frombuffer(encoded.data, dtype=np.float64).tolist() == values.tolist()
+
+    def test_2d_array_splits_into_rows(self) -> None:
+        np = pytest.importorskip("numpy")
+        columns = np.arange(6, dtype=np.float32).reshape(2, 3)
+        encoded = encode_typed_array(columns)
+
+        assert [ext.code for ext in encoded] == [2, 2]
+        assert [np.frombuffer(ext.data, dtype=np.float32).tolist() for ext in encoded] == [
+            [0.0, 1.0, 2.0],
+            [3.0, 4.0, 5.0],
+        ]
+
+    def test_strided_array_is_copied_in_order(self) -> None:
+        np = pytest.importorskip("numpy")
+        values = np.arange(10, dtype=np.int32)[::2]
+        encoded = encode_typed_array(values)
+
+        assert np.frombuffer(encoded.data, dtype=np.int32).tolist() == [0, 2, 4, 6, 8]
+
+    def test_bool_and_big_endian_fall_back_to_lists(self) -> None:
+        np = pytest.importorskip("numpy")
+        assert encode_typed_array(np.array([True, False])) == [True, False]
+        assert encode_typed_array(np.array([1.5, 2.5], dtype=">f8")) == [1.5, 2.5]
+
+    def test_equal_arrays_produce_no_diff(self) -> None:
+        np = pytest.importorskip("numpy")
+        old = {"data": np.arange(5.0)}
+
+        assert diff_props(old, {"data": np.arange(5.0)}) == {}
+        assert set(diff_props(old, {"data": np.arange(6.0)})) == {"data"}
+
+
+class _Ambiguous:
+    def __bool__(self) -> bool:
+        raise ValueError("The truth value of an array is ambiguous")
+
+
+class _Column(bytearray):
+    """Buffer that compares elementwise, as NumPy arrays do."""
+
+    def __eq__(self, other: object) -> _Ambiguous:  # type: ignore[override]
+        return _Ambiguous()
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def _columns(names: str) -> list[_Column]:
+    # Fresh objects each call, as a render building new arrays produces
+    return [_Column(name.encode()) for name in names]
+
+
+class TestArrayListDiff:
+    """Nested diffs of lists of array columns, without depending on NumPy."""
+
+    def test_unchanged_columns(self) -> None:
+        assert diff_props({"data": _columns("abc")}, {"data": _columns("abc")}) == {}
+        assert diff_props({"data": {"x": _Column(b"a")}}, {"data": {"x": _Column(b"a")}}) == {}
+
+    def test_appended_column(self) -> None:
+        old = {"data": _columns("abcdef")}
+        new = {"data": _columns("abcdefg")}
+
+        [op] = diff_props(old, new, nested={"data"})["data"].ops
+
+        assert (op.op, op.index, [bytes(v) for v in op.value]) == ("append", 6, [b"g"])
+
+    def test_sliding_window_of_columns(self) -> None:
+        old = {"data": _columns("abcdefgh")}
+        new = {"data": _columns("bcdefghi")}
+
+        splice, append = diff_props(old, new, nested={"data"})["data"].ops
+
+        assert (splice.op, splice.index, splice.delete) == ("splice", 0, 1)
+        assert (append.op, append.index, [bytes(v) for v in append.value]) == ("append", 7, [b"i"])
+
+    def test_changed_column_in_place(self) -> None:
+        old = {"data": _columns("abcdef")}
+        new = {"data": _columns("abXdef")}
+
+        [op] = diff_props(old, new, nested={"data"})["data"].ops
+
+        assert (op.op, op.path, bytes(op.value)) == ("set", (2,), b"X")
+
+
+class TestBrowserMessages:
+    def test_typed_arrays_become_typed_memoryviews(self) -> None:
+        ext = encode_typed_array(array.array("d", [1.0, 2.0]))
+        msg = PatchMessage(patches=[UpdatePatch(id=1, props={"data": [ext]})])
+
+        data = _message_to_dict(msg)["patches"][0]["props"]["data"][0]
+
+        assert isinstance(data, memoryview)
+        assert data.format == "d"
+        assert data.tolist() == [1.0, 2.0]